@@ -0,0 +1,182 @@
+"""Monte Carlo robustness analysis of backtest trade sequences.
+
+A backtest yields one ordering of one sample of trades; calculate_metrics()
+reports point estimates from it. MonteCarloAnalyzer resamples the trade
+PnLs into thousands of alternative sequences and reports how final equity,
+max drawdown and profit factor are distributed across them, plus the
+probability of ruin.
+
+Resampling methods:
+
+- "iid": draw trades with replacement.
+- "block": circular block bootstrap; draws runs of `block_size` consecutive
+  trades, preserving short-range dependence such as losing streaks.
+- "shuffle": permute the actual trades. Totals are fixed, so only the
+  path-dependent statistics (drawdown, ruin) vary.
+
+All paths are resampled and evaluated as 2-D arrays (paths x trades), in
+chunks that bound peak memory.
+"""
+from __future__ import annotations
+
+from collections.abc import Sequence
+from dataclasses import dataclass
+from typing import Literal, Protocol
+
+import numpy as np
+
+from autotrader.backtest.trade_collector import TradeDetail
+
+Method = Literal["iid", "block", "shuffle"]
+
+# Elements per (paths x trades) working array. Small chunks keep the
+# temporaries cache-sized and let the allocator reuse them; one large
+# batch spends most of its time faulting in fresh pages.
+_CHUNK_ELEMENTS = 250_000
+
+
+class _HasTrades(Protocol):
+    trades: list[TradeDetail]
+    equity_curve: list[float]
+
+
+@dataclass(frozen=True)
+class MonteCarloResult:
+    """Per-path statistics of one Monte Carlo run.
+
+    `final_equity`, `max_drawdown` and `profit_factor` hold one value per
+    path; `risk_of_ruin` is the fraction of paths whose equity touched the
+    ruin level at any point.
+    """
+
+    method: str
+    initial_equity: float
+    final_equity: np.ndarray
+    max_drawdown: np.ndarray
+    profit_factor: np.ndarray
+    risk_of_ruin: float
+
+    @property
+    def paths(self) -> int:
+        return len(self.final_equity)
+
+    def summary(self, percentiles: Sequence[float] = (5, 25, 50, 75, 95)) -> dict:
+        """Mean and percentiles of each statistic, plus risk of ruin.
+
+        Percentiles take the nearest path value, so infinite profit
+        factors (paths without a losing trade) stay well-defined.
+        """
+        out: dict = {}
+        for name in ("final_equity", "max_drawdown", "profit_factor"):
+            values = getattr(self, name)
+            stats = {"mean": float(np.mean(values)) if len(values) else 0.0}
+            if len(values):
+                points = np.percentile(values, percentiles, method="nearest")
+                stats.update({f"p{q:g}": float(v) for q, v in zip(percentiles, points)})
+            out[name] = stats
+        out["risk_of_ruin"] = self.risk_of_ruin
+        return out
+
+
+class MonteCarloAnalyzer:
+    """Bootstrap and shuffle resampling of a backtest's trade PnLs.
+
+    Usage::
+
+        analyzer = MonteCarloAnalyzer(paths=10_000, method="block", seed=7)
+        mc = analyzer.run(backtest_result)
+        mc.summary()["max_drawdown"]["p95"]
+        mc.risk_of_ruin
+    """
+
+    def __init__(
+        self,
+        paths: int = 10_000,
+        method: Method = "iid",
+        block_size: int = 5,
+        ruin_equity_pct: float = 0.5,
+        seed: int | None = None,
+    ) -> None:
+        if method not in ("iid", "block", "shuffle"):
+            raise ValueError(f"Unknown resampling method: {method!r}")
+        if paths <= 0 or block_size <= 0:
+            raise ValueError("paths and block_size must be positive")
+        self._paths = paths
+        self._method = method
+        self._block_size = block_size
+        self._ruin_equity_pct = ruin_equity_pct
+        self._seed = seed
+
+    def run(self, result: _HasTrades, initial_equity: float | None = None) -> MonteCarloResult:
+        """Resample the closed trades of a BacktestResult or RotationBacktestResult.
+
+        `initial_equity` defaults to the first point of the result's
+        equity curve.
+        """
+        if initial_equity is None:
+            initial_equity = result.equity_curve[0]
+        return self.run_pnls([trade.pnl for trade in result.trades], initial_equity)
+
+    def run_pnls(self, pnls: Sequence[float], initial_equity: float) -> MonteCarloResult:
+        """Resample a sequence of trade PnLs starting from `initial_equity`."""
+        rng = np.random.default_rng(self._seed)
+        values = np.asarray(pnls, dtype=np.float64)
+        n = len(values)
+        final_equity = np.full(self._paths, float(initial_equity))
+        max_drawdown = np.zeros(self._paths)
+        profit_factor = np.zeros(self._paths)
+        ruined = np.zeros(self._paths, dtype=bool)
+        if n == 0:
+            return self._result(initial_equity, final_equity, max_drawdown, profit_factor, ruined)
+
+        ruin_level = initial_equity * self._ruin_equity_pct
+        chunk = max(1, _CHUNK_ELEMENTS // n)
+        for start in range(0, self._paths, chunk):
+            stop = min(start + chunk, self._paths)
+            sample = self._resample(rng, values, stop - start)
+
+            equity = initial_equity + np.cumsum(sample, axis=1)
+            peak = np.maximum(np.maximum.accumulate(equity, axis=1), initial_equity)
+            drawdown = np.divide(
+                peak - equity, peak, out=np.zeros_like(equity), where=peak > 0,
+            )
+            gross_profit = np.where(sample > 0, sample, 0.0).sum(axis=1)
+            gross_loss = -np.where(sample < 0, sample, 0.0).sum(axis=1)
+
+            final_equity[start:stop] = equity[:, -1]
+            max_drawdown[start:stop] = drawdown.max(axis=1)
+            profit_factor[start:stop] = np.divide(
+                gross_profit, gross_loss,
+                out=np.full(stop - start, np.inf), where=gross_loss > 0,
+            )
+            ruined[start:stop] = equity.min(axis=1) <= ruin_level
+        return self._result(initial_equity, final_equity, max_drawdown, profit_factor, ruined)
+
+    def _resample(self, rng: np.random.Generator, values: np.ndarray, paths: int) -> np.ndarray:
+        n = len(values)
+        if self._method == "shuffle":
+            return rng.permuted(np.broadcast_to(values, (paths, n)), axis=1)
+        if self._method == "iid":
+            return values[rng.integers(0, n, size=(paths, n))]
+        block = min(self._block_size, n)
+        blocks = -(-n // block)
+        starts = rng.integers(0, n, size=(paths, blocks, 1))
+        index = (starts + np.arange(block)).reshape(paths, blocks * block)[:, :n] % n
+        return values[index]
+
+    def _result(
+        self,
+        initial_equity: float,
+        final_equity: np.ndarray,
+        max_drawdown: np.ndarray,
+        profit_factor: np.ndarray,
+        ruined: np.ndarray,
+    ) -> MonteCarloResult:
+        return MonteCarloResult(
+            method=self._method,
+            initial_equity=initial_equity,
+            final_equity=final_equity,
+            max_drawdown=max_drawdown,
+            profit_factor=profit_factor,
+            risk_of_ruin=float(ruined.mean()),
+        )
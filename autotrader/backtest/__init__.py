@@ -1,4 +1,23 @@
+from autotrader.backtest.cache import BacktestCache
+from autotrader.backtest.checkpoint import BacktestCheckpoint
 from autotrader.backtest.engine import BacktestEngine, BacktestResult
+from autotrader.backtest.parallel import ParallelBacktestRunner
+from autotrader.backtest.profiling import BacktestProfile
+from autotrader.backtest.sweep import ParameterSweep, SweepResult
+from autotrader.backtest.walk_forward import WalkForwardOptimizer, WalkForwardResult
 from autotrader.backtest.trade_collector import TradeCollector, TradeDetail
 
-__all__ = ["BacktestEngine", "BacktestResult", "TradeCollector", "TradeDetail"]
+__all__ = [
+    "BacktestCache",
+    "BacktestCheckpoint",
+    "BacktestEngine",
+    "BacktestProfile",
+    "BacktestResult",
+    "ParallelBacktestRunner",
+    "ParameterSweep",
+    "SweepResult",
+    "TradeCollector",
+    "TradeDetail",
+    "WalkForwardOptimizer",
+    "WalkForwardResult",
+]
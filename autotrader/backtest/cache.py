@@ -0,0 +1,181 @@
+"""Disk-backed, content-addressed cache of backtest results.
+
+A backtest is a pure function of its bars, its strategies (their code and
+constants), the risk config and the initial balance, so BacktestCache keys
+results by a hash of exactly those inputs. Selector rotations, scripts and
+sweeps that replay an unchanged backtest read the stored result instead.
+
+Entries are pickle files named by key. Reads refresh an entry's mtime and,
+once the directory grows past `max_bytes`, the least recently used entries
+are deleted. Writes replace files atomically, so several processes (e.g.
+pool workers) can share one cache directory.
+"""
+from __future__ import annotations
+
+import functools
+import hashlib
+import inspect
+import json
+import logging
+import os
+import pickle
+import uuid
+from collections.abc import Sequence
+from pathlib import Path
+from typing import TYPE_CHECKING
+
+from autotrader.core.bar_history import BarHistory
+from autotrader.core.config import RiskConfig
+from autotrader.core.types import Bar
+from autotrader.strategy.base import Strategy
+
+if TYPE_CHECKING:
+    from autotrader.backtest.engine import BacktestResult
+
+logger = logging.getLogger(__name__)
+
+# Bump when engine, simulator or indicator changes alter results for the
+# same inputs; old entries then simply stop matching.
+CACHE_VERSION = 3
+
+DEFAULT_MAX_BYTES = 512 * 1024 * 1024
+
+_SUFFIX = ".pkl"
+
+
+@functools.cache
+def _class_fingerprint(cls: type) -> str:
+    """Hash of the source of `cls` and its bases (qualified name if unavailable)."""
+    digest = hashlib.sha256()
+    for klass in cls.__mro__:
+        if klass is object:
+            continue
+        digest.update(f"{klass.__module__}.{klass.__qualname__}".encode())
+        try:
+            digest.update(inspect.getsource(klass).encode())
+        except (OSError, TypeError):
+            pass
+    return digest.hexdigest()
+
+
+def _strategy_params(strategy: Strategy) -> dict:
+    """Upper-case constants as the instance sees them, overrides included."""
+    return {
+        name: repr(getattr(strategy, name))
+        for name in sorted(dir(strategy))
+        if name.isupper()
+    }
+
+
+def strategy_fingerprints(strategies: Sequence[Strategy]) -> list[dict]:
+    """JSON-compatible identity of each strategy: code, constants and indicators."""
+    return [
+        {
+            "class": _class_fingerprint(type(strategy)),
+            "params": _strategy_params(strategy),
+            "indicators": [spec.key for spec in strategy.required_indicators],
+        }
+        for strategy in strategies
+    ]
+
+
+def backtest_key(
+    bars: Sequence[Bar],
+    strategies: Sequence[Strategy],
+    risk_config: RiskConfig,
+    initial_balance: float,
+) -> str:
+    """Content hash identifying one BacktestEngine.run().
+
+    Strategies are assumed to be freshly constructed, since the key cannot
+    see state left over from an earlier run.
+    """
+    digest = hashlib.sha256()
+    state = BarHistory(maxlen=max(1, len(bars)), bars=bars).get_state()
+    for name in ("prices", "timestamps", "meta_codes"):
+        digest.update(state[name].tobytes())
+    header = {
+        "version": CACHE_VERSION,
+        "bar_meta": state["meta"],
+        "strategies": strategy_fingerprints(strategies),
+        "risk_config": risk_config.model_dump(mode="json"),
+        "initial_balance": initial_balance,
+    }
+    digest.update(json.dumps(header, sort_keys=True).encode())
+    return digest.hexdigest()
+
+
+class BacktestCache:
+    """Size-bounded LRU store of BacktestResults under one directory."""
+
+    def __init__(self, directory: str | Path, max_bytes: int = DEFAULT_MAX_BYTES) -> None:
+        self._directory = Path(directory)
+        self._max_bytes = max_bytes
+
+    @property
+    def directory(self) -> Path:
+        return self._directory
+
+    def _path(self, key: str) -> Path:
+        return self._directory / f"{key}{_SUFFIX}"
+
+    def get(self, key: str) -> BacktestResult | None:
+        """Stored result for `key`, or None if missing or unreadable."""
+        path = self._path(key)
+        try:
+            with open(path, "rb") as f:
+                result = pickle.load(f)
+        except FileNotFoundError:
+            return None
+        except Exception:
+            logger.warning("Dropping unreadable backtest cache entry %s", path, exc_info=True)
+            path.unlink(missing_ok=True)
+            return None
+        try:
+            os.utime(path)
+        except FileNotFoundError:
+            pass  # Evicted by another process since the read
+        return result
+
+    def put(self, key: str, result: BacktestResult) -> None:
+        """Store `result`, then evict least recently used entries over the size bound."""
+        self._directory.mkdir(parents=True, exist_ok=True)
+        path = self._path(key)
+        tmp_path = path.with_name(f"{path.name}.{uuid.uuid4().hex}.tmp")
+        with open(tmp_path, "wb") as f:
+            pickle.dump(result, f, protocol=pickle.HIGHEST_PROTOCOL)
+        os.replace(tmp_path, path)
+        self._evict()
+
+    def clear(self) -> None:
+        for path in self._entries():
+            path.unlink(missing_ok=True)
+
+    def size_bytes(self) -> int:
+        return sum(size for _path, size, _mtime in self._stats())
+
+    def _entries(self) -> list[Path]:
+        if not self._directory.is_dir():
+            return []
+        return list(self._directory.glob(f"*{_SUFFIX}"))
+
+    def _stats(self) -> list[tuple[Path, int, float]]:
+        stats = []
+        for path in self._entries():
+            try:
+                st = path.stat()
+            except FileNotFoundError:
+                continue
+            stats.append((path, st.st_size, st.st_mtime))
+        return stats
+
+    def _evict(self) -> None:
+        stats = self._stats()
+        total = sum(size for _path, size, _mtime in stats)
+        if total <= self._max_bytes:
+            return
+        for path, size, _mtime in sorted(stats, key=lambda s: s[2]):
+            path.unlink(missing_ok=True)
+            total -= size
+            if total <= self._max_bytes:
+                break
@@ -0,0 +1,122 @@
+"""Checkpoints of streaming backtests, for continuing them over new bars.
+
+A backtest that gains one more day of bars need not replay the months
+before it. After run_stream(), an engine's checkpoint() captures everything
+the replay carries forward: the ledger, trade collector, bar histories,
+strategy state, risk and rotation state, and the indicators' streaming
+state. resume() on an engine configured the same way then processes only
+the appended bars, and its result covers the whole timeline exactly as a
+single run_stream() over all the bars would.
+
+Checkpoints hold pickled engine internals: load only files you wrote, and
+expect checkpoints to stop matching (ValueError on resume) when the
+strategies, their constants or the engine configuration change.
+"""
+from __future__ import annotations
+
+import hashlib
+import json
+import os
+import pickle
+import uuid
+from collections.abc import AsyncIterable, AsyncIterator, Iterable, Iterator, Sequence
+from dataclasses import dataclass
+from datetime import datetime
+from pathlib import Path
+
+from autotrader.backtest.cache import strategy_fingerprints
+from autotrader.core.config import RiskConfig, RotationConfig
+from autotrader.core.types import Bar
+from autotrader.strategy.base import Strategy
+
+# Bump when the replay classes change shape; old checkpoints then fail to
+# match instead of unpickling into inconsistent state.
+CHECKPOINT_VERSION = 1
+
+
+def checkpoint_key(
+    engine: str,
+    strategies: Sequence[Strategy],
+    risk_config: RiskConfig,
+    initial_balance: float,
+    rotation_config: RotationConfig | None = None,
+) -> str:
+    """Hash of the configuration a checkpoint can be resumed under."""
+    header = {
+        "version": CHECKPOINT_VERSION,
+        "engine": engine,
+        "strategies": strategy_fingerprints(strategies),
+        "risk_config": risk_config.model_dump(mode="json"),
+        "rotation_config": (
+            rotation_config.model_dump(mode="json") if rotation_config is not None else None
+        ),
+        "initial_balance": initial_balance,
+    }
+    return hashlib.sha256(json.dumps(header, sort_keys=True).encode()).hexdigest()
+
+
+@dataclass(frozen=True)
+class BacktestCheckpoint:
+    """Frozen state of a streaming backtest after its last bar.
+
+    `state` is an opaque pickle owned by the engine that wrote it; `key`
+    identifies that engine's configuration and `last_timestamp` the last
+    bar processed (None before any bar).
+    """
+
+    key: str
+    last_timestamp: datetime | None
+    state: bytes
+
+    @classmethod
+    def capture(
+        cls, key: str, last_timestamp: datetime | None, state: object,
+    ) -> BacktestCheckpoint:
+        return cls(key, last_timestamp, pickle.dumps(state, protocol=pickle.HIGHEST_PROTOCOL))
+
+    def restore(self, key: str) -> object:
+        """Unpickle a fresh copy of the state; raises ValueError on a key mismatch."""
+        if key != self.key:
+            raise ValueError("Checkpoint was taken under a different backtest configuration")
+        return pickle.loads(self.state)
+
+    def save(self, path: str | Path) -> None:
+        """Write the checkpoint to `path`, replacing any previous file atomically."""
+        path = Path(path)
+        path.parent.mkdir(parents=True, exist_ok=True)
+        tmp_path = path.with_name(f"{path.name}.{uuid.uuid4().hex}.tmp")
+        with open(tmp_path, "wb") as f:
+            pickle.dump(self, f, protocol=pickle.HIGHEST_PROTOCOL)
+        os.replace(tmp_path, path)
+
+    @classmethod
+    def load(cls, path: str | Path) -> BacktestCheckpoint:
+        with open(path, "rb") as f:
+            checkpoint = pickle.load(f)
+        if not isinstance(checkpoint, cls):
+            raise TypeError(f"{path} does not hold a BacktestCheckpoint")
+        return checkpoint
+
+    def appended(self, bars: Iterable[Bar]) -> Iterator[Bar]:
+        """`bars`, after checking that the first starts past the checkpoint."""
+        it = iter(bars)
+        for bar in it:
+            self._check(bar)
+            yield bar
+            yield from it
+
+    async def appended_async(self, bars: AsyncIterable[Bar]) -> AsyncIterator[Bar]:
+        """appended() over an async bar source."""
+        checked = False
+        async for bar in bars:
+            if not checked:
+                self._check(bar)
+                checked = True
+            yield bar
+
+    def _check(self, bar: Bar) -> None:
+        if self.last_timestamp is not None and bar.timestamp <= self.last_timestamp:
+            raise ValueError(
+                f"Bar at {bar.timestamp} does not follow the checkpoint "
+                f"(last bar at {self.last_timestamp})"
+            )
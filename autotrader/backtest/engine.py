@@ -1,11 +1,21 @@
 from __future__ import annotations
 
-from collections import deque
+from collections.abc import AsyncIterable, Iterable, Mapping, Sequence
 from dataclasses import dataclass, field
+from datetime import datetime
+from time import perf_counter
 
+import numpy as np
+
+from autotrader.backtest.cache import BacktestCache, backtest_key
+from autotrader.backtest.checkpoint import BacktestCheckpoint, checkpoint_key
+from autotrader.backtest.profiling import BacktestProfile
+from autotrader.core.bar_history import BarHistory
 from autotrader.core.types import Bar, MarketContext
 from autotrader.core.config import RiskConfig
+from autotrader.indicators.base import SeriesValue
 from autotrader.indicators.engine import IndicatorEngine
+from autotrader.indicators.snapshot import IndicatorSnapshot
 from autotrader.strategy.base import Strategy
 from autotrader.risk.manager import RiskManager
 from autotrader.backtest.simulator import BacktestSimulator
@@ -21,71 +31,306 @@ class BacktestResult:
     equity_curve: list[float] = field(default_factory=list)
     trades: list[TradeDetail] = field(default_factory=list)
     timestamped_equity: list[tuple] = field(default_factory=list)
+    profile: BacktestProfile | None = None
 
 
 class BacktestEngine:
-    def __init__(self, initial_balance: float, risk_config: RiskConfig) -> None:
+    def __init__(
+        self,
+        initial_balance: float,
+        risk_config: RiskConfig,
+        cache: BacktestCache | None = None,
+        profile: bool = False,
+    ) -> None:
         self._initial_balance = initial_balance
         self._risk_config = risk_config
+        self._cache = cache
+        self._profile = profile
         self._strategies: list[Strategy] = []
         self._indicator_engine = IndicatorEngine()
+        self._last_stream: _Replay | None = None
 
     def add_strategy(self, strategy: Strategy) -> None:
         self._strategies.append(strategy)
         for spec in strategy.required_indicators:
             self._indicator_engine.register(spec)
 
-    def run(self, bars: list[Bar]) -> BacktestResult:
-        simulator = BacktestSimulator(self._initial_balance, self._risk_config)
-        risk_mgr = RiskManager(self._risk_config)
-        collector = TradeCollector()
-        history: deque[Bar] = deque(maxlen=500)
-        trade_pnls: list[float] = []
-        equity_curve: list[float] = [self._initial_balance]
-        timestamped_equity: list[tuple] = []
-        total_filled = 0
+    def _history_size(self) -> int:
+        """Bars of context history: enough for the strategies and indicators."""
+        return max(
+            self._indicator_engine.history_bars(),
+            max((s.lookback_bars for s in self._strategies), default=0),
+            1,
+        )
+
+    def run(
+        self, bars: list[Bar], series: Mapping[str, SeriesValue] | None = None,
+    ) -> BacktestResult:
+        """Backtest the strategies over `bars`.
+
+        `series` is precomputed compute_series() output for `bars` covering
+        at least the registered indicators (extra keys are ignored), so runs
+        over the same bars can share one indicator pass.
+
+        With a cache, a run whose bars, strategies, risk config and balance
+        were seen before returns the stored result; strategies should then
+        be freshly constructed, as their state is not part of the key.
+        Profiled runs bypass the cache so that the timings are real.
+        """
+        if self._cache is None or self._profile:
+            return self._run(bars, series)
+        key = backtest_key(bars, self._strategies, self._risk_config, self._initial_balance)
+        result = self._cache.get(key)
+        if result is None:
+            result = self._run(bars, series)
+            self._cache.put(key, result)
+        return result
+
+    def _run(
+        self, bars: list[Bar], series: Mapping[str, SeriesValue] | None,
+    ) -> BacktestResult:
+        replay = self._replay()
+        profile = replay.profile
+        layout = self._indicator_engine.layout
+        if profile:
+            started = perf_counter()
+        if series is None:
+            series = self._indicator_engine.compute_series(bars)
+        table = layout.stack(series, len(bars))
+        if profile:
+            profile.add("indicators", perf_counter() - started)
+            started = perf_counter()
+        candidates = self._entry_candidates(series, len(bars))
+        if profile:
+            profile.add("entry_masks", perf_counter() - started)
+        if candidates is None:
+            for index, bar in enumerate(bars):
+                replay.step(bar, IndicatorSnapshot(layout, table[index].tolist()))
+            return replay.result()
+        for index, bar in enumerate(bars):
+            due = candidates[index]
+            snapshot = (
+                IndicatorSnapshot(layout, table[index].tolist()) if replay.wants(due) else None
+            )
+            replay.step(bar, snapshot, due)
+        return replay.result()
+
+    def _entry_candidates(
+        self, series: Mapping[str, SeriesValue], count: int,
+    ) -> list[list[bool]] | None:
+        """Per bar, which strategies' entry_mask() flags it; None without masks."""
+        masks = [strategy.entry_mask(series) for strategy in self._strategies]
+        if all(mask is None for mask in masks):
+            return None
+        return np.column_stack([
+            np.ones(count, dtype=bool) if mask is None else np.asarray(mask, dtype=bool)
+            for mask in masks
+        ]).tolist()
+
+    def run_stream(self, bars: Iterable[Bar]) -> BacktestResult:
+        """Backtest over a time-ordered bar iterator without materializing it.
 
+        Indicators advance incrementally with each bar, so memory is bounded
+        by the bar history window rather than the dataset; only the equity
+        curve and trades grow. Results match run() over the same bars.
+        Streaming runs bypass the cache, whose key needs every bar.
+        """
+        self._indicator_engine.reset()
+        replay = self._last_stream = self._replay()
         for bar in bars:
-            history.append(bar)
-            indicators = self._indicator_engine.compute(history)
-            ctx = MarketContext(symbol=bar.symbol, bar=bar, indicators=indicators, history=history)
+            replay.step(bar, self._update_indicators(bar, replay.profile))
+        return replay.result()
 
-            for strat in self._strategies:
-                try:
-                    signal = strat.on_context(ctx)
-                except Exception:
-                    continue
+    async def run_stream_async(self, bars: AsyncIterable[Bar]) -> BacktestResult:
+        """run_stream() over an async bar source, e.g. SQLiteStore.iter_bars()."""
+        self._indicator_engine.reset()
+        replay = self._last_stream = self._replay()
+        async for bar in bars:
+            replay.step(bar, self._update_indicators(bar, replay.profile))
+        return replay.result()
 
-                if signal is None:
-                    continue
+    def checkpoint(self) -> BacktestCheckpoint:
+        """State at the end of the last run_stream() or resume(), to resume later."""
+        replay = self._last_stream
+        if replay is None:
+            raise RuntimeError("No streaming run to checkpoint")
+        return BacktestCheckpoint.capture(
+            self._checkpoint_key(), replay.last_timestamp,
+            (replay, self._indicator_engine.get_state()),
+        )
+
+    def resume(self, checkpoint: BacktestCheckpoint, bars: Iterable[Bar]) -> BacktestResult:
+        """Continue a checkpointed run over bars appended after it.
+
+        The result covers every bar since the original run started and
+        equals run_stream() over the old and new bars together. Raises
+        ValueError if the engine's strategies, risk config or balance differ
+        from the checkpointed run's, or if `bars` do not start after it.
+        """
+        replay = self._restore(checkpoint)
+        for bar in checkpoint.appended(bars):
+            replay.step(bar, self._update_indicators(bar, replay.profile))
+        return replay.result()
+
+    async def resume_async(
+        self, checkpoint: BacktestCheckpoint, bars: AsyncIterable[Bar],
+    ) -> BacktestResult:
+        """resume() over an async bar source."""
+        replay = self._restore(checkpoint)
+        async for bar in checkpoint.appended_async(bars):
+            replay.step(bar, self._update_indicators(bar, replay.profile))
+        return replay.result()
 
-                account = simulator._get_account()
-                if not risk_mgr.validate(signal, account, positions=[]):
-                    continue
+    def _checkpoint_key(self) -> str:
+        return checkpoint_key(
+            "backtest", self._strategies, self._risk_config, self._initial_balance,
+        )
+
+    def _restore(self, checkpoint: BacktestCheckpoint) -> _Replay:
+        replay, indicator_state = checkpoint.restore(self._checkpoint_key())
+        self._indicator_engine.set_state(indicator_state)
+        replay.restart(BacktestProfile() if self._profile else None)
+        self._last_stream = replay
+        return replay
 
-                # Calculate PnL before executing close (position gets removed)
+    def _update_indicators(self, bar: Bar, profile: BacktestProfile | None) -> IndicatorSnapshot:
+        if not profile:
+            return self._indicator_engine.update(bar)
+        started = perf_counter()
+        snapshot = self._indicator_engine.update(bar)
+        profile.add("indicators", perf_counter() - started)
+        return snapshot
+
+    def _replay(self) -> _Replay:
+        return _Replay(
+            self._initial_balance, self._risk_config, self._strategies, self._history_size(),
+            BacktestProfile() if self._profile else None,
+        )
+
+
+class _Replay:
+    """Simulation state of one backtest, advanced one bar at a time."""
+
+    def __init__(
+        self,
+        initial_balance: float,
+        risk_config: RiskConfig,
+        strategies: list[Strategy],
+        history_size: int,
+        profile: BacktestProfile | None = None,
+    ) -> None:
+        self._initial_balance = initial_balance
+        self._strategies = strategies
+        self.profile = profile
+        self._started = perf_counter()
+        self._strategy_stages = [f"strategy:{strat.name}" for strat in strategies]
+        self._simulator = BacktestSimulator(initial_balance, risk_config)
+        self._risk_mgr = RiskManager(risk_config)
+        self._collector = TradeCollector()
+        self._history = BarHistory(maxlen=history_size)
+        self._trade_pnls: list[float] = []
+        self._equity_curve: list[float] = [initial_balance]
+        self._timestamped_equity: list[tuple] = []
+        self._total_filled = 0
+        # Strategies with an entry signal since their last close; these run
+        # on every bar regardless of their entry mask
+        self._engaged = [False] * len(strategies)
+
+    @property
+    def last_timestamp(self) -> datetime | None:
+        return self._timestamped_equity[-1][0] if self._timestamped_equity else None
+
+    def restart(self, profile: BacktestProfile | None) -> None:
+        """Start timing a continuation of this replay with a fresh profile."""
+        self.profile = profile
+        self._started = perf_counter()
+
+    def wants(self, due: Sequence[bool]) -> bool:
+        """Whether step() with entry candidates `due` calls any strategy."""
+        return any(d or e for d, e in zip(due, self._engaged))
+
+    def step(
+        self,
+        bar: Bar,
+        indicators: IndicatorSnapshot | None,
+        due: Sequence[bool] | None = None,
+    ) -> None:
+        """Advance one bar; with `due`, flat strategies not flagged are skipped."""
+        simulator = self._simulator
+        profile = self.profile
+        history = self._history
+        history.append(bar)
+        if profile:
+            started = perf_counter()
+        simulator.mark(bar.symbol, bar.close)
+        if profile:
+            profile.add("equity", perf_counter() - started)
+        ctx = None
+
+        for index, strat in enumerate(self._strategies):
+            if due is not None and not (due[index] or self._engaged[index]):
+                continue
+            if ctx is None:
+                ctx = MarketContext(
+                    symbol=bar.symbol, bar=bar, indicators=indicators, history=history,
+                )
+            if profile:
+                started = perf_counter()
+            try:
+                signal = strat.on_context(ctx)
+            except Exception:
+                signal = None
+            if profile:
+                profile.add(self._strategy_stages[index], perf_counter() - started)
+
+            if signal is None:
+                continue
+            self._engaged[index] = signal.direction != "close"
+
+            if profile:
+                started = perf_counter()
+            account = simulator.get_account()
+            valid = self._risk_mgr.validate(signal, account, positions=[])
+            if profile:
+                profile.add("risk", perf_counter() - started)
+            if not valid:
+                continue
+
+            if profile:
+                started = perf_counter()
+            # Calculate PnL before executing close (position gets removed)
+            if signal.direction == "close":
+                pnl = simulator.get_pnl(signal.symbol, bar.close)
+
+            result = simulator.execute_signal(signal, bar.close)
+            if result and result.status == "filled":
+                self._total_filled += 1
                 if signal.direction == "close":
-                    pnl = simulator.get_pnl(signal.symbol, bar.close)
-
-                result = simulator.execute_signal(signal, bar.close)
-                if result and result.status == "filled":
-                    total_filled += 1
-                    if signal.direction == "close":
-                        trade_pnls.append(pnl)
-                        collector.on_exit(signal, bar, pnl)
-                    else:
-                        collector.on_entry(signal, bar, result.filled_qty)
-
-            equity = simulator.get_equity_with_prices({bar.symbol: bar.close})
-            equity_curve.append(equity)
-            timestamped_equity.append((bar.timestamp, equity))
-
-        metrics = calculate_metrics(trade_pnls, self._initial_balance)
+                    self._trade_pnls.append(pnl)
+                    self._collector.on_exit(signal, bar, pnl)
+                else:
+                    self._collector.on_entry(signal, bar, result.filled_qty)
+            if profile:
+                profile.add("execution", perf_counter() - started)
+
+        if profile:
+            started = perf_counter()
+        equity = simulator.equity
+        self._equity_curve.append(equity)
+        self._timestamped_equity.append((bar.timestamp, equity))
+        if profile:
+            profile.add("equity", perf_counter() - started, calls=0)
+
+    def result(self) -> BacktestResult:
+        metrics = calculate_metrics(self._trade_pnls, self._initial_balance)
+        if self.profile:
+            self.profile.wall_seconds = perf_counter() - self._started
         return BacktestResult(
-            total_trades=total_filled,
-            final_equity=equity_curve[-1],
+            total_trades=self._total_filled,
+            final_equity=self._equity_curve[-1],
             metrics=metrics,
-            equity_curve=equity_curve,
-            trades=collector.trades,
-            timestamped_equity=timestamped_equity,
+            equity_curve=self._equity_curve,
+            trades=self._collector.trades,
+            timestamped_equity=self._timestamped_equity,
+            profile=self.profile,
         )
@@ -0,0 +1,154 @@
+"""Process-parallel backtests over many symbols (and strategy sets).
+
+Each (symbol, strategy set) pair is an independent BacktestEngine run, so
+ParallelBacktestRunner fans them out over a process pool. Bars are not
+pickled to the workers: the parent packs every symbol's columns (the same
+layout BarHistory uses) into one shared-memory block, and each worker maps
+the block and rebuilds only its own symbol's bars.
+
+Strategies are passed as zero-argument factories -- usually the strategy
+classes themselves, or functools.partial for parameterized ones -- because
+every job needs fresh strategy state and the factories must be picklable.
+"""
+from __future__ import annotations
+
+import os
+from collections.abc import Callable, Mapping, Sequence
+from concurrent.futures import FIRST_EXCEPTION, ProcessPoolExecutor, wait
+from dataclasses import dataclass
+from typing import TypeVar
+
+from autotrader.backtest.cache import BacktestCache
+from autotrader.backtest.engine import BacktestEngine, BacktestResult
+from autotrader.backtest.shared import SharedBars, load_bars
+from autotrader.core.config import RiskConfig
+from autotrader.core.types import Bar
+from autotrader.strategy.base import Strategy
+
+StrategyFactory = Callable[[], Strategy]
+J = TypeVar("J")
+R = TypeVar("R")
+
+
+@dataclass(frozen=True)
+class _Job:
+    key: str
+    shm_name: str
+    total: int
+    start: int
+    stop: int
+    meta: list
+    strategies: tuple[StrategyFactory, ...]
+    initial_balance: float
+    risk_config: RiskConfig
+    cache: BacktestCache | None = None
+    profile: bool = False
+
+
+def _run_job(job: _Job) -> BacktestResult:
+    bars = load_bars(job.shm_name, job.total, job.start, job.stop, job.meta)
+    engine = BacktestEngine(job.initial_balance, job.risk_config, job.cache, job.profile)
+    for factory in job.strategies:
+        engine.add_strategy(factory())
+    return engine.run(bars)
+
+
+class ParallelBacktestRunner:
+    """Runs independent per-symbol backtests on a process pool.
+
+    Results come back as {key: BacktestResult} in input order, ready for
+    BacktestDashboardData.from_results(). Keys are symbols, or
+    "SYMBOL/set" when run() is given named strategy sets.
+    """
+
+    def __init__(
+        self,
+        initial_balance: float,
+        risk_config: RiskConfig,
+        max_workers: int | None = None,
+        cache: BacktestCache | None = None,
+        profile: bool = False,
+    ) -> None:
+        self._initial_balance = initial_balance
+        self._risk_config = risk_config
+        self._cache = cache
+        self._profile = profile
+        self._max_workers = max_workers or os.cpu_count() or 1
+
+    @property
+    def max_workers(self) -> int:
+        return self._max_workers
+
+    def run(
+        self,
+        bars_by_symbol: Mapping[str, Sequence[Bar]],
+        strategies: Sequence[StrategyFactory] | Mapping[str, Sequence[StrategyFactory]],
+    ) -> dict[str, BacktestResult]:
+        """Backtest every symbol with every strategy set.
+
+        A job failing in a worker cancels the jobs not yet started and
+        re-raises its exception here.
+        """
+        strategy_sets = (
+            {name: tuple(factories) for name, factories in strategies.items()}
+            if isinstance(strategies, Mapping)
+            else {None: tuple(strategies)}
+        )
+        shared = SharedBars(bars_by_symbol)
+        try:
+            jobs = [
+                _Job(
+                    key=symbol if name is None else f"{symbol}/{name}",
+                    shm_name=shared.shm.name,
+                    total=shared.total,
+                    start=start,
+                    stop=stop,
+                    meta=meta,
+                    strategies=factories,
+                    initial_balance=self._initial_balance,
+                    risk_config=self._risk_config,
+                    cache=self._cache,
+                    profile=self._profile,
+                )
+                for symbol, (start, stop, meta) in shared.slices.items()
+                for name, factories in strategy_sets.items()
+            ]
+            results = run_jobs(
+                _run_job, jobs, self._max_workers, weight=lambda job: job.stop - job.start,
+            )
+        finally:
+            shared.close()
+        return {job.key: result for job, result in zip(jobs, results)}
+
+
+def run_jobs(
+    fn: Callable[[J], R],
+    jobs: Sequence[J],
+    max_workers: int,
+    weight: Callable[[J], int] | None = None,
+) -> list[R]:
+    """fn(job) for every job on up to `max_workers` processes, in job order.
+
+    Jobs are submitted heaviest `weight` first so a big job does not start
+    last and idle the pool. The first failure cancels the jobs not yet
+    started and is re-raised here. With one worker (or one job) everything
+    runs in-process.
+    """
+    workers = min(max_workers, len(jobs))
+    if workers <= 1:
+        return [fn(job) for job in jobs]
+    order = list(range(len(jobs)))
+    if weight is not None:
+        order.sort(key=lambda i: weight(jobs[i]), reverse=True)
+    with ProcessPoolExecutor(max_workers=workers) as pool:
+        futures = {pool.submit(fn, jobs[i]): i for i in order}
+        done, pending = wait(futures, return_when=FIRST_EXCEPTION)
+        failed = next((f for f in done if f.exception() is not None), None)
+        if failed is not None:
+            for future in pending:
+                future.cancel()
+            raise failed.exception()
+        results: list = [None] * len(jobs)
+        for future in done:
+            results[futures[future]] = future.result()
+        return results
@@ -0,0 +1,69 @@
+"""Per-stage timing of backtest runs.
+
+Engines built with profile=True time each stage of the replay (indicator
+compute, each strategy's on_context, risk checks, execution, equity
+marking, and for rotation backtests the rotation manager calls) with
+perf_counter and count the calls. The totals come back on the result's
+`profile`. Without profiling the engines only test a None local per stage.
+"""
+from __future__ import annotations
+
+from collections.abc import Iterable
+from dataclasses import dataclass, field
+
+
+@dataclass
+class StageStats:
+    calls: int = 0
+    seconds: float = 0.0
+
+
+@dataclass
+class BacktestProfile:
+    """Call counts and wall time per stage of one or more backtests.
+
+    `wall_seconds` is the time of the whole run(s); what the stages do not
+    cover (bar history, context building, bookkeeping) shows as "other".
+    """
+
+    stages: dict[str, StageStats] = field(default_factory=dict)
+    wall_seconds: float = 0.0
+
+    def add(self, stage: str, seconds: float, calls: int = 1) -> None:
+        stats = self.stages.get(stage)
+        if stats is None:
+            stats = self.stages[stage] = StageStats()
+        stats.calls += calls
+        stats.seconds += seconds
+
+    @classmethod
+    def merge(cls, profiles: Iterable[BacktestProfile | None]) -> BacktestProfile:
+        """Sum of several profiles (e.g. one per symbol); None entries are skipped."""
+        merged = cls()
+        for profile in profiles:
+            if profile is None:
+                continue
+            merged.wall_seconds += profile.wall_seconds
+            for stage, stats in profile.stages.items():
+                merged.add(stage, stats.seconds, stats.calls)
+        return merged
+
+    def format(self) -> str:
+        """Stages by time spent, as a printable table."""
+        rows = sorted(self.stages.items(), key=lambda item: item[1].seconds, reverse=True)
+        other = max(0.0, self.wall_seconds - sum(stats.seconds for _, stats in rows))
+        total = self.wall_seconds or 1.0
+        lines = [
+            f"  {'Stage':<32}{'Calls':>10}{'Total ms':>12}{'us/call':>10}{'Share':>8}",
+            "  " + "-" * 72,
+        ]
+        for stage, stats in rows:
+            per_call = stats.seconds / stats.calls * 1e6 if stats.calls else 0.0
+            lines.append(
+                f"  {stage:<32}{stats.calls:>10}{stats.seconds * 1e3:>12.1f}"
+                f"{per_call:>10.1f}{stats.seconds / total:>8.1%}"
+            )
+        lines.append(f"  {'other':<32}{'':>10}{other * 1e3:>12.1f}{'':>10}{other / total:>8.1%}")
+        lines.append("  " + "-" * 72)
+        lines.append(f"  {'total':<32}{'':>10}{self.wall_seconds * 1e3:>12.1f}")
+        return "\n".join(lines)
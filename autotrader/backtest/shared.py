@@ -0,0 +1,237 @@
+"""Building blocks shared by the process-parallel backtest drivers.
+
+ParallelBacktestRunner, ParameterSweep and WalkForwardOptimizer all hand
+bars (and, for the sweeps, precomputed indicator tables) to pool workers
+through shared memory instead of pickling them, and the two optimizers
+evaluate strategy configurations the same way. This module holds both:
+
+- SharedBars / load_bars(): every symbol's bar columns in one block (the
+  layout BarHistory uses), and a worker-side loader for one symbol's slice.
+- SharedTables / load_series(): stacked indicator tables row-aligned with a
+  SharedBars block, and the matching loader.
+- configure_strategy(), evaluate_configs(), indicator_tables() and
+  combined_metrics(): backtesting configurations of strategy class
+  constants against shared indicator series and combining the per-symbol
+  results.
+"""
+from __future__ import annotations
+
+from collections.abc import Mapping, Sequence
+from dataclasses import dataclass
+from multiprocessing import shared_memory
+from typing import Any
+
+import numpy as np
+
+from autotrader.backtest.cache import BacktestCache
+from autotrader.backtest.engine import BacktestEngine, BacktestResult
+from autotrader.core.bar_history import BarHistory
+from autotrader.core.config import RiskConfig
+from autotrader.core.types import Bar
+from autotrader.indicators.base import SeriesValue
+from autotrader.indicators.engine import IndicatorEngine
+from autotrader.indicators.snapshot import SnapshotLayout
+from autotrader.portfolio.performance import calculate_metrics
+from autotrader.strategy.base import Strategy
+
+# One configuration: per strategy class, the constants it overrides
+Config = tuple[tuple[type[Strategy], dict[str, Any]], ...]
+
+_PRICE_ROWS = 5
+
+
+class SharedBars:
+    """Every symbol's bar columns in one shared-memory block.
+
+    Rows are laid out as BarHistory.get_state() arrays concatenated along
+    the bar axis: prices (5, total) float64, then timestamps (total,) int64,
+    then meta codes (total,) int32. `slices` maps each symbol to its
+    (start, stop, meta) arguments for load_bars().
+    """
+
+    def __init__(self, bars_by_symbol: Mapping[str, Sequence[Bar]]) -> None:
+        states = {
+            symbol: BarHistory(maxlen=max(1, len(bars)), bars=bars).get_state()
+            for symbol, bars in bars_by_symbol.items()
+        }
+        self.total = sum(len(s["timestamps"]) for s in states.values())
+        self.shm = shared_memory.SharedMemory(create=True, size=_block_size(self.total))
+        prices, timestamps, codes = _views(self.shm, self.total)
+        self.slices: dict[str, tuple[int, int, list]] = {}
+        start = 0
+        for symbol, state in states.items():
+            stop = start + len(state["timestamps"])
+            prices[:, start:stop] = state["prices"]
+            timestamps[start:stop] = state["timestamps"]
+            codes[start:stop] = state["meta_codes"]
+            self.slices[symbol] = (start, stop, state["meta"])
+            start = stop
+        del prices, timestamps, codes
+
+    def close(self) -> None:
+        self.shm.close()
+        self.shm.unlink()
+
+
+def _block_size(total: int) -> int:
+    # SharedMemory rejects a zero size
+    return max(1, total * (_PRICE_ROWS * 8 + 8 + 4))
+
+
+def _views(
+    shm: shared_memory.SharedMemory, total: int,
+) -> tuple[np.ndarray, np.ndarray, np.ndarray]:
+    prices = np.ndarray((_PRICE_ROWS, total), dtype=np.float64, buffer=shm.buf)
+    offset = prices.nbytes
+    timestamps = np.ndarray((total,), dtype=np.int64, buffer=shm.buf, offset=offset)
+    offset += timestamps.nbytes
+    codes = np.ndarray((total,), dtype=np.int32, buffer=shm.buf, offset=offset)
+    return prices, timestamps, codes
+
+
+def load_bars(shm_name: str, total: int, start: int, stop: int, meta: list) -> list[Bar]:
+    """Bars [start, stop) of the SharedBars block named `shm_name`."""
+    # Pool workers share the parent's resource tracker, so attaching here
+    # does not make the block look leaked when the worker exits
+    shm = shared_memory.SharedMemory(name=shm_name)
+    try:
+        prices, timestamps, codes = _views(shm, total)
+        window = slice(start, stop)
+        history = BarHistory.from_state({
+            "maxlen": max(1, stop - start),
+            "prices": prices[:, window],
+            "timestamps": timestamps[window],
+            "meta_codes": codes[window],
+            "meta": meta,
+        })
+        del prices, timestamps, codes
+        return list(history)
+    finally:
+        shm.close()
+
+
+class SharedTables:
+    """Every symbol's stacked indicator table, row-aligned with a SharedBars block."""
+
+    def __init__(
+        self, layout: SnapshotLayout, shared: SharedBars, tables: Mapping[str, np.ndarray],
+    ) -> None:
+        self.layout = layout
+        self.shm = shared_memory.SharedMemory(
+            create=True, size=max(1, shared.total * layout.size * 8),
+        )
+        view = _table_view(self.shm, shared.total, layout.size)
+        for symbol, (start, stop, _meta) in shared.slices.items():
+            view[start:stop] = tables[symbol]
+        del view
+
+    def close(self) -> None:
+        self.shm.close()
+        self.shm.unlink()
+
+
+def load_series(
+    shm_name: str, total: int, layout: SnapshotLayout, start: int, stop: int,
+) -> dict[str, SeriesValue]:
+    """Indicator series for rows [start, stop) of the SharedTables block `shm_name`."""
+    shm = shared_memory.SharedMemory(name=shm_name)
+    try:
+        view = _table_view(shm, total, layout.size)
+        table = np.array(view[start:stop])
+        del view
+    finally:
+        shm.close()
+    return layout.unstack(table)
+
+
+def _table_view(shm: shared_memory.SharedMemory, total: int, size: int) -> np.ndarray:
+    return np.ndarray((total, size), dtype=np.float64, buffer=shm.buf)
+
+
+def configure_strategy(cls: type[Strategy], params: Mapping[str, Any]) -> Strategy:
+    """Instance of `cls` with class constants overridden by `params`.
+
+    The overrides are set on the instance before __init__ runs, so
+    indicator specs built from periods (RSI_PERIOD, BB_PERIOD, ...) pick
+    them up as well. Values derived from constants at class level are not
+    recomputed, so strategies derive them in __init__ (see lookback_bars).
+    """
+    strategy = cls.__new__(cls)
+    strategy.__dict__.update(params)
+    strategy.__init__()
+    return strategy
+
+
+@dataclass(frozen=True)
+class ConfigRun:
+    """The parts of one configuration's backtest on one symbol that sweeps keep."""
+
+    index: int
+    pnls: list[float]
+    metrics: dict
+    final_equity: float
+
+    @classmethod
+    def from_result(cls, index: int, result: BacktestResult) -> ConfigRun:
+        return cls(
+            index=index,
+            pnls=[trade.pnl for trade in result.trades],
+            metrics=result.metrics,
+            final_equity=result.final_equity,
+        )
+
+
+def evaluate_configs(
+    bars: list[Bar],
+    series: Mapping[str, SeriesValue],
+    configs: Sequence[tuple[int, Config]],
+    initial_balance: float,
+    risk_config: RiskConfig,
+    cache: BacktestCache | None = None,
+) -> list[ConfigRun]:
+    """Backtest each (index, config) over `bars` with precomputed `series`."""
+    runs = []
+    for index, config in configs:
+        engine = BacktestEngine(initial_balance, risk_config, cache)
+        for cls, params in config:
+            engine.add_strategy(configure_strategy(cls, params))
+        runs.append(ConfigRun.from_result(index, engine.run(bars, series)))
+    return runs
+
+
+def _union_engine(configs: Sequence[Config]) -> IndicatorEngine:
+    """Engine holding every indicator any configuration registers."""
+    engine = IndicatorEngine()
+    for config in configs:
+        for cls, params in config:
+            for spec in configure_strategy(cls, params).required_indicators:
+                engine.register(spec)
+    return engine
+
+
+def indicator_tables(
+    bars_by_symbol: Mapping[str, Sequence[Bar]], configs: Sequence[Config],
+) -> tuple[SnapshotLayout, dict[str, np.ndarray]]:
+    """Stacked series of every indicator any of `configs` needs, per symbol."""
+    # Shared periods across configurations are computed once per symbol
+    engine = _union_engine(configs)
+    layout = engine.layout
+    tables = {
+        symbol: layout.stack(engine.compute_series(bars), len(bars))
+        for symbol, bars in bars_by_symbol.items()
+    }
+    return layout, tables
+
+
+def combined_metrics(runs: Mapping[str, ConfigRun], initial_balance: float) -> dict:
+    """calculate_metrics() over every symbol's trades, each symbol its own account.
+
+    max_drawdown is the worst single symbol's; final_equity sums the accounts.
+    """
+    pnls = [pnl for run in runs.values() for pnl in run.pnls]
+    metrics = calculate_metrics(pnls, initial_balance * max(1, len(runs)))
+    metrics["max_drawdown"] = max(
+        (run.metrics["max_drawdown"] for run in runs.values()), default=0.0,
+    )
+    metrics["final_equity"] = sum(run.final_equity for run in runs.values())
+    return metrics
@@ -1,6 +1,7 @@
 from __future__ import annotations
 
-from autotrader.core.types import Order, OrderResult, Signal
+from autotrader.core.types import OrderResult, Signal
+from autotrader.portfolio.ledger import Ledger
 from autotrader.risk.position_sizer import PositionSizer
 from autotrader.core.config import RiskConfig
 from autotrader.core.types import AccountInfo
@@ -9,63 +10,69 @@ import uuid
 
 
 class BacktestSimulator:
+    """Fills signals at a given price against a Ledger.
+
+    Holds at most one position per symbol: "long" and "short" open one
+    (sized by PositionSizer, with the notional covered by the ledger's
+    buying power, so short proceeds never fund further entries), "close"
+    exits it. Callers mark() each bar's close so equity and sizing see
+    current prices.
+    """
+
     def __init__(self, initial_balance: float, risk_config: RiskConfig) -> None:
-        self._cash = initial_balance
-        self._positions: dict[str, _SimPosition] = {}
+        self._ledger = Ledger(initial_balance)
         self._sizer = PositionSizer(risk_config)
 
+    @property
+    def ledger(self) -> Ledger:
+        return self._ledger
+
+    def mark(self, symbol: str, price: float) -> None:
+        self._ledger.mark(symbol, price)
+
     def execute_signal(self, signal: Signal, price: float) -> OrderResult | None:
-        account = self._get_account()
+        ledger = self._ledger
 
-        if signal.direction == "long":
-            qty = self._sizer.calculate(price, account)
+        if signal.direction in ("long", "short"):
+            if signal.symbol in ledger:
+                return None
+            qty = self._sizer.calculate(price, self.get_account())
             if qty <= 0:
                 return None
-            cost = qty * price
-            if cost > self._cash:
+            if qty * price > ledger.buying_power:
                 return None
-            self._cash -= cost
-            self._positions[signal.symbol] = _SimPosition(signal.symbol, qty, price)
+            ledger.fill(signal.symbol, qty if signal.direction == "long" else -qty, price)
             return OrderResult(str(uuid.uuid4()), signal.symbol, "filled", qty, price)
 
         elif signal.direction == "close":
-            pos = self._positions.pop(signal.symbol, None)
+            pos = ledger.position(signal.symbol)
             if pos is None:
                 return None
-            proceeds = pos.quantity * price
-            self._cash += proceeds
-            return OrderResult(str(uuid.uuid4()), signal.symbol, "filled", pos.quantity, price)
+            qty = pos.quantity
+            ledger.fill(signal.symbol, -qty, price)
+            return OrderResult(str(uuid.uuid4()), signal.symbol, "filled", abs(qty), price)
 
         return None
 
     def get_pnl(self, symbol: str, current_price: float) -> float:
-        pos = self._positions.get(symbol)
+        pos = self._ledger.position(symbol)
         if not pos:
             return 0.0
         return (current_price - pos.avg_price) * pos.quantity
 
-    def _get_account(self) -> AccountInfo:
-        equity = self._cash + sum(p.quantity * p.avg_price for p in self._positions.values())
-        return AccountInfo("backtest", self._cash, equity, self._cash, equity)
+    def get_account(self) -> AccountInfo:
+        ledger = self._ledger
+        equity = ledger.equity
+        return AccountInfo("backtest", ledger.buying_power, equity, ledger.cash, equity)
 
     @property
     def equity(self) -> float:
-        return self._cash + sum(p.quantity * p.avg_price for p in self._positions.values())
+        return self._ledger.equity
 
-    def get_equity_with_prices(self, prices: dict[str, float]) -> float:
-        market_value = sum(
-            p.quantity * prices.get(p.symbol, p.avg_price)
-            for p in self._positions.values()
-        )
-        return self._cash + market_value
+    @property
+    def open_symbols(self) -> list[str]:
+        return self._ledger.symbols
 
     @property
     def has_positions(self) -> bool:
-        return len(self._positions) > 0
-
-
-class _SimPosition:
-    def __init__(self, symbol: str, quantity: float, avg_price: float) -> None:
-        self.symbol = symbol
-        self.quantity = quantity
-        self.avg_price = avg_price
+        return len(self._ledger) > 0
@@ -0,0 +1,252 @@
+"""Parameter sweeps over strategy class constants.
+
+Strategy thresholds and periods are class constants (RSI_OVERSOLD,
+SQUEEZE_THRESHOLD, TIMEOUT_BARS, ...). A sweep grid maps each strategy class
+to candidate values for some of them; every combination across the grid is
+one configuration, backtested on every symbol.
+
+Indicator series are the expensive, shared part: ParameterSweep computes the
+union of indicators any configuration needs once per symbol, packs those
+series (with the bars) into shared memory, and the workers replay each
+configuration through BacktestEngine.run() against the cached arrays.
+"""
+from __future__ import annotations
+
+import itertools
+import math
+import os
+from collections.abc import Mapping, Sequence
+from dataclasses import dataclass, field
+from typing import Any
+
+from autotrader.backtest.cache import BacktestCache
+from autotrader.backtest.parallel import run_jobs
+from autotrader.backtest.shared import (
+    Config,
+    ConfigRun,
+    SharedBars,
+    SharedTables,
+    combined_metrics,
+    configure_strategy,
+    evaluate_configs,
+    indicator_tables,
+    load_bars,
+    load_series,
+)
+from autotrader.core.config import RiskConfig
+from autotrader.core.types import Bar
+from autotrader.indicators.snapshot import SnapshotLayout
+from autotrader.strategy.base import Strategy
+
+__all__ = [
+    "Config",
+    "ParamGrid",
+    "ParameterSweep",
+    "SweepResult",
+    "configure_strategy",
+    "expand_grid",
+    "rank_results",
+    "summarize",
+]
+
+ParamGrid = Mapping[type[Strategy], Mapping[str, Sequence[Any]]]
+
+# Jobs per worker; more, smaller jobs keep the pool busy at the tail
+_JOBS_PER_WORKER = 4
+
+
+def expand_grid(grid: ParamGrid) -> list[Config]:
+    """Every configuration of `grid`, in grid order (last parameter fastest).
+
+    Raises ValueError for a name that is not an upper-case class constant
+    of its strategy, or a parameter with no candidate values.
+    """
+    axes: list[list[tuple[type[Strategy], str, Any]]] = []
+    for cls, params in grid.items():
+        for name, values in params.items():
+            if not name.isupper() or not hasattr(cls, name):
+                raise ValueError(f"{cls.__name__} has no parameter {name}")
+            if not values:
+                raise ValueError(f"No values given for {cls.__name__}.{name}")
+            axes.append([(cls, name, value) for value in values])
+    configs = []
+    for combo in itertools.product(*axes):
+        overrides: dict[type[Strategy], dict[str, Any]] = {cls: {} for cls in grid}
+        for cls, name, value in combo:
+            overrides[cls][name] = value
+        configs.append(tuple(overrides.items()))
+    return configs
+
+
+@dataclass(frozen=True)
+class SweepResult:
+    """One configuration's backtest across every symbol.
+
+    `params` maps strategy name to its overridden constants. `metrics` are
+    calculate_metrics() over all symbols' trades combined, except that
+    max_drawdown is the worst single symbol's; `final_equity` sums the
+    per-symbol accounts.
+    """
+
+    params: dict[str, dict[str, Any]]
+    metrics: dict
+    per_symbol: dict[str, dict] = field(default_factory=dict)
+
+    def row(self) -> dict[str, Any]:
+        """Flat {"strategy.PARAM": value, ..., metric: value} table row."""
+        out: dict[str, Any] = {
+            f"{strategy}.{name}": value
+            for strategy, params in self.params.items()
+            for name, value in params.items()
+        }
+        out.update(self.metrics)
+        return out
+
+
+@dataclass(frozen=True)
+class _SweepJob:
+    symbol: str
+    bars_shm: str
+    bars_total: int
+    table_shm: str
+    layout: SnapshotLayout
+    start: int
+    stop: int
+    meta: list
+    configs: tuple[tuple[int, Config], ...]
+    initial_balance: float
+    risk_config: RiskConfig
+    cache: BacktestCache | None = None
+
+
+def _run_sweep_job(job: _SweepJob) -> list[ConfigRun]:
+    bars = load_bars(job.bars_shm, job.bars_total, job.start, job.stop, job.meta)
+    series = load_series(job.table_shm, job.bars_total, job.layout, job.start, job.stop)
+    return evaluate_configs(
+        bars, series, job.configs, job.initial_balance, job.risk_config, job.cache,
+    )
+
+
+def summarize(
+    config: Config, runs: Mapping[str, ConfigRun], initial_balance: float,
+) -> SweepResult:
+    """SweepResult of `config` from its per-symbol runs."""
+    return SweepResult(
+        params={cls.name: dict(params) for cls, params in config},
+        metrics=combined_metrics(runs, initial_balance),
+        per_symbol={
+            symbol: {**run.metrics, "final_equity": run.final_equity}
+            for symbol, run in runs.items()
+        },
+    )
+
+
+def rank_results(
+    results: Sequence[SweepResult], rank_by: str = "total_pnl", ascending: bool = False,
+) -> list[SweepResult]:
+    """Best `rank_by` metric first; ties keep their input order."""
+    return sorted(results, key=lambda r: r.metrics[rank_by], reverse=not ascending)
+
+
+class ParameterSweep:
+    """Backtests every configuration of a parameter grid on a process pool.
+
+    Usage::
+
+        sweep = ParameterSweep(100_000.0, RiskConfig())
+        ranked = sweep.run(bars_by_symbol, {
+            RsiMeanReversion: {"RSI_OVERSOLD": [25, 30, 35], "MAX_BARS_IN_POSITION": [3, 5, 7]},
+            BbSqueezeBreakout: {},
+        })
+        best = ranked[0]
+
+    Strategies with an empty grid run with their defaults in every
+    configuration.
+    """
+
+    def __init__(
+        self,
+        initial_balance: float,
+        risk_config: RiskConfig,
+        max_workers: int | None = None,
+        cache: BacktestCache | None = None,
+    ) -> None:
+        self._initial_balance = initial_balance
+        self._risk_config = risk_config
+        self._cache = cache
+        self._max_workers = max_workers or os.cpu_count() or 1
+
+    @property
+    def max_workers(self) -> int:
+        return self._max_workers
+
+    def run(
+        self,
+        bars_by_symbol: Mapping[str, Sequence[Bar]],
+        grid: ParamGrid,
+        rank_by: str = "total_pnl",
+        ascending: bool = False,
+    ) -> list[SweepResult]:
+        """Results for every configuration, best `rank_by` metric first.
+
+        Ties keep grid order. A failing configuration cancels the sweep and
+        re-raises its exception here.
+        """
+        configs = expand_grid(grid)
+        layout, tables = indicator_tables(bars_by_symbol, configs)
+        shared = SharedBars(bars_by_symbol)
+        try:
+            shared_tables = SharedTables(layout, shared, tables)
+            try:
+                jobs = self._jobs(shared, shared_tables, configs)
+                runs = run_jobs(
+                    _run_sweep_job, jobs, self._max_workers,
+                    weight=lambda job: (job.stop - job.start) * len(job.configs),
+                )
+            finally:
+                shared_tables.close()
+        finally:
+            shared.close()
+
+        per_config: list[dict[str, ConfigRun]] = [{} for _ in configs]
+        for job, job_runs in zip(jobs, runs):
+            for run in job_runs:
+                per_config[run.index][job.symbol] = run
+        results = [
+            summarize(
+                config,
+                {symbol: by_symbol[symbol] for symbol in bars_by_symbol},
+                self._initial_balance,
+            )
+            for config, by_symbol in zip(configs, per_config)
+        ]
+        return rank_results(results, rank_by, ascending)
+
+    def _jobs(
+        self, shared: SharedBars, tables: SharedTables, configs: list[Config],
+    ) -> list[_SweepJob]:
+        symbols = len(shared.slices)
+        chunks = min(
+            len(configs),
+            max(1, math.ceil(self._max_workers * _JOBS_PER_WORKER / max(1, symbols))),
+        )
+        chunk_size = math.ceil(len(configs) / chunks) if configs else 1
+        indexed = list(enumerate(configs))
+        return [
+            _SweepJob(
+                symbol=symbol,
+                bars_shm=shared.shm.name,
+                bars_total=shared.total,
+                table_shm=tables.shm.name,
+                layout=tables.layout,
+                start=start,
+                stop=stop,
+                meta=meta,
+                configs=tuple(indexed[i : i + chunk_size]),
+                initial_balance=self._initial_balance,
+                risk_config=self._risk_config,
+                cache=self._cache,
+            )
+            for symbol, (start, stop, meta) in shared.slices.items()
+            for i in range(0, len(indexed), chunk_size)
+        ]
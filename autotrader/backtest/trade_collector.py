@@ -71,6 +71,8 @@ class TradeCollector:
         entry_price = pending.entry_price
         exit_price = bar.close
         pnl_pct = (exit_price - entry_price) / entry_price if entry_price else 0.0
+        if pending.direction == "short":
+            pnl_pct = -pnl_pct
 
         detail = TradeDetail(
             trade_id=self._next_id,
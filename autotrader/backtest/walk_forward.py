@@ -0,0 +1,293 @@
+"""Walk-forward optimization.
+
+The bar timeline (every timestamp any symbol trades at) is cut into folds:
+an in-sample window on which a parameter grid is swept, followed by an
+out-of-sample window on which the best configuration is backtested. Rolling
+folds slide a fixed-length in-sample window forward; anchored folds keep it
+starting at the first bar. Out-of-sample windows tile the timeline after the
+first in-sample window, so their results stitch into one continuous record.
+
+Folds run concurrently on a process pool. Bars and the indicator series of
+every configuration are computed once in the parent and shared read-only
+through shared memory; indicators are causal, so slicing a window out of
+the full series gives every fold warmed-up values from its first bar.
+"""
+from __future__ import annotations
+
+import os
+from bisect import bisect_left
+from collections.abc import Mapping, Sequence
+from dataclasses import dataclass, field, replace
+from datetime import datetime
+
+from autotrader.backtest.engine import BacktestEngine, BacktestResult
+from autotrader.backtest.parallel import run_jobs
+from autotrader.backtest.shared import (
+    Config,
+    ConfigRun,
+    SharedBars,
+    SharedTables,
+    combined_metrics,
+    configure_strategy,
+    evaluate_configs,
+    indicator_tables,
+    load_bars,
+    load_series,
+)
+from autotrader.backtest.sweep import ParamGrid, SweepResult, expand_grid, rank_results, summarize
+from autotrader.core.config import RiskConfig
+from autotrader.core.types import Bar
+from autotrader.indicators.base import SeriesValue
+from autotrader.indicators.snapshot import SnapshotLayout
+from autotrader.portfolio.performance import calculate_metrics
+
+
+@dataclass(frozen=True)
+class Fold:
+    """One in-sample / out-of-sample split of the bar timeline.
+
+    Windows are half-open: in-sample is [train_start, test_start) and
+    out-of-sample is [test_start, test_end); test_end None runs to the end.
+    """
+
+    index: int
+    train_start: datetime
+    test_start: datetime
+    test_end: datetime | None
+
+
+def make_folds(
+    timestamps: Sequence[datetime],
+    train_bars: int,
+    test_bars: int,
+    anchored: bool = False,
+) -> list[Fold]:
+    """Folds over a sorted timeline of distinct timestamps.
+
+    The first fold trains on the first `train_bars` timestamps; each later
+    fold starts `test_bars` further on. The last out-of-sample window may
+    be shorter than `test_bars`.
+    """
+    if train_bars <= 0 or test_bars <= 0:
+        raise ValueError("train_bars and test_bars must be positive")
+    folds = []
+    for index, test_start in enumerate(range(train_bars, len(timestamps), test_bars)):
+        train_start = 0 if anchored else test_start - train_bars
+        test_stop = test_start + test_bars
+        folds.append(Fold(
+            index=index,
+            train_start=timestamps[train_start],
+            test_start=timestamps[test_start],
+            test_end=timestamps[test_stop] if test_stop < len(timestamps) else None,
+        ))
+    return folds
+
+
+@dataclass(frozen=True)
+class FoldResult:
+    """The configuration chosen in-sample and how it did out-of-sample."""
+
+    fold: Fold
+    in_sample: SweepResult
+    out_of_sample: dict[str, BacktestResult]
+
+    @property
+    def params(self) -> dict[str, dict]:
+        return self.in_sample.params
+
+
+@dataclass
+class WalkForwardResult:
+    """Per-fold choices plus the stitched out-of-sample record.
+
+    `results` holds one BacktestResult per symbol covering every
+    out-of-sample window back to back (ready for
+    BacktestDashboardData.from_results()). `metrics` combine all symbols the
+    way SweepResult.metrics do.
+    """
+
+    folds: list[FoldResult]
+    results: dict[str, BacktestResult]
+    metrics: dict = field(default_factory=dict)
+
+
+@dataclass(frozen=True)
+class _FoldJob:
+    fold: Fold
+    bars_shm: str
+    bars_total: int
+    table_shm: str
+    layout: SnapshotLayout
+    slices: dict[str, tuple[int, int, list]]
+    configs: tuple[Config, ...]
+    rank_by: str
+    ascending: bool
+    initial_balance: float
+    risk_config: RiskConfig
+
+
+def _window(series: Mapping[str, SeriesValue], start: int, stop: int) -> dict[str, SeriesValue]:
+    return {
+        key: (
+            {name: column[start:stop] for name, column in value.items()}
+            if isinstance(value, dict)
+            else value[start:stop]
+        )
+        for key, value in series.items()
+    }
+
+
+def _run_fold(job: _FoldJob) -> FoldResult:
+    fold = job.fold
+    windows: dict[str, tuple[list[Bar], dict[str, SeriesValue], int, int]] = {}
+    per_config: list[dict[str, ConfigRun]] = [{} for _ in job.configs]
+    indexed = list(enumerate(job.configs))
+    for symbol, (start, stop, meta) in job.slices.items():
+        bars = load_bars(job.bars_shm, job.bars_total, start, stop, meta)
+        stamps = [bar.timestamp for bar in bars]
+        lo = bisect_left(stamps, fold.train_start)
+        mid = bisect_left(stamps, fold.test_start)
+        hi = len(bars) if fold.test_end is None else bisect_left(stamps, fold.test_end)
+        series = load_series(job.table_shm, job.bars_total, job.layout, start + lo, start + hi)
+        windows[symbol] = (bars[lo:hi], series, mid - lo, hi - lo)
+        in_sample = evaluate_configs(
+            bars[lo:mid], _window(series, 0, mid - lo), indexed,
+            job.initial_balance, job.risk_config,
+        )
+        for run in in_sample:
+            per_config[run.index][symbol] = run
+
+    summaries = [
+        summarize(config, runs, job.initial_balance)
+        for config, runs in zip(job.configs, per_config)
+    ]
+    best = rank_results(summaries, job.rank_by, job.ascending)[0]
+    best_config = job.configs[next(i for i, s in enumerate(summaries) if s is best)]
+
+    out_of_sample: dict[str, BacktestResult] = {}
+    for symbol, (bars, series, mid, hi) in windows.items():
+        engine = BacktestEngine(job.initial_balance, job.risk_config)
+        for cls, params in best_config:
+            engine.add_strategy(configure_strategy(cls, params))
+        out_of_sample[symbol] = engine.run(bars[mid:hi], _window(series, mid, hi))
+    return FoldResult(fold=fold, in_sample=best, out_of_sample=out_of_sample)
+
+
+def stitch_results(results: Sequence[BacktestResult], initial_balance: float) -> BacktestResult:
+    """Chain consecutive backtests (each starting at `initial_balance`) into one.
+
+    Each run's equity is shifted by the profit of the runs before it, so the
+    stitched curve is what one account would show trading the windows back
+    to back at a constant stake. Trades are renumbered in order.
+    """
+    offset = 0.0
+    equity_curve = [initial_balance]
+    timestamped_equity: list[tuple] = []
+    trades = []
+    total_trades = 0
+    for result in results:
+        equity_curve.extend(equity + offset for equity in result.equity_curve[1:])
+        timestamped_equity.extend((ts, equity + offset) for ts, equity in result.timestamped_equity)
+        for trade in result.trades:
+            trades.append(replace(trade, trade_id=len(trades) + 1))
+        total_trades += result.total_trades
+        offset += result.final_equity - initial_balance
+    return BacktestResult(
+        total_trades=total_trades,
+        final_equity=equity_curve[-1],
+        metrics=calculate_metrics([trade.pnl for trade in trades], initial_balance),
+        equity_curve=equity_curve,
+        trades=trades,
+        timestamped_equity=timestamped_equity,
+    )
+
+
+class WalkForwardOptimizer:
+    """Walk-forward parameter optimization over BacktestEngine runs.
+
+    Usage::
+
+        optimizer = WalkForwardOptimizer(100_000.0, RiskConfig())
+        result = optimizer.run(
+            bars_by_symbol,
+            {RsiMeanReversion: {"RSI_OVERSOLD": [25, 30, 35]}},
+            train_bars=250, test_bars=60,
+        )
+        for fold in result.folds:
+            print(fold.fold.test_start, fold.params)
+    """
+
+    def __init__(
+        self,
+        initial_balance: float,
+        risk_config: RiskConfig,
+        max_workers: int | None = None,
+    ) -> None:
+        self._initial_balance = initial_balance
+        self._risk_config = risk_config
+        self._max_workers = max_workers or os.cpu_count() or 1
+
+    @property
+    def max_workers(self) -> int:
+        return self._max_workers
+
+    def run(
+        self,
+        bars_by_symbol: Mapping[str, Sequence[Bar]],
+        grid: ParamGrid,
+        train_bars: int,
+        test_bars: int,
+        anchored: bool = False,
+        rank_by: str = "total_pnl",
+        ascending: bool = False,
+    ) -> WalkForwardResult:
+        """Optimize `grid` on each fold's in-sample window by `rank_by` and
+        backtest the winner out-of-sample.
+
+        `train_bars` and `test_bars` count distinct timestamps across all
+        symbols. A failing fold cancels the run and re-raises here.
+        """
+        timeline = sorted({bar.timestamp for bars in bars_by_symbol.values() for bar in bars})
+        folds = make_folds(timeline, train_bars, test_bars, anchored)
+        configs = tuple(expand_grid(grid))
+        layout, tables = indicator_tables(bars_by_symbol, configs)
+        shared = SharedBars(bars_by_symbol)
+        try:
+            shared_tables = SharedTables(layout, shared, tables)
+            try:
+                jobs = [
+                    _FoldJob(
+                        fold=fold,
+                        bars_shm=shared.shm.name,
+                        bars_total=shared.total,
+                        table_shm=shared_tables.shm.name,
+                        layout=layout,
+                        slices=shared.slices,
+                        configs=configs,
+                        rank_by=rank_by,
+                        ascending=ascending,
+                        initial_balance=self._initial_balance,
+                        risk_config=self._risk_config,
+                    )
+                    for fold in folds
+                ]
+                # Anchored folds grow, so the later ones are the heavy ones
+                fold_results = run_jobs(
+                    _run_fold, jobs, self._max_workers, weight=lambda job: job.fold.index,
+                )
+            finally:
+                shared_tables.close()
+        finally:
+            shared.close()
+
+        results = {
+            symbol: stitch_results(
+                [fold.out_of_sample[symbol] for fold in fold_results], self._initial_balance,
+            )
+            for symbol in bars_by_symbol
+        }
+        metrics = combined_metrics(
+            {symbol: ConfigRun.from_result(0, result) for symbol, result in results.items()},
+            self._initial_balance,
+        )
+        return WalkForwardResult(folds=fold_results, results=results, metrics=metrics)
@@ -1,4 +1,5 @@
 from autotrader.core.types import Bar, Signal, Order, OrderResult, Position, AccountInfo, MarketContext
+from autotrader.core.bar_history import BarHistory
 from autotrader.core.event_bus import EventBus
 from autotrader.core.config import Settings, load_settings
 from autotrader.core.exceptions import AutoTraderError
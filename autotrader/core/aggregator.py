@@ -56,7 +56,8 @@ class DailyBarAggregator:
 
     Call add() with each incoming minute bar. When the trading date
     changes for a symbol, the previous day's accumulated bar is returned.
-    Call flush() or flush_all() to force output of current accumulators.
+    Call flush() or flush_all() to force output of current accumulators,
+    or partial() / partials() to read them while the session is still open.
     """
 
     def __init__(self) -> None:
@@ -103,6 +104,15 @@ class DailyBarAggregator:
         acc.update(bar)
         return None
 
+    def partial(self, symbol: str) -> Bar | None:
+        """In-progress daily bar for a symbol, without closing the day."""
+        acc = self._accumulators.get(symbol)
+        return acc.to_daily_bar() if acc is not None else None
+
+    def partials(self) -> list[Bar]:
+        """In-progress daily bars for every symbol with an open session."""
+        return [acc.to_daily_bar() for acc in self._accumulators.values()]
+
     def flush(self, symbol: str) -> Bar | None:
         """Force output the current accumulator for a symbol."""
         acc = self._accumulators.pop(symbol, None)
@@ -0,0 +1,298 @@
+"""Columnar ring buffer of recent bars.
+
+BarHistory stores open/high/low/close/volume as float64 columns and the
+timestamp as int64 microseconds since the epoch, so indicators can read
+zero-copy contiguous views of the most recent bars instead of rebuilding
+lists from Bar objects. It also behaves like a bounded deque[Bar]
+(len, indexing, iteration, append) so strategies that read
+``ctx.history[-21].close`` keep working; Bar objects are rebuilt on access.
+"""
+from __future__ import annotations
+
+from collections.abc import Iterable, Iterator, Sequence
+from datetime import datetime, timedelta, timezone, tzinfo
+from functools import lru_cache
+from zoneinfo import ZoneInfo
+
+import numpy as np
+
+from autotrader.core.types import Bar, Timeframe
+
+_UTC_EPOCH = datetime(1970, 1, 1, tzinfo=timezone.utc)
+_NAIVE_EPOCH = datetime(1970, 1, 1)
+_ONE_MICROSECOND = timedelta(microseconds=1)
+_MICROS_PER_HOUR = 3_600_000_000
+_MICROS_PER_DAY = 24 * _MICROS_PER_HOUR
+_US_EASTERN = ZoneInfo("America/New_York")
+
+_PRICE_FIELDS = ("open", "high", "low", "close", "volume")
+
+
+def timestamp_to_micros(ts: datetime) -> int:
+    """Encode a datetime as integer microseconds since the epoch (UTC if aware)."""
+    epoch = _NAIVE_EPOCH if ts.tzinfo is None else _UTC_EPOCH
+    return (ts - epoch) // _ONE_MICROSECOND
+
+
+def micros_to_timestamp(micros: int, tz: tzinfo | None) -> datetime:
+    """Inverse of timestamp_to_micros(); aware results are expressed in `tz`."""
+    if tz is None:
+        return _NAIVE_EPOCH + timedelta(microseconds=micros)
+    return (_UTC_EPOCH + timedelta(microseconds=micros)).astimezone(tz)
+
+
+@lru_cache(maxsize=4096)
+def _eastern_offset(hour: int) -> int:
+    """US Eastern UTC offset in microseconds during the UTC hour `hour`."""
+    moment = datetime.fromtimestamp(hour * 3600, tz=timezone.utc).astimezone(_US_EASTERN)
+    return moment.utcoffset() // _ONE_MICROSECOND
+
+
+def market_day(micros: int) -> int:
+    """US Eastern trading date of a timestamp_to_micros() value, as days since the epoch."""
+    return (micros + _eastern_offset(micros // _MICROS_PER_HOUR)) // _MICROS_PER_DAY
+
+
+def market_days(micros: np.ndarray) -> np.ndarray:
+    """market_day() of every element; offsets are looked up once per distinct hour."""
+    micros = np.asarray(micros, dtype=np.int64)
+    hours, inverse = np.unique(micros // _MICROS_PER_HOUR, return_inverse=True)
+    offsets = np.fromiter(
+        (_eastern_offset(int(h)) for h in hours), dtype=np.int64, count=len(hours),
+    )
+    return (micros + offsets[inverse].reshape(micros.shape)) // _MICROS_PER_DAY
+
+
+def _encode_tz(tz: tzinfo | None) -> str | float | None:
+    if tz is None:
+        return None
+    if isinstance(tz, ZoneInfo):
+        return tz.key
+    offset = tz.utcoffset(None)
+    if offset is None:
+        raise ValueError(f"Cannot persist timezone {tz!r}")
+    return offset.total_seconds()
+
+
+def _decode_tz(value: str | float | None) -> tzinfo | None:
+    if value is None:
+        return None
+    if isinstance(value, str):
+        return ZoneInfo(value)
+    if value == 0:
+        return timezone.utc
+    return timezone(timedelta(seconds=value))
+
+
+class BarHistory(Sequence[Bar]):
+    """Bounded, append-only bar history backed by NumPy columns.
+
+    Columns are allocated at twice `maxlen`; once the write position reaches
+    the end, the live window is copied back to the front. Every window is
+    therefore contiguous and appends stay amortized O(1).
+
+    Symbol, timeframe and timezone are kept per row as a small code into a
+    lookup table, so bars rebuilt from the columns compare equal to the
+    originals.
+    """
+
+    def __init__(self, maxlen: int, bars: Iterable[Bar] = ()) -> None:
+        if maxlen < 1:
+            raise ValueError(f"maxlen must be >= 1, got {maxlen}")
+        self._maxlen = maxlen
+        size = 2 * maxlen
+        self._prices = np.empty((len(_PRICE_FIELDS), size), dtype=np.float64)
+        self._timestamps = np.empty(size, dtype=np.int64)
+        self._meta_codes = np.empty(size, dtype=np.int32)
+        self._meta: list[tuple[str, Timeframe, tzinfo | None]] = []
+        self._meta_index: dict[tuple[str, Timeframe, tzinfo | None], int] = {}
+        self._start = 0
+        self._end = 0
+        self.extend(bars)
+
+    # ------------------------------------------------------------------
+    # deque-compatible interface
+    # ------------------------------------------------------------------
+
+    @property
+    def maxlen(self) -> int:
+        return self._maxlen
+
+    def __len__(self) -> int:
+        return self._end - self._start
+
+    def __getitem__(self, index):
+        if isinstance(index, slice):
+            return [self._bar_at(self._start + i) for i in range(*index.indices(len(self)))]
+        length = len(self)
+        if index < 0:
+            index += length
+        if not 0 <= index < length:
+            raise IndexError("BarHistory index out of range")
+        return self._bar_at(self._start + index)
+
+    def __iter__(self) -> Iterator[Bar]:
+        start, end = self._start, self._end
+        rows = zip(
+            *(column.tolist() for column in self._prices[:, start:end]),
+            self._timestamps[start:end].tolist(),
+            self._meta_codes[start:end].tolist(),
+        )
+        for open_, high, low, close, volume, micros, code in rows:
+            symbol, timeframe, tz = self._meta[code]
+            yield Bar(
+                symbol=symbol,
+                timestamp=micros_to_timestamp(micros, tz),
+                open=open_, high=high, low=low, close=close, volume=volume,
+                timeframe=timeframe,
+            )
+
+    def __repr__(self) -> str:
+        return f"BarHistory(len={len(self)}, maxlen={self._maxlen})"
+
+    def append(self, bar: Bar) -> None:
+        if self._end == self._timestamps.shape[0]:
+            self._compact()
+        pos = self._end
+        prices = self._prices
+        prices[0, pos] = bar.open
+        prices[1, pos] = bar.high
+        prices[2, pos] = bar.low
+        prices[3, pos] = bar.close
+        prices[4, pos] = bar.volume
+        self._timestamps[pos] = timestamp_to_micros(bar.timestamp)
+        self._meta_codes[pos] = self._meta_code(bar)
+        self._end = pos + 1
+        if self._end - self._start > self._maxlen:
+            self._start += 1
+
+    def extend(self, bars: Iterable[Bar]) -> None:
+        for bar in bars:
+            self.append(bar)
+
+    def clear(self) -> None:
+        self._start = 0
+        self._end = 0
+
+    def get_state(self) -> dict:
+        """Copy of the live window for persistence (see from_state()).
+
+        Array entries are NumPy arrays; everything else is JSON-compatible.
+        """
+        window = slice(self._start, self._end)
+        return {
+            "maxlen": self._maxlen,
+            "prices": self._prices[:, window].copy(),
+            "timestamps": self._timestamps[window].copy(),
+            "meta_codes": self._meta_codes[window].copy(),
+            "meta": [
+                [symbol, timeframe.value, _encode_tz(tz)]
+                for symbol, timeframe, tz in self._meta
+            ],
+        }
+
+    @classmethod
+    def from_state(cls, state: dict, maxlen: int | None = None) -> BarHistory:
+        """Rebuild a history from get_state(), optionally with a new maxlen."""
+        history = cls(maxlen if maxlen is not None else int(state["maxlen"]))
+        for symbol, timeframe, tz in state["meta"]:
+            history._meta_code_for((symbol, Timeframe(timeframe), _decode_tz(tz)))
+        timestamps = np.asarray(state["timestamps"], dtype=np.int64)
+        keep = min(len(timestamps), history._maxlen)
+        src = slice(len(timestamps) - keep, len(timestamps))
+        history._prices[:, :keep] = state["prices"][:, src]
+        history._timestamps[:keep] = timestamps[src]
+        history._meta_codes[:keep] = state["meta_codes"][src]
+        history._end = keep
+        return history
+
+    # ------------------------------------------------------------------
+    # Columnar access
+    # ------------------------------------------------------------------
+
+    def column(self, field: str, last: int | None = None) -> np.ndarray:
+        """Read-only view of one price column ("open" ... "volume")."""
+        view = self._prices[_PRICE_FIELDS.index(field), self._window(last)]
+        view.flags.writeable = False
+        return view
+
+    def columns(self, last: int | None = None) -> dict[str, np.ndarray]:
+        """Read-only views of all price columns and timestamps, shaped like bar_columns().
+
+        Views alias the ring buffer and are only valid until the next append().
+        """
+        window = self._window(last)
+        views = {}
+        for row, field in enumerate(_PRICE_FIELDS):
+            view = self._prices[row, window]
+            view.flags.writeable = False
+            views[field] = view
+        timestamps = self._timestamps[window]
+        timestamps.flags.writeable = False
+        views["timestamp"] = timestamps
+        return views
+
+    @property
+    def opens(self) -> np.ndarray:
+        return self.column("open")
+
+    @property
+    def highs(self) -> np.ndarray:
+        return self.column("high")
+
+    @property
+    def lows(self) -> np.ndarray:
+        return self.column("low")
+
+    @property
+    def closes(self) -> np.ndarray:
+        return self.column("close")
+
+    @property
+    def volumes(self) -> np.ndarray:
+        return self.column("volume")
+
+    @property
+    def timestamps(self) -> np.ndarray:
+        """Read-only view of timestamps as int64 microseconds (see timestamp_to_micros)."""
+        view = self._timestamps[self._window(None)]
+        view.flags.writeable = False
+        return view
+
+    # ------------------------------------------------------------------
+    # Internals
+    # ------------------------------------------------------------------
+
+    def _window(self, last: int | None) -> slice:
+        start = self._start if last is None else max(self._start, self._end - last)
+        return slice(start, self._end)
+
+    def _compact(self) -> None:
+        length = len(self)
+        src = slice(self._start, self._end)
+        self._prices[:, :length] = self._prices[:, src]
+        self._timestamps[:length] = self._timestamps[src]
+        self._meta_codes[:length] = self._meta_codes[src]
+        self._start = 0
+        self._end = length
+
+    def _meta_code(self, bar: Bar) -> int:
+        return self._meta_code_for((bar.symbol, bar.timeframe, bar.timestamp.tzinfo))
+
+    def _meta_code_for(self, key: tuple[str, Timeframe, tzinfo | None]) -> int:
+        code = self._meta_index.get(key)
+        if code is None:
+            code = len(self._meta)
+            self._meta.append(key)
+            self._meta_index[key] = code
+        return code
+
+    def _bar_at(self, pos: int) -> Bar:
+        symbol, timeframe, tz = self._meta[self._meta_codes[pos]]
+        prices = self._prices[:, pos].tolist()
+        return Bar(
+            symbol=symbol,
+            timestamp=micros_to_timestamp(int(self._timestamps[pos]), tz),
+            open=prices[0], high=prices[1], low=prices[2], close=prices[3],
+            volume=prices[4], timeframe=timeframe,
+        )
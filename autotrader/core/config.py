@@ -49,18 +49,40 @@ class DataConfig(BaseModel):
 
     model_config = ConfigDict(use_enum_values=True)
 
-    bar_history_size: int = 500
+    # Bars kept per symbol; None derives it from the registered indicators
+    # (see IndicatorEngine.history_bars) at indicator_tolerance.
+    bar_history_size: int | None = None
+    indicator_tolerance: float = 1e-3
     store_type: Literal["sqlite", "postgres"] = "sqlite"
     sqlite_path: str = "data/autotrader.db"
+    enable_state_snapshot: bool = False
+    state_snapshot_path: str = "data/state_snapshot.npz"
+    state_snapshot_interval_seconds: int = 300
 
     @field_validator("bar_history_size")
     @classmethod
-    def validate_bar_history_size(cls, v: int) -> int:
-        """Validate that bar_history_size is positive."""
-        if v <= 0:
+    def validate_bar_history_size(cls, v: int | None) -> int | None:
+        """Validate that bar_history_size, if set, is positive."""
+        if v is not None and v <= 0:
             raise ValueError("bar_history_size must be positive")
         return v
 
+    @field_validator("indicator_tolerance")
+    @classmethod
+    def validate_indicator_tolerance(cls, v: float) -> float:
+        """Validate that indicator_tolerance is between 0 and 1."""
+        if not 0 < v < 1:
+            raise ValueError("indicator_tolerance must be between 0 and 1")
+        return v
+
+    @field_validator("state_snapshot_interval_seconds")
+    @classmethod
+    def validate_snapshot_interval(cls, v: int) -> int:
+        """Validate that state_snapshot_interval_seconds is positive."""
+        if v <= 0:
+            raise ValueError("state_snapshot_interval_seconds must be positive")
+        return v
+
 
 class RiskConfig(BaseModel):
     """Risk management configuration."""
@@ -5,7 +5,7 @@ AutoTrader system for representing market data, signals, orders, and account sta
 """
 from __future__ import annotations
 
-from collections import deque
+from collections.abc import Mapping, Sequence
 from dataclasses import dataclass, field
 from datetime import datetime
 from enum import Enum
@@ -161,11 +161,13 @@ class MarketContext:
     Attributes:
         symbol: Trading symbol this context represents.
         bar: Current/latest bar for this symbol.
-        indicators: Dictionary of calculated indicators and their values.
-                   Values can be floats or nested dicts for complex indicators.
-        history: Deque of historical bars for this symbol (for lookback analysis).
+        indicators: Calculated indicators by key (an IndicatorSnapshot from the
+                   engines, or a plain dict). Values can be floats or nested
+                   dicts for complex indicators.
+        history: Recent bars for this symbol, oldest first (for lookback analysis).
+                 Usually a BarHistory; any deque-like sequence of bars works.
     """
     symbol: str
     bar: Bar
-    indicators: dict[str, float | dict | None]
-    history: deque[Bar]
+    indicators: Mapping[str, float | dict | None]
+    history: Sequence[Bar]
@@ -1,5 +1,6 @@
 from __future__ import annotations
 
+from collections.abc import AsyncIterator, Sequence
 from datetime import datetime, timezone
 
 import aiosqlite
@@ -45,24 +46,62 @@ class SQLiteStore(DataStore):
     async def save_bars(self, bars: list[Bar]) -> None:
         assert self._db is not None
         await self._db.executemany(
-            "INSERT OR IGNORE INTO bars (symbol, timestamp, open, high, low, close, volume, timeframe) VALUES (?, ?, ?, ?, ?, ?, ?, ?)",
-            [(b.symbol, b.timestamp.isoformat(), b.open, b.high, b.low, b.close, b.volume, b.timeframe.value) for b in bars],
+            "INSERT OR IGNORE INTO bars "
+            "(symbol, timestamp, open, high, low, close, volume, timeframe) "
+            "VALUES (?, ?, ?, ?, ?, ?, ?, ?)",
+            [
+                (
+                    b.symbol, b.timestamp.isoformat(), b.open, b.high, b.low, b.close,
+                    b.volume, b.timeframe.value,
+                )
+                for b in bars
+            ],
         )
         await self._db.commit()
 
     async def load_bars(self, symbol: str, start: datetime, end: datetime) -> list[Bar]:
         assert self._db is not None
         cursor = await self._db.execute(
-            "SELECT symbol, timestamp, open, high, low, close, volume, timeframe FROM bars WHERE symbol = ? AND timestamp >= ? AND timestamp < ? ORDER BY timestamp",
+            "SELECT symbol, timestamp, open, high, low, close, volume, timeframe FROM bars "
+            "WHERE symbol = ? AND timestamp >= ? AND timestamp < ? ORDER BY timestamp",
             (symbol, start.isoformat(), end.isoformat()),
         )
         rows = await cursor.fetchall()
-        return [
-            Bar(
-                symbol=r[0],
-                timestamp=datetime.fromisoformat(r[1]),
-                open=r[2], high=r[3], low=r[4], close=r[5], volume=r[6],
-                timeframe=Timeframe(r[7]) if len(r) > 7 and r[7] else Timeframe.DAILY,
-            )
-            for r in rows
-        ]
+        return [_row_to_bar(r) for r in rows]
+
+    async def iter_bars(
+        self,
+        symbols: Sequence[str],
+        start: datetime,
+        end: datetime,
+        batch_size: int = 10_000,
+    ) -> AsyncIterator[Bar]:
+        """Bars of `symbols` in [start, end), ordered by timestamp then symbol.
+
+        Rows are fetched `batch_size` at a time, so a long range streams
+        through memory instead of loading at once; feed it to the backtest
+        engines' run_stream_async().
+        """
+        assert self._db is not None
+        placeholders = ", ".join("?" for _ in symbols)
+        cursor = await self._db.execute(
+            "SELECT symbol, timestamp, open, high, low, close, volume, timeframe FROM bars "
+            f"WHERE symbol IN ({placeholders}) AND timestamp >= ? AND timestamp < ? "
+            "ORDER BY timestamp, symbol",
+            (*symbols, start.isoformat(), end.isoformat()),
+        )
+        try:
+            while rows := await cursor.fetchmany(batch_size):
+                for r in rows:
+                    yield _row_to_bar(r)
+        finally:
+            await cursor.close()
+
+
+def _row_to_bar(r: tuple) -> Bar:
+    return Bar(
+        symbol=r[0],
+        timestamp=datetime.fromisoformat(r[1]),
+        open=r[2], high=r[3], low=r[4], close=r[5], volume=r[6],
+        timeframe=Timeframe(r[7]) if len(r) > 7 and r[7] else Timeframe.DAILY,
+    )
@@ -0,0 +1,115 @@
+"""Snapshot file for warm restarts of the live trader.
+
+The snapshot holds each symbol's recent bar history as compressed NumPy
+columns plus a small JSON header for any other JSON-compatible state. On
+restart the trader loads it and only needs the bars printed since it was
+written, instead of re-downloading its full history.
+
+The live trader evaluates indicators from these bar windows (compute() over
+each BarHistory) rather than stepping them bar by bar, so the windows are
+all the indicator state it has to persist; it leaves `state` empty. A
+bar-by-bar consumer can store IndicatorEngine.get_state() there instead.
+
+Writes go to a temporary file that replaces the old snapshot in one rename,
+so a crash mid-write leaves the previous snapshot intact.
+"""
+from __future__ import annotations
+
+import json
+import logging
+import os
+from collections.abc import Mapping
+from dataclasses import dataclass, field
+from datetime import datetime, timezone
+from pathlib import Path
+
+import numpy as np
+
+from autotrader.core.bar_history import BarHistory
+
+logger = logging.getLogger(__name__)
+
+FORMAT_VERSION = 1
+
+_ARRAY_FIELDS = ("prices", "timestamps", "meta_codes")
+
+
+@dataclass
+class StateSnapshot:
+    """Contents of a snapshot file."""
+
+    saved_at: datetime
+    histories: dict[str, BarHistory]
+    state: dict = field(default_factory=dict)
+
+
+class StateSnapshotStore:
+    """Reads and atomically writes one snapshot file."""
+
+    def __init__(self, path: str | Path) -> None:
+        self._path = Path(path)
+
+    @property
+    def path(self) -> Path:
+        return self._path
+
+    def save(self, histories: Mapping[str, BarHistory], state: dict | None = None) -> None:
+        """Write `histories` and JSON-compatible `state`, replacing any old snapshot."""
+        symbols = [sym for sym, history in histories.items() if history]
+        arrays: dict[str, np.ndarray] = {}
+        meta: dict[str, dict] = {}
+        for i, symbol in enumerate(symbols):
+            history_state = histories[symbol].get_state()
+            for name in _ARRAY_FIELDS:
+                arrays[f"{i}.{name}"] = history_state[name]
+            meta[symbol] = {"maxlen": history_state["maxlen"], "meta": history_state["meta"]}
+
+        header = {
+            "version": FORMAT_VERSION,
+            "saved_at": datetime.now(timezone.utc).isoformat(),
+            "symbols": symbols,
+            "histories": meta,
+            "state": state or {},
+        }
+        arrays["header"] = np.array(json.dumps(header))
+
+        self._path.parent.mkdir(parents=True, exist_ok=True)
+        tmp_path = self._path.with_name(self._path.name + ".tmp")
+        with open(tmp_path, "wb") as f:
+            np.savez_compressed(f, **arrays)
+            f.flush()
+            os.fsync(f.fileno())
+        os.replace(tmp_path, self._path)
+
+    def load(self, maxlen: int | None = None) -> StateSnapshot | None:
+        """Read the snapshot, or None if it is missing or unreadable.
+
+        `maxlen` resizes the restored histories (e.g. after a change to
+        the derived history size); by default they keep their saved size.
+        """
+        if not self._path.exists():
+            return None
+        try:
+            with np.load(self._path, allow_pickle=False) as data:
+                header = json.loads(str(data["header"]))
+                if header.get("version") != FORMAT_VERSION:
+                    logger.warning(
+                        "Ignoring state snapshot %s with version %s",
+                        self._path, header.get("version"),
+                    )
+                    return None
+                histories = {}
+                for i, symbol in enumerate(header["symbols"]):
+                    history_state = {
+                        **header["histories"][symbol],
+                        **{name: data[f"{i}.{name}"] for name in _ARRAY_FIELDS},
+                    }
+                    histories[symbol] = BarHistory.from_state(history_state, maxlen=maxlen)
+        except Exception:
+            logger.exception("Failed to read state snapshot %s", self._path)
+            return None
+        return StateSnapshot(
+            saved_at=datetime.fromisoformat(header["saved_at"]),
+            histories=histories,
+            state=header["state"],
+        )
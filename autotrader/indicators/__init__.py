@@ -1,2 +1,9 @@
 from autotrader.indicators.base import Indicator, IndicatorSpec
 from autotrader.indicators.engine import IndicatorEngine
+from autotrader.indicators.panel import PanelIndicatorEngine
+from autotrader.indicators.snapshot import (
+    IndicatorSnapshot,
+    LazyIndicatorSnapshot,
+    SnapshotLayout,
+    SnapshotReader,
+)
@@ -1,22 +1,113 @@
 from __future__ import annotations
 
+import copy
 from abc import ABC, abstractmethod
 from collections import deque
+from collections.abc import Sequence
 from dataclasses import dataclass
 from typing import Any
 
+import numpy as np
+
+from autotrader.core.bar_history import BarHistory, timestamp_to_micros
 from autotrader.core.types import Bar
 
+BarColumns = dict[str, np.ndarray]
+SeriesValue = np.ndarray | dict[str, np.ndarray]
+
+
+def bar_columns(bars: Sequence[Bar]) -> BarColumns:
+    """Extract float64 open/high/low/close/volume columns from a bar sequence.
+
+    "timestamp" holds int64 microseconds (see timestamp_to_micros()) for
+    indicators that reset per session, such as VWAP.
+
+    A BarHistory already stores these columns and returns zero-copy views.
+    """
+    if isinstance(bars, BarHistory):
+        return bars.columns()
+    return {
+        "open": np.fromiter((b.open for b in bars), dtype=np.float64, count=len(bars)),
+        "high": np.fromiter((b.high for b in bars), dtype=np.float64, count=len(bars)),
+        "low": np.fromiter((b.low for b in bars), dtype=np.float64, count=len(bars)),
+        "close": np.fromiter((b.close for b in bars), dtype=np.float64, count=len(bars)),
+        "volume": np.fromiter((b.volume for b in bars), dtype=np.float64, count=len(bars)),
+        "timestamp": np.fromiter(
+            (timestamp_to_micros(b.timestamp) for b in bars), dtype=np.int64, count=len(bars),
+        ),
+    }
+
 
 class Indicator(ABC):
     name: str
     warmup_period: int
+    # Field names of dict-valued outputs (e.g. BBANDS); empty for scalars
+    fields: tuple[str, ...] = ()
+
+    # Window kept by the default update() fallback for indicators without an
+    # incremental implementation.
+    fallback_window: int = 500
 
     @abstractmethod
     def calculate(self, bars: deque[Bar]) -> float | dict | None: ...
 
+    def history_bars(self, tolerance: float) -> int:
+        """Bars of history calculate() needs to match its full-history value.
+
+        Finite-window indicators need warmup_period bars and are then exact.
+        Recursively smoothed ones also need the bars it takes for their seed
+        to weigh at most `tolerance` (see rolling.settling_bars()).
+        """
+        return self.warmup_period
+
+    def update(self, bar: Bar) -> float | dict | None:
+        """Advance streaming state by one bar and return the current value.
+
+        Builtin indicators (GraphIndicator) do this in O(1) per bar and match
+        calculate() over the full history. The default recomputes over a
+        bounded window of recent bars.
+        """
+        window = getattr(self, "_fallback_bars", None)
+        if window is None:
+            window = deque(maxlen=self.fallback_window)
+            self._fallback_bars = window
+        window.append(bar)
+        return self.calculate(window)
+
     def reset(self) -> None:
-        pass
+        """Discard streaming state so the next update() starts a new series."""
+        self._fallback_bars = None
+
+    def peek(self, bar: Bar) -> float | dict | None:
+        """What update(bar) would return, leaving streaming state untouched."""
+        window = deque(getattr(self, "_fallback_bars", None) or (), maxlen=self.fallback_window)
+        window.append(bar)
+        return self.calculate(window)
+
+    def calculate_series(
+        self, bars: Sequence[Bar], columns: BarColumns | None = None,
+    ) -> SeriesValue:
+        """Compute the indicator at every bar of a fixed series.
+
+        Element i equals calculate(bars[: i + 1]) with NaN in place of None.
+        Dict-valued indicators return one array per field. Builtins evaluate
+        vectorized NumPy node kernels; the default replays update() on a fresh
+        copy so the indicator's own streaming state is left untouched.
+        """
+        replay = copy.deepcopy(self)
+        replay.reset()
+        values = [replay.update(bar) for bar in bars]
+        fields = next((v.keys() for v in values if isinstance(v, dict)), None)
+        if fields is None:
+            return np.array(
+                [np.nan if v is None else v for v in values], dtype=np.float64,
+            )
+        return {
+            f: np.array(
+                [np.nan if v is None else v[f] for v in values], dtype=np.float64,
+            )
+            for f in fields
+        }
 
 
 @dataclass(frozen=True)
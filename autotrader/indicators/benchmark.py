@@ -0,0 +1,313 @@
+"""Throughput and equivalence benchmark for the indicator engines.
+
+Every indicator is timed in three modes over synthetic random-walk bars:
+
+    batch       Indicator.calculate() over the history up to each bar -- the
+                recompute-per-bar path the indicators started out with.
+    streaming   O(1) update() per bar: IndicatorEngine for one symbol,
+                PanelIndicatorEngine.step() across symbols otherwise.
+    vectorized  One NumPy pass over the whole history: compute_series() for
+                one symbol, PanelIndicatorEngine.compute_matrix() otherwise.
+
+All modes are also checked against each other: each result records the
+largest relative difference from the vectorized series, and run_benchmark()
+raises AssertionError when one exceeds the tolerance. Results serialize to
+JSON (see write_results()) so hot-path regressions can be diffed between runs.
+"""
+from __future__ import annotations
+
+import json
+import math
+import platform
+import time
+from collections import deque
+from collections.abc import Callable, Iterable, Sequence
+from dataclasses import asdict, dataclass
+from datetime import datetime, timezone
+from pathlib import Path
+
+import numpy as np
+
+from autotrader.core.bar_history import BarHistory, micros_to_timestamp, timestamp_to_micros
+from autotrader.core.types import Bar
+from autotrader.indicators.base import BarColumns, IndicatorSpec, SeriesValue
+from autotrader.indicators.engine import _INDICATOR_REGISTRY, IndicatorEngine
+from autotrader.indicators.panel import PanelIndicatorEngine
+
+DEFAULT_SPECS: tuple[IndicatorSpec, ...] = (
+    IndicatorSpec("SMA", {"period": 20}),
+    IndicatorSpec("EMA", {"period": 20}),
+    IndicatorSpec("RSI", {"period": 14}),
+    IndicatorSpec("ATR", {"period": 14}),
+    IndicatorSpec("ADX", {"period": 14}),
+    IndicatorSpec("BBANDS", {"period": 20, "num_std": 2.0}),
+    IndicatorSpec("MACD", {"fast": 12, "slow": 26, "signal": 9}),
+    IndicatorSpec("STOCH", {"k_period": 14, "d_period": 3}),
+    IndicatorSpec("KELTNER", {"period": 20, "multiplier": 2.0, "atr_period": 10}),
+    IndicatorSpec("DONCHIAN", {"period": 20}),
+    IndicatorSpec("ZSCORE", {"period": 20}),
+    IndicatorSpec("OBV_DELTA", {"period": 20}),
+    IndicatorSpec("VWAP", {"session_bars": 390}),
+)
+DEFAULT_HISTORIES = (50, 500, 5000)
+DEFAULT_SYMBOL_COUNTS = (1, 50, 500)
+
+_BAR_MICROS = 5 * 60 * 1_000_000
+_START_MICROS = timestamp_to_micros(datetime(2026, 1, 5, 14, 30, tzinfo=timezone.utc))
+
+
+@dataclass(frozen=True)
+class BenchmarkResult:
+    indicator: str
+    mode: str
+    history: int
+    symbols: int
+    bars: int
+    seconds: float
+    max_rel_error: float
+
+    @property
+    def bars_per_second(self) -> float:
+        return self.bars / self.seconds if self.seconds > 0 else math.inf
+
+    def to_dict(self) -> dict:
+        return {**asdict(self), "bars_per_second": self.bars_per_second}
+
+
+def synthetic_columns(symbols: int, length: int, seed: int = 0) -> BarColumns:
+    """(symbols, length) random-walk OHLCV columns on a 5-minute grid."""
+    rng = np.random.default_rng(seed)
+    steps = rng.normal(0.0, 0.5, size=(symbols, length))
+    close = np.maximum(100.0 + np.cumsum(steps, axis=1), 1.0)
+    open_ = np.concatenate([np.full((symbols, 1), 100.0), close[:, :-1]], axis=1)
+    high = np.maximum(open_, close) + rng.random((symbols, length))
+    low = np.minimum(open_, close) - rng.random((symbols, length))
+    timestamps = _START_MICROS + _BAR_MICROS * np.arange(length, dtype=np.int64)
+    return {
+        "open": open_,
+        "high": high,
+        "low": low,
+        "close": close,
+        "volume": 100.0 + 1000.0 * rng.random((symbols, length)),
+        "timestamp": np.broadcast_to(timestamps, (symbols, length)).copy(),
+    }
+
+
+def _bar(columns: BarColumns, row: int, index: int) -> Bar:
+    return Bar(
+        symbol=f"SYM{row}",
+        timestamp=micros_to_timestamp(int(columns["timestamp"][row, index]), timezone.utc),
+        open=float(columns["open"][row, index]),
+        high=float(columns["high"][row, index]),
+        low=float(columns["low"][row, index]),
+        close=float(columns["close"][row, index]),
+        volume=float(columns["volume"][row, index]),
+    )
+
+
+def _bars(columns: BarColumns, row: int) -> list[Bar]:
+    return [_bar(columns, row, i) for i in range(columns["close"].shape[1])]
+
+
+def _fields(value: SeriesValue) -> dict[str | None, np.ndarray]:
+    return value if isinstance(value, dict) else {None: value}
+
+
+def _rel_error(actual: SeriesValue, expected: SeriesValue) -> float:
+    """Largest |a - e| / max(1, |e|); inf if the warmup (NaN) pattern differs."""
+    worst = 0.0
+    expected_fields = _fields(expected)
+    for field, a in _fields(actual).items():
+        a = np.asarray(a, dtype=np.float64)
+        e = np.asarray(expected_fields[field], dtype=np.float64)
+        if not np.array_equal(np.isnan(a), np.isnan(e)):
+            return math.inf
+        defined = ~np.isnan(e)
+        if defined.any():
+            diff = np.abs(a[defined] - e[defined]) / np.maximum(1.0, np.abs(e[defined]))
+            worst = max(worst, float(diff.max()))
+    return worst
+
+
+def _as_series(values: Sequence[float | dict | None], fields: Sequence[str]) -> SeriesValue:
+    if not fields:
+        return np.array([math.nan if v is None else v for v in values], dtype=np.float64)
+    return {
+        f: np.array([math.nan if v is None else v[f] for v in values], dtype=np.float64)
+        for f in fields
+    }
+
+
+def _take(value: SeriesValue, index: tuple | slice | np.ndarray) -> SeriesValue:
+    if isinstance(value, dict):
+        return {f: arr[index] for f, arr in value.items()}
+    return value[index]
+
+
+def _timed(fn: Callable[[], object], min_seconds: float) -> float:
+    """Seconds per call of `fn`, repeating until `min_seconds` have elapsed."""
+    calls = 0
+    start = time.perf_counter()
+    while True:
+        fn()
+        calls += 1
+        elapsed = time.perf_counter() - start
+        if elapsed >= min_seconds:
+            return elapsed / calls
+
+
+def _bench_vectorized(
+    spec: IndicatorSpec, columns: BarColumns, min_seconds: float,
+) -> tuple[float, SeriesValue]:
+    symbols = columns["close"].shape[0]
+    if symbols == 1:
+        engine = IndicatorEngine()
+        engine.register(spec)
+        history = BarHistory(maxlen=columns["close"].shape[1], bars=_bars(columns, 0))
+        seconds = _timed(lambda: engine.compute_series(history), min_seconds)
+        series = _take(engine.compute_series(history)[spec.key], (None, slice(None)))
+        return seconds, series
+    panel = PanelIndicatorEngine(capacity=symbols)
+    panel.register(spec)
+    seconds = _timed(lambda: panel.compute_matrix(columns), min_seconds)
+    return seconds, panel.compute_matrix(columns)[spec.key]
+
+
+def _bench_streaming(spec: IndicatorSpec, columns: BarColumns) -> tuple[float, SeriesValue]:
+    symbols, length = columns["close"].shape
+    fields = _INDICATOR_REGISTRY[spec.name].fields
+    seconds = 0.0
+    if symbols == 1:
+        engine = IndicatorEngine()
+        engine.register(spec)
+        bars = _bars(columns, 0)
+        values = []
+        start = time.perf_counter()
+        for bar in bars:
+            values.append(engine.update(bar)[spec.key])
+        seconds = time.perf_counter() - start
+        return seconds, _take(_as_series(values, fields), (None, slice(None)))
+
+    panel = PanelIndicatorEngine(capacity=symbols)
+    panel.register(spec)
+    shape = (symbols, length)
+    out = {f: np.empty(shape) for f in fields} if fields else np.empty(shape)
+    for t in range(length):
+        bars = [_bar(columns, row, t) for row in range(symbols)]
+        start = time.perf_counter()
+        step = panel.step(bars)[spec.key]
+        seconds += time.perf_counter() - start
+        for field, arr in _fields(step).items():
+            (out if field is None else out[field])[:, t] = arr
+    return seconds, out
+
+
+def _bench_batch(
+    spec: IndicatorSpec, columns: BarColumns, samples: int,
+) -> tuple[int, float, list[tuple[int, int, float | dict | None]]]:
+    """calculate() over growing histories at the last bars of a few symbols."""
+    symbols, length = columns["close"].shape
+    rows = min(symbols, 5)
+    per_row = max(1, min(length, math.ceil(samples / rows)))
+    indicator = _INDICATOR_REGISTRY[spec.name](**spec.params)
+    calls: list[tuple[int, int, float | dict | None]] = []
+    seconds = 0.0
+    for row in range(rows):
+        bars = _bars(columns, row)
+        for index in range(length - per_row, length):
+            history = deque(bars[: index + 1])
+            start = time.perf_counter()
+            value = indicator.calculate(history)
+            seconds += time.perf_counter() - start
+            calls.append((row, index, value))
+    return len(calls), seconds, calls
+
+
+def benchmark_indicator(
+    spec: IndicatorSpec,
+    history: int,
+    symbols: int,
+    *,
+    batch_samples: int = 100,
+    min_seconds: float = 0.05,
+    seed: int = 0,
+) -> list[BenchmarkResult]:
+    """Time `spec` in every mode at one (history, symbols) size."""
+    columns = synthetic_columns(symbols, history, seed)
+    fields = _INDICATOR_REGISTRY[spec.name].fields
+    bars = symbols * history
+
+    vector_seconds, reference = _bench_vectorized(spec, columns, min_seconds)
+    stream_seconds, streamed = _bench_streaming(spec, columns)
+    batch_calls, batch_seconds, batch_values = _bench_batch(spec, columns, batch_samples)
+
+    rows = np.array([row for row, _, _ in batch_values], dtype=np.int64)
+    indices = np.array([index for _, index, _ in batch_values], dtype=np.int64)
+    batch_error = _rel_error(
+        _as_series([value for _, _, value in batch_values], fields),
+        _take(reference, (rows, indices)),
+    )
+    return [
+        BenchmarkResult(
+            spec.key, "batch", history, symbols, batch_calls, batch_seconds, batch_error,
+        ),
+        BenchmarkResult(
+            spec.key, "streaming", history, symbols, bars, stream_seconds,
+            _rel_error(streamed, reference),
+        ),
+        BenchmarkResult(spec.key, "vectorized", history, symbols, bars, vector_seconds, 0.0),
+    ]
+
+
+def run_benchmark(
+    specs: Iterable[IndicatorSpec] = DEFAULT_SPECS,
+    histories: Iterable[int] = DEFAULT_HISTORIES,
+    symbol_counts: Iterable[int] = DEFAULT_SYMBOL_COUNTS,
+    *,
+    batch_samples: int = 100,
+    min_seconds: float = 0.05,
+    tolerance: float = 1e-8,
+    progress: Callable[[BenchmarkResult], None] | None = None,
+) -> list[BenchmarkResult]:
+    """Benchmark every spec at every (history, symbols) size.
+
+    Raises AssertionError once all sizes have run if any mode disagreed with
+    the vectorized series by more than `tolerance` (relative, floored at 1).
+    """
+    results: list[BenchmarkResult] = []
+    for history in histories:
+        for symbols in symbol_counts:
+            for spec in specs:
+                for result in benchmark_indicator(
+                    spec, history, symbols,
+                    batch_samples=batch_samples, min_seconds=min_seconds,
+                ):
+                    results.append(result)
+                    if progress is not None:
+                        progress(result)
+    mismatched = [r for r in results if not r.max_rel_error <= tolerance]
+    if mismatched:
+        raise AssertionError(
+            "Indicator modes disagree: " + ", ".join(
+                f"{r.indicator} {r.mode} history={r.history} symbols={r.symbols} "
+                f"error={r.max_rel_error:.3g}"
+                for r in mismatched
+            )
+        )
+    return results
+
+
+def write_results(results: Sequence[BenchmarkResult], path: Path | str) -> Path:
+    """Write results with run metadata as JSON; returns the path."""
+    path = Path(path)
+    path.parent.mkdir(parents=True, exist_ok=True)
+    payload = {
+        "generated_at": datetime.now(timezone.utc).isoformat(),
+        "python": platform.python_version(),
+        "numpy": np.__version__,
+        "machine": platform.machine(),
+        "results": [r.to_dict() for r in results],
+    }
+    with open(path, "w", encoding="utf-8") as f:
+        json.dump(payload, f, indent=2)
+    return path
@@ -1,6 +1,16 @@
-from autotrader.indicators.builtin.momentum import RSI
+from autotrader.indicators.builtin.momentum import MACD, RSI, Stochastic
 from autotrader.indicators.builtin.moving_average import EMA, SMA
 from autotrader.indicators.builtin.trend import ADX
-from autotrader.indicators.builtin.volatility import ATR, BollingerBands
+from autotrader.indicators.builtin.volatility import (
+    ATR,
+    BollingerBands,
+    DonchianChannels,
+    KeltnerChannels,
+    ZScore,
+)
+from autotrader.indicators.builtin.volume import VWAP, OBVDelta
 
-__all__ = ["SMA", "EMA", "RSI", "ATR", "ADX", "BollingerBands"]
+__all__ = [
+    "SMA", "EMA", "RSI", "ATR", "ADX", "BollingerBands",
+    "MACD", "Stochastic", "KeltnerChannels", "DonchianChannels", "OBVDelta", "VWAP", "ZScore",
+]
@@ -2,11 +2,29 @@ from __future__ import annotations
 
 from collections import deque
 
+import numpy as np
+
 from autotrader.core.types import Bar
-from autotrader.indicators.base import Indicator
+from autotrader.indicators import rolling
+from autotrader.indicators.base import BarColumns
+from autotrader.indicators.graph import (
+    Column,
+    Delta,
+    Difference,
+    Ema,
+    GraphIndicator,
+    IndicatorGraph,
+    NegativePart,
+    Node,
+    PositivePart,
+    RollingMax,
+    RollingMin,
+    RollingSum,
+    WilderSum,
+)
 
 
-class RSI(Indicator):
+class RSI(GraphIndicator):
     def __init__(self, period: int = 14) -> None:
         self.name = "RSI"
         self.warmup_period = period + 1
@@ -31,3 +49,157 @@ class RSI(Indicator):
             return 100.0
         rs = avg_gain / avg_loss
         return 100.0 - (100.0 / (1.0 + rs))
+
+    def history_bars(self, tolerance: float) -> int:
+        return self.warmup_period + rolling.settling_bars(1 - 1 / self.period, tolerance)
+
+    def bind(self, graph: IndicatorGraph) -> list[Node]:
+        delta = Delta(Column("close"))
+        self._gain_sum = graph.add(WilderSum(PositivePart(delta), self.period))
+        self._loss_sum = graph.add(WilderSum(NegativePart(delta), self.period))
+        return [self._gain_sum, self._loss_sum]
+
+    def output(self) -> float | None:
+        gain_sum = self._gain_sum.value
+        loss_sum = self._loss_sum.value
+        if gain_sum is None or loss_sum is None:
+            return None
+        if loss_sum == 0:
+            return 100.0
+        rs = gain_sum / loss_sum
+        return 100.0 - (100.0 / (1.0 + rs))
+
+    def output_series(self, values: dict[tuple, np.ndarray]) -> np.ndarray:
+        gain_sum = values[self._gain_sum.key]
+        loss_sum = values[self._loss_sum.key]
+        with np.errstate(divide="ignore", invalid="ignore"):
+            return np.where(loss_sum == 0, 100.0, 100.0 - 100.0 / (1.0 + gain_sum / loss_sum))
+
+
+def _ema_values(values: list[float], period: int) -> list[float]:
+    """EMA at every index from period - 1 on, seeded with the SMA of the first period."""
+    multiplier = 2 / (period + 1)
+    ema = sum(values[:period]) / period
+    out = [ema]
+    for value in values[period:]:
+        ema = (value - ema) * multiplier + ema
+        out.append(ema)
+    return out
+
+
+class MACD(GraphIndicator):
+    fields = ("macd", "signal", "histogram")
+
+    def __init__(self, fast: int = 12, slow: int = 26, signal: int = 9) -> None:
+        self.name = "MACD"
+        self.fast = fast
+        self.slow = slow
+        self.signal = signal
+        self.warmup_period = max(fast, slow) + signal - 1
+
+    def calculate(self, bars: deque[Bar]) -> dict | None:
+        if len(bars) < self.warmup_period:
+            return None
+        closes = [b.close for b in bars]
+        fast = _ema_values(closes, self.fast)
+        slow = _ema_values(closes, self.slow)
+        length = min(len(fast), len(slow))
+        line = [f - s for f, s in zip(fast[-length:], slow[-length:])]
+        signal = _ema_values(line, self.signal)[-1]
+        return {"macd": line[-1], "signal": signal, "histogram": line[-1] - signal}
+
+    def history_bars(self, tolerance: float) -> int:
+        # The signal EMA smooths the MACD line, so their settling adds up
+        slow = max(self.fast, self.slow)
+        return (
+            self.warmup_period
+            + rolling.settling_bars(1 - 2 / (slow + 1), tolerance)
+            + rolling.settling_bars(1 - 2 / (self.signal + 1), tolerance)
+        )
+
+    def bind(self, graph: IndicatorGraph) -> list[Node]:
+        close = Column("close")
+        # The EMAs are shared with EMA indicators of the same periods
+        self._line = graph.add(Difference(Ema(close, self.fast), Ema(close, self.slow)))
+        self._signal = graph.add(Ema(self._line, self.signal))
+        return [self._line, self._signal]
+
+    def output(self) -> dict | None:
+        line = self._line.value
+        signal = self._signal.value
+        if line is None or signal is None:
+            return None
+        return {"macd": line, "signal": signal, "histogram": line - signal}
+
+    def output_series(self, values: dict[tuple, np.ndarray]) -> dict[str, np.ndarray]:
+        line = values[self._line.key].copy()
+        signal = values[self._signal.key].copy()
+        return {"macd": line, "signal": signal, "histogram": line - signal}
+
+
+class Stochastic(GraphIndicator):
+    fields = ("k", "d")
+
+    def __init__(self, k_period: int = 14, d_period: int = 3) -> None:
+        self.name = "STOCH"
+        self.k_period = k_period
+        self.d_period = d_period
+        self.warmup_period = k_period + d_period - 1
+
+    def calculate(self, bars: deque[Bar]) -> dict | None:
+        if len(bars) < self.warmup_period:
+            return None
+        bar_list = list(bars)
+        k_values = []
+        for end in range(len(bar_list) - self.d_period + 1, len(bar_list) + 1):
+            window = bar_list[end - self.k_period : end]
+            highest = max(b.high for b in window)
+            lowest = min(b.low for b in window)
+            k_values.append(_percent_k(window[-1].close, highest, lowest))
+        return {"k": k_values[-1], "d": sum(k_values) / self.d_period}
+
+    def bind(self, graph: IndicatorGraph) -> list[Node]:
+        k = StochasticK(
+            Column("close"),
+            RollingMax(Column("high"), self.k_period),
+            RollingMin(Column("low"), self.k_period),
+        )
+        self._k = graph.add(k)
+        self._d_sum = graph.add(RollingSum(k, self.d_period))
+        return [self._k, self._d_sum]
+
+    def output(self) -> dict | None:
+        k = self._k.value
+        d_sum = self._d_sum.value
+        if k is None or d_sum is None:
+            return None
+        return {"k": k, "d": d_sum / self.d_period}
+
+    def output_series(self, values: dict[tuple, np.ndarray]) -> dict[str, np.ndarray]:
+        return {
+            "k": values[self._k.key].copy(),
+            "d": values[self._d_sum.key] / self.d_period,
+        }
+
+
+def _percent_k(close: float, highest: float, lowest: float) -> float:
+    # A flat window puts the close mid-range
+    span = highest - lowest
+    return 50.0 if span == 0 else 100.0 * (close - lowest) / span
+
+
+class StochasticK(Node):
+    """%K from close and the rolling high / low."""
+
+    def step(self, bar: Bar) -> None:
+        close, highest, lowest = (node.value for node in self.inputs)
+        if close is None or highest is None or lowest is None:
+            self.value = None
+            return
+        self.value = _percent_k(close, highest, lowest)
+
+    def compute_series(self, columns: BarColumns, inputs: list[np.ndarray]) -> np.ndarray:
+        close, highest, lowest = inputs
+        span = highest - lowest
+        with np.errstate(divide="ignore", invalid="ignore"):
+            return np.where(span == 0, 50.0, 100.0 * (close - lowest) / span)
@@ -2,11 +2,21 @@ from __future__ import annotations
 
 from collections import deque
 
+import numpy as np
+
 from autotrader.core.types import Bar
-from autotrader.indicators.base import Indicator
+from autotrader.indicators import rolling
+from autotrader.indicators.graph import (
+    Column,
+    Ema,
+    GraphIndicator,
+    IndicatorGraph,
+    Node,
+    RollingSum,
+)
 
 
-class SMA(Indicator):
+class SMA(GraphIndicator):
     def __init__(self, period: int) -> None:
         self.name = "SMA"
         self.warmup_period = period
@@ -18,8 +28,19 @@ class SMA(Indicator):
         closes = [b.close for b in list(bars)[-self.period :]]
         return sum(closes) / self.period
 
+    def bind(self, graph: IndicatorGraph) -> list[Node]:
+        self._sum = graph.add(RollingSum(Column("close"), self.period))
+        return [self._sum]
+
+    def output(self) -> float | None:
+        total = self._sum.value
+        return None if total is None else total / self.period
+
+    def output_series(self, values: dict[tuple, np.ndarray]) -> np.ndarray:
+        return values[self._sum.key] / self.period
+
 
-class EMA(Indicator):
+class EMA(GraphIndicator):
     def __init__(self, period: int) -> None:
         self.name = "EMA"
         self.warmup_period = period
@@ -34,3 +55,16 @@ class EMA(Indicator):
         for close in closes[self.period :]:
             ema = (close - ema) * multiplier + ema
         return ema
+
+    def history_bars(self, tolerance: float) -> int:
+        return self.warmup_period + rolling.settling_bars(1 - 2 / (self.period + 1), tolerance)
+
+    def bind(self, graph: IndicatorGraph) -> list[Node]:
+        self._ema = graph.add(Ema(Column("close"), self.period))
+        return [self._ema]
+
+    def output(self) -> float | None:
+        return self._ema.value
+
+    def output_series(self, values: dict[tuple, np.ndarray]) -> np.ndarray:
+        return values[self._ema.key].copy()
@@ -2,11 +2,22 @@ from __future__ import annotations
 
 from collections import deque
 
-from autotrader.core.types import Bar
-from autotrader.indicators.base import Indicator
-
+import numpy as np
 
-class ADX(Indicator):
+from autotrader.core.types import Bar
+from autotrader.indicators import rolling
+from autotrader.indicators.base import BarColumns
+from autotrader.indicators.graph import (
+    DirectionalMovement,
+    GraphIndicator,
+    IndicatorGraph,
+    Node,
+    TrueRange,
+    WilderSum,
+)
+
+
+class ADX(GraphIndicator):
     def __init__(self, period: int = 14) -> None:
         self.name = "ADX"
         self.period = period
@@ -93,3 +104,51 @@ class ADX(Indicator):
             adx = (adx * (period - 1) + dx) / period
 
         return adx
+
+    def history_bars(self, tolerance: float) -> int:
+        # DX is built from Wilder sums and then Wilder-smoothed again; the
+        # cascade settles no later than two single stages back to back.
+        return self.warmup_period + 2 * rolling.settling_bars(1 - 1 / self.period, tolerance)
+
+    def bind(self, graph: IndicatorGraph) -> list[Node]:
+        period = self.period
+        dx = DirectionalIndex(
+            WilderSum(DirectionalMovement("plus"), period),
+            WilderSum(DirectionalMovement("minus"), period),
+            WilderSum(TrueRange(), period),
+        )
+        self._dx_sum = graph.add(WilderSum(dx, period))
+        return [self._dx_sum]
+
+    def output(self) -> float | None:
+        total = self._dx_sum.value
+        return None if total is None else total / self.period
+
+    def output_series(self, values: dict[tuple, np.ndarray]) -> np.ndarray:
+        return values[self._dx_sum.key] / self.period
+
+
+class DirectionalIndex(Node):
+    """DX from Wilder-smoothed +DM, -DM and true range."""
+
+    def step(self, bar: Bar) -> None:
+        plus_dm, minus_dm, tr = (node.value for node in self.inputs)
+        if plus_dm is None or minus_dm is None or tr is None:
+            self.value = None
+            return
+        if tr == 0:
+            plus_di = 0.0
+            minus_di = 0.0
+        else:
+            plus_di = 100.0 * plus_dm / tr
+            minus_di = 100.0 * minus_dm / tr
+        di_sum = plus_di + minus_di
+        self.value = 0.0 if di_sum == 0 else 100.0 * abs(plus_di - minus_di) / di_sum
+
+    def compute_series(self, columns: BarColumns, inputs: list[np.ndarray]) -> np.ndarray:
+        plus_dm, minus_dm, tr = inputs
+        with np.errstate(divide="ignore", invalid="ignore"):
+            plus_di = np.where(tr == 0, 0.0, 100.0 * plus_dm / tr)
+            minus_di = np.where(tr == 0, 0.0, 100.0 * minus_dm / tr)
+            di_sum = plus_di + minus_di
+            return np.where(di_sum == 0, 0.0, 100.0 * np.abs(plus_di - minus_di) / di_sum)
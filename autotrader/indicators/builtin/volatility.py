@@ -3,11 +3,28 @@ from __future__ import annotations
 import math
 from collections import deque
 
+import numpy as np
+
 from autotrader.core.types import Bar
-from autotrader.indicators.base import Indicator
+from autotrader.indicators import rolling
+from autotrader.indicators.base import bar_columns
+from autotrader.indicators.builtin.moving_average import EMA
+from autotrader.indicators.graph import (
+    Column,
+    Ema,
+    GraphIndicator,
+    IndicatorGraph,
+    Node,
+    RollingMax,
+    RollingMin,
+    RollingSum,
+    RollingVariance,
+    TrueRange,
+    WilderSum,
+)
 
 
-class ATR(Indicator):
+class ATR(GraphIndicator):
     def __init__(self, period: int = 14) -> None:
         self.name = "ATR"
         self.warmup_period = period + 1
@@ -16,21 +33,29 @@ class ATR(Indicator):
     def calculate(self, bars: deque[Bar]) -> float | None:
         if len(bars) < self.warmup_period:
             return None
-        bar_list = list(bars)
-        true_ranges = []
-        for i in range(1, len(bar_list)):
-            high_low = bar_list[i].high - bar_list[i].low
-            high_prev_close = abs(bar_list[i].high - bar_list[i - 1].close)
-            low_prev_close = abs(bar_list[i].low - bar_list[i - 1].close)
-            true_ranges.append(max(high_low, high_prev_close, low_prev_close))
+        columns = bar_columns(bars)
+        true_ranges = rolling.true_range(columns["high"], columns["low"], columns["close"])
+        return float(rolling.wilder_average(true_ranges, self.period)[-1])
+
+    def history_bars(self, tolerance: float) -> int:
+        return self.warmup_period + rolling.settling_bars(1 - 1 / self.period, tolerance)
+
+    def bind(self, graph: IndicatorGraph) -> list[Node]:
+        # Wilder's average is the Wilder sum over period, so ATR shares ADX's TR node
+        self._tr_sum = graph.add(WilderSum(TrueRange(), self.period))
+        return [self._tr_sum]
+
+    def output(self) -> float | None:
+        total = self._tr_sum.value
+        return None if total is None else total / self.period
 
-        atr = sum(true_ranges[: self.period]) / self.period
-        for tr in true_ranges[self.period :]:
-            atr = (atr * (self.period - 1) + tr) / self.period
-        return atr
+    def output_series(self, values: dict[tuple, np.ndarray]) -> np.ndarray:
+        return values[self._tr_sum.key] / self.period
 
 
-class BollingerBands(Indicator):
+class BollingerBands(GraphIndicator):
+    fields = ("upper", "middle", "lower", "width", "pct_b")
+
     def __init__(self, period: int = 20, num_std: float = 2.0) -> None:
         self.name = "BBANDS"
         self.period = period
@@ -41,11 +66,45 @@ class BollingerBands(Indicator):
         if len(bars) < self.period:
             return None
 
-        closes = [b.close for b in bars]
-        window = closes[-self.period :]
+        stats = rolling.RollingVariance(self.period)
+        for bar in list(bars)[-self.period :]:
+            stats.append(bar.close)
+        return self._bands(stats.mean, stats.variance(), bars[-1].close)
+
+    def bind(self, graph: IndicatorGraph) -> list[Node]:
+        close = Column("close")
+        self._close = graph.add(close)
+        # The rolling sum is shared with SMA of the same period
+        self._sum = graph.add(RollingSum(close, self.period))
+        self._var = graph.add(RollingVariance(close, self.period))
+        return [self._close, self._sum, self._var]
+
+    def output(self) -> dict | None:
+        total = self._sum.value
+        variance = self._var.value
+        if total is None or variance is None:
+            return None
+        return self._bands(total / self.period, variance, self._close.value)
 
-        middle = sum(window) / self.period
-        variance = sum((c - middle) ** 2 for c in window) / self.period
+    def output_series(self, values: dict[tuple, np.ndarray]) -> dict[str, np.ndarray]:
+        close = values[self._close.key]
+        middle = values[self._sum.key] / self.period
+        stdev = np.sqrt(values[self._var.key])
+        upper = middle + self.num_std * stdev
+        lower = middle - self.num_std * stdev
+        band_range = upper - lower
+        with np.errstate(divide="ignore", invalid="ignore"):
+            width = np.where(middle == 0, 0.0, band_range / middle)
+            pct_b = np.where(band_range == 0, 0.5, (close - lower) / band_range)
+        return {
+            "upper": upper,
+            "middle": middle,
+            "lower": lower,
+            "width": width,
+            "pct_b": pct_b,
+        }
+
+    def _bands(self, middle: float, variance: float, close: float) -> dict:
         stdev = math.sqrt(variance)
 
         upper = middle + self.num_std * stdev
@@ -60,7 +119,7 @@ class BollingerBands(Indicator):
         if band_range == 0:
             pct_b = 0.5
         else:
-            pct_b = (closes[-1] - lower) / band_range
+            pct_b = (close - lower) / band_range
 
         return {
             "upper": upper,
@@ -69,3 +128,127 @@ class BollingerBands(Indicator):
             "width": width,
             "pct_b": pct_b,
         }
+
+
+class KeltnerChannels(GraphIndicator):
+    fields = ("upper", "middle", "lower")
+
+    def __init__(self, period: int = 20, multiplier: float = 2.0, atr_period: int = 10) -> None:
+        self.name = "KELTNER"
+        self.period = period
+        self.multiplier = multiplier
+        self.atr_period = atr_period
+        self.warmup_period = max(period, atr_period + 1)
+
+    def calculate(self, bars: deque[Bar]) -> dict | None:
+        if len(bars) < self.warmup_period:
+            return None
+        middle = EMA(self.period).calculate(bars)
+        atr = ATR(self.atr_period).calculate(bars)
+        return self._channels(middle, atr)
+
+    def history_bars(self, tolerance: float) -> int:
+        return self.warmup_period + max(
+            rolling.settling_bars(1 - 2 / (self.period + 1), tolerance),
+            rolling.settling_bars(1 - 1 / self.atr_period, tolerance),
+        )
+
+    def bind(self, graph: IndicatorGraph) -> list[Node]:
+        # Shares its EMA with EMA and its smoothed TR with ATR / ADX
+        self._ema = graph.add(Ema(Column("close"), self.period))
+        self._tr_sum = graph.add(WilderSum(TrueRange(), self.atr_period))
+        return [self._ema, self._tr_sum]
+
+    def output(self) -> dict | None:
+        middle = self._ema.value
+        tr_sum = self._tr_sum.value
+        if middle is None or tr_sum is None:
+            return None
+        return self._channels(middle, tr_sum / self.atr_period)
+
+    def output_series(self, values: dict[tuple, np.ndarray]) -> dict[str, np.ndarray]:
+        middle = values[self._ema.key].copy()
+        offset = self.multiplier * values[self._tr_sum.key] / self.atr_period
+        return {"upper": middle + offset, "middle": middle, "lower": middle - offset}
+
+    def _channels(self, middle: float, atr: float) -> dict:
+        offset = self.multiplier * atr
+        return {"upper": middle + offset, "middle": middle, "lower": middle - offset}
+
+
+class DonchianChannels(GraphIndicator):
+    fields = ("upper", "middle", "lower")
+
+    def __init__(self, period: int = 20) -> None:
+        self.name = "DONCHIAN"
+        self.period = period
+        self.warmup_period = period
+
+    def calculate(self, bars: deque[Bar]) -> dict | None:
+        if len(bars) < self.period:
+            return None
+        window = list(bars)[-self.period :]
+        upper = max(b.high for b in window)
+        lower = min(b.low for b in window)
+        return {"upper": upper, "middle": (upper + lower) / 2, "lower": lower}
+
+    def bind(self, graph: IndicatorGraph) -> list[Node]:
+        self._high = graph.add(RollingMax(Column("high"), self.period))
+        self._low = graph.add(RollingMin(Column("low"), self.period))
+        return [self._high, self._low]
+
+    def output(self) -> dict | None:
+        upper = self._high.value
+        lower = self._low.value
+        if upper is None or lower is None:
+            return None
+        return {"upper": upper, "middle": (upper + lower) / 2, "lower": lower}
+
+    def output_series(self, values: dict[tuple, np.ndarray]) -> dict[str, np.ndarray]:
+        upper = values[self._high.key].copy()
+        lower = values[self._low.key].copy()
+        return {"upper": upper, "middle": (upper + lower) / 2, "lower": lower}
+
+
+class ZScore(GraphIndicator):
+    """Distance of the close from its rolling mean, in rolling (population) stdevs."""
+
+    def __init__(self, period: int = 20) -> None:
+        self.name = "ZSCORE"
+        self.period = period
+        self.warmup_period = period
+
+    def calculate(self, bars: deque[Bar]) -> float | None:
+        if len(bars) < self.period:
+            return None
+        stats = rolling.RollingVariance(self.period)
+        for bar in list(bars)[-self.period :]:
+            stats.append(bar.close)
+        return _zscore(bars[-1].close, stats.mean, stats.variance())
+
+    def bind(self, graph: IndicatorGraph) -> list[Node]:
+        close = Column("close")
+        # Same nodes as BBANDS of the same period
+        self._close = graph.add(close)
+        self._sum = graph.add(RollingSum(close, self.period))
+        self._var = graph.add(RollingVariance(close, self.period))
+        return [self._close, self._sum, self._var]
+
+    def output(self) -> float | None:
+        total = self._sum.value
+        variance = self._var.value
+        if total is None or variance is None:
+            return None
+        return _zscore(self._close.value, total / self.period, variance)
+
+    def output_series(self, values: dict[tuple, np.ndarray]) -> np.ndarray:
+        close = values[self._close.key]
+        mean = values[self._sum.key] / self.period
+        stdev = np.sqrt(values[self._var.key])
+        with np.errstate(divide="ignore", invalid="ignore"):
+            return np.where(stdev == 0, 0.0, (close - mean) / stdev)
+
+
+def _zscore(close: float, mean: float, variance: float) -> float:
+    stdev = math.sqrt(variance)
+    return 0.0 if stdev == 0 else (close - mean) / stdev
@@ -0,0 +1,150 @@
+from __future__ import annotations
+
+from collections import deque
+from itertools import pairwise
+
+import numpy as np
+
+from autotrader.core.bar_history import market_day, timestamp_to_micros
+from autotrader.core.types import Bar
+from autotrader.indicators.base import BarColumns
+from autotrader.indicators.graph import (
+    Column,
+    Delta,
+    GraphIndicator,
+    IndicatorGraph,
+    MarketDay,
+    Node,
+    Product,
+    RollingSum,
+    SessionSum,
+)
+
+
+class OBVDelta(GraphIndicator):
+    """Change in on-balance volume over the last `period` bars.
+
+    Classic OBV is a running total whose level depends on where the series
+    starts, so a truncated history and the full series disagree. This is not
+    that total but its change over the window -- net up-volume minus
+    down-volume -- which is the same however much history precedes it; it is
+    registered as OBV_DELTA so it is not mistaken for cumulative OBV.
+    """
+
+    def __init__(self, period: int = 20) -> None:
+        self.name = "OBV_DELTA"
+        self.period = period
+        self.warmup_period = period + 1
+
+    def calculate(self, bars: deque[Bar]) -> float | None:
+        if len(bars) < self.warmup_period:
+            return None
+        bar_list = list(bars)[-self.warmup_period :]
+        return sum(
+            _signed_volume(bar.close - prev.close, bar.volume)
+            for prev, bar in pairwise(bar_list)
+        )
+
+    def bind(self, graph: IndicatorGraph) -> list[Node]:
+        signed = SignedVolume(Delta(Column("close")), Column("volume"))
+        self._sum = graph.add(RollingSum(signed, self.period))
+        return [self._sum]
+
+    def output(self) -> float | None:
+        return self._sum.value
+
+    def output_series(self, values: dict[tuple, np.ndarray]) -> np.ndarray:
+        return values[self._sum.key].copy()
+
+
+class VWAP(GraphIndicator):
+    """Volume-weighted average typical price since the session open.
+
+    Sessions are US Eastern trading dates, so on minute bars this is the
+    intraday VWAP and on daily bars it is each bar's own typical price.
+    `session_bars` is the most bars one session can hold; history_bars()
+    asks for that many so a window always reaches back to the open.
+    """
+
+    def __init__(self, session_bars: int = 390) -> None:
+        self.name = "VWAP"
+        self.session_bars = session_bars
+        self.warmup_period = 1
+
+    def calculate(self, bars: deque[Bar]) -> float | None:
+        if not bars:
+            return None
+        session = _market_day(bars[-1])
+        price_volume = 0.0
+        volume = 0.0
+        for bar in reversed(bars):
+            if _market_day(bar) != session:
+                break
+            price_volume += _typical_price(bar.high, bar.low, bar.close) * bar.volume
+            volume += bar.volume
+        return None if volume == 0 else price_volume / volume
+
+    def history_bars(self, tolerance: float) -> int:
+        return max(self.warmup_period, self.session_bars)
+
+    def bind(self, graph: IndicatorGraph) -> list[Node]:
+        volume = Column("volume")
+        session = MarketDay()
+        self._pv_sum = graph.add(SessionSum(Product(TypicalPrice(), volume), session))
+        self._volume_sum = graph.add(SessionSum(volume, session))
+        return [self._pv_sum, self._volume_sum]
+
+    def output(self) -> float | None:
+        pv_sum = self._pv_sum.value
+        volume_sum = self._volume_sum.value
+        if pv_sum is None or not volume_sum:
+            return None
+        return pv_sum / volume_sum
+
+    def output_series(self, values: dict[tuple, np.ndarray]) -> np.ndarray:
+        pv_sum = values[self._pv_sum.key]
+        volume_sum = values[self._volume_sum.key]
+        with np.errstate(divide="ignore", invalid="ignore"):
+            return np.where(volume_sum == 0, np.nan, pv_sum / volume_sum)
+
+
+def _market_day(bar: Bar) -> int:
+    return market_day(timestamp_to_micros(bar.timestamp))
+
+
+def _typical_price(high: float, low: float, close: float) -> float:
+    return (high + low + close) / 3
+
+
+def _signed_volume(change: float, volume: float) -> float:
+    if change > 0:
+        return volume
+    if change < 0:
+        return -volume
+    return 0.0
+
+
+class TypicalPrice(Node):
+    """(high + low + close) / 3."""
+
+    def __init__(self) -> None:
+        super().__init__(Column("high"), Column("low"), Column("close"))
+
+    def step(self, bar: Bar) -> None:
+        self.value = _typical_price(bar.high, bar.low, bar.close)
+
+    def compute_series(self, columns: BarColumns, inputs: list[np.ndarray]) -> np.ndarray:
+        high, low, close = inputs
+        return (high + low + close) / 3
+
+
+class SignedVolume(Node):
+    """Volume signed by the direction of the close-to-close change."""
+
+    def step(self, bar: Bar) -> None:
+        change, volume = (node.value for node in self.inputs)
+        self.value = None if change is None or volume is None else _signed_volume(change, volume)
+
+    def compute_series(self, columns: BarColumns, inputs: list[np.ndarray]) -> np.ndarray:
+        change, volume = inputs
+        return np.sign(change) * volume
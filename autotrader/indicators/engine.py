@@ -1,13 +1,34 @@
 from __future__ import annotations
 
+import math
 from collections import deque
+from collections.abc import Sequence
 
+import numpy as np
+
+from autotrader.core.bar_history import BarHistory
 from autotrader.core.types import Bar
-from autotrader.indicators.base import Indicator, IndicatorSpec
+from autotrader.indicators.base import Indicator, IndicatorSpec, SeriesValue, bar_columns
 from autotrader.indicators.builtin.moving_average import SMA, EMA
-from autotrader.indicators.builtin.momentum import RSI
+from autotrader.indicators.builtin.momentum import MACD, RSI, Stochastic
 from autotrader.indicators.builtin.trend import ADX
-from autotrader.indicators.builtin.volatility import ATR, BollingerBands
+from autotrader.indicators.builtin.volatility import (
+    ATR,
+    BollingerBands,
+    DonchianChannels,
+    KeltnerChannels,
+    ZScore,
+)
+from autotrader.indicators.builtin.volume import VWAP, OBVDelta
+from autotrader.indicators.graph import GraphIndicator, IndicatorGraph
+from autotrader.indicators.snapshot import (
+    IndicatorSnapshot,
+    LazyIndicatorSnapshot,
+    SnapshotLayout,
+)
+
+# Default convergence tolerance for history_bars(); see Indicator.history_bars()
+DEFAULT_HISTORY_TOLERANCE = 1e-3
 
 _INDICATOR_REGISTRY: dict[str, type[Indicator]] = {
     "SMA": SMA,
@@ -16,24 +37,193 @@ _INDICATOR_REGISTRY: dict[str, type[Indicator]] = {
     "ATR": ATR,
     "ADX": ADX,
     "BBANDS": BollingerBands,
+    "MACD": MACD,
+    "STOCH": Stochastic,
+    "KELTNER": KeltnerChannels,
+    "DONCHIAN": DonchianChannels,
+    "ZSCORE": ZScore,
+    "OBV_DELTA": OBVDelta,
+    "VWAP": VWAP,
 }
 
 
 class IndicatorEngine:
+    """Computes registered indicators for one bar stream.
+
+    Graph-backed indicators are attached to a single shared IndicatorGraph,
+    so intermediates they have in common (close deltas, true range, Wilder
+    sums, rolling sums) are evaluated once per bar by update() and once per
+    series by compute_series().
+
+    Per-bar results are IndicatorSnapshots sharing one SnapshotLayout, which
+    is rebuilt (as a new object) whenever an indicator is registered.
+    """
+
     def __init__(self) -> None:
         self._indicators: dict[str, Indicator] = {}
+        self._graph = IndicatorGraph()
+        self._layout = SnapshotLayout(())
+        # Trailing bars a lazy snapshot evaluates graph indicators over
+        self._lazy_bars = 0
+
+    @property
+    def graph(self) -> IndicatorGraph:
+        return self._graph
+
+    @property
+    def layout(self) -> SnapshotLayout:
+        return self._layout
 
     def register(self, spec: IndicatorSpec) -> None:
+        """Add an indicator. Rebuilds the shared graph, discarding streaming state."""
         cls = _INDICATOR_REGISTRY.get(spec.name)
         if cls is None:
             raise ValueError(f"Unknown indicator: {spec.name}")
         self._indicators[spec.key] = cls(**spec.params)
+        self._layout = SnapshotLayout.for_indicators(self._indicators)
+        self._lazy_bars = self.history_bars()
+        self._rebuild_graph()
+
+    def _rebuild_graph(self) -> None:
+        self._graph = IndicatorGraph()
+        for ind in self._indicators.values():
+            if isinstance(ind, GraphIndicator):
+                ind.attach(self._graph)
+            else:
+                ind.reset()
+
+    def compute(self, bars: deque[Bar] | BarHistory) -> IndicatorSnapshot:
+        """Indicator values at the last bar.
+
+        For a BarHistory the result is lazy: each graph-backed indicator is
+        evaluated (as a vectorized series, reading its last element) the
+        first time it is read, and intermediates shared between indicators
+        are computed once per snapshot. The series only spans the trailing
+        history_bars() of the window, the shortest that matches the
+        full-history values to within the default tolerance, so a long
+        history costs no more per bar than a minimal one.
+        """
+        layout = self._layout
+        if isinstance(bars, BarHistory):
+            if not bars:
+                return IndicatorSnapshot(layout, layout.pack({}))
+            return self._lazy_snapshot(bars)
+        return IndicatorSnapshot.from_values(
+            layout, {key: ind.calculate(bars) for key, ind in self._indicators.items()},
+        )
+
+    def _lazy_snapshot(self, history: BarHistory) -> LazyIndicatorSnapshot:
+        layout = self._layout
+        full = history.columns()
+        # Copies: the history's column views change on the next append
+        start = max(0, len(history) - self._lazy_bars)
+        columns = {field: col[start:].copy() for field, col in full.items()}
+        node_values: dict[tuple, np.ndarray] = {}
+        values = [math.nan] * layout.size
+        pending = []
+        for key, ind in self._indicators.items():
+            if isinstance(ind, GraphIndicator):
+                pending.append(key)
+            else:
+                # Only the last value is kept: one calculate(), not a series replay
+                layout.fill(values, {key: ind.calculate(history)})
+
+        def evaluate(keys: list[str], out: list[float]) -> None:
+            series = {key: self._indicators[key].series_over(columns, node_values) for key in keys}
+            layout.fill_row(out, series, -1)
 
-    def compute(self, bars: deque[Bar]) -> dict[str, float | dict | None]:
-        return {key: ind.calculate(bars) for key, ind in self._indicators.items()}
+        return LazyIndicatorSnapshot(layout, values, pending, evaluate)
+
+    def update(self, bar: Bar) -> IndicatorSnapshot:
+        """Advance every indicator's streaming state by one bar.
+
+        Each engine tracks a single bar stream (one symbol); results match
+        compute() over the full history seen since the last reset().
+        """
+        self._graph.step(bar)
+        return IndicatorSnapshot.from_values(self._layout, {
+            key: ind.current() if isinstance(ind, GraphIndicator) else ind.update(bar)
+            for key, ind in self._indicators.items()
+        })
+
+    def peek(self, bar: Bar) -> IndicatorSnapshot:
+        """What update(bar) would return, leaving streaming state untouched.
+
+        Meant for provisional values on an in-progress bar, such as the
+        current session's partial daily bar; costs the same as one update().
+        """
+        return self._graph.peek(bar, lambda: IndicatorSnapshot.from_values(self._layout, {
+            key: ind.current() if isinstance(ind, GraphIndicator) else ind.peek(bar)
+            for key, ind in self._indicators.items()
+        }))
+
+    def reset(self) -> None:
+        self._graph.reset()
+        for ind in self._indicators.values():
+            if not isinstance(ind, GraphIndicator):
+                ind.reset()
+
+    def get_state(self) -> dict:
+        """Streaming state of every indicator as JSON-compatible data.
+
+        Pair with set_state() on an engine with the same registrations to
+        resume update() where this engine left off.
+        """
+        for key, ind in self._indicators.items():
+            if not isinstance(ind, GraphIndicator):
+                raise TypeError(f"Indicator {key} has no persistable streaming state")
+        return {"indicators": list(self._indicators), "graph": self._graph.get_state()}
+
+    def set_state(self, state: dict) -> None:
+        """Restore get_state() output; raises ValueError on a registration mismatch."""
+        if sorted(state["indicators"]) != sorted(self._indicators):
+            raise ValueError(
+                f"Indicator state covers {sorted(state['indicators'])}, "
+                f"engine has {sorted(self._indicators)}"
+            )
+        self._graph.set_state(state["graph"])
+
+    def compute_series(self, bars: Sequence[Bar]) -> dict[str, SeriesValue]:
+        """Compute every registered indicator over a fixed bar series at once.
+
+        Returns one float64 array per key (a dict of arrays for BBANDS) where
+        element i equals compute(bars[: i + 1]) and NaN marks warmup.
+        """
+        columns = bar_columns(bars)
+        values = self._graph.compute_series(columns)
+        return {
+            key: (
+                ind.series_from(values)
+                if isinstance(ind, GraphIndicator)
+                else ind.calculate_series(bars, columns)
+            )
+            for key, ind in self._indicators.items()
+        }
+
+    @staticmethod
+    def values_at(series: dict[str, SeriesValue], index: int) -> IndicatorSnapshot:
+        """Read a compute()-shaped snapshot for one bar out of compute_series().
+
+        Builds a layout per call; loops over many bars should stack the
+        series once with `layout.stack()` and wrap rows instead.
+        """
+        layout = SnapshotLayout.for_series(series)
+        return IndicatorSnapshot(layout, layout.row(series, index))
 
     @property
     def max_warmup(self) -> int:
         if not self._indicators:
             return 0
         return max(ind.warmup_period for ind in self._indicators.values())
+
+    def history_bars(self, tolerance: float = DEFAULT_HISTORY_TOLERANCE) -> int:
+        """Shortest history for which compute() matches every indicator's
+        full-history value to within `tolerance` of its seed error.
+
+        Size bar buffers with this instead of a fixed length: recursively
+        smoothed indicators (EMA, RSI, ATR, ADX) keep a fading memory of how
+        their window started, while finite-window ones need only warmup.
+        """
+        return max(
+            (ind.history_bars(tolerance) for ind in self._indicators.values()), default=0,
+        )
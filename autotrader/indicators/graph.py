@@ -0,0 +1,1003 @@
+"""Dependency graph of reusable intermediate indicator series.
+
+Indicators built on GraphIndicator describe their math as a small DAG of
+nodes (close deltas, true range, Wilder sums, rolling sums, ...). The
+IndicatorEngine binds every registered indicator to one shared
+IndicatorGraph, so a node requested by several indicators -- e.g. the
+smoothed true range used by both ATR_14 and ADX_14 -- is computed once per
+bar in streaming mode and once per series in vectorized mode.
+
+Node conventions:
+    - ``key`` identifies a node structurally; the graph deduplicates on it.
+    - ``lead`` is the number of leading bars for which the node is undefined.
+    - ``step()`` reads the current ``value`` of the input nodes and stores
+      the node's own ``value`` (None while undefined).
+    - ``compute_series()`` returns one float64 array aligned to bar indices,
+      NaN where undefined; it must not touch streaming state. Kernels work
+      along the last axis, so a (symbol, time) matrix is evaluated the same way.
+    - ``panel_step()`` is the vectorized streaming counterpart used by
+      PanelIndicatorEngine: per-symbol state lives in arrays indexed by row
+      and ``panel_value`` holds each row's latest value (NaN while undefined).
+    - ``get_state()`` / ``set_state()`` capture the streaming state as plain
+      JSON-compatible data so a graph can be persisted and resumed.
+    - ``checkpoint()`` / ``restore()`` undo one ``step()`` in O(1), so
+      ``IndicatorGraph.peek()`` can evaluate a provisional bar (e.g. the
+      in-progress daily bar) on top of the committed state.
+"""
+from __future__ import annotations
+
+from abc import ABC, abstractmethod
+from collections.abc import Callable, Sequence
+from typing import TypeVar
+
+import numpy as np
+
+from autotrader.core.bar_history import market_day, market_days, timestamp_to_micros
+from autotrader.core.types import Bar
+from autotrader.indicators import rolling
+from autotrader.indicators.base import BarColumns, Indicator, SeriesValue, bar_columns
+
+T = TypeVar("T")
+
+
+class Node(ABC):
+    def __init__(self, *inputs: Node, params: tuple = ()) -> None:
+        self.inputs: tuple[Node, ...] = inputs
+        self.params = params
+        self.key: tuple = (type(self).__name__, params, tuple(i.key for i in inputs))
+        self.lead: int = self._lead()
+        self.reset()
+
+    def _lead(self) -> int:
+        return max((i.lead for i in self.inputs), default=0)
+
+    def reset(self) -> None:
+        self.value = None
+
+    def get_state(self) -> dict:
+        """Streaming state as JSON-compatible data (see set_state())."""
+        return {"value": self.value}
+
+    def set_state(self, state: dict) -> None:
+        self.value = state["value"]
+
+    def checkpoint(self) -> tuple:
+        """O(1) token from which restore() undoes the next step()."""
+        return (self.value,)
+
+    def restore(self, token: tuple) -> None:
+        self.value = token[0]
+
+    @abstractmethod
+    def step(self, bar: Bar) -> None: ...
+
+    @abstractmethod
+    def compute_series(self, columns: BarColumns, inputs: list[np.ndarray]) -> np.ndarray: ...
+
+    # -- panel (many symbols) streaming state --------------------------
+
+    def panel_alloc(self, size: int) -> None:
+        """Allocate per-row streaming state for `size` symbols."""
+        self._panel_fields: dict[str, tuple[float, np.dtype, tuple[int, ...]]] = {}
+        self.panel_value = self._panel_array("panel_value", size, np.nan)
+
+    def _panel_array(
+        self, name: str, size: int, fill: float,
+        dtype: type = np.float64, tail: tuple[int, ...] = (),
+    ) -> np.ndarray:
+        self._panel_fields[name] = (fill, dtype, tail)
+        arr = np.full((size, *tail), fill, dtype=dtype)
+        setattr(self, name, arr)
+        return arr
+
+    def panel_grow(self, size: int) -> None:
+        """Extend per-row state to `size` rows, keeping existing rows."""
+        for name, (fill, dtype, tail) in self._panel_fields.items():
+            old = getattr(self, name)
+            new = np.full((size, *tail), fill, dtype=dtype)
+            new[: old.shape[0]] = old
+            setattr(self, name, new)
+
+    def panel_reset(self, rows: np.ndarray | slice) -> None:
+        for name, (fill, _dtype, _tail) in self._panel_fields.items():
+            getattr(self, name)[rows] = fill
+
+    def panel_checkpoint(self, rows: np.ndarray) -> dict[str, np.ndarray]:
+        """Copy of the rows' state, for panel_restore()."""
+        return {name: getattr(self, name)[rows].copy() for name in self._panel_fields}
+
+    def panel_restore(self, rows: np.ndarray, token: dict[str, np.ndarray]) -> None:
+        for name, saved in token.items():
+            getattr(self, name)[rows] = saved
+
+    def panel_step(self, rows: np.ndarray, columns: BarColumns) -> None:
+        """Advance the given rows by one bar; `columns` hold their bar fields.
+
+        The default suits stateless nodes: compute_series() is elementwise
+        for them, so it is applied to the rows' current input values.
+        """
+        inputs = [i.panel_value[rows] for i in self.inputs]
+        self.panel_value[rows] = self.compute_series(columns, inputs)
+
+    def __repr__(self) -> str:
+        return f"{type(self).__name__}{self.params or ''}"
+
+
+class IndicatorGraph:
+    """Deduplicated, topologically ordered set of nodes for one bar stream."""
+
+    def __init__(self) -> None:
+        self._nodes: dict[tuple, Node] = {}
+        self._order: list[Node] = []
+        self.bar_count = 0
+
+    @property
+    def nodes(self) -> list[Node]:
+        return list(self._order)
+
+    def add(self, node: Node) -> Node:
+        """Insert a node (and its inputs) and return the canonical instance."""
+        existing = self._nodes.get(node.key)
+        if existing is not None:
+            return existing
+        node.inputs = tuple(self.add(i) for i in node.inputs)
+        self._nodes[node.key] = node
+        self._order.append(node)
+        return node
+
+    def step(self, bar: Bar) -> None:
+        self.bar_count += 1
+        for node in self._order:
+            node.step(bar)
+
+    def reset(self) -> None:
+        self.bar_count = 0
+        for node in self._order:
+            node.reset()
+
+    def get_state(self) -> dict:
+        """Streaming state of every node, keyed by node repr and key."""
+        return {
+            "bar_count": self.bar_count,
+            "nodes": {self._state_key(node): node.get_state() for node in self._order},
+        }
+
+    def set_state(self, state: dict) -> None:
+        """Restore get_state() output taken from a graph with the same nodes.
+
+        Raises ValueError if the node sets differ; the graph is left untouched.
+        """
+        nodes = state["nodes"]
+        expected = {self._state_key(node) for node in self._order}
+        if set(nodes) != expected:
+            raise ValueError("Indicator state does not match the graph's nodes")
+        for node in self._order:
+            node.set_state(nodes[self._state_key(node)])
+        self.bar_count = state["bar_count"]
+
+    @staticmethod
+    def _state_key(node: Node) -> str:
+        return repr(node.key)
+
+    def peek(self, bar: Bar, read: Callable[[], T]) -> T:
+        """Step `bar`, return `read()`, then roll every node back.
+
+        Costs one step(); the committed streaming state is unchanged.
+        """
+        tokens = [node.checkpoint() for node in self._order]
+        bar_count = self.bar_count
+        try:
+            self.step(bar)
+            return read()
+        finally:
+            for node, token in zip(self._order, tokens):
+                node.restore(token)
+            self.bar_count = bar_count
+
+    def panel_alloc(self, size: int) -> None:
+        self.panel_counts = np.zeros(size, dtype=np.int64)
+        for node in self._order:
+            node.panel_alloc(size)
+
+    def panel_grow(self, size: int) -> None:
+        counts = np.zeros(size, dtype=np.int64)
+        counts[: self.panel_counts.shape[0]] = self.panel_counts
+        self.panel_counts = counts
+        for node in self._order:
+            node.panel_grow(size)
+
+    def panel_step(self, rows: np.ndarray, columns: BarColumns) -> None:
+        """Advance the listed rows (unique symbols) by one bar each."""
+        self.panel_counts[rows] += 1
+        for node in self._order:
+            node.panel_step(rows, columns)
+
+    def panel_reset(self, rows: np.ndarray | slice = slice(None)) -> None:
+        self.panel_counts[rows] = 0
+        for node in self._order:
+            node.panel_reset(rows)
+
+    def panel_peek(self, rows: np.ndarray, columns: BarColumns, read: Callable[[], T]) -> T:
+        """panel_step() the rows, return `read()`, then restore the rows' state."""
+        tokens = [node.panel_checkpoint(rows) for node in self._order]
+        counts = self.panel_counts[rows].copy()
+        try:
+            self.panel_step(rows, columns)
+            return read()
+        finally:
+            for node, token in zip(self._order, tokens):
+                node.panel_restore(rows, token)
+            self.panel_counts[rows] = counts
+
+    def compute_series(
+        self,
+        columns: BarColumns,
+        targets: Sequence[Node] | None = None,
+        values: dict[tuple, np.ndarray] | None = None,
+    ) -> dict[tuple, np.ndarray]:
+        """Evaluate nodes over full columns; only ancestors of `targets` if given.
+
+        Node arrays already in `values` (from an earlier call over the same
+        columns) are reused, and new ones are added to it.
+        """
+        needed = self._ancestors(targets) if targets is not None else None
+        values = {} if values is None else values
+        for node in self._order:
+            if needed is not None and node.key not in needed:
+                continue
+            if node.key in values:
+                continue
+            inputs = [values[i.key] for i in node.inputs]
+            values[node.key] = node.compute_series(columns, inputs)
+        return values
+
+    @staticmethod
+    def _ancestors(targets: Sequence[Node]) -> set[tuple]:
+        seen: set[tuple] = set()
+        stack = list(targets)
+        while stack:
+            node = stack.pop()
+            if node.key not in seen:
+                seen.add(node.key)
+                stack.extend(node.inputs)
+        return seen
+
+
+class GraphIndicator(Indicator):
+    """Indicator whose streaming and vectorized modes are both driven by nodes.
+
+    Subclasses add their nodes in bind() and turn node values into the
+    indicator's output in output() / output_series(). A standalone indicator
+    owns a private graph; inside an IndicatorEngine it is attached to the
+    engine's shared graph instead.
+    """
+
+    _graph: IndicatorGraph | None = None
+
+    @abstractmethod
+    def bind(self, graph: IndicatorGraph) -> list[Node]:
+        """Add this indicator's nodes to `graph`; return the ones it reads."""
+
+    @abstractmethod
+    def output(self) -> float | dict | None:
+        """Current value from the bound nodes (called after warmup only)."""
+
+    @abstractmethod
+    def output_series(self, values: dict[tuple, np.ndarray]) -> SeriesValue:
+        """Full-series value from node arrays (warmup is masked by the caller)."""
+
+    def attach(self, graph: IndicatorGraph) -> None:
+        self._graph = graph
+        self._targets = self.bind(graph)
+
+    def current(self) -> float | dict | None:
+        if self._graph is None or self._graph.bar_count < self.warmup_period:
+            return None
+        return self.output()
+
+    def update(self, bar: Bar) -> float | dict | None:
+        if self._graph is None:
+            self.attach(IndicatorGraph())
+        self._graph.step(bar)
+        return self.current()
+
+    def reset(self) -> None:
+        if self._graph is not None:
+            self._graph.reset()
+
+    def peek(self, bar: Bar) -> float | dict | None:
+        if self._graph is None:
+            self.attach(IndicatorGraph())
+        return self._graph.peek(bar, self.current)
+
+    def calculate_series(
+        self, bars: Sequence[Bar], columns: BarColumns | None = None,
+    ) -> SeriesValue:
+        columns = columns if columns is not None else bar_columns(bars)
+        return self.series_over(columns, {})
+
+    def series_over(self, columns: BarColumns, values: dict[tuple, np.ndarray]) -> SeriesValue:
+        """calculate_series() over `columns`, sharing node arrays through `values`.
+
+        Indicators evaluated one after another with the same `values` dict
+        compute each common intermediate (e.g. true range) only once.
+        """
+        if self._graph is None:
+            self.attach(IndicatorGraph())
+        self._graph.compute_series(columns, self._targets, values)
+        return self.series_from(values)
+
+    def series_from(self, values: dict[tuple, np.ndarray]) -> SeriesValue:
+        """Apply output_series() and blank out the warmup region."""
+        result = self.output_series(values)
+        cutoff = self.warmup_period - 1
+        if isinstance(result, dict):
+            for arr in result.values():
+                arr[..., :cutoff] = np.nan
+        else:
+            result[..., :cutoff] = np.nan
+        return result
+
+
+# ----------------------------------------------------------------------
+# Shared intermediate nodes
+# ----------------------------------------------------------------------
+
+class Column(Node):
+    """Raw bar field (open/high/low/close/volume)."""
+
+    def __init__(self, field: str) -> None:
+        super().__init__(params=(field,))
+        self.field = field
+
+    def step(self, bar: Bar) -> None:
+        self.value = getattr(bar, self.field)
+
+    def compute_series(self, columns: BarColumns, inputs: list[np.ndarray]) -> np.ndarray:
+        return columns[self.field]
+
+
+class Difference(Node):
+    """a - b, e.g. the MACD line from its fast and slow EMAs."""
+
+    def step(self, bar: Bar) -> None:
+        a, b = (node.value for node in self.inputs)
+        self.value = None if a is None or b is None else a - b
+
+    def compute_series(self, columns: BarColumns, inputs: list[np.ndarray]) -> np.ndarray:
+        return inputs[0] - inputs[1]
+
+
+class Product(Node):
+    """a * b, e.g. price times volume."""
+
+    def step(self, bar: Bar) -> None:
+        a, b = (node.value for node in self.inputs)
+        self.value = None if a is None or b is None else a * b
+
+    def compute_series(self, columns: BarColumns, inputs: list[np.ndarray]) -> np.ndarray:
+        return inputs[0] * inputs[1]
+
+
+class Delta(Node):
+    """First difference: x[t] - x[t-1]."""
+
+    def _lead(self) -> int:
+        return self.inputs[0].lead + 1
+
+    def reset(self) -> None:
+        super().reset()
+        self._prev: float | None = None
+
+    def step(self, bar: Bar) -> None:
+        x = self.inputs[0].value
+        prev = self._prev
+        self.value = None if x is None or prev is None else x - prev
+        self._prev = x
+
+    def get_state(self) -> dict:
+        return {**super().get_state(), "prev": self._prev}
+
+    def set_state(self, state: dict) -> None:
+        super().set_state(state)
+        self._prev = state["prev"]
+
+    def checkpoint(self) -> tuple:
+        return (self.value, self._prev)
+
+    def restore(self, token: tuple) -> None:
+        self.value, self._prev = token
+
+    def compute_series(self, columns: BarColumns, inputs: list[np.ndarray]) -> np.ndarray:
+        return rolling.shift_right(np.diff(inputs[0], axis=-1))
+
+    def panel_alloc(self, size: int) -> None:
+        super().panel_alloc(size)
+        self._panel_array("_panel_prev", size, np.nan)
+
+    def panel_step(self, rows: np.ndarray, columns: BarColumns) -> None:
+        x = self.inputs[0].panel_value[rows]
+        self.panel_value[rows] = x - self._panel_prev[rows]
+        self._panel_prev[rows] = x
+
+
+class PositivePart(Node):
+    """max(x, 0) -- e.g. gains from close deltas."""
+
+    def step(self, bar: Bar) -> None:
+        x = self.inputs[0].value
+        self.value = None if x is None else (x if x > 0 else 0.0)
+
+    def compute_series(self, columns: BarColumns, inputs: list[np.ndarray]) -> np.ndarray:
+        return np.maximum(inputs[0], 0.0)
+
+
+class NegativePart(Node):
+    """max(-x, 0) -- e.g. losses from close deltas."""
+
+    def step(self, bar: Bar) -> None:
+        x = self.inputs[0].value
+        self.value = None if x is None else (-x if x < 0 else 0.0)
+
+    def compute_series(self, columns: BarColumns, inputs: list[np.ndarray]) -> np.ndarray:
+        return np.maximum(-inputs[0], 0.0)
+
+
+class TrueRange(Node):
+    def __init__(self) -> None:
+        super().__init__(Column("high"), Column("low"), Column("close"))
+
+    def _lead(self) -> int:
+        return 1
+
+    def reset(self) -> None:
+        super().reset()
+        self._prev_close: float | None = None
+
+    def step(self, bar: Bar) -> None:
+        prev_close = self._prev_close
+        self._prev_close = bar.close
+        if prev_close is None:
+            self.value = None
+            return
+        self.value = max(
+            bar.high - bar.low, abs(bar.high - prev_close), abs(bar.low - prev_close),
+        )
+
+    def get_state(self) -> dict:
+        return {**super().get_state(), "prev_close": self._prev_close}
+
+    def set_state(self, state: dict) -> None:
+        super().set_state(state)
+        self._prev_close = state["prev_close"]
+
+    def checkpoint(self) -> tuple:
+        return (self.value, self._prev_close)
+
+    def restore(self, token: tuple) -> None:
+        self.value, self._prev_close = token
+
+    def compute_series(self, columns: BarColumns, inputs: list[np.ndarray]) -> np.ndarray:
+        high, low, close = inputs
+        return rolling.shift_right(rolling.true_range(high, low, close))
+
+    def panel_alloc(self, size: int) -> None:
+        super().panel_alloc(size)
+        self._panel_array("_panel_prev_close", size, np.nan)
+
+    def panel_step(self, rows: np.ndarray, columns: BarColumns) -> None:
+        high, low = columns["high"], columns["low"]
+        prev_close = self._panel_prev_close[rows]
+        self.panel_value[rows] = np.maximum.reduce([
+            high - low, np.abs(high - prev_close), np.abs(low - prev_close),
+        ])
+        self._panel_prev_close[rows] = columns["close"]
+
+
+class DirectionalMovement(Node):
+    """Wilder's +DM (direction="plus") or -DM (direction="minus")."""
+
+    def __init__(self, direction: str) -> None:
+        super().__init__(Column("high"), Column("low"), params=(direction,))
+        self.plus = direction == "plus"
+
+    def _lead(self) -> int:
+        return 1
+
+    def reset(self) -> None:
+        super().reset()
+        self._prev: tuple[float, float] | None = None
+
+    def step(self, bar: Bar) -> None:
+        prev = self._prev
+        self._prev = (bar.high, bar.low)
+        if prev is None:
+            self.value = None
+            return
+        up = bar.high - prev[0]
+        down = prev[1] - bar.low
+        if self.plus:
+            self.value = up if up > down and up > 0 else 0.0
+        else:
+            self.value = down if down > up and down > 0 else 0.0
+
+    def get_state(self) -> dict:
+        prev = None if self._prev is None else list(self._prev)
+        return {**super().get_state(), "prev": prev}
+
+    def set_state(self, state: dict) -> None:
+        super().set_state(state)
+        prev = state["prev"]
+        self._prev = None if prev is None else (prev[0], prev[1])
+
+    def checkpoint(self) -> tuple:
+        return (self.value, self._prev)
+
+    def restore(self, token: tuple) -> None:
+        self.value, self._prev = token
+
+    def compute_series(self, columns: BarColumns, inputs: list[np.ndarray]) -> np.ndarray:
+        high, low = inputs
+        up = high[..., 1:] - high[..., :-1]
+        down = low[..., :-1] - low[..., 1:]
+        return rolling.shift_right(self._move(up, down))
+
+    def _move(self, up: np.ndarray, down: np.ndarray) -> np.ndarray:
+        if self.plus:
+            return np.where((up > down) & (up > 0), up, 0.0)
+        return np.where((down > up) & (down > 0), down, 0.0)
+
+    def panel_alloc(self, size: int) -> None:
+        super().panel_alloc(size)
+        self._panel_array("_panel_prev_high", size, np.nan)
+        self._panel_array("_panel_prev_low", size, np.nan)
+
+    def panel_step(self, rows: np.ndarray, columns: BarColumns) -> None:
+        high, low = columns["high"], columns["low"]
+        up = high - self._panel_prev_high[rows]
+        down = self._panel_prev_low[rows] - low
+        move = self._move(up, down)
+        move[np.isnan(up)] = np.nan
+        self.panel_value[rows] = move
+        self._panel_prev_high[rows] = high
+        self._panel_prev_low[rows] = low
+
+
+class _SeededSmoother(Node):
+    """Recursive smoother seeded from the first `period` defined inputs."""
+
+    decay: float
+    gain: float
+    seed: str
+
+    def __init__(self, source: Node, period: int) -> None:
+        self.period = period
+        super().__init__(source, params=(period,))
+
+    def _lead(self) -> int:
+        return self.inputs[0].lead + self.period - 1
+
+    def reset(self) -> None:
+        super().reset()
+        self._count = 0
+        self._seed_sum = 0.0
+        self._level = 0.0
+
+    def _seed_value(self, total: float | np.ndarray) -> float | np.ndarray:
+        return total if self.seed == "sum" else total / self.period
+
+    def step(self, bar: Bar) -> None:
+        x = self.inputs[0].value
+        if x is None:
+            self.value = None
+            return
+        if self._count < self.period:
+            self._count += 1
+            self._seed_sum += x
+            if self._count == self.period:
+                self._level = self._seed_value(self._seed_sum)
+                self.value = self._level
+            return
+        self._level = self._advance(self._level, x)
+        self.value = self._level
+
+    def get_state(self) -> dict:
+        return {
+            **super().get_state(),
+            "count": self._count, "seed_sum": self._seed_sum, "level": self._level,
+        }
+
+    def set_state(self, state: dict) -> None:
+        super().set_state(state)
+        self._count = state["count"]
+        self._seed_sum = state["seed_sum"]
+        self._level = state["level"]
+
+    def checkpoint(self) -> tuple:
+        return (self.value, self._count, self._seed_sum, self._level)
+
+    def restore(self, token: tuple) -> None:
+        self.value, self._count, self._seed_sum, self._level = token
+
+    @abstractmethod
+    def _advance(
+        self, value: float | np.ndarray, x: float | np.ndarray,
+    ) -> float | np.ndarray:
+        """One recurrence step; must work on floats and arrays alike."""
+
+    def panel_alloc(self, size: int) -> None:
+        super().panel_alloc(size)
+        self._panel_array("_panel_count", size, 0, dtype=np.int64)
+        self._panel_array("_panel_seed", size, 0.0)
+        self._panel_array("_panel_level", size, 0.0)
+
+    def panel_step(self, rows: np.ndarray, columns: BarColumns) -> None:
+        x = self.inputs[0].panel_value[rows]
+        valid = ~np.isnan(x)
+        count = self._panel_count[rows]
+        level = self._panel_level[rows]
+        seeding = valid & (count < self.period)
+        advancing = valid & (count >= self.period)
+
+        seed_sum = self._panel_seed[rows] + np.where(seeding, x, 0.0)
+        count = count + seeding
+        seeded = seeding & (count == self.period)
+        level = np.where(seeded, self._seed_value(seed_sum), level)
+        level = np.where(advancing, self._advance(level, x), level)
+
+        self._panel_count[rows] = count
+        self._panel_seed[rows] = seed_sum
+        self._panel_level[rows] = level
+        self.panel_value[rows] = np.where(valid & (count >= self.period), level, np.nan)
+
+    def compute_series(self, columns: BarColumns, inputs: list[np.ndarray]) -> np.ndarray:
+        x = inputs[0]
+        start = self.inputs[0].lead
+        out = np.full(x.shape, np.nan)
+        out[..., start:] = rolling.seeded_smooth(
+            x[..., start:], self.period, self.decay, self.gain, seed=self.seed,
+        )
+        return out
+
+
+class WilderSum(_SeededSmoother):
+    """Wilder's smoothed running sum: total - total / period + x.
+
+    Dividing by `period` gives Wilder's moving average, so ATR, RSI and ADX
+    can all share one node per (input, period).
+    """
+
+    seed = "sum"
+
+    def __init__(self, source: Node, period: int) -> None:
+        super().__init__(source, period)
+        self.decay = 1.0 - 1.0 / period
+        self.gain = 1.0
+
+    def _advance(
+        self, value: float | np.ndarray, x: float | np.ndarray,
+    ) -> float | np.ndarray:
+        return value - value / self.period + x
+
+
+class Ema(_SeededSmoother):
+    """Exponential moving average seeded with the SMA of the first `period` inputs."""
+
+    seed = "mean"
+
+    def __init__(self, source: Node, period: int) -> None:
+        super().__init__(source, period)
+        self.multiplier = 2.0 / (period + 1)
+        self.decay = 1.0 - self.multiplier
+        self.gain = self.multiplier
+
+    def _advance(
+        self, value: float | np.ndarray, x: float | np.ndarray,
+    ) -> float | np.ndarray:
+        return (x - value) * self.multiplier + value
+
+
+class RollingSum(Node):
+    """Sum of the last `window` defined inputs."""
+
+    def __init__(self, source: Node, window: int) -> None:
+        self.window = window
+        super().__init__(source, params=(window,))
+
+    def _lead(self) -> int:
+        return self.inputs[0].lead + self.window - 1
+
+    def reset(self) -> None:
+        super().reset()
+        self._window = rolling.RollingMean(self.window)
+
+    def step(self, bar: Bar) -> None:
+        x = self.inputs[0].value
+        if x is None:
+            self.value = None
+            return
+        self._window.append(x)
+        self.value = self._window.total if self._window.full else None
+
+    def get_state(self) -> dict:
+        return {**super().get_state(), "window": self._window.get_state()}
+
+    def set_state(self, state: dict) -> None:
+        super().set_state(state)
+        self._window.set_state(state["window"])
+
+    def checkpoint(self) -> tuple:
+        return (self.value, self._window.checkpoint())
+
+    def restore(self, token: tuple) -> None:
+        self.value = token[0]
+        self._window.rollback(token[1])
+
+    def compute_series(self, columns: BarColumns, inputs: list[np.ndarray]) -> np.ndarray:
+        x = inputs[0]
+        start = self.inputs[0].lead
+        out = np.full(x.shape, np.nan)
+        out[..., start:] = rolling.rolling_sum(x[..., start:], self.window)
+        return out
+
+    def panel_alloc(self, size: int) -> None:
+        super().panel_alloc(size)
+        self._panel_array("_panel_ring", size, 0.0, tail=(self.window,))
+        self._panel_array("_panel_pos", size, 0, dtype=np.int64)
+        self._panel_array("_panel_filled", size, 0, dtype=np.int64)
+        self._panel_array("_panel_sum", size, 0.0)
+
+    def panel_step(self, rows: np.ndarray, columns: BarColumns) -> None:
+        x = self.inputs[0].panel_value[rows]
+        valid = ~np.isnan(x)
+        self.panel_value[rows] = np.nan
+        rows = rows[valid]
+        x = x[valid]
+
+        pos = self._panel_pos[rows]
+        filled = self._panel_filled[rows]
+        evicted = np.where(filled == self.window, self._panel_ring[rows, pos], 0.0)
+        total = self._panel_sum[rows] - evicted + x
+        self._panel_ring[rows, pos] = x
+        self._panel_pos[rows] = (pos + 1) % self.window
+        filled = np.minimum(filled + 1, self.window)
+        self._panel_filled[rows] = filled
+        self._panel_sum[rows] = total
+        self.panel_value[rows] = np.where(filled == self.window, total, np.nan)
+
+
+class RollingVariance(Node):
+    """Population variance of the last `window` defined inputs (Welford updates)."""
+
+    def __init__(self, source: Node, window: int) -> None:
+        self.window = window
+        super().__init__(source, params=(window,))
+
+    def _lead(self) -> int:
+        return self.inputs[0].lead + self.window - 1
+
+    def reset(self) -> None:
+        super().reset()
+        self._window = rolling.RollingVariance(self.window)
+
+    def step(self, bar: Bar) -> None:
+        x = self.inputs[0].value
+        if x is None:
+            self.value = None
+            return
+        self._window.append(x)
+        self.value = self._window.variance() if self._window.full else None
+
+    def get_state(self) -> dict:
+        return {**super().get_state(), "window": self._window.get_state()}
+
+    def set_state(self, state: dict) -> None:
+        super().set_state(state)
+        self._window.set_state(state["window"])
+
+    def checkpoint(self) -> tuple:
+        return (self.value, self._window.checkpoint())
+
+    def restore(self, token: tuple) -> None:
+        self.value = token[0]
+        self._window.rollback(token[1])
+
+    def compute_series(self, columns: BarColumns, inputs: list[np.ndarray]) -> np.ndarray:
+        x = inputs[0]
+        start = self.inputs[0].lead
+        out = np.full(x.shape, np.nan)
+        out[..., start:] = rolling.rolling_var(x[..., start:], self.window)
+        return out
+
+    def panel_alloc(self, size: int) -> None:
+        super().panel_alloc(size)
+        self._panel_array("_panel_ring", size, 0.0, tail=(self.window,))
+        self._panel_array("_panel_pos", size, 0, dtype=np.int64)
+        self._panel_array("_panel_filled", size, 0, dtype=np.int64)
+        self._panel_array("_panel_mean", size, 0.0)
+        self._panel_array("_panel_m2", size, 0.0)
+
+    def panel_step(self, rows: np.ndarray, columns: BarColumns) -> None:
+        x = self.inputs[0].panel_value[rows]
+        valid = ~np.isnan(x)
+        self.panel_value[rows] = np.nan
+        rows = rows[valid]
+        x = x[valid]
+
+        pos = self._panel_pos[rows]
+        filled = self._panel_filled[rows]
+        mean = self._panel_mean[rows]
+        m2 = self._panel_m2[rows]
+        full = filled == self.window
+        # Same windowed Welford update as rolling.RollingVariance, per row
+        old = np.where(full, self._panel_ring[rows, pos], 0.0)
+        count = np.minimum(filled + 1, self.window)
+        new_mean = np.where(full, mean + (x - old) / self.window, mean + (x - mean) / count)
+        m2 = np.where(
+            full, m2 + (x - old) * (x - new_mean + old - mean), m2 + (x - mean) * (x - new_mean),
+        )
+
+        self._panel_ring[rows, pos] = x
+        self._panel_pos[rows] = (pos + 1) % self.window
+        self._panel_filled[rows] = count
+        self._panel_mean[rows] = new_mean
+        self._panel_m2[rows] = m2
+        self.panel_value[rows] = np.where(
+            count == self.window, np.maximum(m2, 0.0) / self.window, np.nan,
+        )
+
+
+class _RollingExtremeNode(Node):
+    """Max or min of the last `window` defined inputs."""
+
+    _streaming: type[rolling.RollingMax | rolling.RollingMin]
+    _kernel: Callable[[np.ndarray, int], np.ndarray]
+    _reduce: Callable[..., np.ndarray]
+
+    def __init__(self, source: Node, window: int) -> None:
+        self.window = window
+        super().__init__(source, params=(window,))
+
+    def _lead(self) -> int:
+        return self.inputs[0].lead + self.window - 1
+
+    def reset(self) -> None:
+        super().reset()
+        self._window = self._streaming(self.window)
+
+    def step(self, bar: Bar) -> None:
+        x = self.inputs[0].value
+        if x is None:
+            self.value = None
+            return
+        self._window.append(x)
+        self.value = self._window.value if self._window.full else None
+
+    def get_state(self) -> dict:
+        return {**super().get_state(), "window": self._window.get_state()}
+
+    def set_state(self, state: dict) -> None:
+        super().set_state(state)
+        self._window.set_state(state["window"])
+
+    def checkpoint(self) -> tuple:
+        return (self.value, self._window.checkpoint())
+
+    def restore(self, token: tuple) -> None:
+        self.value = token[0]
+        self._window.rollback(token[1])
+
+    def compute_series(self, columns: BarColumns, inputs: list[np.ndarray]) -> np.ndarray:
+        x = inputs[0]
+        start = self.inputs[0].lead
+        out = np.full(x.shape, np.nan)
+        out[..., start:] = type(self)._kernel(x[..., start:], self.window)
+        return out
+
+    def panel_alloc(self, size: int) -> None:
+        super().panel_alloc(size)
+        self._panel_array("_panel_ring", size, np.nan, tail=(self.window,))
+        self._panel_array("_panel_pos", size, 0, dtype=np.int64)
+        self._panel_array("_panel_filled", size, 0, dtype=np.int64)
+
+    def panel_step(self, rows: np.ndarray, columns: BarColumns) -> None:
+        # O(window) per row rather than a monotonic deque, but one NumPy
+        # reduction for every row at once.
+        x = self.inputs[0].panel_value[rows]
+        valid = ~np.isnan(x)
+        self.panel_value[rows] = np.nan
+        rows = rows[valid]
+        pos = self._panel_pos[rows]
+        self._panel_ring[rows, pos] = x[valid]
+        self._panel_pos[rows] = (pos + 1) % self.window
+        filled = np.minimum(self._panel_filled[rows] + 1, self.window)
+        self._panel_filled[rows] = filled
+        extreme = type(self)._reduce(self._panel_ring[rows], axis=-1)
+        self.panel_value[rows] = np.where(filled == self.window, extreme, np.nan)
+
+
+class RollingMax(_RollingExtremeNode):
+    _streaming = rolling.RollingMax
+    _kernel = rolling.rolling_max
+    _reduce = np.max
+
+
+class RollingMin(_RollingExtremeNode):
+    _streaming = rolling.RollingMin
+    _kernel = rolling.rolling_min
+    _reduce = np.min
+
+
+class MarketDay(Node):
+    """US Eastern trading date of each bar, as days since the epoch."""
+
+    def step(self, bar: Bar) -> None:
+        self.value = float(market_day(timestamp_to_micros(bar.timestamp)))
+
+    def compute_series(self, columns: BarColumns, inputs: list[np.ndarray]) -> np.ndarray:
+        return market_days(columns["timestamp"]).astype(np.float64)
+
+
+class SessionSum(Node):
+    """Running sum of `source` that restarts whenever `session` changes."""
+
+    def __init__(self, source: Node, session: Node) -> None:
+        super().__init__(source, session)
+
+    def reset(self) -> None:
+        super().reset()
+        self._session: float | None = None
+        self._total = 0.0
+
+    def step(self, bar: Bar) -> None:
+        x, session = (node.value for node in self.inputs)
+        if x is None or session is None:
+            self.value = None
+            return
+        if session != self._session:
+            self._session = session
+            self._total = 0.0
+        self._total += x
+        self.value = self._total
+
+    def get_state(self) -> dict:
+        return {**super().get_state(), "session": self._session, "total": self._total}
+
+    def set_state(self, state: dict) -> None:
+        super().set_state(state)
+        self._session = state["session"]
+        self._total = state["total"]
+
+    def checkpoint(self) -> tuple:
+        return (self.value, self._session, self._total)
+
+    def restore(self, token: tuple) -> None:
+        self.value, self._session, self._total = token
+
+    def compute_series(self, columns: BarColumns, inputs: list[np.ndarray]) -> np.ndarray:
+        x, session = inputs
+        if x.shape[-1] == 0:
+            return x.copy()
+        total = np.cumsum(x, axis=-1)
+        before = total - x
+        # Index of the first bar of each bar's session, carried forward
+        first = np.ones(session.shape, dtype=bool)
+        first[..., 1:] = session[..., 1:] != session[..., :-1]
+        index = np.broadcast_to(np.arange(session.shape[-1]), session.shape)
+        start = np.maximum.accumulate(np.where(first, index, 0), axis=-1)
+        return total - np.take_along_axis(before, start, axis=-1)
+
+    def panel_alloc(self, size: int) -> None:
+        super().panel_alloc(size)
+        self._panel_array("_panel_session", size, np.nan)
+        self._panel_array("_panel_total", size, 0.0)
+
+    def panel_step(self, rows: np.ndarray, columns: BarColumns) -> None:
+        x = self.inputs[0].panel_value[rows]
+        session = self.inputs[1].panel_value[rows]
+        new = session != self._panel_session[rows]
+        total = np.where(new, 0.0, self._panel_total[rows]) + x
+        valid = ~np.isnan(x)
+        self._panel_session[rows] = np.where(valid, session, self._panel_session[rows])
+        self._panel_total[rows] = np.where(valid, total, self._panel_total[rows])
+        self.panel_value[rows] = np.where(valid, total, np.nan)
@@ -0,0 +1,203 @@
+"""Indicators for many symbols at once over a (symbol, time) panel.
+
+PanelIndicatorEngine runs the same node graph as IndicatorEngine, but every
+node keeps per-symbol state in arrays indexed by row. One update() call
+advances all symbols that printed a bar at a timestamp with a fixed number
+of NumPy operations per node, and compute_panel() evaluates whole histories
+for every symbol as a single NaN-padded matrix.
+"""
+from __future__ import annotations
+
+from collections.abc import Mapping, Sequence
+
+import numpy as np
+
+from autotrader.core.types import Bar
+from autotrader.indicators.base import BarColumns, IndicatorSpec, SeriesValue, bar_columns
+from autotrader.indicators.engine import _INDICATOR_REGISTRY, DEFAULT_HISTORY_TOLERANCE
+from autotrader.indicators.graph import GraphIndicator, IndicatorGraph
+from autotrader.indicators.snapshot import IndicatorSnapshot, SnapshotLayout
+
+_PRICE_FIELDS = ("open", "high", "low", "close", "volume")
+
+
+class PanelIndicatorEngine:
+    """Streaming and vectorized indicators for a universe of symbols.
+
+    Symbols are assigned rows on first sight; row storage doubles when the
+    universe outgrows it. Only GraphIndicator-based indicators can be
+    batched across symbols.
+    """
+
+    def __init__(self, capacity: int = 64) -> None:
+        self._indicators: dict[str, GraphIndicator] = {}
+        self._rows: dict[str, int] = {}
+        self._capacity = max(1, capacity)
+        self._graph = IndicatorGraph()
+        self._graph.panel_alloc(self._capacity)
+        self._layout = SnapshotLayout(())
+
+    @property
+    def graph(self) -> IndicatorGraph:
+        return self._graph
+
+    @property
+    def layout(self) -> SnapshotLayout:
+        """Slot layout of the snapshots returned by update() and peek()."""
+        return self._layout
+
+    @property
+    def symbols(self) -> list[str]:
+        return list(self._rows)
+
+    @property
+    def max_warmup(self) -> int:
+        if not self._indicators:
+            return 0
+        return max(ind.warmup_period for ind in self._indicators.values())
+
+    def history_bars(self, tolerance: float = DEFAULT_HISTORY_TOLERANCE) -> int:
+        """See IndicatorEngine.history_bars()."""
+        return max(
+            (ind.history_bars(tolerance) for ind in self._indicators.values()), default=0,
+        )
+
+    def register(self, spec: IndicatorSpec) -> None:
+        """Add an indicator. Rebuilds the shared graph, discarding streaming state."""
+        cls = _INDICATOR_REGISTRY.get(spec.name)
+        if cls is None:
+            raise ValueError(f"Unknown indicator: {spec.name}")
+        indicator = cls(**spec.params)
+        if not isinstance(indicator, GraphIndicator):
+            raise TypeError(f"Indicator {spec.name} cannot be evaluated as a panel")
+        self._indicators[spec.key] = indicator
+        self._layout = SnapshotLayout.for_indicators(self._indicators)
+        self._graph = IndicatorGraph()
+        for ind in self._indicators.values():
+            ind.attach(self._graph)
+        self._graph.panel_alloc(self._capacity)
+
+    def row(self, symbol: str) -> int:
+        """Row index for `symbol`, assigning a new row if needed."""
+        row = self._rows.get(symbol)
+        if row is None:
+            row = len(self._rows)
+            if row >= self._capacity:
+                self._capacity *= 2
+                self._graph.panel_grow(self._capacity)
+            self._rows[symbol] = row
+        return row
+
+    # ------------------------------------------------------------------
+    # Streaming
+    # ------------------------------------------------------------------
+
+    def step(self, bars: Sequence[Bar]) -> dict[str, SeriesValue]:
+        """Advance each bar's symbol by one bar in a single vectorized pass.
+
+        `bars` holds at most one bar per symbol (typically every symbol that
+        printed at one timestamp). Returns one array per indicator key with
+        element i describing bars[i]; NaN marks warmup.
+        """
+        rows = self._rows_for(bars)
+        self._graph.panel_step(rows, bar_columns(bars))
+        return self._outputs(rows)
+
+    def update(self, bars: Sequence[Bar]) -> dict[str, IndicatorSnapshot]:
+        """step(), returned as one IndicatorSnapshot per symbol."""
+        return self._by_symbol(bars, self.step(bars))
+
+    def peek(self, bars: Sequence[Bar]) -> dict[str, IndicatorSnapshot]:
+        """What update(bars) would return, leaving every row's state untouched.
+
+        Evaluates provisional bars (e.g. each symbol's in-progress daily bar)
+        on top of the committed state in one vectorized pass.
+        """
+        rows = self._rows_for(bars)
+        arrays = self._graph.panel_peek(rows, bar_columns(bars), lambda: self._outputs(rows))
+        return self._by_symbol(bars, arrays)
+
+    def _rows_for(self, bars: Sequence[Bar]) -> np.ndarray:
+        rows = np.fromiter((self.row(b.symbol) for b in bars), dtype=np.int64, count=len(bars))
+        if len(np.unique(rows)) != len(rows):
+            raise ValueError("At most one bar per symbol per call")
+        return rows
+
+    def _outputs(self, rows: np.ndarray) -> dict[str, SeriesValue]:
+        values = {node.key: node.panel_value[rows] for node in self._graph.nodes}
+        counts = self._graph.panel_counts[rows]
+        result: dict[str, SeriesValue] = {}
+        for key, ind in self._indicators.items():
+            output = ind.output_series(values)
+            warming = counts < ind.warmup_period
+            if isinstance(output, dict):
+                for arr in output.values():
+                    arr[warming] = np.nan
+            else:
+                output[warming] = np.nan
+            result[key] = output
+        return result
+
+    def _by_symbol(
+        self, bars: Sequence[Bar], arrays: dict[str, SeriesValue],
+    ) -> dict[str, IndicatorSnapshot]:
+        layout = self._layout
+        rows = layout.stack(arrays, len(bars)).tolist()
+        return {bar.symbol: IndicatorSnapshot(layout, row) for bar, row in zip(bars, rows)}
+
+    def reset(self, symbols: Sequence[str] | None = None) -> None:
+        """Discard streaming state for `symbols` (all symbols if None)."""
+        if symbols is None:
+            self._graph.panel_reset()
+            return
+        rows = np.array([self._rows[s] for s in symbols if s in self._rows], dtype=np.int64)
+        if len(rows):
+            self._graph.panel_reset(rows)
+
+    # ------------------------------------------------------------------
+    # Full series
+    # ------------------------------------------------------------------
+
+    def compute_matrix(self, columns: BarColumns) -> dict[str, SeriesValue]:
+        """Evaluate every indicator over 2-D (symbol, time) columns.
+
+        Rows must be left-aligned (first bar at column 0); trailing padding
+        should be NaN (any value for the int64 "timestamp" column). Does not
+        touch streaming state.
+        """
+        values = self._graph.compute_series(columns)
+        return {key: ind.series_from(values) for key, ind in self._indicators.items()}
+
+    def compute_panel(
+        self, bars_by_symbol: Mapping[str, Sequence[Bar]],
+    ) -> dict[str, dict[str, SeriesValue]]:
+        """Compute every indicator at every bar for every symbol.
+
+        Equivalent to IndicatorEngine.compute_series() per symbol, but all
+        symbols are stacked into one NaN-padded matrix and evaluated together.
+        """
+        symbols = list(bars_by_symbol)
+        lengths = [len(bars_by_symbol[s]) for s in symbols]
+        width = max(lengths, default=0)
+        matrix = {f: np.full((len(symbols), width), np.nan) for f in _PRICE_FIELDS}
+        matrix["timestamp"] = np.zeros((len(symbols), width), dtype=np.int64)
+        for row, symbol in enumerate(symbols):
+            length = lengths[row]
+            if not length:
+                continue
+            for field, values in bar_columns(bars_by_symbol[symbol]).items():
+                matrix[field][row, :length] = values
+
+        series = self.compute_matrix(matrix)
+        panel: dict[str, dict[str, SeriesValue]] = {}
+        for row, symbol in enumerate(symbols):
+            length = lengths[row]
+            panel[symbol] = {
+                key: (
+                    {f: arr[row, :length] for f, arr in value.items()}
+                    if isinstance(value, dict)
+                    else value[row, :length]
+                )
+                for key, value in series.items()
+            }
+        return panel
@@ -0,0 +1,396 @@
+"""Rolling statistics: NumPy batch kernels and O(1) streaming primitives.
+
+Batch kernels operate along the last axis, so the same code handles a single
+series (1-D) or a stack of equally long series (2-D). Warmup positions are
+filled with NaN.
+
+Streaming primitives (RollingMean, RollingVariance, RollingMax, RollingMin)
+hold the last `window` values and update in O(1) (amortized for min/max) per
+append. Element i of a batch kernel equals the streaming value after
+appending x[: i + 1]. checkpoint() / rollback() undo a single append, which
+lets callers evaluate a provisional value and return to the committed state.
+"""
+from __future__ import annotations
+
+import math
+from abc import ABC, abstractmethod
+from collections import deque
+from collections.abc import Iterator
+
+import numpy as np
+from numpy.lib.stride_tricks import sliding_window_view
+
+# Largest growth factor allowed inside one closed-form block of
+# linear_filter(); keeps the rescaled partial sums well inside float range.
+_MAX_BLOCK_GROWTH = 1e8
+_MAX_BLOCK_SIZE = 1024
+
+
+def linear_filter(
+    x: np.ndarray, decay: float, gain: float, initial: float | np.ndarray,
+) -> np.ndarray:
+    """Evaluate y[t] = decay * y[t-1] + gain * x[t] with y[-1] = initial.
+
+    The recurrence is solved in closed form block by block
+    (y[k] = decay**(k+1) * (c + gain * cumsum(x[j] / decay**(j+1)))), so each
+    block costs a handful of vectorized operations instead of a Python loop.
+    """
+    x = np.asarray(x, dtype=np.float64)
+    out = np.empty_like(x)
+    n = x.shape[-1]
+    carry = np.broadcast_to(np.asarray(initial, dtype=np.float64), x.shape[:-1]).copy()
+    if n == 0:
+        return out
+    if decay == 0.0:
+        out[...] = gain * x
+        return out
+
+    block = int(math.log(_MAX_BLOCK_GROWTH) / -math.log(decay)) if decay < 1.0 else n
+    block = max(1, min(block, _MAX_BLOCK_SIZE, n))
+    powers = decay ** np.arange(1, block + 1, dtype=np.float64)
+    inverse = 1.0 / powers
+
+    for start in range(0, n, block):
+        stop = min(start + block, n)
+        size = stop - start
+        scaled = np.cumsum(x[..., start:stop] * inverse[:size], axis=-1)
+        values = powers[:size] * (carry[..., np.newaxis] + gain * scaled)
+        out[..., start:stop] = values
+        carry = values[..., -1]
+    return out
+
+
+def seeded_smooth(
+    x: np.ndarray, period: int, decay: float, gain: float, seed: str = "mean",
+) -> np.ndarray:
+    """Recursive smoothing seeded from the first `period` inputs.
+
+    Position period-1 holds the seed (mean or plain sum of the first `period`
+    values); later positions follow linear_filter(). Earlier positions are NaN.
+    """
+    x = np.asarray(x, dtype=np.float64)
+    out = np.full(x.shape, np.nan)
+    n = x.shape[-1]
+    if n < period:
+        return out
+    head = x[..., :period].sum(axis=-1)
+    if seed == "mean":
+        head = head / period
+    out[..., period - 1] = head
+    if n > period:
+        out[..., period:] = linear_filter(x[..., period:], decay, gain, head)
+    return out
+
+
+def wilder_average(x: np.ndarray, period: int) -> np.ndarray:
+    """Wilder's moving average: avg = (avg * (period - 1) + x) / period."""
+    return seeded_smooth(x, period, (period - 1) / period, 1.0 / period, seed="mean")
+
+
+def wilder_sum(x: np.ndarray, period: int) -> np.ndarray:
+    """Wilder's running sum: total = total - total / period + x."""
+    return seeded_smooth(x, period, 1.0 - 1.0 / period, 1.0, seed="sum")
+
+
+def ema(x: np.ndarray, period: int) -> np.ndarray:
+    """Exponential moving average seeded with the SMA of the first `period` values."""
+    multiplier = 2.0 / (period + 1)
+    return seeded_smooth(x, period, 1.0 - multiplier, multiplier, seed="mean")
+
+
+def settling_bars(decay: float, tolerance: float) -> int:
+    """Steps until a recursive filter's starting value weighs at most `tolerance`.
+
+    In y[t] = decay * y[t-1] + gain * x[t] the initial value carries weight
+    decay**k after k steps, so two runs seeded differently agree to within
+    `tolerance` of their seed gap from then on.
+    """
+    if not 0.0 < tolerance < 1.0:
+        raise ValueError("tolerance must be between 0 and 1")
+    if decay <= 0.0:
+        return 0
+    return math.ceil(math.log(tolerance) / math.log(decay))
+
+
+def _rolling_reduce(x: np.ndarray, window: int, reduce, **kwargs) -> np.ndarray:
+    x = np.asarray(x, dtype=np.float64)
+    out = np.full(x.shape, np.nan)
+    if x.shape[-1] >= window:
+        windows = sliding_window_view(x, window, axis=-1)
+        out[..., window - 1 :] = reduce(windows, axis=-1, **kwargs)
+    return out
+
+
+def rolling_sum(x: np.ndarray, window: int) -> np.ndarray:
+    return _rolling_reduce(x, window, np.sum)
+
+
+def rolling_mean(x: np.ndarray, window: int) -> np.ndarray:
+    return _rolling_reduce(x, window, np.mean)
+
+
+def rolling_var(x: np.ndarray, window: int, ddof: int = 0) -> np.ndarray:
+    """Variance over a trailing window (two-pass, per window); population by default."""
+    return _rolling_reduce(x, window, np.var, ddof=ddof)
+
+
+def rolling_std(x: np.ndarray, window: int, ddof: int = 0) -> np.ndarray:
+    return np.sqrt(rolling_var(x, window, ddof=ddof))
+
+
+def rolling_max(x: np.ndarray, window: int) -> np.ndarray:
+    return _rolling_reduce(x, window, np.max)
+
+
+def rolling_min(x: np.ndarray, window: int) -> np.ndarray:
+    return _rolling_reduce(x, window, np.min)
+
+
+def true_range(high: np.ndarray, low: np.ndarray, close: np.ndarray) -> np.ndarray:
+    """True range for each bar pair; element i describes bar i + 1."""
+    prev_close = close[..., :-1]
+    cur_high = high[..., 1:]
+    cur_low = low[..., 1:]
+    return np.maximum.reduce([
+        cur_high - cur_low,
+        np.abs(cur_high - prev_close),
+        np.abs(cur_low - prev_close),
+    ])
+
+
+def shift_right(x: np.ndarray, count: int = 1) -> np.ndarray:
+    """Pad `count` leading NaNs so pairwise series line up with bar indices."""
+    pad = np.full(x.shape[:-1] + (count,), np.nan)
+    return np.concatenate([pad, x], axis=-1)
+
+
+# ----------------------------------------------------------------------
+# Streaming primitives
+# ----------------------------------------------------------------------
+
+class _RollingWindow:
+    """Last `window` appended values; reads like a deque(maxlen=window)."""
+
+    def __init__(self, window: int) -> None:
+        if window < 1:
+            raise ValueError(f"window must be >= 1, got {window}")
+        self.window = window
+        self._values: deque[float] = deque(maxlen=window)
+        self._appends = 0
+
+    def __len__(self) -> int:
+        return len(self._values)
+
+    def __iter__(self) -> Iterator[float]:
+        return iter(self._values)
+
+    def __getitem__(self, index: int) -> float:
+        return self._values[index]
+
+    def __repr__(self) -> str:
+        return f"{type(self).__name__}(window={self.window}, values={list(self._values)})"
+
+    @property
+    def full(self) -> bool:
+        return len(self._values) == self.window
+
+    def clear(self) -> None:
+        self._values.clear()
+
+    def _push(self, x: float) -> None:
+        self._values.append(x)
+        self._appends += 1
+
+    def checkpoint(self) -> tuple:
+        """Token for rollback(); covers at most one subsequent append()."""
+        values = self._values
+        return (self._appends, values[0] if len(values) == self.window else None)
+
+    def rollback(self, token: tuple) -> None:
+        appends, evicted = token[0], token[1]
+        if self._appends != appends:
+            self._values.pop()
+            if evicted is not None:
+                self._values.appendleft(evicted)
+            self._appends = appends
+
+    def get_state(self) -> dict:
+        return {"values": list(self._values)}
+
+    def set_state(self, state: dict) -> None:
+        self._values = deque(state["values"], maxlen=self.window)
+
+
+class RollingMean(_RollingWindow):
+    """Sum and mean of the last `window` values from a running sum."""
+
+    def __init__(self, window: int) -> None:
+        super().__init__(window)
+        self._sum = 0.0
+
+    def append(self, x: float) -> None:
+        values = self._values
+        if len(values) == self.window:
+            self._sum -= values[0]
+        self._push(x)
+        self._sum += x
+
+    def clear(self) -> None:
+        super().clear()
+        self._sum = 0.0
+
+    def checkpoint(self) -> tuple:
+        return (*super().checkpoint(), self._sum)
+
+    def rollback(self, token: tuple) -> None:
+        super().rollback(token)
+        self._sum = token[-1]
+
+    @property
+    def total(self) -> float:
+        return self._sum
+
+    @property
+    def mean(self) -> float:
+        """Mean of the held values (NaN when empty)."""
+        return self._sum / len(self._values) if self._values else math.nan
+
+    def get_state(self) -> dict:
+        return {**super().get_state(), "sum": self._sum}
+
+    def set_state(self, state: dict) -> None:
+        super().set_state(state)
+        self._sum = state["sum"]
+
+
+class RollingVariance(_RollingWindow):
+    """Mean and variance of the last `window` values (windowed Welford updates).
+
+    Unlike running sums of x and x**2, the centered update does not lose
+    precision when the values are large relative to their spread.
+    """
+
+    def __init__(self, window: int) -> None:
+        super().__init__(window)
+        self._mean = 0.0
+        self._m2 = 0.0
+
+    def append(self, x: float) -> None:
+        values = self._values
+        mean = self._mean
+        if len(values) == self.window:
+            old = values[0]
+            self._push(x)
+            new_mean = mean + (x - old) / self.window
+            self._m2 += (x - old) * (x - new_mean + old - mean)
+        else:
+            self._push(x)
+            new_mean = mean + (x - mean) / len(values)
+            self._m2 += (x - mean) * (x - new_mean)
+        self._mean = new_mean
+
+    def clear(self) -> None:
+        super().clear()
+        self._mean = 0.0
+        self._m2 = 0.0
+
+    def checkpoint(self) -> tuple:
+        return (*super().checkpoint(), self._mean, self._m2)
+
+    def rollback(self, token: tuple) -> None:
+        super().rollback(token)
+        self._mean, self._m2 = token[-2], token[-1]
+
+    @property
+    def mean(self) -> float:
+        return self._mean if self._values else math.nan
+
+    def variance(self, ddof: int = 0) -> float:
+        """Population variance by default; NaN with fewer than ddof + 1 values."""
+        n = len(self._values) - ddof
+        if n <= 0:
+            return math.nan
+        # Updates can leave a tiny negative residue on a flat window
+        return max(self._m2, 0.0) / n
+
+    def std(self, ddof: int = 0) -> float:
+        return math.sqrt(self.variance(ddof))
+
+    def get_state(self) -> dict:
+        return {**super().get_state(), "mean": self._mean, "m2": self._m2}
+
+    def set_state(self, state: dict) -> None:
+        super().set_state(state)
+        self._mean = state["mean"]
+        self._m2 = state["m2"]
+
+
+class _RollingExtreme(ABC):
+    """Extreme of the last `window` values via a monotonic deque.
+
+    The deque holds (position, value) candidates that can still become the
+    extreme; each value is pushed and popped at most once.
+    """
+
+    def __init__(self, window: int) -> None:
+        if window < 1:
+            raise ValueError(f"window must be >= 1, got {window}")
+        self.window = window
+        self.clear()
+
+    @staticmethod
+    @abstractmethod
+    def _dominates(kept: float, x: float) -> bool:
+        """True if `kept` stays a candidate after `x` arrives."""
+
+    def append(self, x: float) -> None:
+        queue = self._queue
+        while queue and not self._dominates(queue[-1][1], x):
+            queue.pop()
+        queue.append((self._count, x))
+        self._count += 1
+        if queue[0][0] <= self._count - 1 - self.window:
+            queue.popleft()
+
+    def clear(self) -> None:
+        self._queue: deque[tuple[int, float]] = deque()
+        self._count = 0
+
+    def checkpoint(self) -> tuple:
+        """Token for rollback(); copies the candidate deque (short in practice)."""
+        return (self._count, tuple(self._queue))
+
+    def rollback(self, token: tuple) -> None:
+        self._count = token[0]
+        self._queue = deque(token[1])
+
+    def __len__(self) -> int:
+        return min(self._count, self.window)
+
+    @property
+    def full(self) -> bool:
+        return self._count >= self.window
+
+    @property
+    def value(self) -> float:
+        """Current extreme (NaN when empty)."""
+        return self._queue[0][1] if self._queue else math.nan
+
+    def get_state(self) -> dict:
+        return {"count": self._count, "queue": [list(item) for item in self._queue]}
+
+    def set_state(self, state: dict) -> None:
+        self._count = state["count"]
+        self._queue = deque((pos, x) for pos, x in state["queue"])
+
+
+class RollingMax(_RollingExtreme):
+    @staticmethod
+    def _dominates(kept: float, x: float) -> bool:
+        return kept > x
+
+
+class RollingMin(_RollingExtreme):
+    @staticmethod
+    def _dominates(kept: float, x: float) -> bool:
+        return kept < x
@@ -0,0 +1,305 @@
+"""Compact per-bar indicator values.
+
+An IndicatorSnapshot holds one bar's indicator outputs as a flat list of
+floats (NaN while warming up), one slot per scalar indicator and one per
+field of dict-valued indicators such as BBANDS. A SnapshotLayout maps keys
+and fields to slots; it is built once per engine registration and shared by
+every snapshot the engine produces.
+
+Strategies read through a SnapshotReader, which resolves the slots it needs
+once per layout and then reads positionally, so the per-bar path does no key
+formatting, hashing or nested dict building. Snapshots remain read-only
+Mappings shaped like the compute() dicts for code that looks values up by key.
+
+A LazyIndicatorSnapshot defers each indicator until something reads it, so
+indicators no strategy looks at on a given bar are never evaluated.
+"""
+from __future__ import annotations
+
+import math
+from collections.abc import Callable, Iterable, Iterator, Mapping, Sequence
+
+import numpy as np
+
+from autotrader.indicators.base import Indicator, SeriesValue
+
+IndicatorValue = float | dict | None
+
+
+class SnapshotLayout:
+    """Slot assignment for an ordered set of indicator outputs."""
+
+    __slots__ = ("keys", "size", "_offsets", "_fields")
+
+    def __init__(self, outputs: Iterable[tuple[str, Sequence[str]]]) -> None:
+        offsets: dict[str, int] = {}
+        fields: dict[str, tuple[str, ...]] = {}
+        size = 0
+        for key, names in outputs:
+            offsets[key] = size
+            fields[key] = tuple(names)
+            size += max(1, len(fields[key]))
+        self.keys: tuple[str, ...] = tuple(offsets)
+        self.size = size
+        self._offsets = offsets
+        self._fields = fields
+
+    @classmethod
+    def for_indicators(cls, indicators: Mapping[str, Indicator]) -> SnapshotLayout:
+        return cls((key, ind.fields) for key, ind in indicators.items())
+
+    @classmethod
+    def for_series(cls, series: Mapping[str, SeriesValue]) -> SnapshotLayout:
+        """Layout matching a compute_series()-shaped dict."""
+        return cls(
+            (key, tuple(value) if isinstance(value, dict) else ())
+            for key, value in series.items()
+        )
+
+    def fields(self, key: str) -> tuple[str, ...]:
+        """Field names of a dict-valued indicator; empty for scalar ones."""
+        return self._fields[key]
+
+    def slot(self, key: str, field: str | None = None) -> int:
+        """Slot index of `key` (and `field` for dict-valued indicators).
+
+        Raises KeyError if the key is not in the layout or the field does
+        not match the indicator's shape.
+        """
+        offset = self._offsets[key]
+        names = self._fields[key]
+        if field is None:
+            if names:
+                raise KeyError(f"{key} is dict-valued; pick one of {names}")
+            return offset
+        if field not in names:
+            raise KeyError(f"{key} has no field {field!r}")
+        return offset + names.index(field)
+
+    def pack(self, values: Mapping[str, IndicatorValue]) -> list[float]:
+        """Flatten compute()-shaped values into slot order."""
+        return self.fill([math.nan] * self.size, values)
+
+    def row(self, series: Mapping[str, SeriesValue], index: int) -> list[float]:
+        """Slot values of one bar of a compute_series()-shaped dict."""
+        return self.fill_row([math.nan] * self.size, series, index)
+
+    def fill(self, out: list[float], values: Mapping[str, IndicatorValue]) -> list[float]:
+        """Write compute()-shaped values for some keys into `out`'s slots."""
+        for key, value in values.items():
+            if value is None:
+                continue
+            offset = self._offsets[key]
+            names = self._fields[key]
+            if names:
+                for i, name in enumerate(names):
+                    out[offset + i] = float(value[name])
+            else:
+                out[offset] = float(value)
+        return out
+
+    def fill_row(
+        self, out: list[float], series: Mapping[str, SeriesValue], index: int,
+    ) -> list[float]:
+        """Write bar `index` of compute_series()-shaped arrays into `out`'s slots."""
+        for key, value in series.items():
+            offset = self._offsets[key]
+            names = self._fields[key]
+            if names:
+                for i, name in enumerate(names):
+                    out[offset + i] = float(value[name][index])
+            else:
+                out[offset] = float(value[index])
+        return out
+
+    def stack(self, series: Mapping[str, SeriesValue], length: int) -> np.ndarray:
+        """(length, size) float64 matrix whose row i holds bar i's slots."""
+        out = np.empty((length, self.size), dtype=np.float64)
+        for key in self.keys:
+            offset = self._offsets[key]
+            names = self._fields[key]
+            value = series[key]
+            if names:
+                for i, name in enumerate(names):
+                    out[:, offset + i] = value[name]
+            else:
+                out[:, offset] = value
+        return out
+
+    def unstack(self, table: np.ndarray) -> dict[str, SeriesValue]:
+        """compute_series()-shaped dict of column views into a stack() matrix."""
+        series: dict[str, SeriesValue] = {}
+        for key in self.keys:
+            offset = self._offsets[key]
+            names = self._fields[key]
+            if names:
+                series[key] = {name: table[:, offset + i] for i, name in enumerate(names)}
+            else:
+                series[key] = table[:, offset]
+        return series
+
+    def __repr__(self) -> str:
+        return f"SnapshotLayout({list(self.keys)})"
+
+
+class IndicatorSnapshot(Mapping[str, IndicatorValue]):
+    """One bar's indicator values, addressed by slot or by key.
+
+    Key lookups return what compute() used to: a float, a field dict for
+    dict-valued indicators, or None while any of the values is NaN.
+    """
+
+    __slots__ = ("_values", "layout")
+
+    # Keys not evaluated yet (see LazyIndicatorSnapshot)
+    _pending: frozenset[str] | set[str] = frozenset()
+
+    def __init__(self, layout: SnapshotLayout, values: list[float]) -> None:
+        self.layout = layout
+        self._values = values
+
+    @classmethod
+    def from_values(
+        cls, layout: SnapshotLayout, values: Mapping[str, IndicatorValue],
+    ) -> IndicatorSnapshot:
+        return cls(layout, layout.pack(values))
+
+    def value(self, slot: int) -> float:
+        """Raw slot value; NaN while the indicator is warming up."""
+        return self._values[slot]
+
+    def require(self, keys: Iterable[str]) -> None:
+        """Make sure the slots of `keys` are evaluated (no-op when eager)."""
+
+    def __getitem__(self, key: str) -> IndicatorValue:
+        offset = self.layout._offsets[key]
+        names = self.layout._fields[key]
+        if not names:
+            value = self._values[offset]
+            return None if math.isnan(value) else value
+        fields = self._values[offset : offset + len(names)]
+        if any(math.isnan(v) for v in fields):
+            return None
+        return dict(zip(names, fields))
+
+    def __contains__(self, key: object) -> bool:
+        return key in self.layout._offsets
+
+    def __iter__(self) -> Iterator[str]:
+        return iter(self.layout.keys)
+
+    def __len__(self) -> int:
+        return len(self.layout.keys)
+
+    def to_dict(self) -> dict[str, IndicatorValue]:
+        """Plain (JSON-compatible) dict copy."""
+        return dict(self.items())
+
+    def __repr__(self) -> str:
+        return f"IndicatorSnapshot({self.to_dict()})"
+
+
+class LazyIndicatorSnapshot(IndicatorSnapshot):
+    """IndicatorSnapshot whose indicators are evaluated on first read.
+
+    `evaluate(keys, values)` writes the slots of `keys` into `values`. Each
+    key is evaluated at most once; keys that are never read are never
+    evaluated. Reading by key, iterating values or comparing evaluates what
+    it touches, so a lazy snapshot reads exactly like an eager one.
+    """
+
+    __slots__ = ("_evaluate", "_pending")
+
+    def __init__(
+        self,
+        layout: SnapshotLayout,
+        values: list[float],
+        pending: Iterable[str],
+        evaluate: Callable[[list[str], list[float]], None],
+    ) -> None:
+        super().__init__(layout, values)
+        self._pending = set(pending)
+        self._evaluate: Callable[[list[str], list[float]], None] | None = evaluate
+
+    @property
+    def pending(self) -> frozenset[str]:
+        """Keys not evaluated yet."""
+        return frozenset(self._pending)
+
+    def require(self, keys: Iterable[str]) -> None:
+        missing = [key for key in keys if key in self._pending]
+        if not missing:
+            return
+        self._evaluate(missing, self._values)
+        self._pending.difference_update(missing)
+        if not self._pending:
+            # Drop the evaluator and whatever bar data it holds on to
+            self._evaluate = None
+
+    def __getitem__(self, key: str) -> IndicatorValue:
+        if key in self._pending:
+            self.require((key,))
+        return super().__getitem__(key)
+
+
+class SnapshotReader:
+    """Reads a fixed set of named indicator outputs, all-or-nothing.
+
+    Each keyword maps a name to an indicator key, or to a (key, field) pair
+    for dict-valued indicators::
+
+        SnapshotReader(rsi="RSI_14", pct_b=("BBANDS_20", "pct_b"))
+
+    read() returns {name: value}, or None while any of them is undefined or
+    not registered. Slots are resolved on the first snapshot of each layout;
+    plain mappings (e.g. hand-built test contexts) are read by key.
+    """
+
+    __slots__ = ("_keys", "_layout", "_names", "_refs", "_slots")
+
+    def __init__(self, **refs: str | tuple[str, str]) -> None:
+        self._names = tuple(refs)
+        self._refs = tuple(ref if isinstance(ref, tuple) else (ref, None) for ref in refs.values())
+        self._keys = tuple(dict.fromkeys(key for key, _ in self._refs))
+        self._layout: SnapshotLayout | None = None
+        self._slots: tuple[int, ...] | None = None
+
+    def bind(self, layout: SnapshotLayout) -> None:
+        """Resolve slots against `layout`."""
+        self._layout = layout
+        try:
+            self._slots = tuple(layout.slot(key, field) for key, field in self._refs)
+        except KeyError:
+            self._slots = None
+
+    def read(self, indicators: Mapping[str, IndicatorValue]) -> dict[str, float] | None:
+        if not isinstance(indicators, IndicatorSnapshot):
+            return self._read_mapping(indicators)
+        if indicators.layout is not self._layout:
+            self.bind(indicators.layout)
+        slots = self._slots
+        if slots is None:
+            return None
+        if indicators._pending:
+            indicators.require(self._keys)
+        values = indicators._values
+        out: dict[str, float] = {}
+        for name, slot in zip(self._names, slots):
+            value = values[slot]
+            if value != value:  # NaN
+                return None
+            out[name] = value
+        return out
+
+    def _read_mapping(self, indicators: Mapping[str, IndicatorValue]) -> dict[str, float] | None:
+        out: dict[str, float] = {}
+        for name, (key, field) in zip(self._names, self._refs):
+            value = indicators.get(key)
+            if field is not None:
+                if not isinstance(value, dict):
+                    return None
+                value = value.get(field)
+            if value is None:
+                return None
+            out[name] = value
+        return out
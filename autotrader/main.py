@@ -3,15 +3,18 @@ from __future__ import annotations
 import asyncio
 import logging
 import os
-from collections import defaultdict, deque
-from datetime import date, datetime, timezone
+from collections import defaultdict
+from collections.abc import Mapping
+from datetime import date, datetime, timedelta, timezone
 from pathlib import Path
 
+import numpy as np
 from dotenv import load_dotenv
 
 from zoneinfo import ZoneInfo
 
 from autotrader.core.aggregator import DailyBarAggregator
+from autotrader.core.bar_history import BarHistory, timestamp_to_micros
 from autotrader.core.config import RotationConfig, Settings, load_settings
 from autotrader.core.event_bus import EventBus
 from autotrader.core.logger import setup_logging
@@ -21,7 +24,10 @@ from autotrader.core.types import (
 from autotrader.broker.base import BrokerAdapter
 from autotrader.broker.paper import PaperBroker
 from autotrader.indicators.engine import IndicatorEngine
+from autotrader.indicators.rolling import RollingMean
+from autotrader.indicators.snapshot import IndicatorSnapshot
 from autotrader.data.market_sentiment import VIXFetcher
+from autotrader.data.state_snapshot import StateSnapshotStore
 from autotrader.portfolio.allocation_engine import AllocationEngine
 from autotrader.portfolio.regime_detector import MarketRegime, RegimeDetector
 from autotrader.portfolio.regime_tracker import RegimeTracker
@@ -63,8 +69,8 @@ class AutoTrader:
         self._risk_manager = RiskManager(settings.risk)
         self._position_sizer = PositionSizer(settings.risk)
         self._portfolio_tracker: PortfolioTracker | None = None
-        self._bar_history: dict[str, deque[Bar]] = defaultdict(
-            lambda: deque(maxlen=settings.data.bar_history_size),
+        self._bar_history: dict[str, BarHistory] = defaultdict(
+            lambda: BarHistory(maxlen=self._history_size),
         )
         self._running = False
         self._stream_task: asyncio.Task | None = None
@@ -76,14 +82,18 @@ class AutoTrader:
         self._regime_detector = RegimeDetector()
         self._allocation_engine = AllocationEngine(self._regime_detector)
         self._current_regime: MarketRegime = MarketRegime.UNCERTAIN
-        self._spy_bb_width_history: deque[float] = deque(maxlen=20)
+        self._spy_bb_width_history = RollingMean(20)
+        self._history_size = self._required_history_size()
         self._regime_proxy_symbol: str = self._settings.scheduler.regime_proxy_symbol
         self._position_strategy_map: dict[str, str] = {}
 
-        # Daily bar history for regime detection (separate from live minute bars)
-        self._daily_bar_history: dict[str, deque[Bar]] = defaultdict(
-            lambda: deque(maxlen=settings.data.bar_history_size),
-        )
+        # Daily bars for regime detection. Only confirmed daily bars reach
+        # _bar_history, so both consumers share one BarHistory per symbol.
+        self._daily_bar_history = self._bar_history
+
+        # Latest indicator snapshot per symbol, keyed by the bar it describes
+        # (timestamp in microseconds). A newer bar makes the entry stale.
+        self._indicator_snapshots: dict[str, tuple[int, IndicatorSnapshot]] = {}
         self._daily_regime_task: asyncio.Task | None = None
         self._last_regime_update_date: date | None = None
 
@@ -125,6 +135,12 @@ class AutoTrader:
                 settings.performance.equity_snapshot_path,
             )
 
+        # Bar history snapshot for warm restarts
+        self._state_store: StateSnapshotStore | None = None
+        if settings.data.enable_state_snapshot:
+            self._state_store = StateSnapshotStore(settings.data.state_snapshot_path)
+        self._state_snapshot_task: asyncio.Task | None = None
+
     def _create_broker(self) -> BrokerAdapter:
         if self._settings.broker.type == "paper":
             return PaperBroker(self._settings.broker.paper_balance)
@@ -154,6 +170,36 @@ class AutoTrader:
                 if spec.key not in registered_keys:
                     self._indicator_engine.register(spec)
                     registered_keys.add(spec.key)
+        self._resize_histories(
+            self._required_history_size(max(s.lookback_bars for s in strategies)),
+        )
+
+    def _required_history_size(self, lookback_bars: int = 0) -> int:
+        """Bars kept per symbol.
+
+        DataConfig.bar_history_size when set; otherwise the shortest history
+        covering the registered indicators at indicator_tolerance, the
+        strategies' own lookback and the regime's average BB width.
+        """
+        data = self._settings.data
+        if data.bar_history_size is not None:
+            return data.bar_history_size
+        return max(
+            self._indicator_engine.history_bars(data.indicator_tolerance),
+            lookback_bars,
+            # Regime init averages the last `window` BBANDS_20 widths
+            20 - 1 + self._spy_bb_width_history.window,
+        )
+
+    def _resize_histories(self, size: int) -> None:
+        """Apply a new per-symbol history size, keeping the newest bars."""
+        if size == self._history_size:
+            return
+        logger.info("Bar history size: %d -> %d bars", self._history_size, size)
+        self._history_size = size
+        for sym, history in self._bar_history.items():
+            self._bar_history[sym] = BarHistory.from_state(history.get_state(), maxlen=size)
+        self._indicator_snapshots.clear()
 
     async def start(self) -> None:
         logger.info("Starting %s", self._settings.system.name)
@@ -171,6 +217,9 @@ class AutoTrader:
         # Start daily regime refresh scheduler
         self._daily_regime_task = asyncio.create_task(self._daily_regime_scheduler())
 
+        if self._state_store is not None:
+            self._state_snapshot_task = asyncio.create_task(self._state_snapshot_scheduler())
+
         symbols = list(set(self._settings.symbols + [self._regime_proxy_symbol]))
         await self._broker.subscribe_bars(symbols, self._on_bar)
 
@@ -199,6 +248,13 @@ class AutoTrader:
             except (asyncio.CancelledError, Exception):
                 pass
             self._scheduler_task = None
+        if self._state_snapshot_task is not None and not self._state_snapshot_task.done():
+            self._state_snapshot_task.cancel()
+            try:
+                await self._state_snapshot_task
+            except (asyncio.CancelledError, Exception):
+                pass
+            self._state_snapshot_task = None
         if self._stream_task is not None and not self._stream_task.done():
             self._stream_task.cancel()
             try:
@@ -206,6 +262,7 @@ class AutoTrader:
             except (asyncio.CancelledError, Exception):
                 pass
             self._stream_task = None
+        self._save_state_snapshot()
         await self._broker.disconnect()
 
     async def _on_bar(self, bar: Bar) -> None:
@@ -267,7 +324,7 @@ class AutoTrader:
         history = self._bar_history[bar.symbol]
         history.append(bar)
 
-        indicators = self._indicator_engine.compute(history)
+        indicators = self._indicators_for(bar.symbol)
 
         ctx = MarketContext(
             symbol=bar.symbol,
@@ -291,6 +348,19 @@ class AutoTrader:
         for signal in signals:
             await self._process_signal(signal, account, positions)
 
+    def _indicators_for(self, symbol: str) -> Mapping[str, float | dict | None]:
+        """Indicator snapshot for the latest bar of `symbol`, computed once per bar."""
+        history = self._bar_history.get(symbol)
+        if not history:
+            return {}
+        bar_key = int(history.timestamps[-1])
+        cached = self._indicator_snapshots.get(symbol)
+        if cached is not None and cached[0] == bar_key:
+            return cached[1]
+        indicators = self._indicator_engine.compute(history)
+        self._indicator_snapshots[symbol] = (bar_key, indicators)
+        return indicators
+
     async def _process_signal(
         self, signal: Signal, account: AccountInfo, positions: list[Position],
     ) -> OrderResult | None:
@@ -375,6 +445,7 @@ class AutoTrader:
                     mfe=mfe,
                     mae=mae,
                     bars_held=bars_held,
+                    indicators=dict(self._indicators_for(signal.symbol)),
                 )
                 self._trade_logger.log_trade(record)
 
@@ -447,8 +518,7 @@ class AutoTrader:
                 return None
 
             # Get ATR for risk-based sizing
-            indicators = self._indicator_engine.compute(history)
-            atr = indicators.get("ATR_14")
+            atr = self._indicators_for(signal.symbol).get("ATR_14")
 
             qty = self._allocation_engine.get_position_size(
                 signal.strategy, price, account.equity, self._current_regime,
@@ -471,35 +541,125 @@ class AutoTrader:
         return None
 
     async def _warm_up_from_history(self) -> None:
-        """Load historical daily bars and initialize regime from SPY data."""
+        """Load historical daily bars and initialize regime from SPY data.
+
+        Symbols restored from the state snapshot only fetch the days since
+        their last stored bar; the rest fetch universe_history_days.
+        """
+        restored = self._restore_state_snapshot()
         if not hasattr(self._broker, "get_historical_bars"):
             logger.info("Broker does not support historical bars, skipping warmup")
+            if restored:
+                self._initialize_regime_from_daily()
             return
 
         proxy = self._regime_proxy_symbol
         symbols = list(set(self._settings.symbols + [proxy]))
-        logger.info("Loading historical daily bars for %d symbols...", len(symbols))
-
-        try:
-            hist = await self._broker.get_historical_bars(
-                symbols, days=self._settings.scheduler.universe_history_days,
+        full_days = self._settings.scheduler.universe_history_days
+        cold = [s for s in symbols if s not in restored]
+        warm = [s for s in symbols if s in restored]
+        fetches: list[tuple[list[str], int]] = []
+        if cold:
+            fetches.append((cold, full_days))
+        if warm:
+            oldest = min(restored[s] for s in warm)
+            gap_days = (datetime.now(timezone.utc).date() - oldest).days + 1
+            fetches.append((warm, min(full_days, max(gap_days, 1))))
+
+        loaded_count: dict[str, int] = {}
+        for batch, days in fetches:
+            logger.info(
+                "Loading %d days of historical daily bars for %d symbols...",
+                days, len(batch),
             )
-        except Exception:
-            logger.exception("Failed to load historical bars")
-            return
-
-        for sym, bars in hist.items():
-            for bar in bars:
-                self._daily_bar_history[sym].append(bar)
-                self._bar_history[sym].append(bar)
+            try:
+                hist = await self._broker.get_historical_bars(batch, days=days)
+            except Exception:
+                logger.exception("Failed to load historical bars")
+                continue
+            for sym, bars in hist.items():
+                added = self._append_new_bars(sym, bars)
+                if added:
+                    loaded_count[sym] = added
 
-        loaded_count = {s: len(b) for s, b in hist.items() if b}
+        if not loaded_count and not restored:
+            return
         logger.info("Loaded daily bars: %s", loaded_count)
 
         self._initialize_regime_from_daily()
 
+    def _append_new_bars(self, symbol: str, bars: list[Bar]) -> int:
+        """Append bars newer than the latest stored bar of `symbol`; return the count.
+
+        The live aggregator stamps a day with its last minute, so a fetched
+        bar for a day already aggregated sorts before it and is skipped.
+        """
+        history = self._bar_history[symbol]
+        latest = int(history.timestamps[-1]) if history else None
+        added = 0
+        for bar in sorted(bars, key=lambda b: b.timestamp):
+            micros = timestamp_to_micros(bar.timestamp)
+            if latest is None or micros > latest:
+                history.append(bar)
+                latest = micros
+                added += 1
+        return added
+
+    def _restore_state_snapshot(self) -> dict[str, date]:
+        """Load bar histories from the state snapshot, if enabled and fresh enough.
+
+        Indicators are computed from these windows on demand, so restoring
+        them restores the indicators too; no indicator engine state is kept
+        in the snapshot.
+
+        Returns the date of the last restored bar per symbol. Symbols whose
+        last bar is older than universe_history_days are left for a full
+        reload, since the missing stretch could not be fetched in one request.
+        """
+        if self._state_store is None:
+            return {}
+        snapshot = self._state_store.load(maxlen=self._history_size)
+        if snapshot is None:
+            return {}
+
+        oldest_allowed = datetime.now(timezone.utc).date() - timedelta(
+            days=self._settings.scheduler.universe_history_days,
+        )
+        restored: dict[str, date] = {}
+        for sym, history in snapshot.histories.items():
+            last_date = history[-1].timestamp.date()
+            if last_date < oldest_allowed:
+                continue
+            self._bar_history[sym] = history
+            restored[sym] = last_date
+        logger.info(
+            "Restored bar history for %d symbols from snapshot saved %s",
+            len(restored), snapshot.saved_at.isoformat(),
+        )
+        return restored
+
+    def _save_state_snapshot(self) -> None:
+        """Write bar histories to the state snapshot file (no-op when disabled).
+
+        The bar windows are the trader's whole indicator state; see
+        _restore_state_snapshot().
+        """
+        if self._state_store is None:
+            return
+        try:
+            self._state_store.save(self._bar_history)
+        except Exception:
+            logger.exception("Failed to write state snapshot")
+
+    async def _state_snapshot_scheduler(self) -> None:
+        """Persist bar histories every state_snapshot_interval_seconds."""
+        interval = self._settings.data.state_snapshot_interval_seconds
+        while self._running:
+            await asyncio.sleep(interval)
+            self._save_state_snapshot()
+
     def _initialize_regime_from_daily(self) -> None:
-        """Walk through SPY daily bars to build bb_width_history and classify regime."""
+        """Rebuild bb_width_history from SPY daily bars and classify the regime."""
         proxy = self._regime_proxy_symbol
         spy_history = self._daily_bar_history.get(proxy)
         if not spy_history or len(spy_history) < 30:
@@ -509,18 +669,18 @@ class AutoTrader:
             )
             return
 
-        # Walk through bars incrementally to build _spy_bb_width_history
+        # One vectorized pass gives the BB width at every bar; the rolling
+        # average keeps the most recent defined ones.
         self._spy_bb_width_history.clear()
-        temp: deque[Bar] = deque(maxlen=self._settings.data.bar_history_size)
-        for bar in spy_history:
-            temp.append(bar)
-            indicators = self._indicator_engine.compute(temp)
-            bbands = indicators.get("BBANDS_20")
-            if bbands is not None:
-                self._spy_bb_width_history.append(bbands["width"])
+        series = self._indicator_engine.compute_series(spy_history)
+        bbands_series = series.get("BBANDS_20")
+        if bbands_series is not None:
+            widths = bbands_series["width"]
+            for width in widths[~np.isnan(widths)][-self._spy_bb_width_history.window :]:
+                self._spy_bb_width_history.append(float(width))
 
         # Final classification from full history
-        indicators = self._indicator_engine.compute(spy_history)
+        indicators = self._indicators_for(proxy)
         adx = indicators.get("ADX_14")
         bbands = indicators.get("BBANDS_20")
         atr = indicators.get("ATR_14")
@@ -528,8 +688,8 @@ class AutoTrader:
             logger.warning("Indicators still None after warmup")
             return
 
-        bb_width_avg = sum(self._spy_bb_width_history) / len(self._spy_bb_width_history)
-        close = list(spy_history)[-1].close
+        bb_width_avg = self._spy_bb_width_history.mean
+        close = float(spy_history.closes[-1])
         atr_ratio = atr / close if close > 0 else 0.0
 
         regime = self._regime_detector.classify(
@@ -545,7 +705,7 @@ class AutoTrader:
             regime.value, adx, bbands["width"] / bb_width_avg, atr_ratio, len(spy_history),
         )
 
-    def _update_regime(self, indicators: dict) -> None:
+    def _update_regime(self, indicators: Mapping[str, float | dict | None]) -> None:
         """Update market regime from proxy symbol indicators."""
         adx = indicators.get("ADX_14")
         bbands = indicators.get("BBANDS_20")
@@ -554,7 +714,7 @@ class AutoTrader:
             return
         bb_width = bbands["width"]
         self._spy_bb_width_history.append(bb_width)
-        bb_width_avg = sum(self._spy_bb_width_history) / len(self._spy_bb_width_history)
+        bb_width_avg = self._spy_bb_width_history.mean
         history = self._bar_history.get(self._regime_proxy_symbol)
         if not history:
             return
@@ -731,15 +891,7 @@ class AutoTrader:
                 if not spy_bars:
                     continue
 
-                # Append new daily bars to _daily_bar_history
-                existing_timestamps = {
-                    b.timestamp for b in self._daily_bar_history[proxy]
-                }
-                new_count = 0
-                for bar in spy_bars:
-                    if bar.timestamp not in existing_timestamps:
-                        self._daily_bar_history[proxy].append(bar)
-                        new_count += 1
+                new_count = self._append_new_bars(proxy, spy_bars)
 
                 if new_count > 0:
                     self._initialize_regime_from_daily()
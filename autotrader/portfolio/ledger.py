@@ -0,0 +1,186 @@
+"""Incrementally marked cash-and-positions ledger.
+
+Shared by BacktestSimulator and PaperBroker. Positions carry a signed
+quantity (negative for shorts) and the price they were last marked at;
+the ledger keeps running totals of long value, short value and cost basis,
+so fills and price marks are O(1) and equity, market value, unrealized PnL
+and exposure are read without walking the open positions.
+"""
+from __future__ import annotations
+
+from dataclasses import dataclass
+
+from autotrader.core.types import Position
+
+
+@dataclass(slots=True)
+class LedgerPosition:
+    """An open position; `quantity` is negative for shorts."""
+
+    symbol: str
+    quantity: float
+    avg_price: float
+    price: float
+
+    @property
+    def side(self) -> str:
+        return "long" if self.quantity > 0 else "short"
+
+    @property
+    def market_value(self) -> float:
+        return abs(self.quantity) * self.price
+
+    @property
+    def unrealized_pnl(self) -> float:
+        return (self.price - self.avg_price) * self.quantity
+
+
+class Ledger:
+    """Cash plus open long and short positions, marked to market.
+
+    Usage::
+
+        ledger = Ledger(100_000.0)
+        ledger.fill("AAPL", 10, 150.0)     # buy 10
+        ledger.mark("AAPL", 155.0)
+        ledger.equity                      # 100_050.0
+        ledger.fill("AAPL", -10, 155.0)    # sell 10, returns realized PnL 50.0
+    """
+
+    def __init__(self, cash: float) -> None:
+        self._cash = cash
+        self._positions: dict[str, LedgerPosition] = {}
+        self._long_value = 0.0
+        self._short_value = 0.0
+        self._cost_basis = 0.0  # sum of quantity * avg_price, signed
+
+    @property
+    def cash(self) -> float:
+        return self._cash
+
+    @property
+    def long_value(self) -> float:
+        return self._long_value
+
+    @property
+    def short_value(self) -> float:
+        """Cost to buy back every short at its last mark."""
+        return self._short_value
+
+    @property
+    def market_value(self) -> float:
+        """Net market value: longs minus short liabilities."""
+        return self._long_value - self._short_value
+
+    @property
+    def gross_exposure(self) -> float:
+        return self._long_value + self._short_value
+
+    @property
+    def unrealized_pnl(self) -> float:
+        return self.market_value - self._cost_basis
+
+    @property
+    def equity(self) -> float:
+        return self._cash + self._long_value - self._short_value
+
+    @property
+    def buying_power(self) -> float:
+        """Cash free for new positions without leverage.
+
+        Short sale proceeds are held against the short, and each short
+        also ties up collateral equal to its current value, so this is
+        equity minus gross exposure.
+        """
+        return self._cash - 2 * self._short_value
+
+    @property
+    def symbols(self) -> list[str]:
+        return list(self._positions)
+
+    def __contains__(self, symbol: str) -> bool:
+        return symbol in self._positions
+
+    def __len__(self) -> int:
+        return len(self._positions)
+
+    def position(self, symbol: str) -> LedgerPosition | None:
+        return self._positions.get(symbol)
+
+    def positions(self) -> list[Position]:
+        return [
+            Position(
+                symbol=pos.symbol,
+                quantity=abs(pos.quantity),
+                avg_entry_price=pos.avg_price,
+                market_value=pos.market_value,
+                unrealized_pnl=pos.unrealized_pnl,
+                side=pos.side,
+            )
+            for pos in self._positions.values()
+        ]
+
+    def mark(self, symbol: str, price: float) -> None:
+        """Revalue the position in `symbol` (if any) at `price`."""
+        pos = self._positions.get(symbol)
+        if pos is None:
+            return
+        delta = (price - pos.price) * pos.quantity
+        if pos.quantity > 0:
+            self._long_value += delta
+        else:
+            self._short_value -= delta
+        pos.price = price
+
+    def fill(self, symbol: str, quantity: float, price: float) -> float:
+        """Apply a fill of signed `quantity` (positive buys) at `price`.
+
+        Buying against a short covers it and selling against a long
+        reduces it; a fill larger than the position flips it, with the
+        remainder entered at `price`. Cash moves by the full notional
+        (short sales credit their proceeds). Returns the realized PnL of
+        the reduced part.
+        """
+        self._cash -= quantity * price
+        pos = self._positions.get(symbol)
+        if pos is None:
+            pos = LedgerPosition(symbol, 0.0, price, price)
+            self._positions[symbol] = pos
+        else:
+            self.mark(symbol, price)
+            self._remove(pos)
+
+        held = pos.quantity
+        remaining = held + quantity
+        realized = 0.0
+        if held == 0 or (held > 0) == (quantity > 0):
+            pos.avg_price = (pos.avg_price * held + price * quantity) / remaining
+        else:
+            reduced = held if abs(quantity) >= abs(held) else -quantity
+            realized = (price - pos.avg_price) * reduced
+            if remaining != 0 and (remaining > 0) != (held > 0):
+                pos.avg_price = price
+        pos.quantity = remaining
+
+        if remaining == 0:
+            del self._positions[symbol]
+            if not self._positions:
+                # Drop rounding error accumulated by the running totals
+                self._long_value = self._short_value = self._cost_basis = 0.0
+        else:
+            self._add(pos)
+        return realized
+
+    def _add(self, pos: LedgerPosition) -> None:
+        if pos.quantity > 0:
+            self._long_value += pos.quantity * pos.price
+        else:
+            self._short_value -= pos.quantity * pos.price
+        self._cost_basis += pos.quantity * pos.avg_price
+
+    def _remove(self, pos: LedgerPosition) -> None:
+        if pos.quantity > 0:
+            self._long_value -= pos.quantity * pos.price
+        else:
+            self._short_value += pos.quantity * pos.price
+        self._cost_basis -= pos.quantity * pos.avg_price
@@ -7,7 +7,7 @@ from __future__ import annotations
 
 import json
 import logging
-from dataclasses import asdict, dataclass
+from dataclasses import asdict, dataclass, field
 from pathlib import Path
 
 logger = logging.getLogger(__name__)
@@ -32,6 +32,7 @@ class LiveTradeRecord:
     mfe: float = 0.0
     mae: float = 0.0
     bars_held: int = 0
+    indicators: dict = field(default_factory=dict)
 
 
 @dataclass(frozen=True)
@@ -69,7 +70,7 @@ class TradeLogger:
         """Read all trade records, skipping corrupt lines.
 
         Handles old records that lack the newer fields (exit_reason,
-        mfe, mae, bars_held) by supplying defaults.
+        mfe, mae, bars_held, indicators) by supplying defaults.
         """
         if not self._trade_path.exists():
             return []
@@ -97,6 +98,7 @@ class TradeLogger:
                         mfe=data.get("mfe", 0.0),
                         mae=data.get("mae", 0.0),
                         bars_held=data.get("bars_held", 0),
+                        indicators=data.get("indicators", {}),
                     ))
                 except (json.JSONDecodeError, TypeError, KeyError):
                     logger.warning("Skipping corrupt trade log line: %s", line[:80])
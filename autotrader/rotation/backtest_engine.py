@@ -1,20 +1,26 @@
 """Multi-symbol rotation backtest engine.
 
 Processes bars from multiple symbols with periodic universe rotation,
-per-symbol indicator engines, and watchlist-based signal filtering.
+a cross-symbol indicator panel, and watchlist-based signal filtering.
 """
 from __future__ import annotations
 
+import heapq
 import logging
-from collections import deque
+from collections.abc import AsyncIterable, Iterable, Iterator, Mapping
 from dataclasses import dataclass, field
 from datetime import datetime
+from time import perf_counter
 
+from autotrader.backtest.checkpoint import BacktestCheckpoint, checkpoint_key
+from autotrader.backtest.profiling import BacktestProfile
 from autotrader.backtest.simulator import BacktestSimulator
 from autotrader.backtest.trade_collector import TradeCollector, TradeDetail
+from autotrader.core.bar_history import BarHistory
 from autotrader.core.config import RiskConfig, RotationConfig
 from autotrader.core.types import Bar, MarketContext, Signal
-from autotrader.indicators.engine import IndicatorEngine
+from autotrader.indicators.panel import PanelIndicatorEngine
+from autotrader.indicators.snapshot import IndicatorSnapshot
 from autotrader.portfolio.performance import calculate_metrics
 from autotrader.risk.manager import RiskManager
 from autotrader.rotation.manager import RotationManager
@@ -36,6 +42,7 @@ class RotationBacktestResult:
     trades: list[TradeDetail] = field(default_factory=list)
     timestamped_equity: list[tuple] = field(default_factory=list)
     rotation_events: list[RotationEvent] = field(default_factory=list)
+    profile: BacktestProfile | None = None
 
 
 class RotationBacktestEngine:
@@ -43,8 +50,9 @@ class RotationBacktestEngine:
 
     Unlike BacktestEngine which processes a single symbol's bars,
     this engine:
-    - Maintains per-symbol IndicatorEngine instances and bar histories
-    - Merges bars from all symbols sorted by timestamp
+    - Precomputes indicator series for all symbols as one panel and
+      maintains per-symbol bar histories
+    - Merges the time-sorted bars of all symbols lazily by timestamp
     - Applies rotation at scheduled points
     - Uses RotationManager to filter signals
     """
@@ -55,13 +63,16 @@ class RotationBacktestEngine:
         risk_config: RiskConfig,
         rotation_config: RotationConfig,
         earnings_cal: object | None = None,
+        profile: bool = False,
     ) -> None:
         self._initial_balance = initial_balance
         self._risk_config = risk_config
         self._rotation_config = rotation_config
         self._earnings_cal = earnings_cal
+        self._profile = profile
         self._strategies: list[Strategy] = []
         self._indicator_specs: list = []
+        self._last_stream: tuple[_RotationReplay, PanelIndicatorEngine] | None = None
 
     def add_strategy(self, strategy: Strategy) -> None:
         """Register a strategy and its required indicators."""
@@ -69,9 +80,9 @@ class RotationBacktestEngine:
         for spec in strategy.required_indicators:
             self._indicator_specs.append(spec)
 
-    def _create_indicator_engine(self) -> IndicatorEngine:
-        """Create a fresh IndicatorEngine with all registered specs."""
-        engine = IndicatorEngine()
+    def _create_indicator_engine(self) -> PanelIndicatorEngine:
+        """Create a fresh PanelIndicatorEngine with all registered specs."""
+        engine = PanelIndicatorEngine()
         for spec in self._indicator_specs:
             engine.register(spec)
         return engine
@@ -85,7 +96,7 @@ class RotationBacktestEngine:
         """Run a multi-symbol rotation backtest.
 
         Args:
-            bars: dict mapping symbol -> list of bars (sorted by time).
+            bars: dict mapping symbol -> list of bars (sorted here by time).
             initial_universe: Initial set of active symbols.
             rotation_schedule: Optional dict mapping bar_index -> UniverseResult
                 for applying rotation at specific points in the timeline.
@@ -93,147 +104,174 @@ class RotationBacktestEngine:
         Returns:
             RotationBacktestResult with trades, equity curve, and rotation events.
         """
-        if rotation_schedule is None:
-            rotation_schedule = {}
-
-        # Initialize components
-        simulator = BacktestSimulator(self._initial_balance, self._risk_config)
-        risk_mgr = RiskManager(self._risk_config)
-        collector = TradeCollector()
-        rotation_mgr = RotationManager(self._rotation_config, self._earnings_cal)
-
-        # Set initial universe
-        rotation_mgr._state.active_symbols = list(initial_universe)
-        rotation_mgr._state.weekly_start_equity = self._initial_balance
-
-        # Per-symbol state
-        histories: dict[str, deque[Bar]] = {}
-        indicator_engines: dict[str, IndicatorEngine] = {}
-        for sym in self._all_symbols(bars, initial_universe):
-            histories[sym] = deque(maxlen=500)
-            indicator_engines[sym] = self._create_indicator_engine()
-
-        # Merge and sort all bars by timestamp
-        timeline = self._build_timeline(bars)
-
-        trade_pnls: list[float] = []
-        equity_curve: list[float] = [self._initial_balance]
-        timestamped_equity: list[tuple] = []
-        total_filled = 0
-        bar_index = 0
-        latest_prices: dict[str, float] = {}
-
-        for ts, bars_at_ts in timeline:
-            bar_index += 1
-
-            # Check for rotation at this index
-            if bar_index in rotation_schedule:
-                universe_result = rotation_schedule[bar_index]
-                open_syms = list(simulator._positions.keys())
-                rotation_mgr.apply_rotation(
-                    universe_result,
-                    open_position_symbols=open_syms,
-                    new_equity=simulator.get_equity_with_prices(latest_prices),
-                )
-                # Ensure new symbols have indicator engines
-                for sym in universe_result.symbols:
-                    if sym not in indicator_engines:
-                        histories[sym] = deque(maxlen=500)
-                        indicator_engines[sym] = self._create_indicator_engine()
-
-            # Process each bar at this timestamp
+        indicator_engine = self._create_indicator_engine()
+        replay = self._replay(
+            indicator_engine, initial_universe, rotation_schedule,
+            self._all_symbols(bars, initial_universe),
+        )
+        profile = replay.profile
+        if profile:
+            started = perf_counter()
+        # The indicator tables and the timeline must see each symbol's bars
+        # in the same order, so both are built from one sorted copy.
+        bars = {
+            sym: sorted(symbol_bars, key=lambda b: b.timestamp)
+            for sym, symbol_bars in bars.items()
+        }
+        # Indicator values for every bar are computed up front and looked up
+        # by each symbol's bar position during the replay.
+        indicator_series = indicator_engine.compute_panel(bars)
+        layout = indicator_engine.layout
+        indicator_tables = {
+            sym: layout.stack(series, len(bars[sym]))
+            for sym, series in indicator_series.items()
+        }
+        bar_positions: dict[str, int] = dict.fromkeys(bars, 0)
+        if profile:
+            profile.add("indicators", perf_counter() - started)
+
+        for ts, bars_at_ts in self._build_timeline(bars):
+            snapshots: dict[str, IndicatorSnapshot] = {}
             for bar in bars_at_ts:
-                sym = bar.symbol
-                latest_prices[sym] = bar.close
-
-                # Ensure symbol has state (may be watchlist or new)
-                if sym not in histories:
-                    histories[sym] = deque(maxlen=500)
-                    indicator_engines[sym] = self._create_indicator_engine()
-
-                histories[sym].append(bar)
-
-                # Force close check
-                open_syms = list(simulator._positions.keys())
-                force_close = rotation_mgr.get_force_close_symbols(
-                    bar.timestamp, open_syms,
-                )
-                for fc_sym in force_close:
-                    if fc_sym == sym:
-                        pnl = simulator.get_pnl(fc_sym, bar.close)
-                        close_sig = Signal(
-                            strategy="rotation_manager",
-                            symbol=fc_sym,
-                            direction="close",
-                            strength=1.0,
-                            metadata={"exit_reason": "force_close"},
-                        )
-                        result = simulator.execute_signal(close_sig, bar.close)
-                        if result and result.status == "filled":
-                            total_filled += 1
-                            trade_pnls.append(pnl)
-                            collector.on_exit(close_sig, bar, pnl)
-                            rotation_mgr.on_position_closed(fc_sym)
-
-                # Compute indicators
-                indicators = indicator_engines[sym].compute(histories[sym])
-                ctx = MarketContext(
-                    symbol=sym,
-                    bar=bar,
-                    indicators=indicators,
-                    history=histories[sym],
+                position = bar_positions[bar.symbol]
+                bar_positions[bar.symbol] = position + 1
+                snapshots[bar.symbol] = IndicatorSnapshot(
+                    layout, indicator_tables[bar.symbol][position].tolist(),
                 )
+            replay.step(ts, bars_at_ts, snapshots)
+        return replay.result()
 
-                # Run strategies
-                signals: list[Signal] = []
-                for strat in self._strategies:
-                    try:
-                        signal = strat.on_context(ctx)
-                    except Exception:
-                        continue
-                    if signal is not None:
-                        signals.append(signal)
-
-                # Filter through rotation manager
-                signals = rotation_mgr.filter_signals(signals)
-
-                # Execute filtered signals
-                for signal in signals:
-                    account = simulator._get_account()
-                    if not risk_mgr.validate(signal, account, positions=[]):
-                        continue
+    def run_stream(
+        self,
+        bars: Iterable[Bar],
+        initial_universe: list[str],
+        rotation_schedule: dict[int, UniverseResult] | None = None,
+    ) -> RotationBacktestResult:
+        """Rotation backtest over one time-ordered stream of every symbol's bars.
+
+        `bars` must be sorted by timestamp, with at most one bar per symbol
+        per timestamp (e.g. a query ordered by timestamp, symbol). Bars are
+        grouped by timestamp as they arrive and indicators advance through
+        the panel engine's streaming update, so memory is bounded by the
+        symbols' history windows rather than the dataset. Results match
+        run() over the same bars.
+        """
+        replay, indicator_engine = self._start_stream(initial_universe, rotation_schedule)
+        for ts, bars_at_ts in _group_by_timestamp(bars):
+            replay.step(ts, bars_at_ts, _update(indicator_engine, bars_at_ts, replay.profile))
+        return replay.result()
 
-                    if signal.direction == "close":
-                        pnl = simulator.get_pnl(signal.symbol, bar.close)
+    async def run_stream_async(
+        self,
+        bars: AsyncIterable[Bar],
+        initial_universe: list[str],
+        rotation_schedule: dict[int, UniverseResult] | None = None,
+    ) -> RotationBacktestResult:
+        """run_stream() over an async bar source, e.g. SQLiteStore.iter_bars()."""
+        replay, indicator_engine = self._start_stream(initial_universe, rotation_schedule)
+        return await _replay_async(replay, indicator_engine, bars)
 
-                    exec_result = simulator.execute_signal(signal, bar.close)
-                    if exec_result and exec_result.status == "filled":
-                        total_filled += 1
-                        if signal.direction == "close":
-                            trade_pnls.append(pnl)
-                            collector.on_exit(signal, bar, pnl)
-                            rotation_mgr.on_position_closed(signal.symbol)
-                        else:
-                            collector.on_entry(signal, bar, exec_result.filled_qty)
+    def checkpoint(self) -> BacktestCheckpoint:
+        """State at the end of the last run_stream() or resume(), to resume later.
 
-            # Weekly loss check
-            current_equity = simulator.get_equity_with_prices(latest_prices)
-            rotation_mgr.check_weekly_loss_limit(current_equity)
+        The earnings calendar is not part of the checkpoint; resume() uses
+        the resuming engine's.
+        """
+        if self._last_stream is None:
+            raise RuntimeError("No streaming run to checkpoint")
+        replay, indicator_engine = self._last_stream
+        rotation_mgr = replay._rotation_mgr
+        earnings_cal, rotation_mgr._earnings_cal = rotation_mgr._earnings_cal, None
+        try:
+            return BacktestCheckpoint.capture(
+                self._checkpoint_key(), replay.last_timestamp, (replay, indicator_engine),
+            )
+        finally:
+            rotation_mgr._earnings_cal = earnings_cal
+
+    def resume(
+        self,
+        checkpoint: BacktestCheckpoint,
+        bars: Iterable[Bar],
+        rotation_schedule: dict[int, UniverseResult] | None = None,
+    ) -> RotationBacktestResult:
+        """Continue a checkpointed run over bars appended after it.
+
+        `bars` follow run_stream()'s ordering rules and must start after
+        the checkpoint. Rotation indices keep counting timestamps from the
+        start of the original run; a `rotation_schedule` given here replaces
+        the checkpointed one. The result covers the whole timeline and
+        equals run_stream() over the old and new bars together. Raises
+        ValueError on a configuration mismatch, as BacktestEngine.resume().
+        """
+        replay, indicator_engine = self._restore(checkpoint, rotation_schedule)
+        for ts, bars_at_ts in _group_by_timestamp(checkpoint.appended(bars)):
+            replay.step(ts, bars_at_ts, _update(indicator_engine, bars_at_ts, replay.profile))
+        return replay.result()
 
-            equity_curve.append(current_equity)
-            timestamped_equity.append((ts, current_equity))
+    async def resume_async(
+        self,
+        checkpoint: BacktestCheckpoint,
+        bars: AsyncIterable[Bar],
+        rotation_schedule: dict[int, UniverseResult] | None = None,
+    ) -> RotationBacktestResult:
+        """resume() over an async bar source."""
+        replay, indicator_engine = self._restore(checkpoint, rotation_schedule)
+        return await _replay_async(replay, indicator_engine, checkpoint.appended_async(bars))
 
-        final_equity = equity_curve[-1] if len(equity_curve) > 1 else self._initial_balance
-        metrics = calculate_metrics(trade_pnls, self._initial_balance)
+    def _start_stream(
+        self,
+        initial_universe: list[str],
+        rotation_schedule: dict[int, UniverseResult] | None,
+    ) -> tuple[_RotationReplay, PanelIndicatorEngine]:
+        indicator_engine = self._create_indicator_engine()
+        replay = self._replay(
+            indicator_engine, initial_universe, rotation_schedule, set(initial_universe),
+        )
+        self._last_stream = (replay, indicator_engine)
+        return self._last_stream
 
-        return RotationBacktestResult(
-            total_trades=total_filled,
-            final_equity=final_equity,
-            metrics=metrics,
-            equity_curve=equity_curve,
-            trades=collector.trades,
-            timestamped_equity=timestamped_equity,
-            rotation_events=list(rotation_mgr._state.rotation_history),
+    def _checkpoint_key(self) -> str:
+        return checkpoint_key(
+            "rotation", self._strategies, self._risk_config, self._initial_balance,
+            self._rotation_config,
+        )
+
+    def _restore(
+        self,
+        checkpoint: BacktestCheckpoint,
+        rotation_schedule: dict[int, UniverseResult] | None,
+    ) -> tuple[_RotationReplay, PanelIndicatorEngine]:
+        replay, indicator_engine = checkpoint.restore(self._checkpoint_key())
+        replay._rotation_mgr._earnings_cal = self._earnings_cal
+        if rotation_schedule is not None:
+            replay._rotation_schedule = rotation_schedule
+        replay.restart(BacktestProfile() if self._profile else None)
+        self._last_stream = (replay, indicator_engine)
+        return self._last_stream
+
+    def _replay(
+        self,
+        indicator_engine: PanelIndicatorEngine,
+        initial_universe: list[str],
+        rotation_schedule: dict[int, UniverseResult] | None,
+        symbols: set[str],
+    ) -> _RotationReplay:
+        history_size = max(
+            indicator_engine.history_bars(),
+            max((s.lookback_bars for s in self._strategies), default=0),
+            1,
+        )
+        return _RotationReplay(
+            initial_balance=self._initial_balance,
+            risk_config=self._risk_config,
+            rotation_mgr=RotationManager(self._rotation_config, self._earnings_cal),
+            strategies=self._strategies,
+            initial_universe=initial_universe,
+            rotation_schedule=rotation_schedule or {},
+            history_size=history_size,
+            symbols=symbols,
+            profile=BacktestProfile() if self._profile else None,
         )
 
     @staticmethod
@@ -247,30 +285,258 @@ class RotationBacktestEngine:
 
     @staticmethod
     def _build_timeline(
-        bars: dict[str, list[Bar]],
-    ) -> list[tuple[datetime, list[Bar]]]:
-        """Merge all bars sorted by timestamp, grouping by timestamp."""
-        all_bars: list[Bar] = []
-        for symbol_bars in bars.values():
-            all_bars.extend(symbol_bars)
-        all_bars.sort(key=lambda b: (b.timestamp, b.symbol))
-
-        if not all_bars:
-            return []
-
-        timeline: list[tuple[datetime, list[Bar]]] = []
-        current_ts = all_bars[0].timestamp
-        current_group: list[Bar] = []
-
-        for bar in all_bars:
-            if bar.timestamp == current_ts:
-                current_group.append(bar)
-            else:
-                timeline.append((current_ts, current_group))
-                current_ts = bar.timestamp
-                current_group = [bar]
-
-        if current_group:
-            timeline.append((current_ts, current_group))
-
-        return timeline
+        bars: Mapping[str, Iterable[Bar]],
+    ) -> Iterator[tuple[datetime, list[Bar]]]:
+        """Lazily merge time-sorted per-symbol bars into timestamp groups.
+
+        A k-way heap merge keyed on (timestamp, symbol) holds one pending bar
+        per symbol, so no merged copy of the dataset is built. Symbols that
+        only enter the universe through rotation are merged the same way:
+        their bars surface as soon as the timeline reaches them.
+        """
+        merged = heapq.merge(*bars.values(), key=lambda b: (b.timestamp, b.symbol))
+        return _group_by_timestamp(merged)
+
+
+def _update(
+    indicator_engine: PanelIndicatorEngine,
+    bars_at_ts: list[Bar],
+    profile: BacktestProfile | None,
+) -> dict[str, IndicatorSnapshot]:
+    if not profile:
+        return indicator_engine.update(bars_at_ts)
+    started = perf_counter()
+    snapshots = indicator_engine.update(bars_at_ts)
+    profile.add("indicators", perf_counter() - started)
+    return snapshots
+
+
+async def _replay_async(
+    replay: _RotationReplay,
+    indicator_engine: PanelIndicatorEngine,
+    bars: AsyncIterable[Bar],
+) -> RotationBacktestResult:
+    """Feed an async time-ordered bar stream to `replay`, one timestamp at a time."""
+    profile = replay.profile
+    group: list[Bar] = []
+    async for bar in bars:
+        if group and bar.timestamp != group[0].timestamp:
+            replay.step(group[0].timestamp, group, _update(indicator_engine, group, profile))
+            group = []
+        group.append(bar)
+    if group:
+        replay.step(group[0].timestamp, group, _update(indicator_engine, group, profile))
+    return replay.result()
+
+
+def _group_by_timestamp(bars: Iterable[Bar]) -> Iterator[tuple[datetime, list[Bar]]]:
+    """Consecutive bars sharing a timestamp, as (timestamp, bars) groups."""
+    group: list[Bar] = []
+    for bar in bars:
+        if group and bar.timestamp != group[0].timestamp:
+            yield group[0].timestamp, group
+            group = []
+        group.append(bar)
+    if group:
+        yield group[0].timestamp, group
+
+
+class _RotationReplay:
+    """Simulation state of one rotation backtest, advanced one timestamp at a time."""
+
+    def __init__(
+        self,
+        initial_balance: float,
+        risk_config: RiskConfig,
+        rotation_mgr: RotationManager,
+        strategies: list[Strategy],
+        initial_universe: list[str],
+        rotation_schedule: dict[int, UniverseResult],
+        history_size: int,
+        symbols: set[str],
+        profile: BacktestProfile | None = None,
+    ) -> None:
+        self._initial_balance = initial_balance
+        self.profile = profile
+        self._started = perf_counter()
+        self._strategy_stages = [f"strategy:{strat.name}" for strat in strategies]
+        self._simulator = BacktestSimulator(initial_balance, risk_config)
+        self._risk_mgr = RiskManager(risk_config)
+        self._collector = TradeCollector()
+        self._rotation_mgr = rotation_mgr
+        self._strategies = strategies
+        self._rotation_schedule = rotation_schedule
+        self._history_size = history_size
+
+        # Set initial universe
+        rotation_mgr._state.active_symbols = list(initial_universe)
+        rotation_mgr._state.weekly_start_equity = initial_balance
+
+        self._histories: dict[str, BarHistory] = {
+            sym: BarHistory(maxlen=history_size) for sym in symbols
+        }
+        self._trade_pnls: list[float] = []
+        self._equity_curve: list[float] = [initial_balance]
+        self._timestamped_equity: list[tuple] = []
+        self._total_filled = 0
+        self._bar_index = 0
+
+    @property
+    def last_timestamp(self) -> datetime | None:
+        return self._timestamped_equity[-1][0] if self._timestamped_equity else None
+
+    def restart(self, profile: BacktestProfile | None) -> None:
+        """Start timing a continuation of this replay with a fresh profile."""
+        self.profile = profile
+        self._started = perf_counter()
+
+    def step(
+        self, ts: datetime, bars_at_ts: list[Bar], snapshots: Mapping[str, IndicatorSnapshot],
+    ) -> None:
+        simulator = self._simulator
+        rotation_mgr = self._rotation_mgr
+        histories = self._histories
+        profile = self.profile
+        self._bar_index += 1
+
+        # Check for rotation at this index
+        if self._bar_index in self._rotation_schedule:
+            universe_result = self._rotation_schedule[self._bar_index]
+            if profile:
+                started = perf_counter()
+            rotation_mgr.apply_rotation(
+                universe_result,
+                open_position_symbols=simulator.open_symbols,
+                new_equity=simulator.equity,
+            )
+            if profile:
+                profile.add("rotation", perf_counter() - started)
+            # Ensure new symbols have bar histories
+            for sym in universe_result.symbols:
+                if sym not in histories:
+                    histories[sym] = BarHistory(maxlen=self._history_size)
+
+        # Process each bar at this timestamp
+        for bar in bars_at_ts:
+            sym = bar.symbol
+            if profile:
+                started = perf_counter()
+            simulator.mark(sym, bar.close)
+            if profile:
+                profile.add("equity", perf_counter() - started)
+
+            # Ensure symbol has state (may be watchlist or new)
+            if sym not in histories:
+                histories[sym] = BarHistory(maxlen=self._history_size)
+
+            histories[sym].append(bar)
+
+            # Force close check
+            if profile:
+                started = perf_counter()
+            force_close = rotation_mgr.get_force_close_symbols(
+                bar.timestamp, simulator.open_symbols,
+            )
+            for fc_sym in force_close:
+                if fc_sym == sym:
+                    pnl = simulator.get_pnl(fc_sym, bar.close)
+                    close_sig = Signal(
+                        strategy="rotation_manager",
+                        symbol=fc_sym,
+                        direction="close",
+                        strength=1.0,
+                        metadata={"exit_reason": "force_close"},
+                    )
+                    result = simulator.execute_signal(close_sig, bar.close)
+                    if result and result.status == "filled":
+                        self._total_filled += 1
+                        self._trade_pnls.append(pnl)
+                        self._collector.on_exit(close_sig, bar, pnl)
+                        rotation_mgr.on_position_closed(fc_sym)
+            if profile:
+                profile.add("force_close", perf_counter() - started)
+
+            ctx = MarketContext(
+                symbol=sym,
+                bar=bar,
+                indicators=snapshots[sym],
+                history=histories[sym],
+            )
+
+            # Run strategies
+            signals: list[Signal] = []
+            for index, strat in enumerate(self._strategies):
+                if profile:
+                    started = perf_counter()
+                try:
+                    signal = strat.on_context(ctx)
+                except Exception:
+                    signal = None
+                if profile:
+                    profile.add(self._strategy_stages[index], perf_counter() - started)
+                if signal is not None:
+                    signals.append(signal)
+
+            # Filter through rotation manager
+            if profile:
+                started = perf_counter()
+            signals = rotation_mgr.filter_signals(signals)
+            if profile:
+                profile.add("signal_filter", perf_counter() - started)
+
+            # Execute filtered signals
+            for signal in signals:
+                if profile:
+                    started = perf_counter()
+                account = simulator.get_account()
+                valid = self._risk_mgr.validate(signal, account, positions=[])
+                if profile:
+                    profile.add("risk", perf_counter() - started)
+                if not valid:
+                    continue
+
+                if profile:
+                    started = perf_counter()
+                if signal.direction == "close":
+                    pnl = simulator.get_pnl(signal.symbol, bar.close)
+
+                exec_result = simulator.execute_signal(signal, bar.close)
+                if exec_result and exec_result.status == "filled":
+                    self._total_filled += 1
+                    if signal.direction == "close":
+                        self._trade_pnls.append(pnl)
+                        self._collector.on_exit(signal, bar, pnl)
+                        rotation_mgr.on_position_closed(signal.symbol)
+                    else:
+                        self._collector.on_entry(signal, bar, exec_result.filled_qty)
+                if profile:
+                    profile.add("execution", perf_counter() - started)
+
+        # Weekly loss check
+        if profile:
+            started = perf_counter()
+        current_equity = simulator.equity
+        rotation_mgr.check_weekly_loss_limit(current_equity)
+        if profile:
+            profile.add("weekly_loss_check", perf_counter() - started)
+
+        self._equity_curve.append(current_equity)
+        self._timestamped_equity.append((ts, current_equity))
+
+    def result(self) -> RotationBacktestResult:
+        equity_curve = self._equity_curve
+        final_equity = equity_curve[-1] if len(equity_curve) > 1 else self._initial_balance
+        metrics = calculate_metrics(self._trade_pnls, self._initial_balance)
+        if self.profile:
+            self.profile.wall_seconds = perf_counter() - self._started
+
+        return RotationBacktestResult(
+            total_trades=self._total_filled,
+            final_equity=final_equity,
+            metrics=metrics,
+            equity_curve=equity_curve,
+            trades=self._collector.trades,
+            timestamped_equity=self._timestamped_equity,
+            rotation_events=list(self._rotation_mgr._state.rotation_history),
+            profile=self.profile,
+        )
@@ -9,6 +9,7 @@ from dataclasses import dataclass, field
 
 from autotrader.core.types import MarketContext, Signal
 from autotrader.indicators.base import IndicatorSpec
+from autotrader.indicators.snapshot import SnapshotReader
 from autotrader.strategy.base import Strategy
 
 
@@ -65,6 +66,13 @@ class AdxPullback(Strategy):
             IndicatorSpec(name="ATR", params={"period": self.ATR_PERIOD}),
         ]
         self._states: dict[str, _SymbolState] = {}
+        self._indicator_reader = SnapshotReader(
+            adx=f"ADX_{self.ADX_PERIOD}",
+            ema_fast=f"EMA_{self.EMA_FAST_PERIOD}",
+            ema_slow=f"EMA_{self.EMA_SLOW_PERIOD}",
+            rsi=f"RSI_{self.RSI_PERIOD}",
+            atr=f"ATR_{self.ATR_PERIOD}",
+        )
 
     def _get_state(self, symbol: str) -> _SymbolState:
         if symbol not in self._states:
@@ -72,22 +80,7 @@ class AdxPullback(Strategy):
         return self._states[symbol]
 
     def _extract_indicators(self, ctx: MarketContext) -> dict[str, float] | None:
-        adx = ctx.indicators.get(f"ADX_{self.ADX_PERIOD}")
-        ema_fast = ctx.indicators.get(f"EMA_{self.EMA_FAST_PERIOD}")
-        ema_slow = ctx.indicators.get(f"EMA_{self.EMA_SLOW_PERIOD}")
-        rsi = ctx.indicators.get(f"RSI_{self.RSI_PERIOD}")
-        atr = ctx.indicators.get(f"ATR_{self.ATR_PERIOD}")
-
-        if any(v is None for v in [adx, ema_fast, ema_slow, rsi, atr]):
-            return None
-
-        return {
-            "adx": adx,
-            "ema_fast": ema_fast,
-            "ema_slow": ema_slow,
-            "rsi": rsi,
-            "atr": atr,
-        }
+        return self._indicator_reader.read(ctx.indicators)
 
     def on_context(self, ctx: MarketContext) -> Signal | None:
         indicators = self._extract_indicators(ctx)
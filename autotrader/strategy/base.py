@@ -1,19 +1,35 @@
 from __future__ import annotations
 
 from abc import ABC, abstractmethod
+from collections.abc import Mapping
+
+import numpy as np
 
 from autotrader.core.types import MarketContext, Signal, OrderResult, Position, Timeframe
-from autotrader.indicators.base import IndicatorSpec
+from autotrader.indicators.base import IndicatorSpec, SeriesValue
 
 
 class Strategy(ABC):
     name: str
     required_indicators: list[IndicatorSpec] = []
     timeframe: Timeframe = Timeframe.DAILY
+    # Bars of ctx.history read directly (beyond what the indicators need)
+    lookback_bars: int = 0
 
     @abstractmethod
     def on_context(self, ctx: MarketContext) -> Signal | None: ...
 
+    def entry_mask(self, series: Mapping[str, SeriesValue]) -> np.ndarray | None:
+        """Bars where an entry is possible, from full compute_series() output.
+
+        Optional vectorized prefilter for backtests. A False bar promises
+        that, while the strategy is flat (no entry signal since its last
+        close), on_context() would return None there and leave its state
+        unchanged, so the backtester may skip the call. None (the default)
+        makes every bar a candidate.
+        """
+        return None
+
     def on_order_filled(self, fill: OrderResult) -> None:
         pass
 
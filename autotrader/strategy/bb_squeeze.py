@@ -1,11 +1,12 @@
 """BB Squeeze Breakout strategy: bidirectional volatility breakout after Bollinger Band squeeze."""
 from __future__ import annotations
 
-from collections import deque
 from dataclasses import dataclass, field
 
 from autotrader.core.types import MarketContext, Signal
 from autotrader.indicators.base import IndicatorSpec
+from autotrader.indicators.rolling import RollingMean
+from autotrader.indicators.snapshot import SnapshotReader
 from autotrader.strategy.base import Strategy
 
 
@@ -13,7 +14,7 @@ from autotrader.strategy.base import Strategy
 class _SqueezeState:
     """Per-symbol internal state for BB Squeeze Breakout strategy."""
 
-    bb_width_history: deque = field(default_factory=lambda: deque(maxlen=20))
+    bb_width_history: RollingMean = field(default_factory=lambda: RollingMean(20))
     prev_adx: float | None = None
     in_position: bool = False
     entry_price: float = 0.0
@@ -54,6 +55,16 @@ class BbSqueezeBreakout(Strategy):
             IndicatorSpec(name="ATR", params={"period": self.ATR_PERIOD}),
         ]
         self._states: dict[str, _SqueezeState] = {}
+        self._indicator_reader = SnapshotReader(
+            bb_upper=(f"BBANDS_{self.BB_PERIOD}", "upper"),
+            bb_middle=(f"BBANDS_{self.BB_PERIOD}", "middle"),
+            bb_lower=(f"BBANDS_{self.BB_PERIOD}", "lower"),
+            bb_width=(f"BBANDS_{self.BB_PERIOD}", "width"),
+            bb_pct_b=(f"BBANDS_{self.BB_PERIOD}", "pct_b"),
+            adx=f"ADX_{self.ADX_PERIOD}",
+            rsi=f"RSI_{self.RSI_PERIOD}",
+            atr=f"ATR_{self.ATR_PERIOD}",
+        )
 
     def on_context(self, ctx: MarketContext) -> Signal | None:
         indicators = self._extract_indicators(ctx)
@@ -89,32 +100,12 @@ class BbSqueezeBreakout(Strategy):
         return signal
 
     def _extract_indicators(self, ctx: MarketContext) -> dict | None:
-        bbands = ctx.indicators.get(f"BBANDS_{self.BB_PERIOD}")
-        adx = ctx.indicators.get(f"ADX_{self.ADX_PERIOD}")
-        rsi = ctx.indicators.get(f"RSI_{self.RSI_PERIOD}")
-        atr = ctx.indicators.get(f"ATR_{self.ATR_PERIOD}")
-
-        if any(v is None for v in [bbands, adx, rsi, atr]):
-            return None
-
-        if not isinstance(bbands, dict):
-            return None
-
-        return {
-            "bb_upper": bbands["upper"],
-            "bb_middle": bbands["middle"],
-            "bb_lower": bbands["lower"],
-            "bb_width": bbands["width"],
-            "bb_pct_b": bbands["pct_b"],
-            "adx": adx,
-            "rsi": rsi,
-            "atr": atr,
-        }
+        return self._indicator_reader.read(ctx.indicators)
 
     def _is_squeezed(self, state: _SqueezeState, current_width: float) -> bool:
         if len(state.bb_width_history) < self.MIN_BB_HISTORY:
             return False
-        avg_width = sum(state.bb_width_history) / len(state.bb_width_history)
+        avg_width = state.bb_width_history.mean
         if avg_width <= 0:
             return False
         return current_width <= avg_width * self.SQUEEZE_THRESHOLD
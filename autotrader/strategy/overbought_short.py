@@ -10,6 +10,7 @@ from dataclasses import dataclass
 
 from autotrader.core.types import MarketContext, Signal
 from autotrader.indicators.base import IndicatorSpec
+from autotrader.indicators.snapshot import SnapshotReader
 from autotrader.strategy.base import Strategy
 
 
@@ -71,6 +72,14 @@ class OverboughtShort(Strategy):
             IndicatorSpec(name="ATR", params={"period": self.ATR_PERIOD}),
         ]
         self._states: dict[str, _SymbolState] = {}
+        self._indicator_reader = SnapshotReader(
+            rsi=f"RSI_{self.RSI_PERIOD}",
+            pct_b=(f"BBANDS_{self.BB_PERIOD}", "pct_b"),
+            adx=f"ADX_{self.ADX_PERIOD}",
+            ema_fast=f"EMA_{self.EMA_FAST_PERIOD}",
+            ema_slow=f"EMA_{self.EMA_SLOW_PERIOD}",
+            atr=f"ATR_{self.ATR_PERIOD}",
+        )
 
     # ------------------------------------------------------------------
     # Public interface
@@ -105,27 +114,7 @@ class OverboughtShort(Strategy):
     # ------------------------------------------------------------------
 
     def _extract_indicators(self, ctx: MarketContext) -> dict | None:
-        rsi = ctx.indicators.get(f"RSI_{self.RSI_PERIOD}")
-        bbands = ctx.indicators.get(f"BBANDS_{self.BB_PERIOD}")
-        adx = ctx.indicators.get(f"ADX_{self.ADX_PERIOD}")
-        ema_fast = ctx.indicators.get(f"EMA_{self.EMA_FAST_PERIOD}")
-        ema_slow = ctx.indicators.get(f"EMA_{self.EMA_SLOW_PERIOD}")
-        atr = ctx.indicators.get(f"ATR_{self.ATR_PERIOD}")
-
-        if any(v is None for v in [rsi, bbands, adx, ema_fast, ema_slow, atr]):
-            return None
-
-        if not isinstance(bbands, dict):
-            return None
-
-        return {
-            "rsi": rsi,
-            "pct_b": bbands["pct_b"],
-            "adx": adx,
-            "ema_fast": ema_fast,
-            "ema_slow": ema_slow,
-            "atr": atr,
-        }
+        return self._indicator_reader.read(ctx.indicators)
 
     # ------------------------------------------------------------------
     # Entry logic (short only)
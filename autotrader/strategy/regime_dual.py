@@ -1,11 +1,12 @@
 """Regime-aware dual strategy combining trend-following and mean-reversion."""
 from __future__ import annotations
 
-from collections import deque
 from dataclasses import dataclass, field
 
 from autotrader.core.types import MarketContext, Signal
 from autotrader.indicators.base import IndicatorSpec
+from autotrader.indicators.rolling import RollingMean
+from autotrader.indicators.snapshot import SnapshotReader
 from autotrader.strategy.base import Strategy
 
 
@@ -15,7 +16,7 @@ class _SymbolState:
     regime_score: float = 0.0
     prev_regime: str = "UNCERTAIN"
     regime_bars: int = 0
-    bb_width_history: deque = field(default_factory=lambda: deque(maxlen=20))
+    bb_width_history: RollingMean = field(default_factory=lambda: RollingMean(20))
     prev_ema_fast: float | None = None
     prev_ema_slow: float | None = None
     in_position: bool = False
@@ -75,6 +76,18 @@ class RegimeDualStrategy(Strategy):
             ),
         ]
         self._states: dict[str, _SymbolState] = {}
+        self._indicator_reader = SnapshotReader(
+            ema_fast=f"EMA_{self.EMA_FAST_PERIOD}",
+            ema_slow=f"EMA_{self.EMA_SLOW_PERIOD}",
+            adx=f"ADX_{self.ADX_PERIOD}",
+            rsi=f"RSI_{self.RSI_PERIOD}",
+            atr=f"ATR_{self.ATR_PERIOD}",
+            bb_upper=(f"BBANDS_{self.BB_PERIOD}", "upper"),
+            bb_middle=(f"BBANDS_{self.BB_PERIOD}", "middle"),
+            bb_lower=(f"BBANDS_{self.BB_PERIOD}", "lower"),
+            bb_width=(f"BBANDS_{self.BB_PERIOD}", "width"),
+            bb_pct_b=(f"BBANDS_{self.BB_PERIOD}", "pct_b"),
+        )
 
     def on_context(self, ctx: MarketContext) -> Signal | None:
         indicators = self._extract_indicators(ctx)
@@ -106,31 +119,7 @@ class RegimeDualStrategy(Strategy):
         return signal
 
     def _extract_indicators(self, ctx: MarketContext) -> dict | None:
-        ema_fast = ctx.indicators.get(f"EMA_{self.EMA_FAST_PERIOD}")
-        ema_slow = ctx.indicators.get(f"EMA_{self.EMA_SLOW_PERIOD}")
-        adx = ctx.indicators.get(f"ADX_{self.ADX_PERIOD}")
-        rsi = ctx.indicators.get(f"RSI_{self.RSI_PERIOD}")
-        atr = ctx.indicators.get(f"ATR_{self.ATR_PERIOD}")
-        bbands = ctx.indicators.get(f"BBANDS_{self.BB_PERIOD}")
-
-        if any(v is None for v in [ema_fast, ema_slow, adx, rsi, atr, bbands]):
-            return None
-
-        if not isinstance(bbands, dict):
-            return None
-
-        return {
-            "ema_fast": ema_fast,
-            "ema_slow": ema_slow,
-            "adx": adx,
-            "rsi": rsi,
-            "atr": atr,
-            "bb_upper": bbands["upper"],
-            "bb_middle": bbands["middle"],
-            "bb_lower": bbands["lower"],
-            "bb_width": bbands["width"],
-            "bb_pct_b": bbands["pct_b"],
-        }
+        return self._indicator_reader.read(ctx.indicators)
 
     def _update_regime(self, state: _SymbolState, indicators: dict) -> None:
         adx = indicators["adx"]
@@ -148,7 +137,7 @@ class RegimeDualStrategy(Strategy):
         state.bb_width_history.append(bb_width)
 
         if len(state.bb_width_history) >= 5:
-            avg_width = sum(state.bb_width_history) / len(state.bb_width_history)
+            avg_width = state.bb_width_history.mean
             if avg_width > 0:
                 ratio = bb_width / avg_width
             else:
@@ -1,11 +1,12 @@
 """Regime-aware momentum strategy for TREND regime with volatility filter."""
 from __future__ import annotations
 
-from collections import deque
 from dataclasses import dataclass, field
 
 from autotrader.core.types import MarketContext, Signal
 from autotrader.indicators.base import IndicatorSpec
+from autotrader.indicators.rolling import RollingMean
+from autotrader.indicators.snapshot import SnapshotReader
 from autotrader.strategy.base import Strategy
 
 
@@ -13,8 +14,8 @@ from autotrader.strategy.base import Strategy
 class _SymbolState:
     """Internal per-symbol state for the RegimeMomentum strategy."""
 
-    bb_width_history: deque[float] = field(
-        default_factory=lambda: deque(maxlen=20)
+    bb_width_history: RollingMean = field(
+        default_factory=lambda: RollingMean(20)
     )
     in_position: bool = False
     entry_price: float = 0.0
@@ -84,7 +85,19 @@ class RegimeMomentum(Strategy):
             IndicatorSpec(name="RSI", params={"period": self.RSI_PERIOD}),
             IndicatorSpec(name="ATR", params={"period": self.ATR_PERIOD}),
         ]
+        # Set here rather than at class level so overridden constants
+        # (parameter sweeps) size the history too
+        self.lookback_bars = max(self.MIN_HISTORY_BARS, self.MOMENTUM_LOOKBACK + 1)
         self._states: dict[str, _SymbolState] = {}
+        self._indicator_reader = SnapshotReader(
+            adx=f"ADX_{self.ADX_PERIOD}",
+            bb_width=(f"BBANDS_{self.BB_PERIOD}", "width"),
+            bb_pct_b=(f"BBANDS_{self.BB_PERIOD}", "pct_b"),
+            ema_fast=f"EMA_{self.EMA_FAST_PERIOD}",
+            ema_slow=f"EMA_{self.EMA_SLOW_PERIOD}",
+            rsi=f"RSI_{self.RSI_PERIOD}",
+            atr=f"ATR_{self.ATR_PERIOD}",
+        )
 
     def on_context(self, ctx: MarketContext) -> Signal | None:
         indicators = self._extract_indicators(ctx)
@@ -114,28 +127,7 @@ class RegimeMomentum(Strategy):
 
     def _extract_indicators(self, ctx: MarketContext) -> dict | None:
         """Extract and validate all required indicators from context."""
-        adx = ctx.indicators.get(f"ADX_{self.ADX_PERIOD}")
-        bbands = ctx.indicators.get(f"BBANDS_{self.BB_PERIOD}")
-        ema_fast = ctx.indicators.get(f"EMA_{self.EMA_FAST_PERIOD}")
-        ema_slow = ctx.indicators.get(f"EMA_{self.EMA_SLOW_PERIOD}")
-        rsi = ctx.indicators.get(f"RSI_{self.RSI_PERIOD}")
-        atr = ctx.indicators.get(f"ATR_{self.ATR_PERIOD}")
-
-        if any(v is None for v in [adx, bbands, ema_fast, ema_slow, rsi, atr]):
-            return None
-
-        if not isinstance(bbands, dict):
-            return None
-
-        return {
-            "adx": adx,
-            "bb_width": bbands["width"],
-            "bb_pct_b": bbands["pct_b"],
-            "ema_fast": ema_fast,
-            "ema_slow": ema_slow,
-            "rsi": rsi,
-            "atr": atr,
-        }
+        return self._indicator_reader.read(ctx.indicators)
 
     # ------------------------------------------------------------------
     # Regime detection
@@ -152,7 +144,7 @@ class RegimeMomentum(Strategy):
             state.current_regime = "UNCERTAIN"
             return
 
-        avg_width = sum(state.bb_width_history) / len(state.bb_width_history)
+        avg_width = state.bb_width_history.mean
         if avg_width > 0:
             ratio = bb_width / avg_width
         else:
@@ -171,7 +163,7 @@ class RegimeMomentum(Strategy):
 
     def _calc_return_20(self, ctx: MarketContext) -> float | None:
         """Calculate 20-bar return from history. Returns None if insufficient data."""
-        if len(ctx.history) < self.MIN_HISTORY_BARS:
+        if len(ctx.history) < self.lookback_bars:
             return None
 
         close_20_ago = ctx.history[-(self.MOMENTUM_LOOKBACK + 1)].close
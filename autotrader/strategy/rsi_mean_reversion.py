@@ -5,10 +5,14 @@ RSI overbought + BB %B near upper band.  Only trades when ADX < 25 (non-trending
 """
 from __future__ import annotations
 
+from collections.abc import Mapping
 from dataclasses import dataclass, field
 
+import numpy as np
+
 from autotrader.core.types import MarketContext, Signal
-from autotrader.indicators.base import IndicatorSpec
+from autotrader.indicators.base import IndicatorSpec, SeriesValue
+from autotrader.indicators.snapshot import SnapshotReader
 from autotrader.strategy.base import Strategy
 
 
@@ -77,49 +81,58 @@ class RsiMeanReversion(Strategy):
             IndicatorSpec(name="ATR", params={"period": self.ATR_PERIOD}),
         ]
         self._states: dict[str, _PositionState] = {}
+        self._indicator_reader = SnapshotReader(
+            rsi=f"RSI_{self.RSI_PERIOD}",
+            adx=f"ADX_{self.ADX_PERIOD}",
+            atr=f"ATR_{self.ATR_PERIOD}",
+            pct_b=(f"BBANDS_{self.BB_PERIOD}", "pct_b"),
+        )
+        # Exits skip the ADX regime filter, so ADX is not read (or, with a
+        # lazy snapshot, evaluated) while in position.
+        self._exit_reader = SnapshotReader(
+            rsi=f"RSI_{self.RSI_PERIOD}",
+            atr=f"ATR_{self.ATR_PERIOD}",
+            pct_b=(f"BBANDS_{self.BB_PERIOD}", "pct_b"),
+        )
 
     # ------------------------------------------------------------------
     # Public interface
     # ------------------------------------------------------------------
 
     def on_context(self, ctx: MarketContext) -> Signal | None:
-        indicators = self._extract_indicators(ctx)
-        if indicators is None:
-            return None
-
         symbol = ctx.symbol
         if symbol not in self._states:
             self._states[symbol] = _PositionState()
         state = self._states[symbol]
 
         if state.in_position:
+            indicators = self._exit_reader.read(ctx.indicators)
+            if indicators is None:
+                return None
             state.bars_since_entry += 1
             return self._check_exit(ctx, state, indicators)
 
+        indicators = self._extract_indicators(ctx)
+        if indicators is None:
+            return None
         return self._check_entry(ctx, state, indicators)
 
+    def entry_mask(self, series: Mapping[str, SeriesValue]) -> np.ndarray:
+        """Bars passing the regime filter and either entry threshold."""
+        rsi = series[f"RSI_{self.RSI_PERIOD}"]
+        pct_b = series[f"BBANDS_{self.BB_PERIOD}"]["pct_b"]
+        adx = series[f"ADX_{self.ADX_PERIOD}"]
+        # NaN (warm-up) compares False, matching the reader's None
+        long_entry = (rsi < self.RSI_OVERSOLD) & (pct_b < self.BB_LONG_ENTRY_PCT_B)
+        short_entry = (rsi > self.RSI_OVERBOUGHT) & (pct_b > self.BB_SHORT_ENTRY_PCT_B)
+        return (adx < self.ADX_MAX) & (long_entry | short_entry)
+
     # ------------------------------------------------------------------
     # Indicator extraction
     # ------------------------------------------------------------------
 
     def _extract_indicators(self, ctx: MarketContext) -> dict | None:
-        rsi = ctx.indicators.get(f"RSI_{self.RSI_PERIOD}")
-        bbands = ctx.indicators.get(f"BBANDS_{self.BB_PERIOD}")
-        adx = ctx.indicators.get(f"ADX_{self.ADX_PERIOD}")
-        atr = ctx.indicators.get(f"ATR_{self.ATR_PERIOD}")
-
-        if any(v is None for v in [rsi, bbands, adx, atr]):
-            return None
-
-        if not isinstance(bbands, dict):
-            return None
-
-        return {
-            "rsi": rsi,
-            "adx": adx,
-            "atr": atr,
-            "pct_b": bbands["pct_b"],
-        }
+        return self._indicator_reader.read(ctx.indicators)
 
     # ------------------------------------------------------------------
     # Entry logic
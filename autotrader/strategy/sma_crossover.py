@@ -3,6 +3,7 @@ from __future__ import annotations
 
 from autotrader.core.types import MarketContext, Signal
 from autotrader.indicators.base import IndicatorSpec
+from autotrader.indicators.snapshot import SnapshotReader
 from autotrader.strategy.base import Strategy
 
 
@@ -23,16 +24,16 @@ class SmaCrossover(Strategy):
             IndicatorSpec(name="SMA", params={"period": slow_period}),
         ]
         self._prev_fast_above: dict[str, bool] = {}
+        self._indicator_reader = SnapshotReader(
+            fast=f"SMA_{fast_period}", slow=f"SMA_{slow_period}",
+        )
 
     def on_context(self, ctx: MarketContext) -> Signal | None:
-        fast_key = f"SMA_{self.fast_period}"
-        slow_key = f"SMA_{self.slow_period}"
-
-        fast_val = ctx.indicators.get(fast_key)
-        slow_val = ctx.indicators.get(slow_key)
-
-        if fast_val is None or slow_val is None:
+        values = self._indicator_reader.read(ctx.indicators)
+        if values is None:
             return None
+        fast_val = values["fast"]
+        slow_val = values["slow"]
 
         fast_above = float(fast_val) > float(slow_val)
         symbol = ctx.symbol
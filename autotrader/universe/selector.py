@@ -11,7 +11,9 @@ from __future__ import annotations
 
 import logging
 from datetime import datetime, timezone
-from statistics import mean, stdev
+from statistics import mean
+
+import numpy as np
 
 from autotrader.core.types import Bar
 from autotrader.core.config import RiskConfig
@@ -21,9 +23,11 @@ from autotrader.universe import (
     ScoredCandidate,
     UniverseResult,
 )
+from autotrader.indicators import rolling
 from autotrader.universe.filters import HardFilter
 from autotrader.universe.scorer import ProxyScorer, BacktestScorer
 from autotrader.universe.optimizer import PortfolioOptimizer
+from autotrader.backtest.cache import BacktestCache
 from autotrader.backtest.engine import BacktestEngine
 from autotrader.strategy.rsi_mean_reversion import RsiMeanReversion
 from autotrader.strategy.bb_squeeze import BbSqueezeBreakout
@@ -45,8 +49,10 @@ class UniverseSelector:
         target_size: int = 15,
         proxy_weight: float = 0.50,
         backtest_weight: float = 0.50,
+        cache: BacktestCache | None = None,
     ) -> None:
         self._initial_balance = initial_balance
+        self._cache = cache
         self._target_size = target_size
         self._proxy_weight = proxy_weight
         self._backtest_weight = backtest_weight
@@ -187,18 +193,11 @@ class UniverseSelector:
         trend_pct = trend_count / total_windows
         range_pct = range_count / total_windows
 
-        # Vol cycle: CV of rolling 20-bar standard deviation of closes
-        if len(closes) >= 20:
-            widths: list[float] = []
-            for i in range(20, len(closes)):
-                window = closes[i - 20 : i]
-                sd = stdev(window) if len(window) > 1 else 0.0
-                widths.append(sd)
-            vol_cycle = (
-                stdev(widths) / mean(widths)
-                if widths and mean(widths) > 0
-                else 0.0
-            )
+        # Vol cycle: CV of rolling 20-bar sample standard deviation of closes,
+        # over every full window that ends before the latest bar
+        widths = rolling.rolling_std(np.asarray(closes[:-1]), 20, ddof=1)[19:]
+        if len(widths) > 1 and widths.mean() > 0:
+            vol_cycle = float(widths.std(ddof=1) / widths.mean())
         else:
             vol_cycle = 0.0
 
@@ -219,12 +218,14 @@ class UniverseSelector:
         """Run all 5 strategies via BacktestEngine and return backtest score.
 
         Creates a fresh BacktestEngine with all 5 strategies, runs it on
-        the provided bars, and feeds the results to BacktestScorer.
+        the provided bars, and feeds the results to BacktestScorer. With a
+        cache, candidates whose bars are unchanged since an earlier
+        selection reuse the stored result.
 
         Returns:
             Float score between 0.0 and 1.0.
         """
-        engine = BacktestEngine(self._initial_balance, self._risk_config)
+        engine = BacktestEngine(self._initial_balance, self._risk_config, self._cache)
         strategies = [
             RsiMeanReversion(),
             BbSqueezeBreakout(),
@@ -0,0 +1,88 @@
+"""Indicator throughput benchmark: batch vs streaming vs vectorized.
+
+Times every registered indicator at each history size and symbol count,
+checks that all modes agree, and writes the results as JSON.
+
+Usage:
+    python scripts/benchmark_indicators.py
+    python scripts/benchmark_indicators.py --histories 50 500 --symbols 1 50
+    python scripts/benchmark_indicators.py --indicators RSI ADX --output bench.json
+"""
+from __future__ import annotations
+
+import argparse
+import sys
+from pathlib import Path
+
+_PROJECT_ROOT = Path(__file__).resolve().parents[1]
+sys.path.insert(0, str(_PROJECT_ROOT))
+
+
+def parse_args() -> argparse.Namespace:
+    parser = argparse.ArgumentParser(description="Indicator throughput benchmark")
+    parser.add_argument(
+        "--histories", type=int, nargs="+", default=[50, 500, 5000],
+        help="Bars of history per symbol (default: 50 500 5000)",
+    )
+    parser.add_argument(
+        "--symbols", type=int, nargs="+", default=[1, 50, 500],
+        help="Symbol counts (default: 1 50 500)",
+    )
+    parser.add_argument(
+        "--indicators", nargs="+", default=None,
+        help="Indicator names to run, e.g. RSI BBANDS (default: all)",
+    )
+    parser.add_argument(
+        "--batch-samples", type=int, default=100,
+        help="calculate() calls timed per size in batch mode (default: 100)",
+    )
+    parser.add_argument(
+        "--tolerance", type=float, default=1e-8,
+        help="Max relative difference allowed between modes (default: 1e-8)",
+    )
+    parser.add_argument(
+        "--output", type=Path,
+        default=_PROJECT_ROOT / "data" / "benchmarks" / "indicators.json",
+        help="JSON results path (default: data/benchmarks/indicators.json)",
+    )
+    return parser.parse_args()
+
+
+def main() -> None:
+    args = parse_args()
+
+    from autotrader.indicators.benchmark import DEFAULT_SPECS, run_benchmark, write_results
+
+    specs = DEFAULT_SPECS
+    if args.indicators:
+        wanted = {name.upper() for name in args.indicators}
+        specs = tuple(spec for spec in DEFAULT_SPECS if spec.name in wanted)
+        if not specs:
+            print(f"[ERROR] No benchmarked indicator matches {sorted(wanted)}")
+            sys.exit(1)
+
+    print("=" * 80)
+    print("  AutoTrader v2 -- Indicator Benchmark")
+    print("=" * 80)
+    print(f"  {'Indicator':<14}{'Mode':<12}{'History':>8}{'Symbols':>9}"
+          f"{'Bars/s':>16}{'Max rel err':>14}")
+
+    def report(result) -> None:
+        print(f"  {result.indicator:<14}{result.mode:<12}{result.history:>8}{result.symbols:>9}"
+              f"{result.bars_per_second:>16,.0f}{result.max_rel_error:>14.2e}")
+
+    try:
+        results = run_benchmark(
+            specs, args.histories, args.symbols,
+            batch_samples=args.batch_samples, tolerance=args.tolerance, progress=report,
+        )
+    except AssertionError as exc:
+        print(f"\n[ERROR] {exc}")
+        sys.exit(1)
+
+    path = write_results(results, args.output)
+    print(f"\n  Results written to {path}")
+
+
+if __name__ == "__main__":
+    main()
@@ -59,7 +59,7 @@ def main() -> None:
     # ------------------------------------------------------------------ #
     from autotrader.core.types import Bar
     from autotrader.core.config import RiskConfig
-    from autotrader.backtest.engine import BacktestEngine
+    from autotrader.backtest.parallel import ParallelBacktestRunner
     from autotrader.strategy.regime_dual import RegimeDualStrategy
 
     # ------------------------------------------------------------------ #
@@ -68,6 +68,7 @@ def main() -> None:
     initial_balance = 100_000.0
     risk_config = RiskConfig()
     results: dict[str, dict] = {}
+    bars_by_symbol: dict[str, list[Bar]] = {}
 
     for symbol in symbols:
         print(f"\n  Fetching {symbol} ...")
@@ -108,24 +109,23 @@ def main() -> None:
             )
 
         print(f"  Received {len(bars)} bars  ({bars[0].timestamp.strftime('%Y-%m-%d %H:%M')} -> {bars[-1].timestamp.strftime('%Y-%m-%d %H:%M')})")
-        print(f"  Running backtest ...")
+        bars_by_symbol[symbol] = bars
 
-        # Fresh engine + strategy per symbol
-        engine = BacktestEngine(initial_balance, risk_config)
-        strategy = RegimeDualStrategy()
-        engine.add_strategy(strategy)
-
-        result = engine.run(bars)
+    # Fresh engine + strategy per symbol, one worker process each
+    runner = ParallelBacktestRunner(initial_balance, risk_config)
+    print(f"\n  Running backtests on {runner.max_workers} workers ...")
+    backtests = runner.run(bars_by_symbol, [RegimeDualStrategy])
 
+    for symbol, result in backtests.items():
         results[symbol] = {
             "total_trades": result.total_trades,
             "metrics": result.metrics,
             "final_equity": result.final_equity,
             "equity_curve": result.equity_curve,
-            "num_bars": len(bars),
+            "num_bars": len(bars_by_symbol[symbol]),
         }
 
-        print(f"  Done. Trades: {result.total_trades}, Final equity: ${result.final_equity:,.2f}")
+        print(f"  [{symbol}] Trades: {result.total_trades}, Final equity: ${result.final_equity:,.2f}")
 
     # ------------------------------------------------------------------ #
     # 5. Print results summary
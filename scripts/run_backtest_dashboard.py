@@ -37,7 +37,7 @@ def main() -> None:
 
     from autotrader.core.types import Bar
     from autotrader.core.config import RiskConfig
-    from autotrader.backtest.engine import BacktestEngine
+    from autotrader.backtest.parallel import ParallelBacktestRunner
     from autotrader.strategy.regime_dual import RegimeDualStrategy
     from autotrader.backtest.dashboard_data import BacktestDashboardData
 
@@ -57,7 +57,7 @@ def main() -> None:
     print(f"  Initial : ${initial_balance:,.2f}")
     print("=" * 70)
 
-    results = {}
+    bars_by_symbol: dict[str, list[Bar]] = {}
 
     for symbol in symbols:
         print(f"\n  [{symbol}] Fetching data...")
@@ -94,13 +94,14 @@ def main() -> None:
             for ab in alpaca_bars
         ]
 
-        print(f"  [{symbol}] {len(bars)} bars, running backtest...")
+        print(f"  [{symbol}] {len(bars)} bars")
+        bars_by_symbol[symbol] = bars
 
-        engine = BacktestEngine(initial_balance, risk_config)
-        engine.add_strategy(RegimeDualStrategy())
-        result = engine.run(bars)
-        results[symbol] = result
+    runner = ParallelBacktestRunner(initial_balance, risk_config)
+    print(f"\n  Running backtests on {runner.max_workers} workers...")
+    results = runner.run(bars_by_symbol, [RegimeDualStrategy])
 
+    for symbol, result in results.items():
         print(
             f"  [{symbol}] Trades: {result.total_trades}, "
             f"Final: ${result.final_equity:,.2f}, "
@@ -36,6 +36,18 @@ def parse_args() -> argparse.Namespace:
         "--timeframe", choices=["5min", "15min", "1hour", "1day"], default="1day",
         help="Bar timeframe (default: 1day)",
     )
+    parser.add_argument(
+        "--workers", type=int, default=None,
+        help="Backtest worker processes (default: one per CPU core)",
+    )
+    parser.add_argument(
+        "--cache-dir", default=None,
+        help="Reuse backtest results stored in this directory (default: no cache)",
+    )
+    parser.add_argument(
+        "--profile", action="store_true",
+        help="Time each backtest stage and print the breakdown",
+    )
     return parser.parse_args()
 
 
@@ -56,7 +68,9 @@ def main() -> None:
 
     from autotrader.core.types import Bar
     from autotrader.core.config import RiskConfig
-    from autotrader.backtest.engine import BacktestEngine
+    from autotrader.backtest.cache import BacktestCache
+    from autotrader.backtest.parallel import ParallelBacktestRunner
+    from autotrader.backtest.profiling import BacktestProfile
     from autotrader.strategy.rsi_mean_reversion import RsiMeanReversion
     from autotrader.strategy.bb_squeeze import BbSqueezeBreakout
     from autotrader.strategy.adx_pullback import AdxPullback
@@ -97,6 +111,7 @@ def main() -> None:
     )
 
     results: dict[str, dict] = {}
+    bars_by_symbol: dict[str, list[Bar]] = {}
 
     for symbol in args.symbols:
         print(f"\n  Fetching {symbol} ...")
@@ -134,17 +149,23 @@ def main() -> None:
             ))
 
         print(f"  Received {len(bars)} bars")
-        print(f"  Running 5-strategy backtest ...")
-
-        engine = BacktestEngine(args.balance, risk_config)
-        engine.add_strategy(RsiMeanReversion())
-        engine.add_strategy(BbSqueezeBreakout())
-        engine.add_strategy(AdxPullback())
-        engine.add_strategy(OverboughtShort())
-        engine.add_strategy(RegimeMomentum())
-
-        result = engine.run(bars)
+        bars_by_symbol[symbol] = bars
 
+    cache = BacktestCache(args.cache_dir) if args.cache_dir else None
+    runner = ParallelBacktestRunner(
+        args.balance, risk_config, max_workers=args.workers, cache=cache,
+        profile=args.profile,
+    )
+    print(f"\n  Running 5-strategy backtest on {runner.max_workers} workers ...")
+    backtests = runner.run(bars_by_symbol, [
+        RsiMeanReversion,
+        BbSqueezeBreakout,
+        AdxPullback,
+        OverboughtShort,
+        RegimeMomentum,
+    ])
+
+    for symbol, result in backtests.items():
         strategy_breakdown: dict[str, int] = {}
         for trade in result.trades:
             strategy_breakdown[trade.strategy] = strategy_breakdown.get(trade.strategy, 0) + 1
@@ -154,12 +175,13 @@ def main() -> None:
             "metrics": result.metrics,
             "final_equity": result.final_equity,
             "equity_curve": result.equity_curve,
-            "num_bars": len(bars),
+            "num_bars": len(bars_by_symbol[symbol]),
             "strategy_breakdown": strategy_breakdown,
             "trades": result.trades,
         }
 
-        print(f"  Done. Trades: {result.total_trades}, Final equity: ${result.final_equity:,.2f}")
+        print(f"  [{symbol}] Trades: {result.total_trades}, "
+              f"Final equity: ${result.final_equity:,.2f}")
         if strategy_breakdown:
             print(f"  Breakdown: {strategy_breakdown}")
 
@@ -212,6 +234,12 @@ def main() -> None:
     for strat in sorted(all_strategies.keys()):
         print(f"  {strat:<25} {all_strategies[strat]:>5} trades")
 
+    if args.profile:
+        print("\n\n" + "=" * 80)
+        print("  BACKTEST PROFILE (all symbols, summed across workers)")
+        print("=" * 80)
+        print(BacktestProfile.merge(r.profile for r in backtests.values()).format())
+
     print("\n" + "=" * 80)
     print("  Backtest complete.")
     print("=" * 80)
@@ -181,10 +181,9 @@ class TestStrategiesDifferentiation:
         """Run all 5 strategies on 500 bars and verify that completed trades
         originate from different strategies when trades occur.
 
-        Note: The BacktestSimulator only supports 'long' and 'close' directions.
-        Short-only strategies (OverboughtShort) and short entries from bidirectional
-        strategies will not produce filled trades. This test validates that at least
-        the long-capable strategies generate differentiated trades.
+        Note: The BacktestSimulator holds one position per symbol, so an entry
+        from one strategy blocks entries from the others until it closes. This
+        test validates that the strategies that do trade are known ones.
         """
         bars = _generate_bars(n=500, seed=123)
         engine = BacktestEngine(
@@ -175,3 +175,19 @@ class TestDailyBarAggregator:
         agg.add(_make_minute_bar(symbol="AAPL"))
         agg.flush_all()
         assert agg.flush("AAPL") is None
+
+    def test_partial_does_not_close_session(self):
+        agg = DailyBarAggregator()
+        ts = datetime(2025, 1, 6, 14, 30, tzinfo=timezone.utc)
+        agg.add(_make_minute_bar(ts=ts, high=101, low=99, close=100))
+        agg.add(_make_minute_bar(ts=ts + timedelta(minutes=1), high=103, low=98, close=102))
+        partial = agg.partial("AAPL")
+        assert partial is not None
+        assert (partial.high, partial.low, partial.close) == (103.0, 98.0, 102.0)
+        assert partial.timeframe == Timeframe.DAILY
+        assert agg.partials() == [partial]
+        # The session keeps accumulating after a partial read
+        assert agg.flush("AAPL") == partial
+
+    def test_partial_unknown_symbol(self):
+        assert DailyBarAggregator().partial("AAPL") is None
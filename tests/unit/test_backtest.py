@@ -1,12 +1,17 @@
+import random
 import pytest
 from collections import deque
 from datetime import datetime, timezone, timedelta
+from unittest.mock import patch
 
 from autotrader.core.types import Bar, MarketContext, Signal
 from autotrader.core.config import RiskConfig
 from autotrader.indicators.base import IndicatorSpec
 from autotrader.strategy.base import Strategy
 from autotrader.backtest.engine import BacktestEngine
+from autotrader.backtest.simulator import BacktestSimulator
+from autotrader.backtest.sweep import configure_strategy
+from autotrader.strategy.rsi_mean_reversion import RsiMeanReversion
 
 
 class BuyAndHold(Strategy):
@@ -34,6 +39,31 @@ def _make_bars(n: int, start_price: float = 100.0, trend: float = 1.0) -> list[B
     return bars
 
 
+class TestBacktestSimulator:
+    @staticmethod
+    def _signal(symbol: str, direction: str) -> Signal:
+        return Signal(strategy="test", symbol=symbol, direction=direction, strength=1.0)
+
+    def test_short_proceeds_do_not_fund_new_entries(self):
+        sim = BacktestSimulator(10_000.0, RiskConfig(max_position_pct=0.6))
+        short = sim.execute_signal(self._signal("AAA", "short"), 100.0)
+        assert short.filled_qty == 60
+        # Proceeds sit in cash, but the short's value is held as collateral
+        assert sim.ledger.cash == pytest.approx(16_000.0)
+        assert sim.get_account().buying_power == pytest.approx(4_000.0)
+
+        assert sim.execute_signal(self._signal("BBB", "long"), 100.0) is None
+        assert sim.execute_signal(self._signal("CCC", "short"), 100.0) is None
+        assert sim.ledger.gross_exposure <= 10_000.0
+
+    def test_cover_restores_buying_power(self):
+        sim = BacktestSimulator(10_000.0, RiskConfig(max_position_pct=0.6))
+        sim.execute_signal(self._signal("AAA", "short"), 100.0)
+        sim.execute_signal(self._signal("AAA", "close"), 90.0)
+        assert sim.get_account().buying_power == pytest.approx(10_600.0)
+        assert sim.execute_signal(self._signal("BBB", "long"), 100.0).filled_qty == 63
+
+
 class TestBacktestEngine:
     def test_run_backtest(self):
         bars = _make_bars(20, start_price=100.0, trend=0.5)
@@ -53,3 +83,96 @@ class TestBacktestEngine:
         result = engine.run(bars)
         assert "win_rate" in result.metrics
         assert "profit_factor" in result.metrics
+
+    def test_short_profits_in_downtrend(self):
+        class ShortThenCover(Strategy):
+            name = "short_then_cover"
+            required_indicators = []
+
+            def __init__(self):
+                self._count = 0
+
+            def on_context(self, ctx: MarketContext) -> Signal | None:
+                self._count += 1
+                direction = {1: "short", 10: "close"}.get(self._count)
+                if direction is None:
+                    return None
+                return Signal(
+                    strategy=self.name, symbol=ctx.symbol, direction=direction, strength=1.0,
+                )
+
+        bars = _make_bars(20, start_price=100.0, trend=-1.0)
+        engine = BacktestEngine(initial_balance=100_000.0, risk_config=RiskConfig())
+        engine.add_strategy(ShortThenCover())
+        result = engine.run(bars)
+        [trade] = result.trades
+        assert trade.direction == "short"
+        assert trade.pnl == pytest.approx((bars[0].close - bars[9].close) * trade.quantity)
+        assert trade.pnl_pct > 0
+        # Marked to market while open, flat after the cover
+        assert result.equity_curve[1] == pytest.approx(100_000.0)
+        assert result.equity_curve[5] > 100_000.0
+        assert result.final_equity == pytest.approx(100_000.0 + trade.pnl)
+
+
+class TestEntryPrefilter:
+    @staticmethod
+    def _random_walk(n: int, seed: int) -> list[Bar]:
+        rng = random.Random(seed)
+        bars, price = [], 100.0
+        for i in range(n):
+            open_ = price
+            price = max(1.0, price + rng.gauss(0, 1.5))
+            bars.append(Bar(
+                symbol="AAPL",
+                timestamp=datetime(2025, 1, 1, 21, tzinfo=timezone.utc) + timedelta(days=i),
+                open=open_, high=max(open_, price) + rng.random(),
+                low=min(open_, price) - rng.random(), close=price, volume=1_000_000.0,
+            ))
+        return bars
+
+    def _run(self, bars, *strategies):
+        engine = BacktestEngine(initial_balance=100_000.0, risk_config=RiskConfig())
+        for strategy in strategies:
+            engine.add_strategy(strategy)
+        return engine.run(bars)
+
+    def test_masked_run_matches_unfiltered_run_with_fewer_calls(self):
+        bars = self._random_walk(500, seed=2)
+        params = {"RSI_OVERSOLD": 40.0, "RSI_OVERBOUGHT": 60.0}
+        calls = []
+        original = RsiMeanReversion.on_context
+
+        def counting(strategy, ctx):
+            calls.append(ctx.bar.timestamp)
+            return original(strategy, ctx)
+
+        with patch.object(RsiMeanReversion, "on_context", counting):
+            filtered = self._run(bars, configure_strategy(RsiMeanReversion, params))
+            filtered_calls = len(calls)
+            with patch.object(RsiMeanReversion, "entry_mask", return_value=None):
+                unfiltered = self._run(bars, configure_strategy(RsiMeanReversion, params))
+
+        assert filtered.total_trades > 0
+        assert any(t.direction == "short" for t in filtered.trades)
+        assert filtered.trades == unfiltered.trades
+        assert filtered.equity_curve == unfiltered.equity_curve
+        assert filtered_calls < len(bars) // 2
+        assert len(calls) - filtered_calls == len(bars)
+
+    def test_unmasked_strategy_still_sees_every_bar(self):
+        class Counter(Strategy):
+            name = "counter"
+            required_indicators = []
+
+            def __init__(self):
+                self.seen = 0
+
+            def on_context(self, ctx: MarketContext) -> Signal | None:
+                self.seen += 1
+                return None
+
+        bars = self._random_walk(120, seed=3)
+        counter = Counter()
+        self._run(bars, RsiMeanReversion(), counter)
+        assert counter.seen == len(bars)
@@ -0,0 +1,122 @@
+import os
+import random
+from dataclasses import replace
+from datetime import datetime, timedelta, timezone
+from unittest.mock import patch
+
+from autotrader.backtest.cache import BacktestCache, backtest_key
+from autotrader.backtest.engine import BacktestEngine
+from autotrader.backtest.parallel import ParallelBacktestRunner
+from autotrader.backtest.sweep import configure_strategy
+from autotrader.core.config import RiskConfig
+from autotrader.core.types import Bar
+from autotrader.strategy.bb_squeeze import BbSqueezeBreakout
+from autotrader.strategy.rsi_mean_reversion import RsiMeanReversion
+
+
+def _make_random_walk(symbol: str, count: int, seed: int) -> list[Bar]:
+    rng = random.Random(seed)
+    bars = []
+    price = 100.0
+    for i in range(count):
+        open_ = price
+        price = max(1.0, price + rng.gauss(0, 1.5))
+        bars.append(Bar(
+            symbol=symbol,
+            timestamp=datetime(2025, 1, 1, 21, tzinfo=timezone.utc) + timedelta(days=i),
+            open=open_, high=max(open_, price) + rng.random(),
+            low=min(open_, price) - rng.random(), close=price, volume=1_000_000.0,
+        ))
+    return bars
+
+
+def _key(bars, *strategies, risk_config=None, balance=100_000.0) -> str:
+    return backtest_key(bars, list(strategies), risk_config or RiskConfig(), balance)
+
+
+class TestBacktestKey:
+    def test_stable_for_equal_inputs(self):
+        bars = _make_random_walk("A", 100, seed=1)
+        assert _key(bars, RsiMeanReversion()) == _key(list(bars), RsiMeanReversion())
+
+    def test_changes_with_every_input(self):
+        bars = _make_random_walk("A", 100, seed=1)
+        base = _key(bars, RsiMeanReversion())
+        edited = bars[:-1] + [replace(bars[-1], close=bars[-1].close + 0.01)]
+        variants = [
+            _key(edited, RsiMeanReversion()),
+            _key(bars[:-1], RsiMeanReversion()),
+            _key([replace(b, symbol="B") for b in bars], RsiMeanReversion()),
+            _key(bars, configure_strategy(RsiMeanReversion, {"RSI_OVERSOLD": 25.0})),
+            _key(bars, RsiMeanReversion(), BbSqueezeBreakout()),
+            _key(bars, RsiMeanReversion(), risk_config=RiskConfig(max_position_pct=0.2)),
+            _key(bars, RsiMeanReversion(), balance=50_000.0),
+        ]
+        assert len({base, *variants}) == len(variants) + 1
+
+
+class TestBacktestCache:
+    def test_engine_reuses_stored_result(self, tmp_path):
+        cache = BacktestCache(tmp_path)
+        bars = _make_random_walk("A", 250, seed=2)
+
+        def run():
+            engine = BacktestEngine(100_000.0, RiskConfig(), cache)
+            engine.add_strategy(RsiMeanReversion())
+            return engine.run(bars)
+
+        first = run()
+        with patch.object(BacktestEngine, "_run", side_effect=AssertionError("not cached")):
+            second = run()
+        assert second.equity_curve == first.equity_curve
+        assert second.trades == first.trades
+
+    def test_missing_and_corrupt_entries(self, tmp_path):
+        cache = BacktestCache(tmp_path)
+        assert cache.get("0" * 64) is None
+        (tmp_path / f"{'1' * 64}.pkl").write_bytes(b"not a pickle")
+        assert cache.get("1" * 64) is None
+        assert not (tmp_path / f"{'1' * 64}.pkl").exists()
+
+    def test_evicts_least_recently_used(self, tmp_path):
+        bars = _make_random_walk("A", 120, seed=3)
+        engine = BacktestEngine(100_000.0, RiskConfig())
+        engine.add_strategy(RsiMeanReversion())
+        result = engine.run(bars)
+
+        probe = BacktestCache(tmp_path / "probe")
+        probe.put("probe", result)
+        entry_size = probe.size_bytes()
+
+        cache = BacktestCache(tmp_path / "lru", max_bytes=2 * entry_size)
+        cache.put("a", result)
+        cache.put("b", result)
+        # Age both entries, then touch "a" so "b" is least recently used
+        for name, age in (("a", 20), ("b", 10)):
+            path = cache.directory / f"{name}.pkl"
+            stamp = path.stat().st_mtime - age
+            os.utime(path, (stamp, stamp))
+        assert cache.get("a") is not None
+        cache.put("c", result)
+        assert cache.get("b") is None
+        assert cache.get("a") is not None
+        assert cache.get("c") is not None
+        assert cache.size_bytes() <= 2 * entry_size
+
+    def test_clear(self, tmp_path):
+        cache = BacktestCache(tmp_path)
+        engine = BacktestEngine(100_000.0, RiskConfig())
+        cache.put("a", engine.run(_make_random_walk("A", 10, seed=4)))
+        cache.clear()
+        assert cache.get("a") is None
+        assert cache.size_bytes() == 0
+
+    def test_shared_by_pool_workers(self, tmp_path):
+        universe = {f"S{i}": _make_random_walk(f"S{i}", 200, seed=i) for i in range(3)}
+        cache = BacktestCache(tmp_path)
+        runner = ParallelBacktestRunner(100_000.0, RiskConfig(), max_workers=2, cache=cache)
+        first = runner.run(universe, [RsiMeanReversion])
+        assert len(list(tmp_path.glob("*.pkl"))) == 3
+        second = runner.run(universe, [RsiMeanReversion])
+        for symbol in universe:
+            assert second[symbol].equity_curve == first[symbol].equity_curve
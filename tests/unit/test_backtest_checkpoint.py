@@ -0,0 +1,218 @@
+import random
+from datetime import datetime, timedelta, timezone
+
+import pytest
+
+from autotrader.backtest.checkpoint import BacktestCheckpoint
+from autotrader.backtest.engine import BacktestEngine
+from autotrader.backtest.sweep import configure_strategy
+from autotrader.core.config import RiskConfig, RotationConfig
+from autotrader.core.types import Bar
+from autotrader.rotation.backtest_engine import RotationBacktestEngine
+from autotrader.strategy.rsi_mean_reversion import RsiMeanReversion
+from autotrader.universe import UniverseResult
+
+START = datetime(2025, 1, 1, 21, tzinfo=timezone.utc)
+
+# Loose enough that random walks trade
+PARAMS = {"RSI_OVERSOLD": 40.0}
+
+
+def _make_random_walk(symbol: str, count: int, seed: int, offset: int = 0) -> list[Bar]:
+    rng = random.Random(seed)
+    bars = []
+    price = 100.0
+    for i in range(count):
+        open_ = price
+        price = max(1.0, price + rng.gauss(0, 1.5))
+        bars.append(Bar(
+            symbol=symbol,
+            timestamp=START + timedelta(days=offset + i),
+            open=open_, high=max(open_, price) + rng.random(),
+            low=min(open_, price) - rng.random(), close=price, volume=1_000_000.0,
+        ))
+    return bars
+
+
+def _ordered_universe() -> list[Bar]:
+    bars = _make_random_walk("AAA", 250, seed=1) + _make_random_walk("BBB", 200, seed=2, offset=50)
+    return sorted(bars, key=lambda b: (b.timestamp, b.symbol))
+
+
+def _engine() -> BacktestEngine:
+    engine = BacktestEngine(100_000.0, RiskConfig())
+    engine.add_strategy(configure_strategy(RsiMeanReversion, PARAMS))
+    return engine
+
+
+def _rotation_engine(earnings_cal: object | None = None) -> RotationBacktestEngine:
+    engine = RotationBacktestEngine(100_000.0, RiskConfig(), RotationConfig(), earnings_cal)
+    engine.add_strategy(configure_strategy(RsiMeanReversion, PARAMS))
+    return engine
+
+
+class _NoEarnings:
+    def should_force_close(self, symbol, check_date) -> bool:
+        return False
+
+
+def _split_at_timestamp(bars, index):
+    """Split time-ordered bars before the first bar at bars[index]'s timestamp."""
+    ts = bars[index].timestamp
+    cut = next(i for i, bar in enumerate(bars) if bar.timestamp == ts)
+    return bars[:cut], bars[cut:]
+
+
+class TestBacktestEngineCheckpoint:
+    def test_resume_matches_full_run(self):
+        bars = _make_random_walk("AAA", 300, seed=3)
+        full = _engine().run_stream(iter(bars))
+
+        engine = _engine()
+        engine.run_stream(iter(bars[:170]))
+        resumed = _engine().resume(engine.checkpoint(), iter(bars[170:]))
+
+        assert full.total_trades > 0
+        assert resumed.equity_curve == full.equity_curve
+        assert resumed.timestamped_equity == full.timestamped_equity
+        assert resumed.trades == full.trades
+        assert resumed.metrics == full.metrics
+        assert resumed.total_trades == full.total_trades
+
+    def test_chained_resumes(self):
+        bars = _make_random_walk("AAA", 300, seed=5)
+        full = _engine().run_stream(iter(bars))
+
+        engine = _engine()
+        engine.run_stream(iter(bars[:100]))
+        for start, stop in ((100, 101), (101, 101), (101, 220), (220, 300)):
+            result = engine.resume(engine.checkpoint(), iter(bars[start:stop]))
+
+        assert result.equity_curve == full.equity_curve
+        assert result.trades == full.trades
+
+    def test_checkpoint_is_a_snapshot(self):
+        bars = _make_random_walk("AAA", 200, seed=6)
+        engine = _engine()
+        first = engine.run_stream(iter(bars[:150]))
+        curve = list(first.equity_curve)
+        checkpoint = engine.checkpoint()
+
+        engine.resume(checkpoint, iter(bars[150:]))
+        again = engine.resume(checkpoint, iter(bars[150:175]))
+
+        assert first.equity_curve == curve
+        assert len(again.equity_curve) == 176
+
+    def test_save_and_load(self, tmp_path):
+        bars = _make_random_walk("AAA", 250, seed=7)
+        full = _engine().run_stream(iter(bars))
+        engine = _engine()
+        engine.run_stream(iter(bars[:200]))
+        path = tmp_path / "nightly" / "aaa.ckpt"
+        engine.checkpoint().save(path)
+
+        resumed = _engine().resume(BacktestCheckpoint.load(path), iter(bars[200:]))
+        assert resumed.equity_curve == full.equity_curve
+
+    async def test_resume_async(self):
+        bars = _make_random_walk("AAA", 300, seed=3)
+        full = _engine().run_stream(iter(bars))
+        engine = _engine()
+        engine.run_stream(iter(bars[:170]))
+
+        async def source():
+            for bar in bars[170:]:
+                yield bar
+
+        resumed = await _engine().resume_async(engine.checkpoint(), source())
+        assert resumed.equity_curve == full.equity_curve
+
+    def test_rejects_overlapping_bars(self):
+        bars = _make_random_walk("AAA", 200, seed=8)
+        engine = _engine()
+        engine.run_stream(iter(bars[:150]))
+        with pytest.raises(ValueError, match="does not follow"):
+            engine.resume(engine.checkpoint(), iter(bars[149:]))
+
+    def test_rejects_different_configuration(self):
+        bars = _make_random_walk("AAA", 200, seed=8)
+        engine = _engine()
+        engine.run_stream(iter(bars[:150]))
+        other = _engine()
+        params = {**PARAMS, "RSI_OVERSOLD": 30.0}
+        other._strategies[0] = configure_strategy(RsiMeanReversion, params)
+        with pytest.raises(ValueError, match="different backtest configuration"):
+            other.resume(engine.checkpoint(), iter(bars[150:]))
+
+    def test_checkpoint_requires_streaming_run(self):
+        engine = _engine()
+        engine.run(_make_random_walk("AAA", 50, seed=9))
+        with pytest.raises(RuntimeError):
+            engine.checkpoint()
+
+
+class TestRotationBacktestCheckpoint:
+    def test_resume_matches_full_run(self):
+        bars = _ordered_universe()
+        head, tail = _split_at_timestamp(bars, 200)
+        full = _rotation_engine().run_stream(iter(bars), ["AAA", "BBB"])
+
+        engine = _rotation_engine()
+        engine.run_stream(iter(head), ["AAA", "BBB"])
+        resumed = _rotation_engine().resume(engine.checkpoint(), iter(tail))
+
+        assert full.total_trades > 0
+        assert resumed.equity_curve == full.equity_curve
+        assert resumed.timestamped_equity == full.timestamped_equity
+        assert resumed.trades == full.trades
+        assert resumed.metrics == full.metrics
+
+    def test_rotation_schedule_spans_checkpoint(self):
+        bars = _ordered_universe()
+        head, tail = _split_at_timestamp(bars, 150)
+        timestamps = sorted({bar.timestamp for bar in bars})
+        cut = timestamps.index(tail[0].timestamp)
+        schedule = {
+            index: UniverseResult(
+                symbols=symbols, scored=[], timestamp=timestamps[index - 1],
+                rotation_in=[], rotation_out=[],
+            )
+            for index, symbols in ((cut - 20, ["AAA"]), (cut + 30, ["BBB"]))
+        }
+        full = _rotation_engine().run_stream(iter(bars), ["AAA", "BBB"], schedule)
+
+        engine = _rotation_engine()
+        engine.run_stream(iter(head), ["AAA", "BBB"], schedule)
+        resumed = _rotation_engine().resume(engine.checkpoint(), iter(tail))
+
+        assert len(full.rotation_events) == 2
+        assert resumed.rotation_events == full.rotation_events
+        assert resumed.equity_curve == full.equity_curve
+        assert resumed.trades == full.trades
+
+    def test_earnings_calendar_is_not_checkpointed(self):
+        calendar = _NoEarnings()
+        engine = _rotation_engine(calendar)
+        bars = _ordered_universe()
+        engine.run_stream(iter(bars[:50]), ["AAA", "BBB"])
+        checkpoint = engine.checkpoint()
+
+        replay, _ = checkpoint.restore(engine._checkpoint_key())
+        assert replay._rotation_mgr._earnings_cal is None
+        assert engine._last_stream[0]._rotation_mgr._earnings_cal is calendar
+
+    def test_rejects_backtest_engine_checkpoint(self):
+        bars = _make_random_walk("AAA", 100, seed=1)
+        engine = _engine()
+        engine.run_stream(iter(bars[:50]))
+        with pytest.raises(ValueError):
+            _rotation_engine().resume(engine.checkpoint(), iter(bars[50:]))
+
+    def test_rejects_overlapping_bars(self):
+        bars = _ordered_universe()
+        head, _ = _split_at_timestamp(bars, 100)
+        engine = _rotation_engine()
+        engine.run_stream(iter(head), ["AAA", "BBB"])
+        with pytest.raises(ValueError, match="does not follow"):
+            engine.resume(engine.checkpoint(), iter(bars[len(head) - 1:]))
@@ -0,0 +1,105 @@
+import random
+from datetime import datetime, timedelta, timezone
+from unittest.mock import patch
+
+from autotrader.backtest.cache import BacktestCache
+from autotrader.backtest.engine import BacktestEngine
+from autotrader.backtest.parallel import ParallelBacktestRunner
+from autotrader.backtest.profiling import BacktestProfile
+from autotrader.core.config import RiskConfig, RotationConfig
+from autotrader.core.types import Bar
+from autotrader.rotation.backtest_engine import RotationBacktestEngine
+from autotrader.strategy.bb_squeeze import BbSqueezeBreakout
+from autotrader.strategy.rsi_mean_reversion import RsiMeanReversion
+
+
+def _make_random_walk(symbol: str, count: int, seed: int) -> list[Bar]:
+    rng = random.Random(seed)
+    bars = []
+    price = 100.0
+    for i in range(count):
+        open_ = price
+        price = max(1.0, price + rng.gauss(0, 1.5))
+        bars.append(Bar(
+            symbol=symbol,
+            timestamp=datetime(2025, 1, 1, 21, tzinfo=timezone.utc) + timedelta(days=i),
+            open=open_, high=max(open_, price) + rng.random(),
+            low=min(open_, price) - rng.random(), close=price, volume=1_000_000.0,
+        ))
+    return bars
+
+
+def _engine(profile: bool, cache: BacktestCache | None = None) -> BacktestEngine:
+    engine = BacktestEngine(100_000.0, RiskConfig(), cache, profile=profile)
+    engine.add_strategy(RsiMeanReversion())
+    engine.add_strategy(BbSqueezeBreakout())
+    return engine
+
+
+class TestBacktestEngineProfile:
+    def test_disabled_by_default(self):
+        assert _engine(profile=False).run(_make_random_walk("A", 50, seed=1)).profile is None
+
+    def test_counts_stages_without_changing_results(self):
+        bars = _make_random_walk("A", 300, seed=1)
+        plain = _engine(profile=False).run(bars)
+        profiled = _engine(profile=True).run(bars)
+        assert profiled.equity_curve == plain.equity_curve
+        assert profiled.trades == plain.trades
+
+        stages = profiled.profile.stages
+        # No entry mask: the squeeze strategy sees every bar, the masked one fewer
+        assert stages["strategy:bb_squeeze"].calls == len(bars)
+        assert 0 < stages["strategy:rsi_mean_reversion"].calls < len(bars)
+        assert stages["equity"].calls == len(bars)
+        assert stages["indicators"].calls == 1
+        assert profiled.profile.wall_seconds >= sum(s.seconds for s in stages.values())
+
+    def test_streaming_times_each_indicator_update(self):
+        bars = _make_random_walk("A", 120, seed=2)
+        result = _engine(profile=True).run_stream(iter(bars))
+        assert result.profile.stages["indicators"].calls == len(bars)
+
+    def test_profiled_run_bypasses_cache(self, tmp_path):
+        bars = _make_random_walk("A", 100, seed=3)
+        cache = BacktestCache(tmp_path)
+        _engine(profile=False, cache=cache).run(bars)
+        with patch.object(BacktestCache, "get") as get:
+            result = _engine(profile=True, cache=cache).run(bars)
+        get.assert_not_called()
+        assert result.profile is not None
+
+
+class TestRotationBacktestEngineProfile:
+    def test_counts_rotation_manager_stages(self):
+        universe = {sym: _make_random_walk(sym, 150, seed=i) for i, sym in enumerate("ABC")}
+        engine = RotationBacktestEngine(
+            100_000.0, RiskConfig(), RotationConfig(), profile=True,
+        )
+        engine.add_strategy(RsiMeanReversion())
+        result = engine.run(universe, initial_universe=list(universe))
+
+        stages = result.profile.stages
+        total_bars = sum(len(bars) for bars in universe.values())
+        assert stages["force_close"].calls == total_bars
+        assert stages["strategy:rsi_mean_reversion"].calls == total_bars
+        assert stages["weekly_loss_check"].calls == 150
+        assert "force_close" in result.profile.format()
+
+
+class TestProfileMerge:
+    def test_runner_returns_worker_profiles(self):
+        universe = {f"S{i}": _make_random_walk(f"S{i}", 120, seed=i) for i in range(3)}
+        runner = ParallelBacktestRunner(100_000.0, RiskConfig(), max_workers=2, profile=True)
+        results = runner.run(universe, [BbSqueezeBreakout])
+        merged = BacktestProfile.merge(result.profile for result in results.values())
+        assert merged.stages["strategy:bb_squeeze"].calls == 360
+        assert merged.wall_seconds == sum(r.profile.wall_seconds for r in results.values())
+
+    def test_merge_skips_missing_profiles(self):
+        profile = BacktestProfile()
+        profile.add("risk", 0.5)
+        profile.add("risk", 0.25, calls=2)
+        merged = BacktestProfile.merge([profile, None, profile])
+        assert merged.stages["risk"].calls == 6
+        assert merged.stages["risk"].seconds == 1.5
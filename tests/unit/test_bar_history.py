@@ -0,0 +1,217 @@
+from collections import deque
+from datetime import datetime, timedelta, timezone
+from zoneinfo import ZoneInfo
+
+import numpy as np
+import pytest
+
+from autotrader.core.bar_history import (
+    BarHistory,
+    market_day,
+    market_days,
+    micros_to_timestamp,
+    timestamp_to_micros,
+)
+from autotrader.core.types import Bar, Timeframe
+from autotrader.indicators.base import IndicatorSpec, bar_columns
+from autotrader.indicators.engine import IndicatorEngine
+
+
+def _make_bars(n: int, symbol: str = "AAPL", start: float = 100.0) -> list[Bar]:
+    base = datetime(2026, 1, 2, 20, 0, tzinfo=timezone.utc)
+    bars = []
+    price = start
+    for i in range(n):
+        price += (-1) ** i * 0.5 + 0.1
+        bars.append(Bar(
+            symbol=symbol,
+            timestamp=base + timedelta(days=i),
+            open=price - 0.2, high=price + 1.0, low=price - 1.0, close=price,
+            volume=1000.0 + i,
+        ))
+    return bars
+
+
+class TestTimestampEncoding:
+    @pytest.mark.parametrize("ts", [
+        datetime(2026, 3, 4, 14, 30, 15, 123456, tzinfo=timezone.utc),
+        datetime(2026, 3, 4, 9, 30, tzinfo=ZoneInfo("America/New_York")),
+        datetime(2026, 3, 4, 9, 30, 1, 5),
+    ])
+    def test_round_trip(self, ts):
+        assert micros_to_timestamp(timestamp_to_micros(ts), ts.tzinfo) == ts
+
+    def test_market_days_follow_eastern_dates_across_dst(self):
+        eastern = ZoneInfo("America/New_York")
+        start = datetime(2026, 3, 7, 0, 0, tzinfo=timezone.utc)
+        stamps = [start + timedelta(minutes=37 * i) for i in range(300)]
+        micros = np.array([timestamp_to_micros(ts) for ts in stamps])
+        epoch = datetime(1970, 1, 1).date()
+        expected = [(ts.astimezone(eastern).date() - epoch).days for ts in stamps]
+        assert market_days(micros).tolist() == expected
+        assert [market_day(int(m)) for m in micros] == expected
+
+
+class TestBarHistory:
+    def test_append_and_index(self):
+        bars = _make_bars(5)
+        history = BarHistory(maxlen=10)
+        history.extend(bars)
+        assert len(history) == 5
+        assert history[0] == bars[0]
+        assert history[-1] == bars[-1]
+        assert history[-3] == bars[-3]
+
+    def test_maxlen_evicts_oldest(self):
+        bars = _make_bars(25)
+        history = BarHistory(maxlen=10, bars=bars)
+        assert len(history) == 10
+        assert list(history) == bars[-10:]
+        assert history.maxlen == 10
+
+    def test_matches_deque_across_compactions(self):
+        bars = _make_bars(137)
+        history = BarHistory(maxlen=16)
+        reference: deque[Bar] = deque(maxlen=16)
+        for bar in bars:
+            history.append(bar)
+            reference.append(bar)
+            assert history[-1] == reference[-1]
+            assert history[0] == reference[0]
+        assert list(history) == list(reference)
+
+    def test_index_out_of_range(self):
+        history = BarHistory(maxlen=5, bars=_make_bars(2))
+        with pytest.raises(IndexError):
+            history[2]
+        with pytest.raises(IndexError):
+            history[-3]
+
+    def test_empty_is_falsy(self):
+        history = BarHistory(maxlen=5)
+        assert not history
+        history.append(_make_bars(1)[0])
+        assert history
+
+    def test_slice_returns_bars(self):
+        bars = _make_bars(8)
+        history = BarHistory(maxlen=8, bars=bars)
+        assert history[-3:] == bars[-3:]
+
+    def test_preserves_symbol_timeframe_and_timezone(self):
+        eastern = ZoneInfo("America/New_York")
+        bars = [
+            Bar("SPY", datetime(2026, 1, 2, 15, 59, tzinfo=eastern), 1, 2, 0.5, 1.5, 10,
+                Timeframe.MINUTE),
+            Bar("QQQ", datetime(2026, 1, 3), 3, 4, 2.5, 3.5, 20),
+        ]
+        history = BarHistory(maxlen=4, bars=bars)
+        assert list(history) == bars
+        assert history[0].timestamp.tzinfo is eastern
+        assert history[1].timestamp.tzinfo is None
+
+    def test_clear(self):
+        history = BarHistory(maxlen=4, bars=_make_bars(3))
+        history.clear()
+        assert len(history) == 0
+        assert history.closes.shape == (0,)
+
+    def test_invalid_maxlen(self):
+        with pytest.raises(ValueError):
+            BarHistory(maxlen=0)
+
+
+class TestBarHistoryColumns:
+    def test_columns_match_bar_columns(self):
+        bars = _make_bars(40)
+        history = BarHistory(maxlen=30, bars=bars)
+        expected = bar_columns(bars[-30:])
+        columns = history.columns()
+        assert columns.keys() == expected.keys()
+        for field, values in expected.items():
+            np.testing.assert_array_equal(columns[field], values)
+
+    def test_views_are_zero_copy_and_read_only(self):
+        history = BarHistory(maxlen=10, bars=_make_bars(7))
+        closes = history.closes
+        assert np.shares_memory(closes, history.column("close"))
+        assert closes.flags.c_contiguous
+        with pytest.raises(ValueError):
+            closes[0] = 1.0
+
+    def test_last_n_window(self):
+        bars = _make_bars(12)
+        history = BarHistory(maxlen=10, bars=bars)
+        np.testing.assert_array_equal(
+            history.column("close", last=3), [b.close for b in bars[-3:]],
+        )
+        assert history.columns(last=50)["close"].shape == (10,)
+
+    def test_timestamps(self):
+        bars = _make_bars(3)
+        history = BarHistory(maxlen=5, bars=bars)
+        assert history.timestamps.tolist() == [timestamp_to_micros(b.timestamp) for b in bars]
+
+    def test_bar_columns_uses_views(self):
+        history = BarHistory(maxlen=5, bars=_make_bars(5))
+        assert np.shares_memory(bar_columns(history)["close"], history.closes)
+
+
+class TestEngineWithBarHistory:
+    def test_compute_matches_deque(self):
+        engine = IndicatorEngine()
+        for spec in [
+            IndicatorSpec("SMA", {"period": 20}),
+            IndicatorSpec("RSI", {"period": 14}),
+            IndicatorSpec("ADX", {"period": 14}),
+            IndicatorSpec("BBANDS", {"period": 20, "num_std": 2.0}),
+        ]:
+            engine.register(spec)
+        bars = _make_bars(120)
+        history = BarHistory(maxlen=60)
+        reference: deque[Bar] = deque(maxlen=60)
+        for bar in bars:
+            history.append(bar)
+            reference.append(bar)
+        columnar = engine.compute(history)
+        batch = engine.compute(reference)
+        for key, value in batch.items():
+            if isinstance(value, dict):
+                for field in value:
+                    assert columnar[key][field] == pytest.approx(value[field], rel=1e-9)
+            else:
+                assert columnar[key] == pytest.approx(value, rel=1e-9)
+
+    def test_compute_empty_history(self):
+        engine = IndicatorEngine()
+        engine.register(IndicatorSpec("SMA", {"period": 3}))
+        assert engine.compute(BarHistory(maxlen=5)) == {"SMA_3": None}
+
+
+class TestBarHistoryState:
+    def test_round_trip(self):
+        eastern = ZoneInfo("America/New_York")
+        bars = _make_bars(12) + [
+            Bar("SPY", datetime(2026, 2, 2, 15, 59, tzinfo=eastern), 1, 2, 0.5, 1.5, 10,
+                Timeframe.MINUTE),
+            Bar("QQQ", datetime(2026, 2, 3), 3, 4, 2.5, 3.5, 20),
+        ]
+        history = BarHistory(maxlen=10, bars=bars)
+        restored = BarHistory.from_state(history.get_state())
+        assert restored.maxlen == 10
+        assert list(restored) == list(history)
+        assert restored[-2].timestamp.tzinfo == eastern
+
+    def test_resize_keeps_most_recent(self):
+        bars = _make_bars(20)
+        state = BarHistory(maxlen=20, bars=bars).get_state()
+        restored = BarHistory.from_state(state, maxlen=5)
+        assert list(restored) == bars[-5:]
+        restored.append(_make_bars(21)[-1])
+        assert len(restored) == 5
+
+    def test_state_is_a_copy(self):
+        history = BarHistory(maxlen=5, bars=_make_bars(3))
+        state = history.get_state()
+        history.append(_make_bars(4)[-1])
+        assert state["timestamps"].shape == (3,)
@@ -101,7 +101,8 @@ def test_data_config_defaults():
     """Test default data configuration values."""
     from autotrader.core.config import DataConfig
     data_cfg = DataConfig()
-    assert data_cfg.bar_history_size == 500
+    assert data_cfg.bar_history_size is None
+    assert data_cfg.indicator_tolerance == 0.001
     assert data_cfg.store_type == "sqlite"
     assert data_cfg.sqlite_path == "data/autotrader.db"
 
@@ -47,3 +47,19 @@ class TestSQLiteStore:
             datetime(2026, 1, 16, 0, 0, tzinfo=timezone.utc),
         )
         assert len(loaded) == 1
+
+    async def test_iter_bars_orders_by_time_then_symbol(self, store):
+        day = datetime(2026, 1, 15, 21, 0, tzinfo=timezone.utc)
+        await store.save_bars([
+            Bar(sym, day.replace(day=15 + i), 100 + i, 101 + i, 99 + i, 100 + i, 1000)
+            for sym in ("MSFT", "AAPL", "GOOG")
+            for i in range(3)
+        ])
+        streamed = [
+            bar async for bar in store.iter_bars(
+                ["AAPL", "MSFT"], day, day.replace(day=17), batch_size=2,
+            )
+        ]
+        assert [(b.timestamp.day, b.symbol) for b in streamed] == [
+            (15, "AAPL"), (15, "MSFT"), (16, "AAPL"), (16, "MSFT"),
+        ]
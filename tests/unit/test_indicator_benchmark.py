@@ -0,0 +1,62 @@
+"""Smoke tests for the indicator benchmark suite."""
+import json
+
+import numpy as np
+import pytest
+
+from autotrader.indicators.base import IndicatorSpec
+from autotrader.indicators.benchmark import (
+    BenchmarkResult,
+    _rel_error,
+    run_benchmark,
+    synthetic_columns,
+    write_results,
+)
+
+_SPECS = [
+    IndicatorSpec("RSI", {"period": 14}),
+    IndicatorSpec("BBANDS", {"period": 20, "num_std": 2.0}),
+    IndicatorSpec("VWAP", {"session_bars": 390}),
+]
+
+
+def test_every_mode_runs_and_agrees(tmp_path):
+    results = run_benchmark(
+        _SPECS, histories=(60,), symbol_counts=(1, 3), batch_samples=6, min_seconds=0.0,
+    )
+    assert {(r.indicator, r.mode, r.symbols) for r in results} == {
+        (spec.key, mode, symbols)
+        for spec in _SPECS
+        for mode in ("batch", "streaming", "vectorized")
+        for symbols in (1, 3)
+    }
+    assert all(r.max_rel_error <= 1e-8 for r in results)
+    assert all(r.bars_per_second > 0 for r in results)
+
+    path = write_results(results, tmp_path / "out" / "bench.json")
+    payload = json.loads(path.read_text())
+    assert len(payload["results"]) == len(results)
+    assert {"indicator", "mode", "history", "symbols", "bars_per_second"} <= set(
+        payload["results"][0],
+    )
+
+
+def test_rel_error_flags_warmup_mismatch():
+    expected = np.array([np.nan, 1.0, 2.0])
+    assert _rel_error(np.array([np.nan, 1.0, 2.0 + 1e-12]), expected) < 1e-11
+    assert _rel_error(np.array([0.0, 1.0, 2.0]), expected) == float("inf")
+
+
+def test_disagreement_raises(monkeypatch):
+    def broken(spec, history, symbols, **kwargs):
+        return [BenchmarkResult(spec.key, "streaming", history, symbols, 1, 1.0, 0.5)]
+
+    monkeypatch.setattr("autotrader.indicators.benchmark.benchmark_indicator", broken)
+    with pytest.raises(AssertionError, match="RSI_14 streaming"):
+        run_benchmark(_SPECS[:1], histories=(10,), symbol_counts=(1,))
+
+
+def test_synthetic_columns_shape():
+    columns = synthetic_columns(4, 30)
+    assert all(arr.shape == (4, 30) for arr in columns.values())
+    assert (columns["high"] >= columns["low"]).all()
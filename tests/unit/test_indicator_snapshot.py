@@ -0,0 +1,279 @@
+"""Unit tests for slot-addressed indicator snapshots."""
+import json
+import math
+import random
+from collections import deque
+from datetime import datetime, timedelta, timezone
+
+import pytest
+
+from autotrader.core.bar_history import BarHistory
+from autotrader.core.types import Bar, MarketContext
+from autotrader.indicators import engine as engine_module
+from autotrader.indicators.base import Indicator, IndicatorSpec
+from autotrader.indicators.engine import IndicatorEngine
+from autotrader.indicators.graph import IndicatorGraph, TrueRange
+from autotrader.indicators.snapshot import (
+    IndicatorSnapshot,
+    LazyIndicatorSnapshot,
+    SnapshotLayout,
+    SnapshotReader,
+)
+from autotrader.strategy.rsi_mean_reversion import RsiMeanReversion
+
+
+def _random_walk(count: int, seed: int = 11) -> list[Bar]:
+    rng = random.Random(seed)
+    bars = []
+    price = 100.0
+    for i in range(count):
+        open_ = price
+        price = max(1.0, price + rng.gauss(0, 1.5))
+        bars.append(Bar(
+            symbol="TEST",
+            timestamp=datetime(2026, 1, 1, tzinfo=timezone.utc) + timedelta(days=i),
+            open=open_, high=max(open_, price) + rng.random(),
+            low=min(open_, price) - rng.random(), close=price, volume=1000.0,
+        ))
+    return bars
+
+
+def _engine(*specs: IndicatorSpec) -> IndicatorEngine:
+    engine = IndicatorEngine()
+    for spec in specs:
+        engine.register(spec)
+    return engine
+
+
+RSI_14 = IndicatorSpec(name="RSI", params={"period": 14})
+BBANDS_20 = IndicatorSpec(name="BBANDS", params={"period": 20, "num_std": 2.0})
+ATR_14 = IndicatorSpec(name="ATR", params={"period": 14})
+ADX_14 = IndicatorSpec(name="ADX", params={"period": 14})
+
+
+def _history(bars: list[Bar]) -> BarHistory:
+    history = BarHistory(maxlen=500)
+    for bar in bars:
+        history.append(bar)
+    return history
+
+
+class TestSnapshotLayout:
+    def test_slots_follow_registration_order(self):
+        layout = _engine(RSI_14, BBANDS_20).layout
+        assert layout.keys == ("RSI_14", "BBANDS_20")
+        assert layout.size == 6
+        assert layout.slot("RSI_14") == 0
+        assert layout.slot("BBANDS_20", "upper") == 1
+        assert layout.slot("BBANDS_20", "pct_b") == 5
+
+    def test_slot_rejects_unknown_or_mismatched_fields(self):
+        layout = _engine(RSI_14, BBANDS_20).layout
+        with pytest.raises(KeyError):
+            layout.slot("ATR_14")
+        with pytest.raises(KeyError):
+            layout.slot("BBANDS_20")
+        with pytest.raises(KeyError):
+            layout.slot("RSI_14", "upper")
+
+    def test_unstack_inverts_stack(self):
+        engine = _engine(RSI_14, BBANDS_20)
+        bars = _random_walk(80)
+        series = engine.compute_series(bars)
+        unstacked = engine.layout.unstack(engine.layout.stack(series, len(bars)))
+        assert unstacked.keys() == series.keys()
+        assert unstacked["RSI_14"].tolist() == pytest.approx(series["RSI_14"].tolist(), nan_ok=True)
+        for name, column in series["BBANDS_20"].items():
+            expected = pytest.approx(column.tolist(), nan_ok=True)
+            assert unstacked["BBANDS_20"][name].tolist() == expected
+
+    def test_register_replaces_layout(self):
+        engine = _engine(RSI_14)
+        before = engine.layout
+        engine.register(BBANDS_20)
+        assert engine.layout is not before
+
+
+class TestIndicatorSnapshot:
+    def test_mapping_view_matches_compute_dicts(self):
+        layout = SnapshotLayout([("RSI_14", ()), ("BBANDS_20", ("middle", "width"))])
+        snapshot = IndicatorSnapshot(layout, [55.0, 100.0, 0.1])
+        assert snapshot == {"RSI_14": 55.0, "BBANDS_20": {"middle": 100.0, "width": 0.1}}
+        assert snapshot.get("ATR_14") is None
+        assert "RSI_14" in snapshot and "ATR_14" not in snapshot
+        assert json.loads(json.dumps(snapshot.to_dict())) == snapshot
+
+    def test_nan_reads_as_none(self):
+        layout = SnapshotLayout([("RSI_14", ()), ("BBANDS_20", ("middle", "width"))])
+        snapshot = IndicatorSnapshot(layout, [math.nan, 100.0, math.nan])
+        assert snapshot == {"RSI_14": None, "BBANDS_20": None}
+        assert math.isnan(snapshot.value(0))
+
+    def test_engine_paths_share_layout(self):
+        bars = _random_walk(60)
+        engine = _engine(RSI_14, BBANDS_20)
+        for bar in bars:
+            streamed = engine.update(bar)
+        assert streamed.layout is engine.layout
+        assert engine.compute(bars).layout is engine.layout
+        assert streamed["RSI_14"] == pytest.approx(engine.compute(bars)["RSI_14"])
+
+
+class TestSnapshotReader:
+    def _reader(self) -> SnapshotReader:
+        return SnapshotReader(rsi="RSI_14", pct_b=("BBANDS_20", "pct_b"))
+
+    def test_snapshot_and_dict_read_the_same(self):
+        bars = _random_walk(60)
+        snapshot = _engine(RSI_14, BBANDS_20).compute(bars)
+        assert self._reader().read(snapshot) == self._reader().read(snapshot.to_dict())
+        assert self._reader().read(snapshot) == {
+            "rsi": snapshot["RSI_14"], "pct_b": snapshot["BBANDS_20"]["pct_b"],
+        }
+
+    def test_none_until_every_value_is_defined(self):
+        bars = _random_walk(60)
+        engine = _engine(RSI_14, BBANDS_20)
+        reader = self._reader()
+        results = [reader.read(engine.update(bar)) for bar in bars]
+        # RSI_14 needs 15 bars, BBANDS_20 needs 20
+        assert all(r is None for r in results[:19])
+        assert all(r is not None for r in results[19:])
+
+    def test_missing_indicator_reads_none(self):
+        snapshot = _engine(RSI_14).compute(_random_walk(30))
+        assert self._reader().read(snapshot) is None
+        assert self._reader().read({"RSI_14": 50.0, "BBANDS_20": 0.5}) is None
+
+    def test_rebinds_on_new_layout(self):
+        bars = _random_walk(40)
+        reader = SnapshotReader(rsi="RSI_14")
+        first = _engine(RSI_14).compute(bars)
+        second = _engine(BBANDS_20, RSI_14).compute(bars)
+        assert reader.read(first) == reader.read(second) == {"rsi": first["RSI_14"]}
+
+
+class TestLazySnapshot:
+    def test_evaluates_only_what_is_read(self):
+        engine = _engine(RSI_14, BBANDS_20, ATR_14, ADX_14)
+        snapshot = engine.compute(_history(_random_walk(80)))
+        assert isinstance(snapshot, LazyIndicatorSnapshot)
+        assert snapshot.pending == {"RSI_14", "BBANDS_20", "ATR_14", "ADX_14"}
+        SnapshotReader(rsi="RSI_14", pct_b=("BBANDS_20", "pct_b")).read(snapshot)
+        assert snapshot.pending == {"ATR_14", "ADX_14"}
+        snapshot.get("ATR_14")
+        assert snapshot.pending == {"ADX_14"}
+
+    def test_matches_eager_compute(self):
+        bars = _random_walk(120)
+        engine = _engine(RSI_14, BBANDS_20, ATR_14, ADX_14)
+        lazy = engine.compute(_history(bars))
+        eager = engine.compute(deque(bars))
+        assert lazy.keys() == eager.keys()
+        for key, value in eager.items():
+            if isinstance(value, dict):
+                assert lazy[key] == pytest.approx(value)
+            else:
+                assert lazy[key] == pytest.approx(value, rel=1e-9)
+
+    def test_shared_intermediates_evaluated_once(self, monkeypatch):
+        calls = []
+        original = TrueRange.compute_series
+        monkeypatch.setattr(
+            TrueRange, "compute_series",
+            lambda self, *args: calls.append(1) or original(self, *args),
+        )
+        snapshot = _engine(ATR_14, ADX_14).compute(_history(_random_walk(60)))
+        snapshot.get("ATR_14")
+        snapshot.get("ADX_14")
+        assert len(calls) == 1
+
+    def test_long_history_evaluates_only_trailing_window(self, monkeypatch):
+        lengths = []
+        original = IndicatorGraph.compute_series
+        monkeypatch.setattr(
+            IndicatorGraph, "compute_series",
+            lambda self, columns, *args: (
+                lengths.append(len(columns["close"])) or original(self, columns, *args)
+            ),
+        )
+        bars = _random_walk(3000)
+        history = BarHistory(maxlen=3000)
+        for bar in bars:
+            history.append(bar)
+        engine = _engine(RSI_14, BBANDS_20)
+        snapshot = engine.compute(history)
+        rsi, bbands = snapshot["RSI_14"], snapshot["BBANDS_20"]
+
+        assert set(lengths) == {engine.history_bars()}
+        assert engine.history_bars() < 250
+        eager = engine.compute(deque(bars))
+        # Recursive RSI converges to within the default tolerance; BBANDS
+        # has a finite window and is exact
+        assert rsi == pytest.approx(eager["RSI_14"], rel=1e-3)
+        assert bbands == pytest.approx(eager["BBANDS_20"], rel=1e-9)
+
+    def test_custom_indicator_calculated_once_per_bar(self, monkeypatch):
+        calls = []
+
+        class LastClose(Indicator):
+            name = "LAST"
+
+            def __init__(self, period: int) -> None:
+                self.warmup_period = period
+
+            def calculate(self, bars):
+                calls.append(len(bars))
+                return bars[-1].close if len(bars) >= self.warmup_period else None
+
+        monkeypatch.setitem(engine_module._INDICATOR_REGISTRY, "LAST", LastClose)
+        engine = _engine(RSI_14, IndicatorSpec("LAST", {"period": 1}))
+        history = BarHistory(maxlen=500)
+        for bar in _random_walk(300):
+            history.append(bar)
+            calls.clear()
+            snapshot = engine.compute(history)
+            assert len(calls) == 1
+            assert snapshot["LAST_1"] == bar.close
+
+    def test_survives_later_appends(self):
+        bars = _random_walk(80)
+        engine = _engine(RSI_14)
+        history = _history(bars[:60])
+        snapshot = engine.compute(history)
+        for bar in bars[60:]:
+            history.append(bar)
+        assert snapshot["RSI_14"] == pytest.approx(engine.compute(deque(bars[:60]))["RSI_14"])
+
+
+def test_rsi_exit_does_not_evaluate_adx():
+    strategy = RsiMeanReversion()
+    engine = _engine(*strategy.required_indicators)
+    bars = _random_walk(80)
+    history = _history(bars)
+    strategy.on_context(MarketContext("TEST", bars[-1], engine.compute(history), history))
+    state = strategy._states["TEST"]
+    state.in_position, state.entry_direction, state.entry_price = True, "long", bars[-1].close
+    snapshot = engine.compute(history)
+    strategy.on_context(MarketContext("TEST", bars[-1], snapshot, history))
+    assert snapshot.pending == {"ADX_14"}
+
+
+def test_strategy_signals_match_dict_contexts():
+    bars = _random_walk(400, seed=7)
+    engine = IndicatorEngine()
+    via_snapshot, via_dict = RsiMeanReversion(), RsiMeanReversion()
+    for spec in via_snapshot.required_indicators:
+        engine.register(spec)
+    series = engine.compute_series(bars)
+    table = engine.layout.stack(series, len(bars))
+    signals = 0
+    for i, bar in enumerate(bars):
+        snapshot = IndicatorSnapshot(engine.layout, table[i].tolist())
+        a = via_snapshot.on_context(MarketContext(bar.symbol, bar, snapshot, bars[: i + 1]))
+        b = via_dict.on_context(
+            MarketContext(bar.symbol, bar, engine.values_at(series, i).to_dict(), bars[: i + 1]),
+        )
+        assert a == b
+        signals += a is not None
+    assert signals > 0
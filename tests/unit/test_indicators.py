@@ -1,13 +1,25 @@
+import json
+import random
+
+import numpy as np
 import pytest
 from collections import deque
-from datetime import datetime, timezone
+from datetime import datetime, timedelta, timezone
 
 from autotrader.core.types import Bar
 from autotrader.indicators.base import Indicator, IndicatorSpec
 from autotrader.indicators.engine import IndicatorEngine
 from autotrader.indicators.builtin.moving_average import SMA, EMA
-from autotrader.indicators.builtin.momentum import RSI
-from autotrader.indicators.builtin.volatility import ATR
+from autotrader.indicators.builtin.momentum import MACD, RSI, Stochastic
+from autotrader.indicators.builtin.trend import ADX
+from autotrader.indicators.builtin.volatility import (
+    ATR,
+    BollingerBands,
+    DonchianChannels,
+    KeltnerChannels,
+    ZScore,
+)
+from autotrader.indicators.builtin.volume import VWAP, OBVDelta
 
 
 def _make_bars(closes: list[float], symbol: str = "AAPL") -> deque[Bar]:
@@ -21,6 +33,34 @@ def _make_bars(closes: list[float], symbol: str = "AAPL") -> deque[Bar]:
     return bars
 
 
+def _make_random_walk(count: int, seed: int = 7, start: float = 100.0) -> list[Bar]:
+    rng = random.Random(seed)
+    bars = []
+    price = start
+    for i in range(count):
+        open_ = price
+        price = max(1.0, price + rng.gauss(0, 1.5))
+        high = max(open_, price) + rng.random()
+        low = min(open_, price) - rng.random()
+        bars.append(Bar(
+            symbol="TEST",
+            timestamp=datetime(2026, 1, 1, tzinfo=timezone.utc) + timedelta(days=i),
+            open=open_, high=high, low=low, close=price, volume=1000.0 + i,
+        ))
+    return bars
+
+
+def _assert_value_close(streamed, batch):
+    if batch is None:
+        assert streamed is None
+    elif isinstance(batch, dict):
+        assert streamed.keys() == batch.keys()
+        for field in batch:
+            assert streamed[field] == pytest.approx(batch[field], rel=1e-9, abs=1e-9)
+    else:
+        assert streamed == pytest.approx(batch, rel=1e-9, abs=1e-9)
+
+
 class TestSMA:
     def test_sma_basic(self):
         sma = SMA(period=3)
@@ -86,3 +126,450 @@ class TestIndicatorEngine:
         results = engine.compute(bars)
         assert "SMA_3" in results
         assert "RSI_14" in results
+
+
+class TestHistoryBars:
+    @pytest.mark.parametrize("indicator", [
+        SMA(20), EMA(8), EMA(21), RSI(14), ATR(14), ADX(14), BollingerBands(20),
+    ], ids=lambda ind: f"{ind.name}_{ind.period}")
+    @pytest.mark.parametrize("tolerance", [1e-2, 1e-4])
+    def test_truncated_window_matches_full_history(self, indicator, tolerance):
+        bars = _make_random_walk(1500)
+        needed = indicator.history_bars(tolerance)
+        assert needed >= indicator.warmup_period
+        full = indicator.calculate(deque(bars))
+        truncated = indicator.calculate(deque(bars[-needed:]))
+        if isinstance(full, dict):
+            full, truncated = full["middle"], truncated["middle"]
+        assert truncated == pytest.approx(full, rel=tolerance)
+
+    def test_finite_windows_need_only_warmup(self):
+        assert SMA(20).history_bars(1e-6) == 20
+        assert BollingerBands(20).history_bars(1e-6) == 20
+
+    def test_engine_takes_the_slowest_indicator(self):
+        engine = IndicatorEngine()
+        assert engine.history_bars() == 0
+        engine.register(IndicatorSpec(name="SMA", params={"period": 50}))
+        engine.register(IndicatorSpec(name="RSI", params={"period": 14}))
+        assert engine.history_bars(1e-3) == RSI(14).history_bars(1e-3)
+        assert engine.history_bars(1e-6) > engine.history_bars(1e-3) > 50
+
+
+class TestStreamingUpdate:
+    @pytest.mark.parametrize("indicator", [
+        SMA(period=5),
+        EMA(period=8),
+        RSI(period=14),
+        ATR(period=14),
+        ADX(period=14),
+        ADX(period=5),
+        BollingerBands(period=20, num_std=2.0),
+    ], ids=lambda ind: f"{ind.name}_{ind.period}")
+    def test_update_matches_calculate(self, indicator):
+        bars = _make_random_walk(120)
+        history: deque[Bar] = deque()
+        for bar in bars:
+            history.append(bar)
+            _assert_value_close(indicator.update(bar), indicator.calculate(history))
+
+    def test_reset_starts_new_series(self):
+        rsi = RSI(period=14)
+        bars = _make_random_walk(40)
+        for bar in bars:
+            rsi.update(bar)
+        rsi.reset()
+        assert rsi.update(bars[0]) is None
+
+    def test_rsi_all_gains_streaming(self):
+        rsi = RSI(period=14)
+        result = None
+        for bar in _make_bars([float(i) for i in range(1, 20)]):
+            result = rsi.update(bar)
+        assert result == 100.0
+
+    def test_bbands_flat_window(self):
+        bb = BollingerBands(period=5)
+        result = None
+        for bar in _make_bars([50.0] * 10):
+            result = bb.update(bar)
+        assert result["width"] == pytest.approx(0.0)
+        assert result["pct_b"] == pytest.approx(0.5)
+
+    def test_default_update_falls_back_to_calculate(self):
+        class LastClose(Indicator):
+            name = "LAST"
+            warmup_period = 1
+
+            def calculate(self, bars):
+                return bars[-1].close if bars else None
+
+        ind = LastClose()
+        for bar in _make_bars([1.0, 2.0, 3.0]):
+            value = ind.update(bar)
+        assert value == 3.0
+
+
+class TestIndicatorEngineStreaming:
+    def test_update_matches_compute(self):
+        engine = IndicatorEngine()
+        for spec in [
+            IndicatorSpec("EMA", {"period": 8}),
+            IndicatorSpec("RSI", {"period": 14}),
+            IndicatorSpec("ADX", {"period": 14}),
+            IndicatorSpec("BBANDS", {"period": 20, "num_std": 2.0}),
+        ]:
+            engine.register(spec)
+        history: deque[Bar] = deque()
+        for bar in _make_random_walk(80):
+            history.append(bar)
+            streamed = engine.update(bar)
+            batch = engine.compute(history)
+            assert streamed.keys() == batch.keys()
+            for key in batch:
+                _assert_value_close(streamed[key], batch[key])
+
+    def test_reset(self):
+        engine = IndicatorEngine()
+        engine.register(IndicatorSpec("SMA", {"period": 3}))
+        for bar in _make_bars([10.0, 20.0, 30.0]):
+            engine.update(bar)
+        engine.reset()
+        assert engine.update(_make_bars([5.0])[0]) == {"SMA_3": None}
+
+
+class TestComputeSeries:
+    @pytest.mark.parametrize("indicator", [
+        SMA(period=5),
+        EMA(period=8),
+        RSI(period=14),
+        ATR(period=14),
+        ADX(period=14),
+        BollingerBands(period=20, num_std=2.0),
+    ], ids=lambda ind: f"{ind.name}_{ind.period}")
+    def test_series_matches_calculate(self, indicator):
+        bars = _make_random_walk(150)
+        series = indicator.calculate_series(bars)
+        history: deque[Bar] = deque()
+        for i, bar in enumerate(bars):
+            history.append(bar)
+            batch = indicator.calculate(history)
+            if isinstance(series, dict):
+                value = None if np.isnan(series["middle"][i]) else {
+                    f: series[f][i] for f in series
+                }
+            else:
+                value = None if np.isnan(series[i]) else series[i]
+            _assert_value_close(value, batch)
+
+    def test_short_series_all_nan(self):
+        bars = _make_random_walk(10)
+        assert np.isnan(ADX(period=14).calculate_series(bars)).all()
+        assert np.isnan(RSI(period=14).calculate_series(bars)).all()
+
+    def test_engine_compute_series_shapes(self):
+        engine = IndicatorEngine()
+        engine.register(IndicatorSpec("RSI", {"period": 14}))
+        engine.register(IndicatorSpec("BBANDS", {"period": 20, "num_std": 2.0}))
+        bars = _make_random_walk(60)
+        series = engine.compute_series(bars)
+        assert series["RSI_14"].shape == (60,)
+        assert set(series["BBANDS_20"]) == {"upper", "middle", "lower", "width", "pct_b"}
+        assert all(arr.shape == (60,) for arr in series["BBANDS_20"].values())
+
+    def test_values_at_matches_compute(self):
+        engine = IndicatorEngine()
+        engine.register(IndicatorSpec("ATR", {"period": 14}))
+        engine.register(IndicatorSpec("BBANDS", {"period": 20, "num_std": 2.0}))
+        bars = _make_random_walk(40)
+        series = engine.compute_series(bars)
+        assert engine.values_at(series, 5) == {"ATR_14": None, "BBANDS_20": None}
+        batch = engine.compute(deque(bars))
+        for key, value in engine.values_at(series, 39).items():
+            _assert_value_close(value, batch[key])
+
+    def test_default_series_replays_update(self):
+        class LastClose(Indicator):
+            name = "LAST"
+            warmup_period = 2
+
+            def calculate(self, bars):
+                return bars[-1].close if len(bars) >= 2 else None
+
+        ind = LastClose()
+        series = ind.calculate_series(_make_bars([1.0, 2.0, 3.0]))
+        assert np.isnan(series[0])
+        assert series[1:].tolist() == [2.0, 3.0]
+
+
+class TestIndicatorGraph:
+    def _engine(self) -> IndicatorEngine:
+        engine = IndicatorEngine()
+        for spec in [
+            IndicatorSpec("SMA", {"period": 20}),
+            IndicatorSpec("EMA", {"period": 8}),
+            IndicatorSpec("RSI", {"period": 14}),
+            IndicatorSpec("ATR", {"period": 14}),
+            IndicatorSpec("ADX", {"period": 14}),
+            IndicatorSpec("BBANDS", {"period": 20, "num_std": 2.0}),
+        ]:
+            engine.register(spec)
+        return engine
+
+    def _count(self, engine: IndicatorEngine, node_type: str) -> int:
+        return sum(1 for node in engine.graph.nodes if type(node).__name__ == node_type)
+
+    def test_shared_intermediates_deduplicated(self):
+        engine = self._engine()
+        assert self._count(engine, "TrueRange") == 1
+        assert self._count(engine, "Delta") == 1
+        # close, high, low -- each extracted once
+        assert self._count(engine, "Column") == 3
+        # SMA_20 and BBANDS_20 share the close rolling sum
+        assert self._count(engine, "RollingSum") == 1
+        assert self._count(engine, "RollingVariance") == 1
+        # ATR_14 and ADX_14 share Wilder-smoothed TR
+        smoothed_tr = [
+            node for node in engine.graph.nodes
+            if type(node).__name__ == "WilderSum"
+            and type(node.inputs[0]).__name__ == "TrueRange"
+        ]
+        assert len(smoothed_tr) == 1
+
+    def test_each_node_steps_once_per_bar(self, monkeypatch):
+        engine = self._engine()
+        calls: list[int] = []
+        node = next(n for n in engine.graph.nodes if type(n).__name__ == "TrueRange")
+        original = node.step
+        monkeypatch.setattr(node, "step", lambda bar: (calls.append(1), original(bar)))
+        for bar in _make_random_walk(10):
+            engine.update(bar)
+        assert len(calls) == 10
+
+    def test_shared_graph_matches_standalone(self):
+        engine = self._engine()
+        standalone = {
+            "ATR_14": ATR(period=14),
+            "ADX_14": ADX(period=14),
+            "RSI_14": RSI(period=14),
+        }
+        for bar in _make_random_walk(90):
+            shared = engine.update(bar)
+            for key, ind in standalone.items():
+                _assert_value_close(shared[key], ind.update(bar))
+
+    def test_engine_series_matches_streaming(self):
+        engine = self._engine()
+        bars = _make_random_walk(90)
+        series = engine.compute_series(bars)
+        for i, bar in enumerate(bars):
+            streamed = engine.update(bar)
+            for key, value in engine.values_at(series, i).items():
+                _assert_value_close(value, streamed[key])
+
+    def test_register_resets_streaming_state(self):
+        engine = IndicatorEngine()
+        engine.register(IndicatorSpec("SMA", {"period": 3}))
+        for bar in _make_bars([10.0, 20.0, 30.0]):
+            engine.update(bar)
+        engine.register(IndicatorSpec("EMA", {"period": 3}))
+        assert engine.update(_make_bars([5.0])[0]) == {"SMA_3": None, "EMA_3": None}
+
+
+class TestIndicatorState:
+    def _engine(self) -> IndicatorEngine:
+        return TestIndicatorGraph()._engine()
+
+    def test_restored_engine_resumes_stream(self):
+        bars = _make_random_walk(120)
+        continuous = self._engine()
+        first = self._engine()
+        for bar in bars[:60]:
+            continuous.update(bar)
+            first.update(bar)
+
+        state = json.loads(json.dumps(first.get_state()))
+        resumed = self._engine()
+        resumed.set_state(state)
+        for bar in bars[60:]:
+            expected = continuous.update(bar)
+            result = resumed.update(bar)
+            for key in expected:
+                _assert_value_close(result[key], expected[key])
+
+    def test_state_during_warmup(self):
+        bars = _make_random_walk(30)
+        continuous = self._engine()
+        partial = self._engine()
+        for bar in bars[:5]:
+            continuous.update(bar)
+            partial.update(bar)
+        resumed = self._engine()
+        resumed.set_state(partial.get_state())
+        for bar in bars[5:]:
+            expected = continuous.update(bar)
+            result = resumed.update(bar)
+            for key in expected:
+                _assert_value_close(result[key], expected[key])
+
+    def test_mismatched_registrations_rejected(self):
+        engine = IndicatorEngine()
+        engine.register(IndicatorSpec("SMA", {"period": 3}))
+        other = IndicatorEngine()
+        other.register(IndicatorSpec("SMA", {"period": 5}))
+        with pytest.raises(ValueError):
+            other.set_state(engine.get_state())
+
+
+class TestPeek:
+    def _engine(self) -> IndicatorEngine:
+        return TestIndicatorGraph()._engine()
+
+    @pytest.mark.parametrize("split", [3, 15, 60])
+    def test_peek_matches_update_without_mutating(self, split):
+        bars = _make_random_walk(90)
+        peeking = self._engine()
+        reference = self._engine()
+        for bar in bars[:split]:
+            peeking.update(bar)
+            reference.update(bar)
+        provisional = bars[split]
+        for _ in range(2):
+            peeked = peeking.peek(provisional)
+        assert peeking.graph.bar_count == split
+        expected = reference.update(provisional)
+        for key in expected:
+            _assert_value_close(peeked[key], expected[key])
+        # Committing the same bar afterwards continues the untouched stream
+        for bar in bars[split:]:
+            result = peeking.update(bar)
+            expected = expected if bar is provisional else reference.update(bar)
+            for key in expected:
+                _assert_value_close(result[key], expected[key])
+
+    def test_standalone_indicator_peek(self):
+        bars = _make_random_walk(40)
+        sma = SMA(period=5)
+        for bar in bars[:-1]:
+            sma.update(bar)
+        peeked = sma.peek(bars[-1])
+        assert peeked == pytest.approx(SMA(period=5).calculate(deque(bars)))
+        assert sma.update(bars[-1]) == pytest.approx(peeked)
+
+
+def _make_minute_walk(count: int, seed: int = 3) -> list[Bar]:
+    """5-minute bars around the clock, crossing several sessions and a DST change."""
+    rng = random.Random(seed)
+    bars = []
+    price = 100.0
+    start = datetime(2026, 3, 6, 14, 30, tzinfo=timezone.utc)
+    for i in range(count):
+        open_ = price
+        price = max(1.0, price + rng.gauss(0, 0.5))
+        bars.append(Bar(
+            symbol="TEST",
+            timestamp=start + timedelta(minutes=5 * i),
+            open=open_, high=max(open_, price) + rng.random(),
+            low=min(open_, price) - rng.random(), close=price,
+            volume=100.0 + 1000.0 * rng.random(),
+        ))
+    return bars
+
+
+_EXPANDED = [
+    MACD(), MACD(fast=5, slow=13, signal=4), Stochastic(), KeltnerChannels(),
+    DonchianChannels(), ZScore(), OBVDelta(), VWAP(session_bars=300),
+]
+
+
+class TestExpandedIndicators:
+    @pytest.mark.parametrize("indicator", _EXPANDED, ids=lambda ind: ind.name)
+    def test_update_and_series_match_calculate(self, indicator):
+        bars = _make_minute_walk(700)
+        series = indicator.calculate_series(bars)
+        history: deque[Bar] = deque()
+        for i, bar in enumerate(bars):
+            history.append(bar)
+            batch = indicator.calculate(history)
+            _assert_value_close(indicator.update(bar), batch)
+            if isinstance(series, dict):
+                value = None if any(np.isnan(arr[i]) for arr in series.values()) else {
+                    f: series[f][i] for f in series
+                }
+            else:
+                value = None if np.isnan(series[i]) else series[i]
+            _assert_value_close(value, batch)
+
+    @pytest.mark.parametrize("indicator", _EXPANDED, ids=lambda ind: ind.name)
+    def test_truncated_window_matches_full_history(self, indicator):
+        bars = _make_minute_walk(1500)
+        needed = indicator.history_bars(1e-4)
+        full = indicator.calculate(deque(bars))
+        truncated = indicator.calculate(deque(bars[-needed:]))
+        if isinstance(full, dict):
+            for field in full:
+                assert truncated[field] == pytest.approx(full[field], rel=1e-4, abs=1e-4)
+        else:
+            assert truncated == pytest.approx(full, rel=1e-4)
+
+    def test_register_by_spec(self):
+        engine = IndicatorEngine()
+        for spec in [
+            IndicatorSpec("MACD", {"fast": 12, "slow": 26, "signal": 9}),
+            IndicatorSpec("STOCH", {"k_period": 14, "d_period": 3}),
+            IndicatorSpec("KELTNER", {"period": 20, "multiplier": 2.0, "atr_period": 10}),
+            IndicatorSpec("DONCHIAN", {"period": 20}),
+            IndicatorSpec("ZSCORE", {"period": 20}),
+            IndicatorSpec("OBV_DELTA", {"period": 20}),
+            IndicatorSpec("VWAP", {"session_bars": 390}),
+        ]:
+            engine.register(spec)
+        assert engine.layout.fields("MACD_12") == ("macd", "signal", "histogram")
+        assert engine.layout.fields("STOCH_14") == ("k", "d")
+        history: deque[Bar] = deque()
+        for bar in _make_minute_walk(120):
+            history.append(bar)
+            streamed = engine.update(bar)
+        batch = engine.compute(history)
+        for key in batch:
+            _assert_value_close(streamed[key], batch[key])
+
+    def test_shares_nodes_with_existing_indicators(self):
+        engine = IndicatorEngine()
+        for spec in [
+            IndicatorSpec("EMA", {"period": 12}),
+            IndicatorSpec("MACD", {"fast": 12, "slow": 26, "signal": 9}),
+            IndicatorSpec("BBANDS", {"period": 20, "num_std": 2.0}),
+            IndicatorSpec("ZSCORE", {"period": 20}),
+            IndicatorSpec("ATR", {"period": 10}),
+            IndicatorSpec("KELTNER", {"period": 26, "multiplier": 2.0, "atr_period": 10}),
+        ]:
+            engine.register(spec)
+        types = [type(node).__name__ for node in engine.graph.nodes]
+        # EMA 12 / 26 (MACD, KELTNER) and the MACD signal EMA
+        assert types.count("Ema") == 3
+        assert types.count("RollingVariance") == 1
+        assert types.count("WilderSum") == 1
+
+    def test_vwap_restarts_each_session(self):
+        bars = _make_minute_walk(400)
+        vwap = VWAP()
+        values = [vwap.update(bar) for bar in bars]
+        # 2026-03-07 00:00 US Eastern is 05:00 UTC, 14.5 hours after the first bar
+        opening = 14 * 12 + 6
+        bar = bars[opening]
+        assert values[opening] == pytest.approx((bar.high + bar.low + bar.close) / 3)
+        assert VWAP().calculate(deque(bars[: opening + 1])) == pytest.approx(values[opening])
+        assert VWAP().calculate(deque(bars[:opening])) == pytest.approx(values[opening - 1])
+
+    def test_stochastic_flat_window_is_mid_range(self):
+        stoch = Stochastic(k_period=5, d_period=3)
+        for bar in _make_bars([50.0] * 10):
+            result = stoch.update(bar)
+        assert result["k"] == pytest.approx(50.0)
+        assert result["d"] == pytest.approx(50.0)
+
+    def test_obv_delta_counts_up_and_down_volume(self):
+        bars = _make_bars([10.0, 11.0, 10.5, 10.5, 12.0])
+        assert OBVDelta(period=4).calculate(bars) == pytest.approx(100.0 - 100.0 + 0.0 + 100.0)
+        assert OBVDelta(period=4).calculate_series(bars)[-1] == pytest.approx(100.0)
@@ -0,0 +1,78 @@
+import pytest
+
+from autotrader.portfolio.ledger import Ledger
+
+
+class TestLedger:
+    def test_long_round_trip(self):
+        ledger = Ledger(10_000.0)
+        assert ledger.fill("AAPL", 10, 100.0) == 0.0
+        assert ledger.cash == 9_000.0
+        assert ledger.equity == 10_000.0
+        ledger.mark("AAPL", 110.0)
+        assert ledger.long_value == 1_100.0
+        assert ledger.unrealized_pnl == 100.0
+        assert ledger.equity == 10_100.0
+        assert ledger.fill("AAPL", -10, 110.0) == 100.0
+        assert "AAPL" not in ledger
+        assert ledger.cash == ledger.equity == 10_100.0
+
+    def test_short_round_trip(self):
+        ledger = Ledger(10_000.0)
+        ledger.fill("AAPL", -10, 100.0)
+        assert ledger.cash == 11_000.0
+        assert ledger.short_value == 1_000.0
+        ledger.mark("AAPL", 90.0)
+        assert ledger.equity == 10_100.0
+        assert ledger.unrealized_pnl == 100.0
+        [position] = ledger.positions()
+        assert (position.side, position.quantity, position.market_value) == ("short", 10, 900.0)
+        assert ledger.fill("AAPL", 10, 90.0) == 100.0
+        assert len(ledger) == 0
+        assert ledger.equity == 10_100.0
+
+    def test_buying_power_is_equity_net_of_gross_exposure(self):
+        ledger = Ledger(10_000.0)
+        ledger.fill("AAPL", 10, 100.0)
+        ledger.fill("MSFT", -20, 100.0)
+        assert ledger.cash == 11_000.0
+        assert ledger.buying_power == 7_000.0
+        ledger.mark("MSFT", 110.0)
+        assert ledger.buying_power == ledger.equity - ledger.gross_exposure
+
+    def test_adding_averages_and_reducing_realizes(self):
+        ledger = Ledger(10_000.0)
+        ledger.fill("AAPL", 10, 100.0)
+        ledger.fill("AAPL", 10, 110.0)
+        assert ledger.position("AAPL").avg_price == 105.0
+        assert ledger.fill("AAPL", -5, 115.0) == 50.0
+        assert ledger.position("AAPL").quantity == 15
+        assert ledger.unrealized_pnl == pytest.approx(150.0)
+
+    def test_fill_through_zero_flips_side(self):
+        ledger = Ledger(10_000.0)
+        ledger.fill("AAPL", 10, 100.0)
+        assert ledger.fill("AAPL", -15, 120.0) == 200.0
+        position = ledger.position("AAPL")
+        assert (position.side, position.quantity, position.avg_price) == ("short", -5, 120.0)
+        assert ledger.short_value == 600.0
+        assert ledger.long_value == 0.0
+
+    def test_totals_match_positions_after_many_updates(self):
+        ledger = Ledger(100_000.0)
+        ledger.fill("AAA", 30, 50.0)
+        ledger.fill("BBB", -20, 80.0)
+        ledger.fill("CCC", 5, 200.0)
+        for step in range(100):
+            ledger.mark("AAA", 50.0 + step * 0.1)
+            ledger.mark("BBB", 80.0 - step * 0.07)
+            ledger.mark("ZZZ", 1.0)  # not held: ignored
+        positions = {p.symbol: p for p in ledger.positions()}
+        long_value = positions["AAA"].market_value + positions["CCC"].market_value
+        assert ledger.long_value == pytest.approx(long_value)
+        assert ledger.short_value == pytest.approx(positions["BBB"].market_value)
+        assert ledger.gross_exposure == pytest.approx(long_value + positions["BBB"].market_value)
+        assert ledger.unrealized_pnl == pytest.approx(
+            sum(p.unrealized_pnl for p in positions.values())
+        )
+        assert ledger.equity == pytest.approx(ledger.cash + ledger.market_value)
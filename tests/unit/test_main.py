@@ -6,6 +6,7 @@ import pytest
 
 from autotrader.main import AutoTrader
 from autotrader.broker.paper import PaperBroker
+from autotrader.core.bar_history import BarHistory
 from autotrader.core.config import Settings, RiskConfig
 from autotrader.core.types import (
     AccountInfo, Bar, MarketContext, Order, OrderResult, Position, Signal, Timeframe,
@@ -53,6 +54,11 @@ class TestAutoTrader:
         app = AutoTrader(Settings())
         assert isinstance(app._bar_history, dict)
 
+    def test_daily_and_live_history_share_instances(self):
+        app = AutoTrader(Settings())
+        assert app._daily_bar_history is app._bar_history
+        assert isinstance(app._bar_history["AAPL"], BarHistory)
+
     def test_init_has_running_flag(self):
         app = AutoTrader(Settings())
         assert app._running is False
@@ -90,6 +96,26 @@ class TestRegisterStrategies:
         app._register_strategies()
         assert len(app._indicator_engine._indicators) == count_before
 
+    def test_register_sizes_history_from_indicators(self):
+        app = AutoTrader(Settings())
+        for i in range(30):
+            app._bar_history["AAPL"].append(_make_bar("AAPL", 100.0 + i, idx=i))
+        app._register_strategies()
+        # ADX_14 settles slowest: 29 warmup bars plus two Wilder stages
+        assert app._history_size == app._indicator_engine.history_bars(0.001) == 217
+        history = app._bar_history["AAPL"]
+        assert history.maxlen == 217
+        assert len(history) == 30
+        assert history[-1].close == 129.0
+
+    def test_configured_history_size_wins(self):
+        settings = Settings()
+        settings.data.bar_history_size = 300
+        app = AutoTrader(settings)
+        app._register_strategies()
+        assert app._history_size == 300
+        assert app._bar_history["AAPL"].maxlen == 300
+
 
 class TestSignalToOrder:
     @pytest.fixture()
@@ -234,9 +260,12 @@ class TestAutoTraderTradingLoop:
 
     @pytest.mark.asyncio
     async def test_on_bar_respects_history_limit(self, app):
-        """Bar history should be bounded by data.bar_history_size."""
+        """Bar history should be bounded by the derived history size."""
         await app.start()
-        limit = app._settings.data.bar_history_size
+        limit = app._history_size
+        assert limit == app._indicator_engine.history_bars(
+            app._settings.data.indicator_tolerance,
+        )
         for i in range(limit + 50):
             bar = _make_bar("AAPL", 100.0 + (i % 10), idx=i % 28)
             await app._on_bar(bar)
@@ -373,6 +402,7 @@ class TestRotationManagerIntegration:
     async def test_weekly_loss_check_halts_trading(self, app_with_rotation):
         """Weekly loss limit triggers halt, blocking new entries."""
         from autotrader.core.config import RotationConfig
+        from autotrader.portfolio.ledger import Ledger
         settings = Settings()
         settings.broker.paper_balance = 3000.0
         cfg = RotationConfig(weekly_loss_limit_pct=0.01)  # 1% to trigger easily
@@ -381,7 +411,7 @@ class TestRotationManagerIntegration:
         app._rotation_manager._state.active_symbols = ["AAPL"]
         app._rotation_manager._state.weekly_start_equity = 3000.0
         # Drain cash to simulate loss
-        app._broker._cash = 2900.0  # ~3.3% loss
+        app._broker._ledger = Ledger(2900.0)  # ~3.3% loss
         bar = _make_bar("AAPL", 150.0)
         await app._on_bar(bar)
         assert app._rotation_manager._state.is_halted is True
@@ -643,6 +673,64 @@ class TestTradeLoggerIntegration:
         await app.stop()
 
 
+class TestIndicatorSnapshotCache:
+    @pytest.fixture()
+    def app(self):
+        settings = Settings()
+        settings.performance.enable_trade_log = False
+        app = AutoTrader(settings)
+        app._register_strategies()
+        return app
+
+    def _count_computes(self, app) -> list[int]:
+        calls: list[int] = []
+        original = app._indicator_engine.compute
+
+        def counting(history):
+            calls.append(1)
+            return original(history)
+
+        app._indicator_engine.compute = counting
+        return calls
+
+    @pytest.mark.asyncio
+    async def test_sizing_reuses_daily_bar_snapshot(self, app):
+        await app._broker.connect()
+        for i in range(30):
+            app._bar_history["AAPL"].append(_make_bar("AAPL", 100.0 + i, idx=i))
+        calls = self._count_computes(app)
+        await app._on_daily_bar(_make_bar("AAPL", 131.0, idx=30))
+        assert len(calls) == 1
+
+        account = await app._broker.get_account()
+        signal = Signal(strategy="adx_pullback", symbol="AAPL",
+                        direction="long", strength=0.8)
+        app._signal_to_order(signal, account, [])
+        assert len(calls) == 1
+        assert app._indicators_for("AAPL")["ATR_14"] is not None
+
+    @pytest.mark.asyncio
+    async def test_new_bar_invalidates_snapshot(self, app):
+        for i in range(25):
+            app._bar_history["AAPL"].append(_make_bar("AAPL", 100.0 + i, idx=i))
+        first = app._indicators_for("AAPL")
+        await app._on_daily_bar(_make_bar("AAPL", 90.0, idx=25))
+        second = app._indicators_for("AAPL")
+        assert second is not first
+        assert second["RSI_14"] != first["RSI_14"]
+
+    def test_empty_history_has_empty_snapshot(self, app):
+        assert app._indicators_for("MSFT") == {}
+
+    @pytest.mark.asyncio
+    async def test_proxy_daily_bar_leaves_regime_alone(self, app):
+        for i in range(40):
+            app._bar_history["SPY"].append(_make_bar("SPY", 450.0 + i % 5, idx=i))
+        await app._on_daily_bar(_make_bar("SPY", 452.0, idx=40))
+        assert len(app._spy_bb_width_history) == 0
+        assert app._current_regime == MarketRegime.UNCERTAIN
+
+
 class TestDailyBarAggregation:
     """Test that minute bars are aggregated and only daily bars reach strategies."""
 
@@ -0,0 +1,77 @@
+import numpy as np
+import pytest
+
+from autotrader.analysis.monte_carlo import MonteCarloAnalyzer
+from autotrader.backtest.engine import BacktestResult
+from autotrader.portfolio.performance import calculate_metrics
+
+PNLS = [120.0, -80.0, 45.0, -200.0, 310.0, -15.0, 60.0, -90.0, 150.0, -40.0]
+
+
+class TestMonteCarloAnalyzer:
+    def test_statistics_match_calculate_metrics_per_path(self, monkeypatch):
+        analyzer = MonteCarloAnalyzer(paths=3, seed=1)
+        monkeypatch.setattr(
+            analyzer, "_resample",
+            lambda rng, values, paths: np.broadcast_to(values, (paths, len(values))),
+        )
+        mc = analyzer.run_pnls(PNLS, 1_000.0)
+        expected = calculate_metrics(PNLS, 1_000.0)
+        assert mc.final_equity == pytest.approx([1_000.0 + expected["total_pnl"]] * 3)
+        assert mc.max_drawdown == pytest.approx([expected["max_drawdown"]] * 3)
+        assert mc.profit_factor == pytest.approx([expected["profit_factor"]] * 3)
+
+    def test_shuffle_keeps_totals_and_varies_drawdown(self):
+        mc = MonteCarloAnalyzer(paths=2_000, method="shuffle", seed=2).run_pnls(PNLS, 1_000.0)
+        assert mc.final_equity == pytest.approx(np.full(2_000, 1_000.0 + sum(PNLS)))
+        assert mc.profit_factor == pytest.approx(
+            np.full(2_000, calculate_metrics(PNLS, 1_000.0)["profit_factor"])
+        )
+        assert mc.max_drawdown.min() < calculate_metrics(PNLS, 1_000.0)["max_drawdown"]
+        assert mc.max_drawdown.max() > mc.max_drawdown.min()
+
+    def test_iid_is_seeded_and_centered(self):
+        first = MonteCarloAnalyzer(paths=5_000, seed=3).run_pnls(PNLS, 1_000.0)
+        second = MonteCarloAnalyzer(paths=5_000, seed=3).run_pnls(PNLS, 1_000.0)
+        assert np.array_equal(first.final_equity, second.final_equity)
+        assert first.final_equity.mean() == pytest.approx(1_000.0 + sum(PNLS), rel=0.01)
+        assert first.final_equity.std() > 0
+
+    def test_block_bootstrap_draws_consecutive_runs(self):
+        analyzer = MonteCarloAnalyzer(paths=50, method="block", block_size=4, seed=4)
+        values = np.arange(10, dtype=float)
+        sample = analyzer._resample(np.random.default_rng(4), values, 50)
+        assert sample.shape == (50, 10)
+        steps = np.diff(sample, axis=1)
+        within_block = steps[:, [0, 1, 2, 4, 5, 6, 8]]
+        assert np.isin(within_block, [1.0, -9.0]).all()
+
+    def test_risk_of_ruin(self):
+        losing = MonteCarloAnalyzer(paths=1_000, seed=5).run_pnls([-300.0, 50.0] * 5, 1_000.0)
+        winning = MonteCarloAnalyzer(paths=1_000, seed=5).run_pnls([300.0, -40.0] * 5, 1_000.0)
+        assert losing.risk_of_ruin > 0.5
+        assert winning.risk_of_ruin == 0.0
+
+    def test_runs_on_backtest_result(self):
+        result = BacktestResult(
+            total_trades=0, final_equity=0.0, metrics={}, equity_curve=[5_000.0],
+        )
+        mc = MonteCarloAnalyzer(paths=10).run(result)
+        assert mc.paths == 10
+        assert mc.initial_equity == 5_000.0
+        assert (mc.final_equity == 5_000.0).all()
+        assert mc.risk_of_ruin == 0.0
+        summary = mc.summary()
+        assert summary["final_equity"]["p50"] == 5_000.0
+        assert summary["risk_of_ruin"] == 0.0
+
+    def test_summary_handles_paths_without_losses(self):
+        mc = MonteCarloAnalyzer(paths=500, seed=6).run_pnls([10.0, -1.0], 100.0)
+        summary = mc.summary(percentiles=(50, 99))
+        assert np.isinf(mc.profit_factor).any()
+        assert summary["profit_factor"]["p99"] == float("inf")
+        assert np.isfinite(summary["profit_factor"]["p50"])
+
+    def test_rejects_unknown_method(self):
+        with pytest.raises(ValueError):
+            MonteCarloAnalyzer(method="jackknife")
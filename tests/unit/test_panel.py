@@ -0,0 +1,211 @@
+import dataclasses
+import random
+from datetime import datetime, timedelta, timezone
+
+import numpy as np
+import pytest
+
+from autotrader.core.types import Bar
+from autotrader.indicators.base import IndicatorSpec
+from autotrader.indicators.engine import IndicatorEngine
+from autotrader.indicators.panel import PanelIndicatorEngine
+
+_SPECS = [
+    IndicatorSpec("SMA", {"period": 20}),
+    IndicatorSpec("EMA", {"period": 8}),
+    IndicatorSpec("RSI", {"period": 14}),
+    IndicatorSpec("ATR", {"period": 14}),
+    IndicatorSpec("ADX", {"period": 14}),
+    IndicatorSpec("BBANDS", {"period": 20, "num_std": 2.0}),
+]
+
+
+_EXPANDED_SPECS = [
+    IndicatorSpec("MACD", {"fast": 12, "slow": 26, "signal": 9}),
+    IndicatorSpec("STOCH", {"k_period": 14, "d_period": 3}),
+    IndicatorSpec("KELTNER", {"period": 20, "multiplier": 2.0, "atr_period": 10}),
+    IndicatorSpec("DONCHIAN", {"period": 20}),
+    IndicatorSpec("ZSCORE", {"period": 20}),
+    IndicatorSpec("OBV_DELTA", {"period": 20}),
+    IndicatorSpec("VWAP", {"session_bars": 390}),
+]
+
+
+def _make_random_walk(symbol: str, count: int, seed: int) -> list[Bar]:
+    rng = random.Random(seed)
+    bars = []
+    price = 100.0
+    for i in range(count):
+        open_ = price
+        price = max(1.0, price + rng.gauss(0, 1.5))
+        bars.append(Bar(
+            symbol=symbol,
+            timestamp=datetime(2026, 1, 1, tzinfo=timezone.utc) + timedelta(days=i),
+            open=open_,
+            high=max(open_, price) + rng.random(),
+            low=min(open_, price) - rng.random(),
+            close=price,
+            volume=1000.0 + i,
+        ))
+    return bars
+
+
+def _universe(count: int = 5) -> dict[str, list[Bar]]:
+    return {
+        f"SYM{i}": _make_random_walk(f"SYM{i}", 60 + 9 * i, seed=i) for i in range(count)
+    }
+
+
+def _panel_engine(capacity: int = 64) -> PanelIndicatorEngine:
+    engine = PanelIndicatorEngine(capacity=capacity)
+    for spec in _SPECS:
+        engine.register(spec)
+    return engine
+
+
+def _single_engine() -> IndicatorEngine:
+    engine = IndicatorEngine()
+    for spec in _SPECS:
+        engine.register(spec)
+    return engine
+
+
+def _assert_value_close(value, expected):
+    if expected is None:
+        assert value is None
+    elif isinstance(expected, dict):
+        for field in expected:
+            assert value[field] == pytest.approx(expected[field], rel=1e-9, abs=1e-9)
+    else:
+        assert value == pytest.approx(expected, rel=1e-9, abs=1e-9)
+
+
+def _panel_engine_copy_update(universe: dict[str, list[Bar]], t: int) -> dict:
+    engine = _panel_engine()
+    for i in range(t + 1):
+        result = engine.update([bars[i] for bars in universe.values()])
+    return result
+
+
+class TestPanelStreaming:
+    def test_update_matches_per_symbol_engines(self):
+        universe = _universe()
+        panel = _panel_engine(capacity=2)  # forces row storage to grow
+        singles = {sym: _single_engine() for sym in universe}
+        for t in range(max(len(b) for b in universe.values())):
+            bars_at_t = [bars[t] for bars in universe.values() if t < len(bars)]
+            result = panel.update(bars_at_t)
+            for bar in bars_at_t:
+                expected = singles[bar.symbol].update(bar)
+                assert result[bar.symbol].keys() == expected.keys()
+                for key in expected:
+                    _assert_value_close(result[bar.symbol][key], expected[key])
+
+    def test_step_returns_arrays_aligned_with_bars(self):
+        panel = _panel_engine()
+        bars = [_make_random_walk(f"S{i}", 1, seed=i)[0] for i in range(3)]
+        arrays = panel.step(bars)
+        assert arrays["RSI_14"].shape == (3,)
+        assert np.isnan(arrays["RSI_14"]).all()
+        assert set(arrays["BBANDS_20"]) == {"upper", "middle", "lower", "width", "pct_b"}
+
+    def test_duplicate_symbol_rejected(self):
+        panel = _panel_engine()
+        bar = _make_random_walk("AAPL", 1, seed=1)[0]
+        with pytest.raises(ValueError):
+            panel.step([bar, dataclasses.replace(bar, close=bar.close + 1)])
+
+    def test_reset_single_symbol(self):
+        universe = _universe(2)
+        panel = _panel_engine()
+        for t in range(40):
+            panel.update([bars[t] for bars in universe.values()])
+        panel.reset(["SYM0"])
+        result = panel.update([universe["SYM0"][40], universe["SYM1"][40]])
+        assert result["SYM0"]["SMA_20"] is None
+        assert result["SYM1"]["SMA_20"] is not None
+
+    def test_peek_matches_update_without_mutating(self):
+        universe = _universe(3)
+        peeking = _panel_engine()
+        reference = _panel_engine()
+        for t in range(50):
+            bars_at_t = [bars[t] for bars in universe.values()]
+            if t % 7 == 3:
+                peeked = peeking.peek(bars_at_t)
+                expected = _panel_engine_copy_update(universe, t)
+                for sym, values in expected.items():
+                    for key in values:
+                        _assert_value_close(peeked[sym][key], values[key])
+            result = peeking.update(bars_at_t)
+            expected = reference.update(bars_at_t)
+            for sym in expected:
+                for key in expected[sym]:
+                    _assert_value_close(result[sym][key], expected[sym][key])
+
+    def test_unknown_indicator(self):
+        with pytest.raises(ValueError):
+            PanelIndicatorEngine().register(IndicatorSpec("NOPE", {"period": 3}))
+
+
+class TestComputePanel:
+    def test_matches_compute_series(self):
+        universe = _universe()
+        panel = _panel_engine().compute_panel(universe)
+        single = _single_engine()
+        for sym, bars in universe.items():
+            expected = single.compute_series(bars)
+            for key, series in expected.items():
+                if isinstance(series, dict):
+                    for field in series:
+                        np.testing.assert_allclose(
+                            panel[sym][key][field], series[field], rtol=1e-9, atol=1e-9,
+                        )
+                else:
+                    np.testing.assert_allclose(panel[sym][key], series, rtol=1e-9, atol=1e-9)
+
+    def test_rows_keep_their_own_length(self):
+        universe = {"A": _make_random_walk("A", 30, seed=1), "B": []}
+        panel = _panel_engine().compute_panel(universe)
+        assert panel["A"]["ATR_14"].shape == (30,)
+        assert panel["B"]["ATR_14"].shape == (0,)
+
+    def test_does_not_touch_streaming_state(self):
+        universe = _universe(2)
+        engine = _panel_engine()
+        engine.compute_panel(universe)
+        result = engine.update([bars[0] for bars in universe.values()])
+        assert all(v is None for values in result.values() for v in values.values())
+
+
+class TestExpandedIndicators:
+    def _engines(self) -> tuple[PanelIndicatorEngine, IndicatorEngine]:
+        panel = PanelIndicatorEngine(capacity=2)
+        single = IndicatorEngine()
+        for spec in _EXPANDED_SPECS:
+            panel.register(spec)
+            single.register(spec)
+        return panel, single
+
+    def test_update_matches_per_symbol_engines(self):
+        universe = _universe(3)
+        panel, _ = self._engines()
+        singles = {sym: self._engines()[1] for sym in universe}
+        for t in range(max(len(b) for b in universe.values())):
+            bars_at_t = [bars[t] for bars in universe.values() if t < len(bars)]
+            result = panel.update(bars_at_t)
+            for bar in bars_at_t:
+                expected = singles[bar.symbol].update(bar)
+                for key in expected:
+                    _assert_value_close(result[bar.symbol][key], expected[key])
+
+    def test_compute_panel_matches_compute_series(self):
+        universe = _universe(3)
+        panel, single = self._engines()
+        result = panel.compute_panel(universe)
+        for sym, bars in universe.items():
+            for key, series in single.compute_series(bars).items():
+                for field in series if isinstance(series, dict) else [None]:
+                    expected = series if field is None else series[field]
+                    actual = result[sym][key] if field is None else result[sym][key][field]
+                    np.testing.assert_allclose(actual, expected, rtol=1e-9, atol=1e-9)
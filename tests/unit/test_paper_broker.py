@@ -178,9 +178,27 @@ class TestPaperBrokerShort:
         # Short: proceeds = 100*10 = 1000 added to cash
         sell = Order(symbol="AAPL", side="sell", quantity=10, order_type="market")
         await broker.submit_order(sell)
-        assert broker._cash == 11_000.0  # 10000 + 1000
+        assert (await broker.get_account()).cash == 11_000.0  # 10000 + 1000
         # Cover at 90: cost = 90*10 = 900 deducted
         broker.set_price("AAPL", 90.0)
         buy = Order(symbol="AAPL", side="buy", quantity=10, order_type="market")
         await broker.submit_order(buy)
-        assert broker._cash == 10_100.0  # 11000 - 900
+        assert (await broker.get_account()).cash == 10_100.0  # 11000 - 900
+
+    async def test_short_does_not_add_buying_power(self):
+        """Short proceeds stay held against the short, as in backtests."""
+        broker = PaperBroker(10_000.0)
+        await broker.connect()
+        broker.set_price("AAPL", 100.0)
+        broker.set_price("MSFT", 100.0)
+        sell = Order(symbol="AAPL", side="sell", quantity=10, order_type="market")
+        await broker.submit_order(sell)
+        account = await broker.get_account()
+        assert account.cash == 11_000.0
+        # Equity 10000 less the 1000 short exposure
+        assert account.buying_power == 9_000.0
+        buy = Order(symbol="MSFT", side="buy", quantity=95, order_type="market")
+        assert (await broker.submit_order(buy)).status == "rejected"
+        buy = Order(symbol="MSFT", side="buy", quantity=90, order_type="market")
+        assert (await broker.submit_order(buy)).status == "filled"
+        assert (await broker.get_account()).buying_power == 0.0
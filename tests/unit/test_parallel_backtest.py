@@ -0,0 +1,100 @@
+import random
+from datetime import datetime, timedelta, timezone
+
+import pytest
+
+from autotrader.backtest.dashboard_data import BacktestDashboardData
+from autotrader.backtest.engine import BacktestEngine
+from autotrader.backtest.parallel import ParallelBacktestRunner
+from autotrader.core.config import RiskConfig
+from autotrader.core.types import Bar, MarketContext, Signal
+from autotrader.strategy.base import Strategy
+from autotrader.strategy.bb_squeeze import BbSqueezeBreakout
+from autotrader.strategy.rsi_mean_reversion import RsiMeanReversion
+
+
+class Exploding(Strategy):
+    name = "exploding"
+    required_indicators = []
+
+    def __init__(self) -> None:
+        raise RuntimeError("factory failed")
+
+    def on_context(self, ctx: MarketContext) -> Signal | None:
+        return None
+
+
+def _make_random_walk(symbol: str, count: int, seed: int) -> list[Bar]:
+    rng = random.Random(seed)
+    bars = []
+    price = 100.0
+    for i in range(count):
+        open_ = price
+        price = max(1.0, price + rng.gauss(0, 1.5))
+        bars.append(Bar(
+            symbol=symbol,
+            timestamp=datetime(2025, 1, 1, 21, tzinfo=timezone.utc) + timedelta(days=i),
+            open=open_, high=max(open_, price) + rng.random(),
+            low=min(open_, price) - rng.random(), close=price, volume=1_000_000.0,
+        ))
+    return bars
+
+
+def _universe() -> dict[str, list[Bar]]:
+    return {f"SYM{i}": _make_random_walk(f"SYM{i}", 250 + 40 * i, seed=i) for i in range(4)}
+
+
+def _sequential(bars: list[Bar], *factories) -> object:
+    engine = BacktestEngine(100_000.0, RiskConfig())
+    for factory in factories:
+        engine.add_strategy(factory())
+    return engine.run(bars)
+
+
+class TestParallelBacktestRunner:
+    @pytest.mark.parametrize("workers", [1, 2])
+    def test_matches_sequential_engines(self, workers):
+        universe = _universe()
+        runner = ParallelBacktestRunner(100_000.0, RiskConfig(), max_workers=workers)
+        results = runner.run(universe, [RsiMeanReversion])
+        assert list(results) == list(universe)
+        for symbol, bars in universe.items():
+            expected = _sequential(bars, RsiMeanReversion)
+            assert results[symbol].equity_curve == expected.equity_curve
+            assert results[symbol].trades == expected.trades
+            assert results[symbol].timestamped_equity == expected.timestamped_equity
+        assert sum(r.total_trades for r in results.values()) > 0
+
+    def test_strategy_sets_run_per_symbol(self):
+        universe = dict(list(_universe().items())[:2])
+        runner = ParallelBacktestRunner(100_000.0, RiskConfig(), max_workers=2)
+        results = runner.run(universe, {
+            "rsi": [RsiMeanReversion],
+            "both": [RsiMeanReversion, BbSqueezeBreakout],
+        })
+        assert list(results) == ["SYM0/rsi", "SYM0/both", "SYM1/rsi", "SYM1/both"]
+        expected = _sequential(universe["SYM1"], RsiMeanReversion, BbSqueezeBreakout)
+        assert results["SYM1/both"].equity_curve == expected.equity_curve
+
+    def test_results_feed_dashboard_data(self):
+        universe = _universe()
+        results = ParallelBacktestRunner(100_000.0, RiskConfig(), max_workers=2).run(
+            universe, [RsiMeanReversion],
+        )
+        data = BacktestDashboardData.from_results(results, {"initial_balance": 100_000.0})
+        assert set(data.equity_curves) == set(universe)
+        assert data.aggregate_metrics["total_trades"] == sum(
+            len(r.trades) for r in results.values()
+        )
+
+    @pytest.mark.parametrize("workers", [1, 2])
+    def test_worker_failure_propagates(self, workers):
+        runner = ParallelBacktestRunner(100_000.0, RiskConfig(), max_workers=workers)
+        with pytest.raises(RuntimeError, match="factory failed"):
+            runner.run(_universe(), [Exploding])
+
+    def test_empty_symbol(self):
+        runner = ParallelBacktestRunner(100_000.0, RiskConfig(), max_workers=2)
+        results = runner.run({"A": _make_random_walk("A", 30, seed=1), "B": []}, [RsiMeanReversion])
+        assert results["B"].equity_curve == [100_000.0]
+        assert results["A"].total_trades == 0
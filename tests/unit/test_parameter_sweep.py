@@ -0,0 +1,160 @@
+import random
+from datetime import datetime, timedelta, timezone
+
+import pytest
+
+from autotrader.backtest.engine import BacktestEngine
+from autotrader.backtest.sweep import ParameterSweep, configure_strategy, expand_grid
+from autotrader.core.config import RiskConfig
+from autotrader.core.types import Bar
+from autotrader.strategy.bb_squeeze import BbSqueezeBreakout
+from autotrader.strategy.regime_momentum import RegimeMomentum
+from autotrader.strategy.rsi_mean_reversion import RsiMeanReversion
+
+
+def _make_random_walk(symbol: str, count: int, seed: int) -> list[Bar]:
+    rng = random.Random(seed)
+    bars = []
+    price = 100.0
+    for i in range(count):
+        open_ = price
+        price = max(1.0, price + rng.gauss(0, 1.5))
+        bars.append(Bar(
+            symbol=symbol,
+            timestamp=datetime(2025, 1, 1, 21, tzinfo=timezone.utc) + timedelta(days=i),
+            open=open_, high=max(open_, price) + rng.random(),
+            low=min(open_, price) - rng.random(), close=price, volume=1_000_000.0,
+        ))
+    return bars
+
+
+def _universe() -> dict[str, list[Bar]]:
+    return {f"SYM{i}": _make_random_walk(f"SYM{i}", 250 + 40 * i, seed=i) for i in range(3)}
+
+
+def _sequential(bars: list[Bar], *strategies) -> object:
+    engine = BacktestEngine(100_000.0, RiskConfig())
+    for strategy in strategies:
+        engine.add_strategy(strategy)
+    return engine.run(bars)
+
+
+GRID = {
+    RsiMeanReversion: {
+        "RSI_PERIOD": [10, 14],
+        "RSI_OVERSOLD": [30.0, 40.0],
+        "MAX_BARS_IN_POSITION": [3, 5],
+    },
+}
+
+
+class TestConfigureStrategy:
+    def test_overrides_shadow_class_constants(self):
+        strategy = configure_strategy(RsiMeanReversion, {"RSI_PERIOD": 10, "RSI_OVERSOLD": 25.0})
+        assert strategy.RSI_OVERSOLD == 25.0
+        assert RsiMeanReversion.RSI_OVERSOLD == 30.0
+        assert "RSI_10" in [spec.key for spec in strategy.required_indicators]
+
+    def test_overrides_resize_lookback(self):
+        assert configure_strategy(RegimeMomentum, {"MIN_HISTORY_BARS": 300}).lookback_bars == 300
+        assert configure_strategy(RegimeMomentum, {"MOMENTUM_LOOKBACK": 40}).lookback_bars == 41
+        assert RegimeMomentum().lookback_bars == RegimeMomentum.MIN_HISTORY_BARS
+
+
+class TestExpandGrid:
+    def test_cartesian_product_in_grid_order(self):
+        configs = expand_grid({
+            RsiMeanReversion: {"RSI_OVERSOLD": [25, 30]},
+            BbSqueezeBreakout: {"MAX_BARS_IN_POSITION": [5, 7]},
+        })
+        assert [
+            {cls.__name__: params for cls, params in config} for config in configs
+        ] == [
+            {"RsiMeanReversion": {"RSI_OVERSOLD": 25},
+             "BbSqueezeBreakout": {"MAX_BARS_IN_POSITION": 5}},
+            {"RsiMeanReversion": {"RSI_OVERSOLD": 25},
+             "BbSqueezeBreakout": {"MAX_BARS_IN_POSITION": 7}},
+            {"RsiMeanReversion": {"RSI_OVERSOLD": 30},
+             "BbSqueezeBreakout": {"MAX_BARS_IN_POSITION": 5}},
+            {"RsiMeanReversion": {"RSI_OVERSOLD": 30},
+             "BbSqueezeBreakout": {"MAX_BARS_IN_POSITION": 7}},
+        ]
+
+    def test_empty_grid_is_one_default_config(self):
+        assert expand_grid({RsiMeanReversion: {}}) == [((RsiMeanReversion, {}),)]
+
+    def test_unknown_parameter_rejected(self):
+        with pytest.raises(ValueError, match="RSI_OVERSOLDD"):
+            expand_grid({RsiMeanReversion: {"RSI_OVERSOLDD": [25]}})
+        with pytest.raises(ValueError, match="name"):
+            expand_grid({RsiMeanReversion: {"name": ["x"]}})
+
+    def test_empty_values_rejected(self):
+        with pytest.raises(ValueError, match="No values"):
+            expand_grid({RsiMeanReversion: {"RSI_OVERSOLD": []}})
+
+
+class TestParameterSweep:
+    @pytest.mark.parametrize("workers", [1, 2])
+    def test_matches_sequential_engines(self, workers):
+        universe = _universe()
+        results = ParameterSweep(100_000.0, RiskConfig(), max_workers=workers).run(universe, GRID)
+        assert len(results) == 8
+        for result in results:
+            params = result.params["rsi_mean_reversion"]
+            for symbol, bars in universe.items():
+                expected = _sequential(bars, configure_strategy(RsiMeanReversion, params))
+                assert result.per_symbol[symbol]["final_equity"] == expected.final_equity
+                assert result.per_symbol[symbol]["total_trades"] == expected.metrics["total_trades"]
+        assert sum(r.metrics["total_trades"] for r in results) > 0
+
+    def test_ranked_by_metric(self):
+        sweep = ParameterSweep(100_000.0, RiskConfig(), max_workers=1)
+        results = sweep.run(_universe(), GRID)
+        pnls = [r.metrics["total_pnl"] for r in results]
+        assert pnls == sorted(pnls, reverse=True)
+        drawdowns = [
+            r.metrics["max_drawdown"]
+            for r in sweep.run(_universe(), GRID, rank_by="max_drawdown", ascending=True)
+        ]
+        assert drawdowns == sorted(drawdowns)
+
+    def test_aggregate_metrics(self):
+        results = ParameterSweep(100_000.0, RiskConfig(), max_workers=1).run(_universe(), GRID)
+        for result in results:
+            per_symbol = result.per_symbol.values()
+            assert result.metrics["total_trades"] == sum(m["total_trades"] for m in per_symbol)
+            total_pnl = sum(m["total_pnl"] for m in per_symbol)
+            assert result.metrics["total_pnl"] == pytest.approx(total_pnl)
+            assert result.metrics["final_equity"] == pytest.approx(
+                sum(m["final_equity"] for m in per_symbol)
+            )
+            assert result.metrics["max_drawdown"] == max(m["max_drawdown"] for m in per_symbol)
+
+    def test_history_override_changes_behavior(self):
+        bars = _make_random_walk("A", 600, seed=2)
+        results = ParameterSweep(100_000.0, RiskConfig(), max_workers=1).run(
+            {"A": bars}, {RegimeMomentum: {"MIN_HISTORY_BARS": [21, 300]}},
+        )
+        trades = {
+            r.params["regime_momentum"]["MIN_HISTORY_BARS"]: r.metrics["total_trades"]
+            for r in results
+        }
+        # 300 bars exceed the indicators' own history needs; the engine
+        # must keep that many for the strategy to trade at all
+        assert trades[300] > 0
+        assert trades[300] != trades[21]
+        for result in results:
+            params = result.params["regime_momentum"]
+            expected = _sequential(bars, configure_strategy(RegimeMomentum, params))
+            assert result.per_symbol["A"]["final_equity"] == expected.final_equity
+
+    def test_row_flattens_params_and_metrics(self):
+        result = ParameterSweep(100_000.0, RiskConfig(), max_workers=1).run(
+            {"A": _make_random_walk("A", 120, seed=3)},
+            {RsiMeanReversion: {"RSI_OVERSOLD": [35.0]}, BbSqueezeBreakout: {}},
+        )[0]
+        row = result.row()
+        assert row["rsi_mean_reversion.RSI_OVERSOLD"] == 35.0
+        assert row["total_pnl"] == result.metrics["total_pnl"]
+        assert result.params["bb_squeeze"] == {}
@@ -10,6 +10,7 @@ from collections import deque
 from datetime import datetime, timedelta, timezone
 from unittest.mock import AsyncMock, patch
 
+import numpy as np
 import pytest
 
 from autotrader.core.config import Settings
@@ -122,30 +123,28 @@ class TestRegimeWarmup:
         for bar in spy_bars:
             app._daily_bar_history["SPY"].append(bar)
 
-        original_compute = app._indicator_engine.compute
-        call_count = 0
-
-        def mock_compute(history):
-            nonlocal call_count
-            call_count += 1
-            result = original_compute(history)
-            # Loop calls (1-60): small width fills the deque average low
-            # Final call (61): large width -> ratio = 0.05/0.01 = 5.0 >> 1.3
-            is_final = call_count > len(spy_bars)
-            width = 0.05 if is_final else 0.01
-            result["ADX_14"] = 30.0
-            result["BBANDS_20"] = {
-                "upper": 460, "middle": 450, "lower": 440,
-                "width": width, "pct_b": 0.7,
+        original_series = app._indicator_engine.compute_series
+
+        def mock_compute_series(bars):
+            series = original_series(bars)
+            n = len(bars)
+            # Earlier bars: small width keeps the rolling average low.
+            # Latest bar: large width -> ratio = 0.05 / 0.012 ~= 4.2 >> 1.3
+            width = np.full(n, 0.01)
+            width[-1] = 0.05
+            series["ADX_14"] = np.full(n, 30.0)
+            series["BBANDS_20"] = {
+                "upper": np.full(n, 460.0), "middle": np.full(n, 450.0),
+                "lower": np.full(n, 440.0), "width": width, "pct_b": np.full(n, 0.7),
             }
-            result["ATR_14"] = 8.0
-            return result
+            series["ATR_14"] = np.full(n, 8.0)
+            return series
 
-        app._indicator_engine.compute = mock_compute
+        app._indicator_engine.compute_series = mock_compute_series
 
         app._initialize_regime_from_daily()
 
-        # ADX=30 >= 25, width_ratio=0.05/0.01=5.0 >= 1.3 -> TREND
+        # ADX=30 >= 25, width_ratio=0.05/0.012 >= 1.3 -> TREND
         assert app._current_regime == MarketRegime.TREND
         assert app._regime_tracker._confirmed_regime == MarketRegime.TREND
 
@@ -192,6 +191,21 @@ class TestRegimeWarmup:
         # BB needs 20 bars warmup, so with 60 bars we should have ~40 entries
         assert len(app._spy_bb_width_history) > 0
 
+    def test_bb_width_history_matches_bar_by_bar_walk(self, app):
+        """The vectorized rebuild keeps the widths of the last 20 bars."""
+        app._register_strategies()
+        spy_bars = _make_trending_bars("SPY", n=60)
+        app._daily_bar_history["SPY"].extend(spy_bars)
+
+        app._initialize_regime_from_daily()
+
+        expected: deque[float] = deque(maxlen=20)
+        for i in range(1, len(spy_bars) + 1):
+            bbands = app._indicator_engine.compute(deque(spy_bars[:i]))["BBANDS_20"]
+            if bbands is not None:
+                expected.append(bbands["width"])
+        assert list(app._spy_bb_width_history) == pytest.approx(list(expected), rel=1e-9)
+
     @pytest.mark.asyncio
     async def test_regime_tracker_initialized(self, app):
         """After warmup, _regime_tracker confirmed regime should match _current_regime."""
@@ -309,3 +323,91 @@ class TestRegimeWarmup:
 
         # Re-initialize should not crash
         app._initialize_regime_from_daily()
+
+
+class TestWarmRestart:
+    """Restarting from a state snapshot only fetches the missed bars."""
+
+    @staticmethod
+    def _recent_bars(symbol: str, n: int, end: datetime) -> list[Bar]:
+        bars = _make_trending_bars(symbol, n=n)
+        shift = end - bars[-1].timestamp
+        return [
+            Bar(b.symbol, b.timestamp + shift, b.open, b.high, b.low, b.close, b.volume)
+            for b in bars
+        ]
+
+    @staticmethod
+    def _snapshot_settings(tmp_path) -> Settings:
+        s = _settings()
+        s.data.enable_state_snapshot = True
+        s.data.state_snapshot_path = str(tmp_path / "state.npz")
+        return s
+
+    @pytest.mark.asyncio
+    async def test_restart_fetches_only_missed_bars(self, tmp_path):
+        today = datetime.now(timezone.utc).replace(hour=20, minute=0, second=0, microsecond=0)
+        bars = {
+            sym: self._recent_bars(sym, 61, today - timedelta(days=1))
+            for sym in ("SPY", "AAPL", "MSFT")
+        }
+
+        first = AutoTrader(self._snapshot_settings(tmp_path))
+        first._register_strategies()
+
+        async def full_history(symbols, days=120):
+            return {sym: bars[sym][:-3] for sym in symbols}
+
+        first._broker.get_historical_bars = full_history
+        await first._warm_up_from_history()
+        first._save_state_snapshot()
+
+        calls: list[tuple[list[str], int]] = []
+
+        async def recent(symbols, days=120):
+            calls.append((sorted(symbols), days))
+            return {sym: bars[sym][-days:] for sym in symbols}
+
+        second = AutoTrader(self._snapshot_settings(tmp_path))
+        second._register_strategies()
+        second._broker.get_historical_bars = recent
+        await second._warm_up_from_history()
+
+        assert calls == [(["AAPL", "MSFT", "SPY"], 5)]
+        for sym in bars:
+            assert list(second._bar_history[sym]) == bars[sym]
+        assert second._regime_tracker._confirmed_regime == second._current_regime
+
+    @pytest.mark.asyncio
+    async def test_stale_snapshot_triggers_full_reload(self, tmp_path):
+        old = datetime(2020, 1, 1, 20, 0, tzinfo=timezone.utc)
+        first = AutoTrader(self._snapshot_settings(tmp_path))
+        first._bar_history["SPY"].extend(self._recent_bars("SPY", 40, old))
+        first._save_state_snapshot()
+
+        calls: list[int] = []
+
+        async def mock_get_hist(symbols, days=120):
+            calls.append(days)
+            return {}
+
+        second = AutoTrader(self._snapshot_settings(tmp_path))
+        second._broker.get_historical_bars = mock_get_hist
+        await second._warm_up_from_history()
+
+        assert calls == [second._settings.scheduler.universe_history_days]
+        assert not second._bar_history.get("SPY")
+
+    @pytest.mark.asyncio
+    async def test_stop_writes_snapshot(self, tmp_path):
+        app = AutoTrader(self._snapshot_settings(tmp_path))
+        await app._broker.connect()
+        app._bar_history["SPY"].extend(_make_trending_bars("SPY", n=5))
+        await app.stop()
+        assert (tmp_path / "state.npz").exists()
+
+    @pytest.mark.asyncio
+    async def test_disabled_by_default(self, tmp_path):
+        app = AutoTrader(_settings())
+        assert app._state_store is None
+        app._save_state_snapshot()
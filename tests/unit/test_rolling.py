@@ -0,0 +1,196 @@
+"""Unit tests for the NumPy rolling/smoothing kernels."""
+import numpy as np
+import pytest
+
+from autotrader.indicators import rolling
+
+
+def _loop_filter(x, decay, gain, initial):
+    out = []
+    y = initial
+    for value in x:
+        y = decay * y + gain * value
+        out.append(y)
+    return np.array(out)
+
+
+class TestLinearFilter:
+    @pytest.mark.parametrize("decay", [0.0, 1.0 / 3.0, 13.0 / 14.0, 0.999])
+    def test_matches_loop(self, decay):
+        x = np.random.default_rng(3).normal(100.0, 5.0, size=3000)
+        result = rolling.linear_filter(x, decay, 1.0 - decay, 95.0)
+        np.testing.assert_allclose(result, _loop_filter(x, decay, 1.0 - decay, 95.0), rtol=1e-10)
+
+    def test_two_dimensional_rows_independent(self):
+        x = np.random.default_rng(4).normal(0.0, 1.0, size=(3, 500))
+        result = rolling.linear_filter(x, 0.9, 0.1, np.array([1.0, 2.0, 3.0]))
+        for row, initial in enumerate([1.0, 2.0, 3.0]):
+            np.testing.assert_allclose(result[row], _loop_filter(x[row], 0.9, 0.1, initial))
+
+    def test_empty(self):
+        assert rolling.linear_filter(np.array([]), 0.5, 0.5, 0.0).shape == (0,)
+
+
+class TestSeededSmooth:
+    def test_wilder_average_seed_and_step(self):
+        x = np.array([1.0, 2.0, 3.0, 4.0])
+        result = rolling.wilder_average(x, 3)
+        assert np.isnan(result[:2]).all()
+        assert result[2] == pytest.approx(2.0)
+        assert result[3] == pytest.approx((2.0 * 2 + 4.0) / 3)
+
+    def test_wilder_sum_seed(self):
+        result = rolling.wilder_sum(np.array([1.0, 2.0, 3.0, 4.0]), 3)
+        assert result[2] == pytest.approx(6.0)
+        assert result[3] == pytest.approx(6.0 - 2.0 + 4.0)
+
+    def test_too_short_is_nan(self):
+        assert np.isnan(rolling.ema(np.array([1.0, 2.0]), 5)).all()
+
+
+class TestSettlingBars:
+    def test_seed_weight_falls_below_tolerance(self):
+        decay = 13.0 / 14.0
+        bars = rolling.settling_bars(decay, 1e-3)
+        assert decay ** bars <= 1e-3 < decay ** (bars - 1)
+
+    def test_memoryless_filter_settles_immediately(self):
+        assert rolling.settling_bars(0.0, 1e-3) == 0
+
+    @pytest.mark.parametrize("tolerance", [0.0, 1.0])
+    def test_invalid_tolerance(self, tolerance):
+        with pytest.raises(ValueError):
+            rolling.settling_bars(0.5, tolerance)
+
+
+class TestRollingWindow:
+    def test_rolling_mean_and_var(self):
+        x = np.array([1.0, 2.0, 3.0, 4.0, 5.0])
+        mean = rolling.rolling_mean(x, 3)
+        var = rolling.rolling_var(x, 3)
+        assert np.isnan(mean[:2]).all()
+        np.testing.assert_allclose(mean[2:], [2.0, 3.0, 4.0])
+        np.testing.assert_allclose(var[2:], [2.0 / 3.0] * 3)
+
+    def test_true_range_uses_previous_close(self):
+        high = np.array([10.0, 12.0])
+        low = np.array([9.0, 11.5])
+        close = np.array([9.5, 12.0])
+        np.testing.assert_allclose(rolling.true_range(high, low, close), [2.5])
+
+
+class TestRollingKernels:
+    def test_sum_std_min_max(self):
+        x = np.array([3.0, 1.0, 4.0, 1.0, 5.0, 9.0])
+        np.testing.assert_allclose(rolling.rolling_sum(x, 3)[2:], [8.0, 6.0, 10.0, 15.0])
+        np.testing.assert_allclose(rolling.rolling_max(x, 3)[2:], [4.0, 4.0, 5.0, 9.0])
+        np.testing.assert_allclose(rolling.rolling_min(x, 3)[2:], [1.0, 1.0, 1.0, 1.0])
+        np.testing.assert_allclose(
+            rolling.rolling_std(x, 3, ddof=1)[2:],
+            [np.std(x[i - 2 : i + 1], ddof=1) for i in range(2, 6)],
+        )
+
+    def test_window_longer_than_series(self):
+        assert np.isnan(rolling.rolling_max(np.array([1.0, 2.0]), 3)).all()
+
+
+class TestStreamingPrimitives:
+    @pytest.mark.parametrize("window", [1, 3, 20])
+    def test_match_batch_kernels(self, window):
+        x = np.random.default_rng(5).normal(100.0, 10.0, size=200)
+        mean = rolling.RollingMean(window)
+        var = rolling.RollingVariance(window)
+        high = rolling.RollingMax(window)
+        low = rolling.RollingMin(window)
+        expected = {
+            "sum": rolling.rolling_sum(x, window),
+            "mean": rolling.rolling_mean(x, window),
+            "var": rolling.rolling_var(x, window),
+            "max": rolling.rolling_max(x, window),
+            "min": rolling.rolling_min(x, window),
+        }
+        for i, value in enumerate(x):
+            for primitive in (mean, var, high, low):
+                primitive.append(value)
+            if i < window - 1:
+                assert not mean.full and not high.full
+                continue
+            assert mean.total == pytest.approx(expected["sum"][i], rel=1e-12)
+            assert mean.mean == pytest.approx(expected["mean"][i], rel=1e-12)
+            assert var.variance() == pytest.approx(expected["var"][i], rel=1e-9, abs=1e-12)
+            assert high.value == expected["max"][i]
+            assert low.value == expected["min"][i]
+
+    def test_welford_keeps_precision_on_large_offsets(self):
+        x = 1e6 + np.random.default_rng(6).normal(0.0, 0.01, size=500)
+        var = rolling.RollingVariance(20)
+        for value in x:
+            var.append(value)
+        # E[x^2] - E[x]^2 loses every significant digit here
+        assert var.variance() == pytest.approx(np.var(x[-20:]), rel=1e-6)
+
+    def test_flat_window_has_zero_variance(self):
+        var = rolling.RollingVariance(4)
+        for _ in range(10):
+            var.append(0.1)
+        assert var.variance() == 0.0
+        assert var.std(ddof=1) == 0.0
+
+    def test_rolling_mean_reads_like_deque(self):
+        widths = rolling.RollingMean(3)
+        assert len(widths) == 0
+        assert np.isnan(widths.mean)
+        for value in [1.0, 2.0, 3.0, 4.0]:
+            widths.append(value)
+        assert list(widths) == [2.0, 3.0, 4.0]
+        assert widths[0] == 2.0
+        assert widths[-1] == 4.0
+        assert widths.mean == pytest.approx(3.0)
+        widths.clear()
+        assert len(widths) == 0
+        assert widths.total == 0.0
+
+    def test_sample_variance_needs_two_values(self):
+        var = rolling.RollingVariance(5)
+        var.append(1.0)
+        assert var.variance() == 0.0
+        assert np.isnan(var.variance(ddof=1))
+
+    @pytest.mark.parametrize("cls", [
+        rolling.RollingMean, rolling.RollingVariance, rolling.RollingMax, rolling.RollingMin,
+    ])
+    def test_state_round_trip(self, cls):
+        x = np.random.default_rng(7).normal(0.0, 1.0, size=50)
+        original = cls(7)
+        for value in x[:30]:
+            original.append(float(value))
+        restored = cls(7)
+        restored.set_state(original.get_state())
+        for value in x[30:]:
+            original.append(float(value))
+            restored.append(float(value))
+        assert restored.get_state() == original.get_state()
+
+    @pytest.mark.parametrize("cls", [
+        rolling.RollingMean, rolling.RollingVariance, rolling.RollingMax, rolling.RollingMin,
+    ])
+    @pytest.mark.parametrize("count", [2, 7, 12])
+    def test_rollback_undoes_one_append(self, cls, count):
+        primitive = cls(7)
+        for value in range(count):
+            primitive.append(float(value % 4))
+        before = primitive.get_state()
+        token = primitive.checkpoint()
+        primitive.append(-5.0)
+        primitive.rollback(token)
+        assert primitive.get_state() == before
+
+    def test_invalid_window(self):
+        with pytest.raises(ValueError):
+            rolling.RollingMean(0)
+        with pytest.raises(ValueError):
+            rolling.RollingMax(0)
+
+    def test_extreme_base_is_abstract(self):
+        with pytest.raises(TypeError):
+            rolling._RollingExtreme(3)
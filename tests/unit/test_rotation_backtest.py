@@ -103,6 +103,19 @@ class BuyAndCloseStrategy(Strategy):
         return None
 
 
+class SmaRecorderStrategy(Strategy):
+    """Records the SMA_3 value seen for every bar; never trades."""
+    name = "sma_recorder"
+    required_indicators = [IndicatorSpec(name="SMA", params={"period": 3})]
+
+    def __init__(self):
+        self.seen: list[tuple[str, datetime, float | None]] = []
+
+    def on_context(self, ctx: MarketContext) -> Signal | None:
+        self.seen.append((ctx.symbol, ctx.bar.timestamp, ctx.indicators.get("SMA_3")))
+        return None
+
+
 # --- Tests ---
 
 class TestRotationBacktestEngine:
@@ -238,3 +251,67 @@ class TestRotationBacktestEngine:
         result = engine.run({}, initial_universe=[])
         assert result.final_equity == 3000.0
         assert result.total_trades == 0
+
+
+    def test_out_of_order_input_matches_sorted(self):
+        """Unsorted per-symbol lists are sorted once, so indicator rows stay aligned."""
+        start = datetime(2026, 1, 5, 14, 30, tzinfo=timezone.utc)
+        ordered = {
+            "AAPL": _make_bars_from_start("AAPL", 12, 100.0, start),
+            "MSFT": _make_bars_from_start("MSFT", 12, 200.0, start),
+        }
+        shuffled = {
+            "AAPL": ordered["AAPL"][6:] + ordered["AAPL"][:6],
+            "MSFT": list(reversed(ordered["MSFT"])),
+        }
+        results = []
+        for bars in (ordered, shuffled):
+            engine = RotationBacktestEngine(
+                initial_balance=5000.0,
+                risk_config=RiskConfig(),
+                rotation_config=RotationConfig(),
+            )
+            recorder = SmaRecorderStrategy()
+            engine.add_strategy(recorder)
+            result = engine.run(bars, initial_universe=["AAPL", "MSFT"])
+            results.append((recorder.seen, result.timestamped_equity))
+
+        assert results[1] == results[0]
+        seen = results[0][0]
+        assert [ts for sym, ts, _ in seen if sym == "AAPL"] == [
+            b.timestamp for b in ordered["AAPL"]
+        ]
+        closes = [b.close for b in ordered["AAPL"]]
+        assert [v for sym, _, v in seen if sym == "AAPL"][2] == pytest.approx(
+            sum(closes[:3]) / 3,
+        )
+
+
+class TestBuildTimeline:
+    def test_merges_groups_in_time_then_symbol_order(self):
+        start = datetime(2026, 1, 5, 14, 30, tzinfo=timezone.utc)
+        bars = {
+            "MSFT": _make_bars_from_start("MSFT", 10, 200.0, start),
+            "AAPL": _make_bars_from_start("AAPL", 10, 100.0, start),
+            # Listed later, as a symbol rotated in mid-run would be
+            "GOOG": _make_bars_from_start("GOOG", 4, 150.0, start + timedelta(days=7)),
+        }
+        timeline = list(RotationBacktestEngine._build_timeline(bars))
+
+        expected = sorted(
+            (b for symbol_bars in bars.values() for b in symbol_bars),
+            key=lambda b: (b.timestamp, b.symbol),
+        )
+        assert [b for _, group in timeline for b in group] == expected
+        assert [ts for ts, _ in timeline] == sorted({b.timestamp for b in expected})
+        assert all(b.timestamp == ts for ts, group in timeline for b in group)
+        assert [b.symbol for b in timeline[5][1]] == ["AAPL", "GOOG", "MSFT"]
+
+    def test_empty_and_lazy(self):
+        assert list(RotationBacktestEngine._build_timeline({})) == []
+        bars = {"AAPL": iter(_make_bars("AAPL", 5))}
+        timeline = RotationBacktestEngine._build_timeline(bars)
+        ts, group = next(timeline)
+        assert [b.symbol for b in group] == ["AAPL"]
+        # Only the merge's lookahead has been consumed from the source
+        assert len(list(bars["AAPL"])) >= 3
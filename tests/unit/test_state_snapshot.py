@@ -0,0 +1,55 @@
+from datetime import datetime, timedelta, timezone
+
+from autotrader.core.bar_history import BarHistory
+from autotrader.core.types import Bar
+from autotrader.data.state_snapshot import StateSnapshotStore
+
+
+def _make_bars(symbol: str, n: int) -> list[Bar]:
+    base = datetime(2026, 1, 2, 20, 0, tzinfo=timezone.utc)
+    return [
+        Bar(symbol, base + timedelta(days=i), 100.0 + i, 101.0 + i, 99.0 + i, 100.5 + i, 1e6)
+        for i in range(n)
+    ]
+
+
+class TestStateSnapshotStore:
+    def test_round_trip(self, tmp_path):
+        store = StateSnapshotStore(tmp_path / "state.npz")
+        histories = {
+            "AAPL": BarHistory(maxlen=50, bars=_make_bars("AAPL", 30)),
+            "SPY": BarHistory(maxlen=50, bars=_make_bars("SPY", 60)),
+            "EMPTY": BarHistory(maxlen=50),
+        }
+        store.save(histories, {"indicators": ["SMA_20"]})
+
+        snapshot = store.load()
+        assert snapshot is not None
+        assert set(snapshot.histories) == {"AAPL", "SPY"}
+        for sym in ("AAPL", "SPY"):
+            assert list(snapshot.histories[sym]) == list(histories[sym])
+        assert snapshot.state == {"indicators": ["SMA_20"]}
+        assert snapshot.saved_at.tzinfo is not None
+
+    def test_load_resizes(self, tmp_path):
+        store = StateSnapshotStore(tmp_path / "state.npz")
+        store.save({"SPY": BarHistory(maxlen=50, bars=_make_bars("SPY", 40))})
+        history = store.load(maxlen=10).histories["SPY"]
+        assert history.maxlen == 10
+        assert list(history) == _make_bars("SPY", 40)[-10:]
+
+    def test_missing_file(self, tmp_path):
+        assert StateSnapshotStore(tmp_path / "missing.npz").load() is None
+
+    def test_corrupt_file(self, tmp_path):
+        path = tmp_path / "state.npz"
+        path.write_bytes(b"not a snapshot")
+        assert StateSnapshotStore(path).load() is None
+
+    def test_overwrite_leaves_no_temp_file(self, tmp_path):
+        store = StateSnapshotStore(tmp_path / "nested" / "state.npz")
+        store.save({"SPY": BarHistory(maxlen=5, bars=_make_bars("SPY", 3))})
+        store.save({"SPY": BarHistory(maxlen=5, bars=_make_bars("SPY", 4))})
+        assert [p.name for p in store.path.parent.iterdir()] == ["state.npz"]
+        assert len(store.load().histories["SPY"]) == 4
+
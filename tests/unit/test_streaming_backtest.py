@@ -0,0 +1,112 @@
+import random
+from datetime import datetime, timedelta, timezone
+
+from autotrader.backtest.engine import BacktestEngine
+from autotrader.backtest.sweep import configure_strategy
+from autotrader.core.config import RiskConfig, RotationConfig
+from autotrader.core.types import Bar
+from autotrader.data.sqlite_store import SQLiteStore
+from autotrader.rotation.backtest_engine import RotationBacktestEngine
+from autotrader.strategy.rsi_mean_reversion import RsiMeanReversion
+
+START = datetime(2025, 1, 1, 21, tzinfo=timezone.utc)
+
+# Loose enough that random walks trade
+PARAMS = {"RSI_OVERSOLD": 40.0}
+
+
+def _make_random_walk(symbol: str, count: int, seed: int, offset: int = 0) -> list[Bar]:
+    rng = random.Random(seed)
+    bars = []
+    price = 100.0
+    for i in range(count):
+        open_ = price
+        price = max(1.0, price + rng.gauss(0, 1.5))
+        bars.append(Bar(
+            symbol=symbol,
+            timestamp=START + timedelta(days=offset + i),
+            open=open_, high=max(open_, price) + rng.random(),
+            low=min(open_, price) - rng.random(), close=price, volume=1_000_000.0,
+        ))
+    return bars
+
+
+def _universe() -> dict[str, list[Bar]]:
+    return {
+        "AAA": _make_random_walk("AAA", 250, seed=1),
+        "BBB": _make_random_walk("BBB", 200, seed=2, offset=50),
+    }
+
+
+def _ordered(universe: dict[str, list[Bar]]) -> list[Bar]:
+    return sorted(
+        (bar for bars in universe.values() for bar in bars),
+        key=lambda b: (b.timestamp, b.symbol),
+    )
+
+
+def _engine() -> BacktestEngine:
+    engine = BacktestEngine(100_000.0, RiskConfig())
+    engine.add_strategy(configure_strategy(RsiMeanReversion, PARAMS))
+    return engine
+
+
+def _rotation_engine() -> RotationBacktestEngine:
+    engine = RotationBacktestEngine(100_000.0, RiskConfig(), RotationConfig())
+    engine.add_strategy(configure_strategy(RsiMeanReversion, PARAMS))
+    return engine
+
+
+class TestBacktestEngineStream:
+    def test_matches_batch_run(self):
+        bars = _make_random_walk("AAA", 300, seed=3)
+        batch = _engine().run(bars)
+        streamed = _engine().run_stream(iter(bars))
+        assert batch.total_trades > 0
+        assert streamed.equity_curve == batch.equity_curve
+        assert streamed.trades == batch.trades
+        assert streamed.metrics == batch.metrics
+
+    def test_engine_is_reusable(self):
+        bars = _make_random_walk("AAA", 200, seed=4)
+        engine = _engine()
+        first = engine.run_stream(iter(bars))
+        assert engine.run_stream(iter(bars)).equity_curve == first.equity_curve
+
+    async def test_async_source(self):
+        bars = _make_random_walk("AAA", 300, seed=3)
+
+        async def source():
+            for bar in bars:
+                yield bar
+
+        streamed = await _engine().run_stream_async(source())
+        assert streamed.equity_curve == _engine().run(bars).equity_curve
+
+
+class TestRotationBacktestEngineStream:
+    def test_matches_batch_run(self):
+        universe = _universe()
+        batch = _rotation_engine().run(universe, initial_universe=list(universe))
+        streamed = _rotation_engine().run_stream(
+            iter(_ordered(universe)), initial_universe=list(universe),
+        )
+        assert batch.total_trades > 0
+        assert streamed.equity_curve == batch.equity_curve
+        assert streamed.trades == batch.trades
+
+    async def test_streams_from_store(self, tmp_path):
+        universe = _universe()
+        store = SQLiteStore(str(tmp_path / "bars.db"))
+        await store.initialize()
+        try:
+            await store.save_bars(_ordered(universe))
+            streamed = await _rotation_engine().run_stream_async(
+                store.iter_bars(list(universe), START, START + timedelta(days=365), batch_size=64),
+                initial_universe=list(universe),
+            )
+        finally:
+            await store.close()
+        batch = _rotation_engine().run(universe, initial_universe=list(universe))
+        assert streamed.equity_curve == batch.equity_curve
+        assert streamed.trades == batch.trades
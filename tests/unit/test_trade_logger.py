@@ -88,6 +88,18 @@ class TestTradeLogger:
         assert trades[0].price == 100.0
         assert trades[2].price == 102.0
 
+    def test_indicator_snapshot_round_trip(self, tmp_path):
+        logger = TradeLogger(str(tmp_path / "trades.jsonl"), str(tmp_path / "equity.jsonl"))
+        indicators = {"ATR_14": 2.5, "RSI_14": None, "BBANDS_20": {"width": 0.04}}
+        logger.log_trade(LiveTradeRecord(
+            timestamp="2026-01-01T00:00:00Z", symbol="AAPL",
+            strategy="test", direction="long", side="buy",
+            quantity=10, price=100.0, pnl=0.0,
+            regime="TREND", equity_after=10000.0, metadata={},
+            indicators=indicators,
+        ))
+        assert logger.read_trades()[0].indicators == indicators
+
     def test_log_equity_snapshot(self, tmp_path):
         trade_path = str(tmp_path / "trades.jsonl")
         equity_path = str(tmp_path / "equity.jsonl")
@@ -0,0 +1,136 @@
+import random
+from datetime import datetime, timedelta, timezone
+
+import pytest
+
+from autotrader.backtest.dashboard_data import BacktestDashboardData
+from autotrader.backtest.engine import BacktestEngine
+from autotrader.backtest.sweep import configure_strategy
+from autotrader.backtest.walk_forward import WalkForwardOptimizer, make_folds, stitch_results
+from autotrader.core.config import RiskConfig
+from autotrader.core.types import Bar
+from autotrader.strategy.rsi_mean_reversion import RsiMeanReversion
+
+START = datetime(2025, 1, 1, 21, tzinfo=timezone.utc)
+
+
+def _make_random_walk(symbol: str, count: int, seed: int, offset: int = 0) -> list[Bar]:
+    rng = random.Random(seed)
+    bars = []
+    price = 100.0
+    for i in range(count):
+        open_ = price
+        price = max(1.0, price + rng.gauss(0, 1.5))
+        bars.append(Bar(
+            symbol=symbol,
+            timestamp=START + timedelta(days=offset + i),
+            open=open_, high=max(open_, price) + rng.random(),
+            low=min(open_, price) - rng.random(), close=price, volume=1_000_000.0,
+        ))
+    return bars
+
+
+def _universe() -> dict[str, list[Bar]]:
+    return {
+        "AAA": _make_random_walk("AAA", 400, seed=1),
+        # Listed later: its bars start partway through the timeline
+        "BBB": _make_random_walk("BBB", 300, seed=2, offset=100),
+    }
+
+
+GRID = {RsiMeanReversion: {"RSI_OVERSOLD": [30.0, 40.0], "MAX_BARS_IN_POSITION": [3, 5]}}
+
+
+class TestMakeFolds:
+    def test_rolling_folds_tile_out_of_sample(self):
+        stamps = [START + timedelta(days=i) for i in range(10)]
+        folds = make_folds(stamps, train_bars=4, test_bars=3)
+        assert [(f.train_start, f.test_start, f.test_end) for f in folds] == [
+            (stamps[0], stamps[4], stamps[7]),
+            (stamps[3], stamps[7], None),
+        ]
+
+    def test_anchored_folds_keep_first_bar(self):
+        stamps = [START + timedelta(days=i) for i in range(10)]
+        folds = make_folds(stamps, train_bars=4, test_bars=2, anchored=True)
+        assert [f.train_start for f in folds] == [stamps[0]] * 3
+        assert [f.test_start for f in folds] == [stamps[4], stamps[6], stamps[8]]
+        assert folds[-1].test_end is None
+
+    def test_too_short_timeline_has_no_folds(self):
+        stamps = [START + timedelta(days=i) for i in range(4)]
+        assert make_folds(stamps, train_bars=4, test_bars=2) == []
+
+    def test_rejects_non_positive_windows(self):
+        with pytest.raises(ValueError):
+            make_folds([START], train_bars=0, test_bars=1)
+
+
+class TestStitchResults:
+    def test_equity_continues_across_windows(self):
+        bars = _make_random_walk("AAA", 300, seed=5)
+        engine = BacktestEngine(100_000.0, RiskConfig())
+        engine.add_strategy(RsiMeanReversion())
+        first = engine.run(bars[:150])
+        second = engine.run(bars[150:])
+        stitched = stitch_results([first, second], 100_000.0)
+        assert len(stitched.equity_curve) == len(bars) + 1
+        assert stitched.equity_curve[150] == first.final_equity
+        assert stitched.final_equity == pytest.approx(
+            first.final_equity + second.final_equity - 100_000.0
+        )
+        assert [t.trade_id for t in stitched.trades] == list(range(1, len(stitched.trades) + 1))
+        assert stitched.total_trades == first.total_trades + second.total_trades
+
+
+class TestWalkForwardOptimizer:
+    @pytest.mark.parametrize("anchored", [False, True])
+    def test_parallel_matches_in_process(self, anchored):
+        universe = _universe()
+        kwargs = dict(train_bars=150, test_bars=80, anchored=anchored)
+        serial = WalkForwardOptimizer(100_000.0, RiskConfig(), max_workers=1).run(
+            universe, GRID, **kwargs,
+        )
+        parallel = WalkForwardOptimizer(100_000.0, RiskConfig(), max_workers=2).run(
+            universe, GRID, **kwargs,
+        )
+        assert len(serial.folds) == 4
+        assert [f.params for f in parallel.folds] == [f.params for f in serial.folds]
+        assert parallel.metrics == serial.metrics
+        for symbol in universe:
+            assert parallel.results[symbol].equity_curve == serial.results[symbol].equity_curve
+
+    def test_out_of_sample_uses_in_sample_winner_with_warm_indicators(self):
+        universe = _universe()
+        result = WalkForwardOptimizer(100_000.0, RiskConfig(), max_workers=1).run(
+            universe, GRID, train_bars=150, test_bars=80,
+        )
+        fold = result.folds[1]
+        bars = universe["AAA"]
+        window = [b for b in bars if fold.fold.test_start <= b.timestamp < fold.fold.test_end]
+
+        engine = BacktestEngine(100_000.0, RiskConfig())
+        engine.add_strategy(configure_strategy(RsiMeanReversion, fold.params["rsi_mean_reversion"]))
+        full = engine._indicator_engine.compute_series(bars)
+        start = bars.index(window[0])
+        series = {
+            key: (
+                {name: col[start : start + len(window)] for name, col in value.items()}
+                if isinstance(value, dict) else value[start : start + len(window)]
+            )
+            for key, value in full.items()
+        }
+        expected = engine.run(window, series)
+        assert fold.out_of_sample["AAA"].equity_curve == expected.equity_curve
+
+    def test_stitched_results_cover_every_out_of_sample_bar(self):
+        universe = _universe()
+        result = WalkForwardOptimizer(100_000.0, RiskConfig(), max_workers=1).run(
+            universe, GRID, train_bars=150, test_bars=80,
+        )
+        first_test = result.folds[0].fold.test_start
+        for symbol, bars in universe.items():
+            tested = [b.timestamp for b in bars if b.timestamp >= first_test]
+            assert [ts for ts, _ in result.results[symbol].timestamped_equity] == tested
+        data = BacktestDashboardData.from_results(result.results, {"initial_balance": 100_000.0})
+        assert data.aggregate_metrics["total_trades"] == result.metrics["total_trades"]